@@ -16,6 +16,17 @@ if str(REPO_ROOT) not in sys.path:
 from stl2scad.core.feature_inventory import InventoryConfig, analyze_stl_folder
 
 
+def _non_negative_int(value: str) -> int:
+    """argparse type validator for non-negative integers."""
+    try:
+        parsed = int(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"Expected an integer, got '{value}'") from exc
+    if parsed < 0:
+        raise argparse.ArgumentTypeError("Value must be non-negative")
+    return parsed
+
+
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Analyze STL files for feature-level parametric reconstruction signals."
@@ -43,6 +54,15 @@ def _build_parser() -> argparse.ArgumentParser:
         default=0,
         help="Parallel workers for folder scans. Use 0 for auto, 1 for serial.",
     )
+    parser.add_argument(
+        "--symmetry-sample-size",
+        type=_non_negative_int,
+        default=None,
+        help=(
+            "Mirror-test at most this many sampled vertices per file and report "
+            "a confidence bound. Use 0 to test every vertex (the default)."
+        ),
+    )
     return parser
 
 
@@ -66,6 +86,7 @@ def main() -> int:
             recursive=not args.no_recursive,
             max_files=args.max_files,
             workers=workers,
+            symmetry_sample_size=args.symmetry_sample_size or None,
         ),
     )
 
@@ -74,6 +74,11 @@ def _build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Optional inventory JSON output path when using --inventory-prefilter.",
     )
+    parser.add_argument(
+        "--inventory-fused",
+        action="store_true",
+        help="With --inventory-prefilter, parse each STL once and graph selected files from the in-memory mesh.",
+    )
     parser.add_argument(
         "--inventory-min-mechanical-score",
         type=_unit_interval_float,
@@ -147,7 +152,7 @@ def main() -> int:
         raise ValueError(
             "--inventory-prefilter, --inventory-output, and --inventory-* selection options require a directory input."
         )
-    if has_inventory_selection_filters and not args.inventory_prefilter:
+    if (has_inventory_selection_filters or args.inventory_fused) and not args.inventory_prefilter:
         raise ValueError("--inventory-* selection options require --inventory-prefilter.")
     if args.triage_output is not None and not input_path.is_dir():
         raise ValueError("--triage-output requires a directory input.")
@@ -215,6 +220,7 @@ def main() -> int:
                 ),
                 inventory_progress_callback=_inventory_progress,
                 graph_progress_callback=_graph_progress,
+                fused=args.inventory_fused,
             )
         else:
             report = build_feature_graph_for_folder(
@@ -2,7 +2,8 @@
 
 STL files are cached to a gitignored local directory (default: .local/thingi10k).
 The manifest is updated in-place with sha256 and file_size_bytes when files are
-newly downloaded.
+newly downloaded, or were installed by an interrupted earlier run (recovered
+from the resume journal in the cache directory).
 
 Example
 -------
@@ -23,6 +24,7 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
+from stl2scad.core.fingerprint_index import DEFAULT_VERIFY_POLICY, VERIFY_POLICIES
 from stl2scad.tuning.thingi10k import (
     list_missing_thingi10k_files,
     load_thingi10k_batch_manifest,
@@ -68,6 +70,21 @@ def main(argv: list[str]) -> int:
         action="store_false",
         help="Do not modify the manifest file after downloading.",
     )
+    parser.add_argument(
+        "--verify-fingerprints",
+        choices=VERIFY_POLICIES,
+        default=DEFAULT_VERIFY_POLICY,
+        help=(
+            "full: rehash every STL; stat: reuse indexed digests for files whose "
+            "size/mtime/inode are unchanged; off: skip verification."
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Concurrent downloads (default: 8).",
+    )
     args = parser.parse_args(argv)
 
     manifest_path = Path(args.manifest)
@@ -81,7 +98,10 @@ def main(argv: list[str]) -> int:
         f"Already cached: {n_total - len(missing)}  |  "
         f"To download: {len(missing)}"
     )
-    if not missing:
+    unrecorded = [
+        e for e in manifest["entries"] if not str(e.get("sha256", "")).strip()
+    ]
+    if not missing and not unrecorded:
         print("All STLs already cached — nothing to download.")
         return 0
 
@@ -91,6 +111,8 @@ def main(argv: list[str]) -> int:
         hf_token=args.hf_token,
         progress_fn=corpus_progress,
         force=args.force,
+        verify_fingerprints=args.verify_fingerprints,
+        workers=args.workers,
     )
 
     print(
@@ -109,7 +131,7 @@ def main(argv: list[str]) -> int:
         if len(failed_entries) > 10:
             print(f"  ... and {len(failed_entries) - 10} more")
 
-    if args.update_manifest and result["downloaded"] > 0:
+    if args.update_manifest and result["manifest_updated"]:
         manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
         print(f"\nManifest updated with sha256/file_size_bytes: {manifest_path}")
         print("  Commit the updated manifest if sha256 values should be recorded.")
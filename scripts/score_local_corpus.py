@@ -11,6 +11,7 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
+from stl2scad.core.fingerprint_index import DEFAULT_VERIFY_POLICY, VERIFY_POLICIES
 from stl2scad.tuning.local_corpus import (
     compare_local_corpus_score_to_baseline,
     score_local_corpus,
@@ -66,6 +67,37 @@ def main(argv: list[str]) -> int:
         default="artifacts/thumbs",
         help="Directory for cached STL thumbnail PNGs.",
     )
+    parser.add_argument(
+        "--no-graph-cache",
+        action="store_true",
+        help="Re-run the detector instead of reading the persistent feature-graph store.",
+    )
+    parser.add_argument(
+        "--verify-fingerprints",
+        choices=VERIFY_POLICIES,
+        default=DEFAULT_VERIFY_POLICY,
+        help=(
+            "full: rehash every STL; stat: reuse indexed digests for files whose "
+            "size/mtime/inode are unchanged; off: skip verification."
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Processes building feature graphs in parallel; preview validation "
+            "then runs concurrently up to STL2SCAD_RENDER_CONCURRENCY (default: 1)."
+        ),
+    )
+    parser.add_argument(
+        "--per-file-output",
+        default=None,
+        help=(
+            "NDJSON file that receives each per-file entry as it completes "
+            "(default: --output with a .ndjson suffix)."
+        ),
+    )
     args = parser.parse_args(argv)
 
     score = score_local_corpus(
@@ -73,6 +105,12 @@ def main(argv: list[str]) -> int:
         corpus_root=args.corpus_root,
         triage_top_n=args.triage_top_n,
         progress_fn=corpus_progress,
+        use_graph_cache=not args.no_graph_cache,
+        verify_fingerprints=args.verify_fingerprints,
+        workers=args.workers,
+        per_file_output=(
+            args.per_file_output or Path(args.output).with_suffix(".ndjson")
+        ),
     )
 
     output_path = Path(args.output)
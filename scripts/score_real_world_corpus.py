@@ -11,6 +11,7 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
+from stl2scad.core.fingerprint_index import DEFAULT_VERIFY_POLICY, VERIFY_POLICIES
 from stl2scad.tuning.config import DetectorConfig
 from stl2scad.tuning.real_world_corpus import (
     compare_real_world_score_to_baseline,
@@ -60,6 +61,34 @@ def main(argv: list[str]) -> int:
             "delta cannot be produced."
         ),
     )
+    parser.add_argument(
+        "--no-graph-cache",
+        action="store_true",
+        help="Re-run the detector instead of reading the persistent feature-graph store.",
+    )
+    parser.add_argument(
+        "--verify-fingerprints",
+        choices=VERIFY_POLICIES,
+        default=DEFAULT_VERIFY_POLICY,
+        help=(
+            "full: rehash every STL; stat: reuse indexed digests for files whose "
+            "size/mtime/inode are unchanged; off: skip verification."
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes scoring cases in parallel (default: 1).",
+    )
+    parser.add_argument(
+        "--per-case-output",
+        default=None,
+        help=(
+            "NDJSON file that receives each per-case entry as it completes "
+            "(default: --output with a .ndjson suffix)."
+        ),
+    )
     args = parser.parse_args(argv)
 
     manifest = load_real_world_corpus_manifest(args.manifest)
@@ -87,6 +116,12 @@ def main(argv: list[str]) -> int:
         DetectorConfig(),
         manifest_path=args.manifest,
         corpus_root=corpus_root,
+        use_graph_cache=not args.no_graph_cache,
+        verify_fingerprints=args.verify_fingerprints,
+        workers=args.workers,
+        per_case_output=(
+            args.per_case_output or Path(args.output).with_suffix(".ndjson")
+        ),
     )
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -10,6 +10,9 @@ python scripts/score_thingi10k_batch.py \\
     --cache .local/thingi10k \\
     --output artifacts/thingi10k_batch_001_score.json \\
     --baseline artifacts/thingi10k_batch_001_baseline.json
+
+Add --incremental to re-score only files whose STL bytes or traced detector
+stages changed since the previous run's trace file.
 """
 
 from __future__ import annotations
@@ -72,6 +75,27 @@ def main(argv: list[str]) -> int:
         action="store_true",
         help="Fail with exit code 1 if any STL is missing from the cache.",
     )
+    parser.add_argument(
+        "--no-graph-cache",
+        action="store_true",
+        help="Re-run the detector instead of reading the persistent feature-graph store.",
+    )
+    parser.add_argument(
+        "--trace-file",
+        default=None,
+        help=(
+            "Per-file dispatch trace written after scoring "
+            "(default: the output path with a .trace.json suffix)."
+        ),
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "Only re-score files whose STL or traced detectors changed since the "
+            "trace file was written; carry over every other result."
+        ),
+    )
     args = parser.parse_args(argv)
 
     manifest = load_thingi10k_batch_manifest(args.manifest)
@@ -92,14 +116,22 @@ def main(argv: list[str]) -> int:
         f"({len(manifest['entries'])} entries, {len(missing)} missing)..."
     )
 
+    output_path = Path(args.output)
+    trace_path = (
+        Path(args.trace_file)
+        if args.trace_file
+        else output_path.with_suffix(".trace.json")
+    )
     score = score_thingi10k_batch(
         manifest,
         args.cache,
         config=config,
         progress_fn=corpus_progress,
+        use_graph_cache=not args.no_graph_cache,
+        trace_path=trace_path,
+        incremental=args.incremental,
     )
 
-    output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     output_path.write_text(json.dumps(score, indent=2), encoding="utf-8")
     print(f"\nScore written to: {output_path}")
@@ -2,6 +2,10 @@
 
 Usage:
     python scripts/tune_detector.py --trials 200 --output artifacts/tuning/run_001
+    python scripts/tune_detector.py --trials 200 --workers 4 --output artifacts/tuning/run_002
+
+With --workers N, N processes share study.db and split the trials between them;
+each keeps its own parsed fixture meshes warm across trials.
 
 Outputs, under <output>/:
     baseline.json        -- default config scores on full manifest
@@ -20,7 +24,9 @@ import json
 import logging
 import statistics
 import sys
+import time
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -35,7 +41,7 @@ from stl2scad.core.feature_fixtures import (
     write_feature_fixture_library,
 )
 from stl2scad.tuning.config import DetectorConfig
-from stl2scad.tuning.scoring import ManifestScore, score_manifest
+from stl2scad.tuning.scoring import FixtureMeshCache, ManifestScore, score_manifest
 from stl2scad.tuning.real_world_corpus import (
     compare_real_world_score_to_baseline,
     list_missing_real_world_corpus_files,
@@ -49,6 +55,10 @@ from stl2scad.tuning.splits import leave_one_out, stratified_split
 
 logger = logging.getLogger(__name__)
 
+STUDY_NAME = "detector_autotune"
+# Seconds a worker waits on the SQLite write lock held by another worker.
+_SQLITE_LOCK_TIMEOUT = 120
+
 
 def main(argv: list[str]) -> int:
     logging.basicConfig(level=logging.INFO, format="%(message)s")
@@ -56,6 +66,12 @@ def main(argv: list[str]) -> int:
     parser.add_argument("--manifest", default="tests/data/feature_fixtures_manifest.json")
     parser.add_argument("--output", required=True, type=Path)
     parser.add_argument("--trials", type=int, default=200)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes sharing the study; trials are split between them.",
+    )
     parser.add_argument("--seed", type=int, default=42)
     parser.add_argument("--holdout-ratio", type=float, default=0.25)
     parser.add_argument("--cross-validate", action="store_true")
@@ -77,6 +93,8 @@ def main(argv: list[str]) -> int:
         ),
     )
     args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
 
     args.output.mkdir(parents=True, exist_ok=True)
     fixtures = load_feature_fixture_manifest(Path(args.manifest))
@@ -87,33 +105,47 @@ def main(argv: list[str]) -> int:
 
     train, holdout = stratified_split(fixtures, holdout_ratio=args.holdout_ratio, seed=args.seed)
     logger.info("Train: %d fixtures, Holdout: %d fixtures", len(train), len(holdout))
-    baseline_train = score_manifest(DetectorConfig(), train, stl_dir)
-    baseline_holdout = score_manifest(DetectorConfig(), holdout, stl_dir) if holdout else None
+    mesh_cache = FixtureMeshCache()
+    baseline_train = score_manifest(DetectorConfig(), train, stl_dir, mesh_cache)
+    baseline_holdout = (
+        score_manifest(DetectorConfig(), holdout, stl_dir, mesh_cache) if holdout else None
+    )
 
     if not args.cross_validate:
-        baseline_full = score_manifest(DetectorConfig(), fixtures, stl_dir)
+        baseline_full = score_manifest(DetectorConfig(), fixtures, stl_dir, mesh_cache)
         _dump(args.output / "baseline.json", _serialize_score(baseline_full, fixtures))
         logger.info("Baseline (full manifest) mean: %.4f", baseline_full.mean)
 
-        storage = f"sqlite:///{(args.output / 'study.db').as_posix()}"
+        storage_url = f"sqlite:///{(args.output / 'study.db').as_posix()}"
         study = optuna.create_study(
-            study_name="detector_autotune",
+            study_name=STUDY_NAME,
             direction="maximize",
             sampler=optuna.samplers.TPESampler(seed=args.seed),
-            storage=storage,
+            storage=_study_storage(storage_url),
             load_if_exists=True,
         )
 
-        def objective(trial: optuna.Trial) -> float:
-            config = suggest_config(trial)
-            return score_manifest(config, train, stl_dir).mean
-
-        study.optimize(objective, n_trials=args.trials, show_progress_bar=True)
-        logger.info("Best train score: %.4f", study.best_value)
+        started = time.perf_counter()
+        if args.workers == 1:
+            def objective(trial: optuna.Trial) -> float:
+                config = suggest_config(trial)
+                return score_manifest(config, train, stl_dir, mesh_cache).mean
+
+            study.optimize(objective, n_trials=args.trials, show_progress_bar=True)
+        else:
+            _optimize_in_workers(args, storage_url, train, stl_dir)
+        logger.info(
+            "%d trials in %.1fs; best train score: %.4f",
+            args.trials,
+            time.perf_counter() - started,
+            study.best_value,
+        )
 
         best_config = _reconstruct_config(study.best_params)
-        tuned_train = score_manifest(best_config, train, stl_dir)
-        tuned_holdout = score_manifest(best_config, holdout, stl_dir) if holdout else None
+        tuned_train = score_manifest(best_config, train, stl_dir, mesh_cache)
+        tuned_holdout = (
+            score_manifest(best_config, holdout, stl_dir, mesh_cache) if holdout else None
+        )
         selected_config_source = "optuna_best"
 
         # Guardrail: never recommend a regressive config when search misses baseline.
@@ -163,12 +195,16 @@ def main(argv: list[str]) -> int:
                 sampler=optuna.samplers.TPESampler(seed=args.seed + fold_index),
             )
             study.optimize(
-                lambda trial: score_manifest(suggest_config(trial), fold_train, stl_dir).mean,
+                lambda trial: score_manifest(
+                    suggest_config(trial), fold_train, stl_dir, mesh_cache
+                ).mean,
                 n_trials=max(10, args.trials // len(fixtures)),
                 show_progress_bar=False,
             )
             fold_config = _reconstruct_config(study.best_params)
-            fold_holdout_score = score_manifest(fold_config, fold_holdout, stl_dir).mean
+            fold_holdout_score = score_manifest(
+                fold_config, fold_holdout, stl_dir, mesh_cache
+            ).mean
             fold_scores.append(fold_holdout_score)
             fold_params.append(study.best_params)
             logger.info("Fold %d/%d: holdout=%.4f", fold_index + 1, len(fixtures), fold_holdout_score)
@@ -177,6 +213,82 @@ def main(argv: list[str]) -> int:
     return 0
 
 
+def _study_storage(storage_url: str) -> optuna.storages.RDBStorage:
+    # SQLite allows one writer at a time; a generous busy timeout makes
+    # concurrent workers queue on the lock instead of failing a trial.
+    return optuna.storages.RDBStorage(
+        storage_url,
+        engine_kwargs={"connect_args": {"timeout": _SQLITE_LOCK_TIMEOUT}},
+    )
+
+
+def _optimize_in_workers(
+    args: argparse.Namespace,
+    storage_url: str,
+    train: list[dict],
+    stl_dir: Path,
+) -> None:
+    """Split ``args.trials`` across ``args.workers`` processes sharing the study."""
+    share, extra = divmod(args.trials, args.workers)
+    quotas = [share + (1 if index < extra else 0) for index in range(args.workers)]
+    logger.info("Running %d trials on %d workers", args.trials, args.workers)
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = [
+            pool.submit(
+                _run_worker,
+                index,
+                quota,
+                storage_url,
+                args.seed + index,
+                train,
+                stl_dir,
+            )
+            for index, quota in enumerate(quotas)
+            if quota
+        ]
+        for future in futures:
+            future.result()
+
+
+def _run_worker(
+    worker_index: int,
+    n_trials: int,
+    storage_url: str,
+    seed: int,
+    train: list[dict],
+    stl_dir: Path,
+) -> None:
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    # The per-trial callback below replaces Optuna's own trial log lines.
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    # Distinct seeds keep workers from proposing identical first trials, and
+    # constant_liar steers TPE away from points other workers are evaluating.
+    study = optuna.load_study(
+        study_name=STUDY_NAME,
+        storage=_study_storage(storage_url),
+        sampler=optuna.samplers.TPESampler(seed=seed, constant_liar=True),
+    )
+    mesh_cache = FixtureMeshCache()
+
+    def objective(trial: optuna.Trial) -> float:
+        return score_manifest(suggest_config(trial), train, stl_dir, mesh_cache).mean
+
+    def report(study: optuna.Study, trial: optuna.trial.FrozenTrial) -> None:
+        if trial.value is None:
+            logger.info("[worker %d] trial %d %s", worker_index, trial.number, trial.state.name)
+            return
+        logger.info(
+            "[worker %d] trial %d: %.4f (best %.4f, %.1fs)",
+            worker_index,
+            trial.number,
+            trial.value,
+            study.best_value,
+            trial.duration.total_seconds() if trial.duration else 0.0,
+        )
+
+    study.optimize(objective, n_trials=n_trials, callbacks=[report])
+
+
 def _reconstruct_config(params: dict) -> DetectorConfig:
     defaults = DetectorConfig()
     fields = {f.name for f in dataclasses.fields(defaults)}
@@ -32,10 +32,17 @@ from stl2scad.core.feature_inventory import (
 from stl2scad.core.recognition import SUPPORTED_RECOGNITION_BACKENDS
 from stl2scad.core.temp_paths import temporary_directory
 from stl2scad.core.verification import (
+    VISUALIZATION_RENDERERS,
+    batch_verify,
     generate_comparison_visualization,
     generate_verification_report_html,
     verify_conversion,
 )
+from stl2scad.core.verification.analytic import METRICS_ENGINES
+from stl2scad.core.verification.metrics import (
+    DEFAULT_NUM_SAMPLES,
+    AdaptiveSamplingConfig,
+)
 
 
 def _positive_float(value: str) -> float:
@@ -71,6 +78,17 @@ def _non_negative_int(value: str) -> int:
     return parsed
 
 
+def _positive_int(value: str) -> int:
+    """argparse type validator for strictly positive integers."""
+    try:
+        parsed = int(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"Expected an integer, got '{value}'") from exc
+    if parsed <= 0:
+        raise argparse.ArgumentTypeError("Value must be positive")
+    return parsed
+
+
 def _unit_interval_float(value: str) -> float:
     """argparse type validator for 0.0-1.0 floats."""
     try:
@@ -182,6 +200,18 @@ def build_parser() -> argparse.ArgumentParser:
         default=0.5,
         help="Bounding box difference tolerance in percent (default: 0.5)",
     )
+    verify_parser.add_argument(
+        "--hausdorff-tol",
+        type=_non_negative_float,
+        default=None,
+        help="Optional Hausdorff distance tolerance in percent of the bounding box diagonal",
+    )
+    verify_parser.add_argument(
+        "--normal-tol",
+        type=_non_negative_float,
+        default=None,
+        help="Optional normal deviation tolerance in degrees",
+    )
     verify_parser.add_argument(
         "--visualize",
         action="store_true",
@@ -192,6 +222,12 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Generate HTML report with visualizations",
     )
+    verify_parser.add_argument(
+        "--visual-renderer",
+        choices=list(VISUALIZATION_RENDERERS),
+        default="openscad",
+        help="Renderer for visualization images; 'software' rasterizes meshes with NumPy (default: openscad)",
+    )
     verify_parser.add_argument(
         "--parametric",
         action="store_true",
@@ -209,12 +245,40 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Seed for deterministic sampling-based verification metrics",
     )
+    verify_parser.add_argument(
+        "--samples",
+        type=_positive_int,
+        default=DEFAULT_NUM_SAMPLES,
+        help=f"Surface points sampled per mesh for Hausdorff/normal metrics (default: {DEFAULT_NUM_SAMPLES})",
+    )
+    verify_parser.add_argument(
+        "--adaptive-sampling",
+        action="store_true",
+        help="Sample in rounds (starting at --samples) until tolerance decisions are statistically settled",
+    )
+    verify_parser.add_argument(
+        "--max-samples",
+        type=_positive_int,
+        default=AdaptiveSamplingConfig.max_samples,
+        help=f"Per-side sample cap for --adaptive-sampling (default: {AdaptiveSamplingConfig.max_samples})",
+    )
     verify_parser.add_argument(
         "--compute-backend",
         choices=["auto", "cpu", "gpu"],
         default="auto",
         help="Compute backend for conversion step when SCAD must be generated (default: auto)",
     )
+    verify_parser.add_argument(
+        "--metrics-engine",
+        choices=list(METRICS_ENGINES),
+        default="openscad",
+        help=(
+            "How SCAD metrics are measured: openscad renders, analytic "
+            "integrates and tessellates feature-graph output directly (falling "
+            "back to OpenSCAD), auto also renders when a Hausdorff/normal "
+            "tolerance needs a mesh it cannot tessellate (default: openscad)"
+        ),
+    )
     verify_parser.set_defaults(handler=verify_command)
 
     batch_parser = subparsers.add_parser(
@@ -241,11 +305,29 @@ def build_parser() -> argparse.ArgumentParser:
         default=0.5,
         help="Bounding box difference tolerance in percent (default: 0.5)",
     )
+    batch_parser.add_argument(
+        "--hausdorff-tol",
+        type=_non_negative_float,
+        default=None,
+        help="Optional Hausdorff distance tolerance in percent of the bounding box diagonal",
+    )
+    batch_parser.add_argument(
+        "--normal-tol",
+        type=_non_negative_float,
+        default=None,
+        help="Optional normal deviation tolerance in degrees",
+    )
     batch_parser.add_argument(
         "--html-report",
         action="store_true",
         help="Generate HTML reports (and visualizations) for each processed file",
     )
+    batch_parser.add_argument(
+        "--visual-renderer",
+        choices=list(VISUALIZATION_RENDERERS),
+        default="openscad",
+        help="Renderer for visualization images; 'software' rasterizes meshes with NumPy (default: openscad)",
+    )
     batch_parser.add_argument(
         "--parametric",
         action="store_true",
@@ -263,12 +345,35 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Seed for deterministic sampling-based verification metrics",
     )
+    batch_parser.add_argument(
+        "--samples",
+        type=_positive_int,
+        default=DEFAULT_NUM_SAMPLES,
+        help=f"Surface points sampled per mesh for Hausdorff/normal metrics (default: {DEFAULT_NUM_SAMPLES})",
+    )
+    batch_parser.add_argument(
+        "--adaptive-sampling",
+        action="store_true",
+        help="Sample in rounds (starting at --samples) until tolerance decisions are statistically settled",
+    )
+    batch_parser.add_argument(
+        "--max-samples",
+        type=_positive_int,
+        default=AdaptiveSamplingConfig.max_samples,
+        help=f"Per-side sample cap for --adaptive-sampling (default: {AdaptiveSamplingConfig.max_samples})",
+    )
     batch_parser.add_argument(
         "--compute-backend",
         choices=["auto", "cpu", "gpu"],
         default="auto",
         help="Compute backend for conversion step (default: auto)",
     )
+    batch_parser.add_argument(
+        "--workers",
+        type=_non_negative_int,
+        default=1,
+        help="Processes converting and verifying files in parallel. Use 0 for auto, 1 for serial (default: 1)",
+    )
     batch_parser.set_defaults(handler=batch_command)
 
     accel_parser = subparsers.add_parser(
@@ -312,6 +417,15 @@ def build_parser() -> argparse.ArgumentParser:
         default=0,
         help="Parallel workers for folder scans. Use 0 for auto, 1 for serial",
     )
+    feature_inventory_parser.add_argument(
+        "--symmetry-sample-size",
+        type=_non_negative_int,
+        default=None,
+        help=(
+            "Mirror-test at most this many sampled vertices per file and report "
+            "a confidence bound (default: test every vertex)"
+        ),
+    )
     feature_inventory_parser.set_defaults(handler=feature_inventory_command)
 
     feature_graph_parser = subparsers.add_parser(
@@ -354,6 +468,11 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Optional inventory JSON output path when using --inventory-prefilter",
     )
+    feature_graph_parser.add_argument(
+        "--inventory-fused",
+        action="store_true",
+        help="With --inventory-prefilter, parse each STL once and graph selected files from the in-memory mesh",
+    )
     feature_graph_parser.add_argument(
         "--inventory-min-mechanical-score",
         type=_unit_interval_float,
@@ -568,11 +687,28 @@ def build_parser() -> argparse.ArgumentParser:
 
 def _tolerance_from_args(args: argparse.Namespace) -> Dict[str, float]:
     """Construct a tolerance dictionary from parsed args."""
-    return {
+    tolerance = {
         "volume": args.volume_tol,
         "surface_area": args.area_tol,
         "bounding_box": args.bbox_tol,
     }
+    if getattr(args, "hausdorff_tol", None) is not None:
+        tolerance["hausdorff_distance"] = args.hausdorff_tol
+    if getattr(args, "normal_tol", None) is not None:
+        tolerance["normal_deviation"] = args.normal_tol
+    return tolerance
+
+
+def _adaptive_sampling_from_args(
+    args: argparse.Namespace,
+) -> Optional[AdaptiveSamplingConfig]:
+    """Construct adaptive-sampling settings when --adaptive-sampling is set."""
+    if not getattr(args, "adaptive_sampling", False):
+        return None
+    return AdaptiveSamplingConfig(
+        initial_samples=min(args.samples, args.max_samples),
+        max_samples=args.max_samples,
+    )
 
 
 def print_stats(stats: ConversionStats) -> None:
@@ -924,6 +1060,7 @@ def feature_inventory_command(args: argparse.Namespace) -> int:
                 recursive=not args.no_recursive,
                 max_files=args.max_files,
                 workers=workers,
+                symmetry_sample_size=args.symmetry_sample_size or None,
             ),
             progress_callback=_progress,
         )
@@ -970,7 +1107,7 @@ def feature_graph_command(args: argparse.Namespace) -> int:
             raise ValueError(
                 "--inventory-prefilter, --inventory-output, and --inventory-* selection options require a directory input"
             )
-        if has_inventory_selection_filters and not args.inventory_prefilter:
+        if (has_inventory_selection_filters or args.inventory_fused) and not args.inventory_prefilter:
             raise ValueError(
                 "--inventory-* selection options require --inventory-prefilter"
             )
@@ -1035,6 +1172,7 @@ def feature_graph_command(args: argparse.Namespace) -> int:
                     ),
                     inventory_progress_callback=_inventory_progress,
                     graph_progress_callback=_graph_progress,
+                    fused=args.inventory_fused,
                 )
             else:
                 report = build_feature_graph_for_folder(
@@ -1294,8 +1432,17 @@ def verify_command(args: argparse.Namespace) -> int:
         print(f"  Volume: {tolerance['volume']}%")
         print(f"  Surface area: {tolerance['surface_area']}%")
         print(f"  Bounding box: {tolerance['bounding_box']}%")
+        if "hausdorff_distance" in tolerance:
+            print(f"  Hausdorff distance: {tolerance['hausdorff_distance']}%")
+        if "normal_deviation" in tolerance:
+            print(f"  Normal deviation: {tolerance['normal_deviation']} deg")
         if args.sample_seed is not None:
             print(f"  Sample seed: {args.sample_seed}")
+        if args.adaptive_sampling:
+            print(f"  Adaptive sampling: up to {args.max_samples} samples per side")
+        metrics_engine = getattr(args, "metrics_engine", "openscad")
+        if metrics_engine != "openscad":
+            print(f"  Metrics engine: {metrics_engine}")
 
         if visualize:
             print("Visualization enabled")
@@ -1308,6 +1455,9 @@ def verify_command(args: argparse.Namespace) -> int:
             tolerance,
             debug=False,
             sample_seed=args.sample_seed,
+            num_samples=args.samples,
+            adaptive_sampling=_adaptive_sampling_from_args(args),
+            metrics_engine=metrics_engine,
         )
         print_verification_result(result)
 
@@ -1330,6 +1480,7 @@ def verify_command(args: argparse.Namespace) -> int:
                 args.input_file,
                 scad_file_to_use,
                 vis_dir,
+                renderer=getattr(args, "visual_renderer", "openscad"),
             )
             print(f"Generated {len(visualizations)} visualization files")
 
@@ -1389,82 +1540,62 @@ def batch_command(args: argparse.Namespace) -> int:
         print(f"  Volume: {tolerance['volume']}%")
         print(f"  Surface area: {tolerance['surface_area']}%")
         print(f"  Bounding box: {tolerance['bounding_box']}%")
+        if "hausdorff_distance" in tolerance:
+            print(f"  Hausdorff distance: {tolerance['hausdorff_distance']}%")
+        if "normal_deviation" in tolerance:
+            print(f"  Normal deviation: {tolerance['normal_deviation']} deg")
         if args.sample_seed is not None:
             print(f"  Sample seed: {args.sample_seed}")
+        if args.adaptive_sampling:
+            print(f"  Adaptive sampling: up to {args.max_samples} samples per side")
 
         if args.html_report:
             print("HTML reports will be generated")
 
-        results: Dict[str, Dict[str, Any]] = {}
-        for stl_file in stl_files:
-            rel_path = stl_file.relative_to(input_path)
-            scad_file = output_path / rel_path.with_suffix(".scad")
-            report_file = output_path / rel_path.with_suffix(".verification.json")
-            scad_file.parent.mkdir(exist_ok=True, parents=True)
-
-            print(f"\nProcessing: {stl_file}")
-            print(f"Output: {scad_file}")
-
-            try:
-                stl2scad(
-                    str(stl_file),
-                    str(scad_file),
-                    parametric=getattr(args, "parametric", False),
-                    recognition_backend=getattr(args, "recognition_backend", "native"),
-                    compute_backend=getattr(args, "compute_backend", "auto"),
-                )
-                result = verify_conversion(
-                    stl_file,
-                    scad_file,
-                    tolerance,
-                    debug=False,
-                    sample_seed=args.sample_seed,
-                )
-                result.save_report(report_file)
-
-                if args.html_report:
-                    vis_dir = output_path / rel_path.with_suffix(".visualizations")
-                    vis_dir.mkdir(exist_ok=True, parents=True)
-                    visualizations = generate_comparison_visualization(
-                        stl_file,
-                        scad_file,
-                        vis_dir,
-                    )
-                    html_file = output_path / rel_path.with_suffix(".verification.html")
-                    generate_verification_report_html(
-                        vars(result), visualizations, html_file
-                    )
-
-                results[str(rel_path)] = {
-                    "passed": result.passed,
-                    "report": str(report_file),
-                }
-
-                status = "PASSED" if result.passed else "FAILED"
-                print(f"Verification: {status}")
+        workers = _resolve_workers(args.workers)
+        if workers > 1:
+            print(f"Workers: {workers}")
 
-            except Exception as exc:
-                print(f"Error processing {stl_file}: {str(exc)}", file=sys.stderr)
-                results[str(rel_path)] = {
-                    "passed": False,
-                    "error": str(exc),
-                }
+        def _report_progress(completed: int, total: int, key: str) -> None:
+            print(f"[{completed}/{total}] {key}")
 
-        summary = {
-            "total": len(results),
-            "passed": sum(1 for r in results.values() if r.get("passed", False)),
-            "failed": sum(1 for r in results.values() if not r.get("passed", False)),
-            "results": results,
-        }
+        batch_verify(
+            stl_files,
+            output_path,
+            tolerance,
+            sample_seed=args.sample_seed,
+            num_samples=args.samples,
+            adaptive_sampling=_adaptive_sampling_from_args(args),
+            workers=workers,
+            input_root=input_path,
+            conversion_options={
+                "parametric": getattr(args, "parametric", False),
+                "recognition_backend": getattr(args, "recognition_backend", "native"),
+                "compute_backend": getattr(args, "compute_backend", "auto"),
+            },
+            html_report=args.html_report,
+            visual_renderer=getattr(args, "visual_renderer", "openscad"),
+            progress_callback=_report_progress,
+        )
 
-        summary_file = output_path / "batch_summary.json"
-        with open(summary_file, "w", encoding="utf-8") as summary_handle:
-            json.dump(summary, summary_handle, indent=2)
+        # batch_verify rewrites the summary after every file.
+        summary_file = output_path / "verification_summary.json"
+        summary = json.loads(summary_file.read_text(encoding="utf-8"))
+        for key, entry in summary["results"].items():
+            if "error" in entry:
+                print(f"Error processing {key}: {entry['error']}", file=sys.stderr)
+            elif not entry["passed"]:
+                print(f"Verification FAILED: {key}")
 
         print("\nBatch processing complete:")
         print(f"  Total files: {summary['total']}")
         print(f"  Passed: {summary['passed']}")
         print(f"  Failed: {summary['failed']}")
+        if "render_cache" in summary:
+            cache_stats = summary["render_cache"]
+            print(
+                f"  Render cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses"
+            )
         print(f"Summary report saved to: {summary_file}")
 
         return 0 if summary["failed"] == 0 else 2
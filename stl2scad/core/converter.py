@@ -25,6 +25,9 @@ def run_openscad(
 ) -> bool:
     """Execute OpenSCAD command with proper error handling and logging.
 
+    Runs on the shared render pool, so concurrent callers respect one
+    process-wide cap on OpenSCAD processes.
+
     Args:
         description: Description of the command being executed
         args: List of command arguments
@@ -35,48 +38,9 @@ def run_openscad(
     Returns:
         bool: True if command executed successfully, False otherwise
     """
-    logging.info(f"Executing OpenSCAD: {description}")
-    logging.debug(f"Command arguments: {args}")
-    logging.debug(f"Log file path: {log_file}")
-    logging.debug(f"Command timeout: {timeout} seconds")
-    logging.debug(f"OpenSCAD path: {openscad_path or 'default'}")
-
-    try:
-        command = [openscad_path or "openscad"] + args
-        logging.info(f"Executing command: {' '.join(str(c) for c in command)}")
-
-        result = subprocess.run(
-            command, capture_output=True, text=True, timeout=timeout
-        )
-
-        # Always write output to log file so callers (e.g. version check) can read it
-        with open(log_file, "w", encoding="utf-8") as f:
-            if result.stdout:
-                f.write(result.stdout)
-            if result.stderr:
-                f.write(result.stderr)
-
-        if result.stdout:
-            logging.debug(f"Command output: {result.stdout}")
-        if result.stderr:
-            logging.warning(f"Command stderr: {result.stderr}")
-
-        if result.returncode != 0:
-            logging.error(f"Command failed with exit code {result.returncode}.")
-            return False
-
-        logging.info("Command completed successfully")
-        return True
-
-    except subprocess.TimeoutExpired:
-        logging.error(
-            f"Command timed out after {timeout} seconds. This may indicate that OpenSCAD is having trouble processing the file or the system is under heavy load."
-        )
-        return False
-    except Exception as e:
-        logging.error(f"Unexpected error executing OpenSCAD: {str(e)}")
-        logging.debug("Stack trace:", exc_info=True)
-        return False
+    return get_render_pool().run(
+        RenderJob(description, list(args), log_file, openscad_path, timeout)
+    )
 
 
 from . import config
@@ -87,6 +51,7 @@ from .acceleration import (
 )
 from .cgal_backend import detect_primitive_with_cgal
 from .feature_graph import build_feature_graph_for_stl, emit_feature_graph_scad_preview
+from .render_pool import RenderJob, get_render_pool
 from .recognition import (
     detect_primitive_with_diagnostics,
     get_available_recognition_backends,
@@ -824,20 +789,31 @@ def stl2scad(
                 debug_png,
                 debug_scad,
             ]
-            if not run_openscad(
-                "Preview image",
-                preview_args,
-                f"{debug_base}_preview.log",
-                openscad_path,
-            ):
-                success = False
-                logging.warning("Preview image generation failed")
-
             # Generate echo output
             echo_args = ["--backend=Manifold", "--render", "-o", debug_echo, debug_scad]
-            if not run_openscad(
-                "Debug output", echo_args, f"{debug_base}_echo.log", openscad_path
-            ):
+
+            # The preview and echo renders are independent; run them side by
+            # side on the shared render pool.
+            preview_ok, echo_ok = get_render_pool().map(
+                [
+                    RenderJob(
+                        "Preview image",
+                        preview_args,
+                        f"{debug_base}_preview.log",
+                        openscad_path,
+                    ),
+                    RenderJob(
+                        "Debug output",
+                        echo_args,
+                        f"{debug_base}_echo.log",
+                        openscad_path,
+                    ),
+                ]
+            )
+            if not preview_ok:
+                success = False
+                logging.warning("Preview image generation failed")
+            if not echo_ok:
                 success = False
                 logging.warning("Debug output generation failed")
 
@@ -0,0 +1,212 @@
+"""
+Detector dispatch traces and per-detector code fingerprints.
+
+Every detector stage that ``build_feature_graph_for_mesh_arrays`` dispatches to
+is registered with ``@traced_detector``. While ``recording_dispatch()`` is
+active, each stage call is logged with the feature types it returned, so a
+graph records exactly which detectors produced it.
+
+``detector_fingerprints()`` hashes each stage's source together with every
+module-level helper and constant it reaches (stopping at other stages, which
+are traced on their own), and ``code_fingerprint()`` does the same for the
+shared dispatch code. Because the detector is deterministic, a file whose STL,
+config, shared code and traced detectors are all unchanged produces the same
+graph again, which is what incremental corpus scoring relies on.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import sys
+import types
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+_DETECTORS: dict[str, Callable[..., Any]] = {}
+
+_active_trace: ContextVar[Optional[list[dict[str, Any]]]] = ContextVar(
+    "stl2scad_dispatch_trace", default=None
+)
+
+# Modules that register detector stages on import.
+_DETECTOR_MODULES = (
+    "stl2scad.core.feature_graph",
+    "stl2scad.core.revolve_recovery",
+    "stl2scad.core.linear_extrude_recovery",
+)
+
+
+def traced_detector(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Register a detector stage under *name* and log its calls when tracing."""
+
+    def decorate(func: Callable[..., Any]) -> Callable[..., Any]:
+        if name in _DETECTORS:
+            raise ValueError(f"Detector stage already registered: {name}")
+        _DETECTORS[name] = func
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            features = func(*args, **kwargs)
+            trace = _active_trace.get()
+            if trace is not None:
+                trace.append(
+                    {
+                        "detector": name,
+                        "feature_types": [
+                            str(feature.get("type", "")) for feature in features or []
+                        ],
+                    }
+                )
+            return features
+
+        return wrapper
+
+    return decorate
+
+
+@contextmanager
+def recording_dispatch() -> Iterator[list[dict[str, Any]]]:
+    """Collect every traced detector call made in this context, in call order."""
+    trace: list[dict[str, Any]] = []
+    token = _active_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _active_trace.reset(token)
+
+
+def traced_detector_names(trace: Iterable[dict[str, Any]]) -> list[str]:
+    """Return the sorted, de-duplicated detector names in a dispatch trace."""
+    return sorted({str(step["detector"]) for step in trace})
+
+
+@functools.lru_cache(maxsize=None)
+def detector_fingerprints() -> dict[str, str]:
+    """Return ``{detector name: digest of its code closure}`` for every stage."""
+    _import_detector_modules()
+    stages = {inspect.unwrap(func) for func in _DETECTORS.values()}
+    return {
+        name: _closure_digest([func], stop=stages - {inspect.unwrap(func)})
+        for name, func in sorted(_DETECTORS.items())
+    }
+
+
+def code_fingerprint(roots: Iterable[Callable[..., Any]]) -> str:
+    """Digest *roots* and the helpers they reach, excluding detector stages."""
+    from stl2scad import __version__
+
+    _import_detector_modules()
+    stages = {inspect.unwrap(func) for func in _DETECTORS.values()}
+    return f"{__version__}:{_closure_digest(list(roots), stop=stages)}"
+
+
+def _import_detector_modules() -> None:
+    import importlib
+
+    for module in _DETECTOR_MODULES:
+        importlib.import_module(module)
+
+
+def _closure_digest(
+    roots: list[Callable[..., Any]],
+    stop: set[Callable[..., Any]],
+) -> str:
+    """Hash the source of *roots* plus every stl2scad global they reference."""
+    parts: dict[str, str] = {}
+    pending = [inspect.unwrap(root) for root in roots]
+    while pending:
+        func = pending.pop()
+        key = f"{func.__module__}.{func.__qualname__}"
+        if key in parts:
+            continue
+        try:
+            parts[key] = inspect.getsource(func)
+        except (OSError, TypeError):
+            parts[key] = key
+        if not isinstance(func, types.FunctionType):
+            continue
+        namespaces = [func.__globals__]
+        names: set[str] = set()
+        for code in _iter_code(func.__code__):
+            names.update(code.co_names)
+        # Function-local ``from stl2scad.x import y`` puts the module path in
+        # co_names; resolve names against those modules as well.
+        namespaces.extend(
+            vars(sys.modules[name])
+            for name in sorted(names)
+            if name.startswith("stl2scad.") and name in sys.modules
+        )
+        for name in sorted(names):
+            value = next((ns[name] for ns in namespaces if name in ns), None)
+            if value is None or isinstance(value, types.ModuleType):
+                continue
+            if callable(value):
+                referenced = [value]
+            elif _is_constant(value):
+                parts[f"{func.__module__}.{name}"] = _stable_repr(value)
+                # Dispatch tables hold functions whose code matters too.
+                referenced = list(_nested_callables(value))
+            else:
+                continue
+            for target in referenced:
+                target = inspect.unwrap(target)
+                if _is_project_object(target) and target not in stop:
+                    pending.append(target)
+    digest = hashlib.sha256()
+    for key in sorted(parts):
+        digest.update(key.encode("utf-8"))
+        digest.update(parts[key].encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def _iter_code(code: types.CodeType) -> Iterator[types.CodeType]:
+    yield code
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            yield from _iter_code(const)
+
+
+def _is_project_object(value: Any) -> bool:
+    return str(getattr(value, "__module__", "") or "").startswith("stl2scad")
+
+
+def _is_constant(value: Any) -> bool:
+    return isinstance(
+        value, (bool, int, float, str, bytes, tuple, list, dict, set, frozenset)
+    )
+
+
+def _nested_callables(value: Any) -> Iterator[Callable[..., Any]]:
+    if callable(value):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _nested_callables(item)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            yield from _nested_callables(item)
+
+
+def _stable_repr(value: Any) -> str:
+    # Function reprs embed memory addresses.
+    if callable(value):
+        return (
+            f"{getattr(value, '__module__', '')}.{getattr(value, '__qualname__', '')}"
+        )
+    # Set iteration order depends on string hash randomization.
+    if isinstance(value, (set, frozenset)):
+        return "{" + ", ".join(sorted(_stable_repr(item) for item in value)) + "}"
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(_stable_repr(item) for item in value) + "]"
+    if isinstance(value, dict):
+        return (
+            "{"
+            + ", ".join(
+                f"{_stable_repr(k)}: {_stable_repr(v)}" for k, v in value.items()
+            )
+            + "}"
+        )
+    return repr(value)
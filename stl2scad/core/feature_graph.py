@@ -8,6 +8,7 @@ feature candidates without committing to SCAD generation yet.
 from __future__ import annotations
 
 from concurrent.futures import ThreadPoolExecutor, as_completed
+import contextlib
 from datetime import datetime, timezone
 import json
 import math
@@ -28,7 +29,9 @@ COMPOSITE_COMPONENT_MAX_COUNT = 6
 COMPOSITE_CONTAINMENT_THRESHOLD = 0.50
 
 
+from stl2scad.core.dispatch_trace import recording_dispatch, traced_detector
 from stl2scad.tuning.config import DetectorConfig
+from stl2scad.tuning.decisions import gate, recording_decisions, threshold_value
 from stl2scad.core.linear_extrude_recovery import detect_linear_extrude_solid
 
 
@@ -427,12 +430,19 @@ def build_feature_graph_for_stl(
     boundary_tolerance_ratio: Optional[float] = None,
     config: Optional[DetectorConfig] = None,
     inventory_context: Optional[dict[str, Any]] = None,
+    record_decisions: bool = False,
+    record_dispatch: bool = False,
 ) -> dict[str, Any]:
     """
     Build a conservative feature graph for one STL file.
 
     config overrides defaults; the legacy kwargs override config fields when
-    provided, preserving every existing call site.
+    provided, preserving every existing call site. With ``record_decisions``
+    the graph gains a ``threshold_decisions`` list holding every replayable
+    threshold comparison (see ``stl2scad.tuning.decisions``). With
+    ``record_dispatch`` it gains a ``dispatch_trace`` list of the detector
+    stages that ran and the feature types each returned (see
+    ``stl2scad.core.dispatch_trace``).
     """
     resolved = config or DetectorConfig()
     if normal_axis_threshold is not None or boundary_tolerance_ratio is not None:
@@ -444,11 +454,99 @@ def build_feature_graph_for_stl(
             overrides["boundary_tolerance_ratio"] = boundary_tolerance_ratio
         resolved = dataclasses.replace(resolved, **overrides)
     path = Path(stl_file)
-    mesh = Mesh.from_file(str(path))
+    vectors, normals, face_areas = load_mesh_arrays(path)
+    return build_feature_graph_for_mesh_arrays(
+        path,
+        vectors,
+        normals,
+        face_areas,
+        root_dir=root_dir,
+        config=resolved,
+        inventory_context=inventory_context,
+        record_decisions=record_decisions,
+        record_dispatch=record_dispatch,
+    )
+
+
+def load_mesh_arrays(
+    stl_file: Union[Path, str],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Parse an STL into the ``(vectors, normals, face_areas)`` arrays the
+    feature-graph builders consume.
+    """
+    mesh = Mesh.from_file(str(stl_file))
     vectors = np.asarray(mesh.vectors, dtype=np.float64)
-    points = vectors.reshape(-1, 3)
     normals = _normalized_normals(np.asarray(mesh.normals, dtype=np.float64))
     face_areas = _triangle_areas(vectors)
+    return vectors, normals, face_areas
+
+
+def weld_mesh_vertices(vectors: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Deduplicate the per-triangle vertex soup into a vertex + index table.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: unique vertices rounded to 1e-6 and the
+        (n, 3) int64 triangle indices into them
+    """
+    rounded = np.round(vectors.reshape(-1, 3), decimals=6)
+    unique_verts, inverse = np.unique(rounded, axis=0, return_inverse=True)
+    return unique_verts, inverse.reshape(-1, 3).astype(np.int64)
+
+
+def build_feature_graph_for_mesh_arrays(
+    stl_file: Union[Path, str],
+    vectors: np.ndarray,
+    normals: np.ndarray,
+    face_areas: np.ndarray,
+    root_dir: Optional[Union[Path, str]] = None,
+    config: Optional[DetectorConfig] = None,
+    inventory_context: Optional[dict[str, Any]] = None,
+    welded: Optional[tuple[np.ndarray, np.ndarray]] = None,
+    record_decisions: bool = False,
+    record_dispatch: bool = False,
+) -> dict[str, Any]:
+    """
+    Build a feature graph from already-parsed mesh arrays.
+
+    ``vectors`` is the float64 (n, 3, 3) triangle array, ``normals`` the unit
+    face normals and ``face_areas`` the per-triangle areas, exactly as
+    ``build_feature_graph_for_stl`` derives them from the file. ``welded``
+    optionally supplies ``weld_mesh_vertices(vectors)`` so callers that graph
+    the same mesh under many configs weld it once. ``stl_file`` is only used
+    for the ``source_file`` field. ``record_decisions`` and
+    ``record_dispatch`` behave as in ``build_feature_graph_for_stl``.
+    """
+    if record_decisions or record_dispatch:
+        with contextlib.ExitStack() as stack:
+            decisions = (
+                stack.enter_context(recording_decisions()) if record_decisions else None
+            )
+            dispatch = (
+                stack.enter_context(recording_dispatch()) if record_dispatch else None
+            )
+            recorded = build_feature_graph_for_mesh_arrays(
+                stl_file,
+                vectors,
+                normals,
+                face_areas,
+                root_dir=root_dir,
+                config=config,
+                inventory_context=inventory_context,
+                welded=welded,
+            )
+        if decisions is not None:
+            recorded["threshold_decisions"] = [
+                d.as_dict() for d in dict.fromkeys(decisions)
+            ]
+        if dispatch is not None:
+            recorded["dispatch_trace"] = dispatch
+        return recorded
+
+    resolved = config or DetectorConfig()
+    path = Path(stl_file)
+    points = vectors.reshape(-1, 3)
     bbox = _bbox(points)
     box_features = _extract_axis_aligned_box_features(
         vectors,
@@ -462,12 +560,9 @@ def build_feature_graph_for_stl(
     # Deduplicate the per-triangle vertex soup into a clean vertex + index table
     # so that revolve_recovery's covariance and profile computations are not
     # skewed by the repeated vertices present in the raw STL format.
-    _rounded = np.round(points, decimals=6)
-    _, _inv, _counts = np.unique(
-        _rounded, axis=0, return_inverse=True, return_counts=True
+    unique_verts, triangles_indices = (
+        welded if welded is not None else weld_mesh_vertices(vectors)
     )
-    unique_verts, _inv_idx = np.unique(_rounded, axis=0, return_inverse=True)
-    triangles_indices = _inv_idx.reshape(-1, 3).astype(np.int64)
     revolve_features = detect_revolve_solid(unique_verts, triangles_indices, config=resolved)
     if revolve_features:
         plane_pairs = [f for f in box_features if f.get("type") == "axis_boundary_plane_pair"]
@@ -1988,6 +2083,7 @@ def _select_component_prismatic_solid(
     return best if _passes_preview_solid_confidence(best.get("confidence")) else None
 
 
+@traced_detector("composite_planar_prismatic_solids")
 def _extract_composite_planar_prismatic_solids(
     vectors: np.ndarray,
     normals: np.ndarray,
@@ -2052,9 +2148,54 @@ def _matrix_to_euler_xyz(R: np.ndarray) -> list[float]:
         z = 0
     return [math.degrees(x), math.degrees(y), math.degrees(z)]
 
+
+def _akl_toussaint_filter(points: np.ndarray) -> np.ndarray:
+    """Drop points strictly inside the octagon of the 8 directional extremes.
+
+    The octagon's corners are hull vertices listed in counter-clockwise
+    order, so anything strictly inside it can never be on the convex hull.
+    """
+    if len(points) < 16:
+        return points
+    x = points[:, 0]
+    y = points[:, 1]
+    corner_indices = [
+        int(np.argmin(x)),
+        int(np.argmin(x + y)),
+        int(np.argmin(y)),
+        int(np.argmax(x - y)),
+        int(np.argmax(x)),
+        int(np.argmax(x + y)),
+        int(np.argmax(y)),
+        int(np.argmin(x - y)),
+    ]
+    corners: list[np.ndarray] = []
+    for index in corner_indices:
+        corner = points[index]
+        if not corners or not np.array_equal(corners[-1], corner):
+            corners.append(corner)
+    if len(corners) > 1 and np.array_equal(corners[0], corners[-1]):
+        corners.pop()
+    if len(corners) < 3:
+        return points
+
+    scale = float(np.max(np.ptp(points, axis=0)))
+    eps = 1e-12 * max(scale * scale, 1e-12)
+    inside = np.ones(len(points), dtype=bool)
+    for index, start in enumerate(corners):
+        edge = corners[(index + 1) % len(corners)] - start
+        cross = edge[0] * (y - start[1]) - edge[1] * (x - start[0])
+        inside &= cross > eps
+    return points[~inside]
+
+
 def _convex_hull_2d(points: np.ndarray) -> np.ndarray:
-    """Computes the convex hull of a set of 2D points using Monotone Chain."""
-    pts = np.unique(points, axis=0)
+    """Computes the convex hull of a set of 2D points using Monotone Chain.
+
+    An Akl-Toussaint prefilter discards interior points in NumPy first, so
+    the sort and the chain only see the few points near the boundary.
+    """
+    pts = np.unique(_akl_toussaint_filter(np.asarray(points, dtype=np.float64)), axis=0)
     pts = pts[np.lexsort((pts[:, 1], pts[:, 0]))]
     if len(pts) <= 2:
         return pts
@@ -2079,24 +2220,61 @@ def _convex_hull_2d(points: np.ndarray) -> np.ndarray:
 def _min_area_rect_2d(points: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
     """Find the minimum area bounding rectangle for a set of 2D points.
     Returns (u_axis, v_axis) that minimize the bounding box area.
+
+    Rotating calipers: the hull is counter-clockwise, so the extreme points
+    along u, -u and the inward normal v only ever advance as the edge index
+    does, giving O(h) over all hull edges.
     """
     hull = _convex_hull_2d(points)
     if len(hull) < 3:
         return np.array([1.0, 0.0]), np.array([0.0, 1.0])
 
+    count = len(hull)
+    edges = np.roll(hull, -1, axis=0) - hull
+    lengths = np.linalg.norm(edges, axis=1)
+    areas = np.full(count, np.inf)
+    far_u = far_v = near_u = -1
+
+    def advance(pointer: int, direction: np.ndarray) -> int:
+        for _ in range(count):
+            following = (pointer + 1) % count
+            if float(hull[following] @ direction) > float(hull[pointer] @ direction):
+                pointer = following
+            else:
+                break
+        return pointer
+
+    for i in range(count):
+        if lengths[i] < 1e-9:
+            continue
+        u = edges[i] / lengths[i]
+        v = np.array([-u[1], u[0]])
+        if far_u < 0:
+            far_u = int(np.argmax(hull @ u))
+            far_v = int(np.argmax(hull @ v))
+            near_u = int(np.argmin(hull @ u))
+        else:
+            far_u = advance(far_u, u)
+            far_v = advance(far_v, v)
+            near_u = advance(near_u, -u)
+        span_u = float(hull[far_u] @ u) - float(hull[near_u] @ u)
+        span_v = float(hull[far_v] @ v) - float(hull[i] @ v)
+        areas[i] = span_u * span_v
+
+    finite = np.isfinite(areas)
+    if not np.any(finite):
+        return np.array([1.0, 0.0]), np.array([0.0, 1.0])
+
+    # Re-score near-ties with full projections so that rounding differences
+    # between the caliper spans and a direct projection never change which
+    # edge wins (the first strictly smallest one, in hull order).
+    threshold = float(np.min(areas[finite])) * (1.0 + 1e-9) + 1e-12
     min_area = float('inf')
     best_u = np.array([1.0, 0.0])
-    
-    for i in range(len(hull)):
-        p1 = hull[i]
-        p2 = hull[(i + 1) % len(hull)]
-        edge = p2 - p1
-        length = np.linalg.norm(edge)
-        if length < 1e-9:
-            continue
-        u = edge / length
+    for i in np.flatnonzero(areas <= threshold).tolist():
+        edge = hull[(i + 1) % count] - hull[i]
+        u = edge / np.linalg.norm(edge)
         v = np.array([-u[1], u[0]])
-        
         proj_u = hull @ u
         proj_v = hull @ v
         span_u = np.max(proj_u) - np.min(proj_u)
@@ -2110,6 +2288,7 @@ def _min_area_rect_2d(points: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
     return best_u, best_v
 
 
+@traced_detector("rotated_plate_solid")
 def _extract_rotated_plate_solid(
     normals: np.ndarray,
     face_areas: np.ndarray,
@@ -2146,7 +2325,7 @@ def _extract_rotated_plate_solid(
         return []
 
     confidence = (pos_area + neg_area) / total_area
-    if confidence < config.plate_confidence_min:
+    if gate(config, "plate_confidence_min", "<", confidence):
         return []
 
     # Plate thickness: vertex projection range along dominant_axis.
@@ -2228,6 +2407,7 @@ def _extract_rotated_plate_solid(
     ]
 
 
+@traced_detector("rotated_box_solid")
 def _extract_rotated_box_solid(
     normals: np.ndarray,
     face_areas: np.ndarray,
@@ -2283,7 +2463,7 @@ def _extract_rotated_box_solid(
         covered_area += pair_area
 
     confidence = float(min(1.0, covered_area / total_area))
-    if confidence < config.box_confidence_min:
+    if gate(config, "box_confidence_min", "<", confidence):
         return []
 
     all_verts = vertices.reshape(-1, 3)
@@ -2346,6 +2526,7 @@ def _extract_rotated_box_solid(
     ]
 
 
+@traced_detector("cylinder_like_solid")
 def _extract_cylinder_like_solid(
     normals: np.ndarray,
     face_areas: np.ndarray,
@@ -2463,7 +2644,7 @@ def _extract_cylinder_like_solid(
         fill_score = max(0.0, 1.0 - abs(cap_fill_ratio - ideal_fill) / ideal_fill)
         confidence = float(fill_score * squareness)
 
-        if confidence < config.cylinder_confidence_min:
+        if gate(config, "cylinder_confidence_min", "<", confidence):
             continue
 
         if confidence > best_confidence:
@@ -2496,6 +2677,7 @@ def _extract_cylinder_like_solid(
     return [best] if best is not None else []
 
 
+@traced_detector("axis_aligned_box_features")
 def _extract_axis_aligned_box_features(
     vectors: np.ndarray,
     normals: np.ndarray,
@@ -2590,12 +2772,12 @@ def _extract_axis_aligned_box_features(
 
     features: list[dict[str, Any]] = plane_features
     if (
-        paired_axes >= config.plate_paired_axes_min and confidence >= config.plate_confidence_min and thin_ratio <= config.plate_thin_ratio_max
-    ) or tolerant_plate_confidence >= config.plate_tolerant_confidence_min:
+        paired_axes >= config.plate_paired_axes_min and gate(config, "plate_confidence_min", ">=", confidence) and thin_ratio <= config.plate_thin_ratio_max
+    ) or gate(config, "plate_tolerant_confidence_min", ">=", tolerant_plate_confidence):
         plate_confidence = max(confidence, tolerant_plate_confidence)
         strict_plate_passes = (
             paired_axes >= config.plate_paired_axes_min
-            and confidence >= config.plate_confidence_min
+            and gate(config, "plate_confidence_min", ">=", confidence)
             and thin_ratio <= config.plate_thin_ratio_max
         )
         via_tolerant = not strict_plate_passes
@@ -2636,11 +2818,11 @@ def _extract_axis_aligned_box_features(
         )
         if via_tolerant:
             features[-1]["edge_treatment"] = edge_treatment
-    elif (paired_axes == config.box_paired_axes_required and confidence >= config.box_confidence_min) or tolerant_box_confidence >= config.box_tolerant_confidence_min:
+    elif (paired_axes == config.box_paired_axes_required and gate(config, "box_confidence_min", ">=", confidence)) or gate(config, "box_tolerant_confidence_min", ">=", tolerant_box_confidence):
         box_confidence = max(confidence, tolerant_box_confidence)
         strict_box_passes = (
             paired_axes == config.box_paired_axes_required
-            and confidence >= config.box_confidence_min
+            and gate(config, "box_confidence_min", ">=", confidence)
         )
         via_tolerant_box = not strict_box_passes
         box_edge_treatment: dict[str, Any] = {}
@@ -2774,11 +2956,11 @@ def _tolerant_plate_confidence(
         float(positive_projection["fill_ratio"]),
     )
 
-    if paired_support_ratio < config.tolerant_plate_paired_support_min:
+    if gate(config, "tolerant_plate_paired_support_min", "<", paired_support_ratio):
         return 0.0
     if min_span_ratio < config.tolerant_plate_min_span_ratio or footprint_area_ratio < config.tolerant_plate_footprint_area_ratio:
         return 0.0
-    if footprint_fill_ratio < config.tolerant_plate_footprint_fill_ratio:
+    if gate(config, "tolerant_plate_footprint_fill_ratio", "<", footprint_fill_ratio):
         return 0.0
 
     return min(1.0, 0.6 * paired_support_ratio + 0.4 * footprint_area_ratio)
@@ -2839,7 +3021,7 @@ def _tolerant_box_confidence(
             return 0.0
         if footprint_fill_ratio < config.tolerant_box_relaxed_fill_ratio:
             return 0.0
-        if footprint_fill_ratio >= config.tolerant_box_footprint_fill_ratio:
+        if gate(config, "tolerant_box_footprint_fill_ratio", ">=", footprint_fill_ratio):
             full_fill_axes += 1
 
         axis_confidences.append(
@@ -3183,6 +3365,7 @@ def _counterbore_bore_module_body(
     return ["  // unsupported hole axis"]
 
 
+@traced_detector("axis_aligned_through_holes")
 def _extract_axis_aligned_through_holes(
     vectors: np.ndarray,
     normals: np.ndarray,
@@ -3299,8 +3482,8 @@ def _extract_axis_aligned_through_holes(
                 if (
                     height_span >= cutout_depth * config.hole_height_span_ratio_min
                     and min_radius <= radius <= max_radius
-                    and radial_error_ratio <= config.hole_radial_error_max
-                    and angular_coverage >= config.hole_angular_coverage_min
+                    and gate(config, "hole_radial_error_max", "<=", radial_error_ratio)
+                    and gate(config, "hole_angular_coverage_min", ">=", angular_coverage)
                     and not _center_near_outer_boundary(center_2d, bbox, plane_axes, radius, config=config)
                 ):
                     center = [0.0, 0.0, 0.0]
@@ -3309,7 +3492,7 @@ def _extract_axis_aligned_through_holes(
                     center[cutout_axis_index] = (span_min + span_max) * 0.5
                     confidence = max(
                         0.0,
-                        min(1.0, (1.0 - radial_error_ratio / config.hole_radial_error_max) * angular_coverage),
+                        min(1.0, (1.0 - radial_error_ratio / threshold_value(config, "hole_radial_error_max")) * angular_coverage),
                     )
                     features.append(
                         {
@@ -3459,6 +3642,7 @@ def _extract_axis_aligned_through_holes(
 
 
 
+@traced_detector("rotated_plate_through_holes")
 def _extract_rotated_plate_through_holes(
     vectors: np.ndarray,
     normals: np.ndarray,
@@ -3623,6 +3807,7 @@ def _extract_rotated_plate_through_holes(
     return features
 
 
+@traced_detector("rotated_box_through_holes")
 def _extract_rotated_box_through_holes(
     vectors: np.ndarray,
     normals: np.ndarray,
@@ -3805,6 +3990,7 @@ def _candidate_cutout_axes(
     return candidates
 
 
+@traced_detector("repeated_hole_patterns")
 def _extract_repeated_hole_patterns(
     features: list[dict[str, Any]],
     config: DetectorConfig,
@@ -3844,23 +4030,296 @@ def _extract_repeated_hole_patterns(
             if len(group) >= config.grid_pattern_min_holes and min(unique_counts) >= 2
             else "linear_hole_pattern"
         )
+        diameter = float(diameter_key * config.pattern_diameter_rounding_mm)
         pattern = {
             "type": pattern_type,
             "confidence": float(min(float(hole["confidence"]) for hole in group)),
             "axis": axis,
             "hole_count": int(len(group)),
-            "diameter": float(diameter_key * config.pattern_diameter_rounding_mm),
+            "diameter": diameter,
             "centers": [[float(value) for value in hole["center"]] for hole in group],
             "note": "Candidate repeated hole pattern for future SCAD loop emission.",
         }
         if pattern_type == "linear_hole_pattern":
-            pattern.update(_linear_hole_pattern_metadata(centers, varying_axes, config=config))
+            metadata = _linear_hole_pattern_metadata(centers, varying_axes, config=config)
+        else:
+            metadata = _grid_hole_pattern_metadata(centers, axis, varying_axes, config=config)
+        if not metadata and len(group) >= config.grid_pattern_min_holes:
+            # Row/column rounding cannot describe noisy, oblique or interleaved
+            # layouts; fall back to the lattice finder and emit one pattern
+            # per recovered lattice. Unclaimed holes stay standalone cutouts.
+            lattice_patterns = _lattice_hole_patterns(
+                group, centers, axis, varying_axes, diameter, config=config
+            )
+            if lattice_patterns:
+                patterns.extend(lattice_patterns)
+                continue
+        pattern.update(metadata)
+        patterns.append(pattern)
+    return patterns
+
+
+def _lattice_hole_patterns(
+    group: list[dict[str, Any]],
+    centers: np.ndarray,
+    axis: str,
+    varying_axes: list[int],
+    diameter: float,
+    config: DetectorConfig,
+) -> list[dict[str, Any]]:
+    axis_index = {"x": 0, "y": 1, "z": 2}[axis]
+    labels = ("x", "y", "z")
+    patterns: list[dict[str, Any]] = []
+    for lattice in _find_hole_lattices(centers[:, varying_axes], config=config):
+        members = lattice["members"]
+        member_centers = centers[members]
+        pattern: dict[str, Any] = {
+            "confidence": float(min(float(group[index]["confidence"]) for index in members)),
+            "axis": axis,
+            "hole_count": int(len(members)),
+            "diameter": diameter,
+            "centers": [[float(value) for value in center] for center in member_centers],
+            "detected_via": "lattice",
+            "note": "Candidate repeated hole pattern recovered by the hole-lattice finder.",
+        }
+        if lattice["rows"] >= 2 and lattice["cols"] >= 2:
+            origin = np.zeros(3, dtype=np.float64)
+            row_step = np.zeros(3, dtype=np.float64)
+            col_step = np.zeros(3, dtype=np.float64)
+            origin[varying_axes] = lattice["origin"]
+            origin[axis_index] = float(np.mean(member_centers[:, axis_index]))
+            row_step[varying_axes] = lattice["row_step"]
+            col_step[varying_axes] = lattice["col_step"]
+            pattern.update(
+                {
+                    "type": "grid_hole_pattern",
+                    "grid_origin": [float(value) for value in origin],
+                    "grid_row_step": [float(value) for value in row_step],
+                    "grid_col_step": [float(value) for value in col_step],
+                    "grid_rows": int(lattice["rows"]),
+                    "grid_cols": int(lattice["cols"]),
+                    "grid_row_spacing": float(np.linalg.norm(row_step)),
+                    "grid_col_spacing": float(np.linalg.norm(col_step)),
+                    "grid_row_axis": labels[int(np.argmax(np.abs(row_step)))],
+                    "grid_col_axis": labels[int(np.argmax(np.abs(col_step)))],
+                    "regularity_error": float(lattice["regularity_error"]),
+                }
+            )
         else:
-            pattern.update(_grid_hole_pattern_metadata(centers, axis, varying_axes, config=config))
+            metadata = _linear_hole_pattern_metadata(
+                member_centers, varying_axes, config=config
+            )
+            if not metadata:
+                continue
+            pattern["type"] = "linear_hole_pattern"
+            pattern.update(metadata)
         patterns.append(pattern)
     return patterns
 
 
+def _find_hole_lattices(
+    points: np.ndarray,
+    config: DetectorConfig,
+) -> list[dict[str, Any]]:
+    """Partition 2D hole centers into complete rows x cols lattices.
+
+    Candidate basis vectors come from a histogram of spatial-hash neighbour
+    offsets; each candidate basis splits the centers into lattice cosets
+    (interleaved grids) and the basis whose complete cosets claim the most
+    holes wins. Returns one dict per complete lattice with at least two holes.
+    """
+    candidates = _hole_offset_basis_candidates(points, config=config)
+    if not candidates:
+        return []
+
+    bases: list[np.ndarray] = []
+    for first_index, first in enumerate(candidates):
+        for second in candidates[first_index + 1:]:
+            cross = abs(float(first[0] * second[1] - first[1] * second[0]))
+            if cross > 0.25 * float(np.linalg.norm(first) * np.linalg.norm(second)):
+                bases.append(_normalize_lattice_basis(first, second))
+    if not bases:
+        # Collinear holes: pair the shortest offset with its perpendicular so
+        # every off-line hole lands in its own (rejected) coset.
+        shortest = candidates[0]
+        bases.append(
+            _normalize_lattice_basis(shortest, np.array([-shortest[1], shortest[0]]))
+        )
+
+    best: list[dict[str, Any]] = []
+    best_key: Optional[tuple[int, int, float]] = None
+    for basis in bases:
+        lattices = _complete_hole_lattices(points, basis, config=config)
+        covered = sum(len(lattice["members"]) for lattice in lattices)
+        key = (covered, -len(lattices), -abs(float(np.linalg.det(basis))))
+        if covered > 0 and (best_key is None or key > best_key):
+            best, best_key = lattices, key
+    return best
+
+
+def _hole_offset_basis_candidates(
+    points: np.ndarray,
+    config: DetectorConfig,
+) -> list[np.ndarray]:
+    """Return the most frequent near-neighbour offsets, shortest first on ties."""
+    count = len(points)
+    if count < 2:
+        return []
+    mins = np.min(points, axis=0)
+    spans = np.ptp(points, axis=0)
+    area = float(spans[0] * spans[1])
+    cell = max(
+        math.sqrt(area / count) if area > 1e-12 else 0.0,
+        float(np.max(spans)) / float(count - 1),
+        1e-9,
+    )
+
+    # Spatial hash: sort cell keys once, then gather every pair in a 5x5 cell
+    # neighbourhood with vectorized range expansion over searchsorted bounds.
+    cells = np.floor((points - mins) / cell).astype(np.int64) + 2
+    stride = int(np.max(cells[:, 0])) + 3
+    keys = cells[:, 1] * stride + cells[:, 0]
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    point_ids = np.arange(count)
+    sources: list[np.ndarray] = []
+    targets: list[np.ndarray] = []
+    for dy in range(-2, 3):
+        for dx in range(-2, 3):
+            neighbour_keys = keys + dy * stride + dx
+            lo = np.searchsorted(sorted_keys, neighbour_keys, side="left")
+            hi = np.searchsorted(sorted_keys, neighbour_keys, side="right")
+            run_lengths = hi - lo
+            total = int(np.sum(run_lengths))
+            if total == 0:
+                continue
+            run_starts = np.repeat(np.cumsum(run_lengths) - run_lengths, run_lengths)
+            src = np.repeat(point_ids, run_lengths)
+            dst = order[np.repeat(lo, run_lengths) + (np.arange(total) - run_starts)]
+            keep = dst > src
+            sources.append(src[keep])
+            targets.append(dst[keep])
+    if not sources:
+        return []
+    src = np.concatenate(sources)
+    dst = np.concatenate(targets)
+    if len(src) == 0:
+        return []
+
+    # Fold +v/-v into one half-plane; the dead band keeps noisy near-vertical
+    # offsets from splitting across two bins.
+    offsets = points[dst] - points[src]
+    bin_size = cell * config.lattice_offset_bin_ratio
+    dead_band = bin_size * 0.5
+    flip = (offsets[:, 0] < -dead_band) | (
+        (np.abs(offsets[:, 0]) <= dead_band) & (offsets[:, 1] < 0.0)
+    )
+    offsets[flip] *= -1.0
+    bins, inverse, counts = np.unique(
+        np.round(offsets / bin_size).astype(np.int64),
+        axis=0,
+        return_inverse=True,
+        return_counts=True,
+    )
+    inverse = inverse.reshape(-1)
+    lengths = np.linalg.norm(bins.astype(np.float64), axis=1)
+    ranked = np.lexsort((lengths, -counts))[: max(int(config.lattice_basis_candidates), 1)]
+    candidates: list[np.ndarray] = []
+    for bin_index in ranked:
+        if lengths[bin_index] <= 0.0:
+            continue
+        candidates.append(np.mean(offsets[inverse == bin_index], axis=0))
+    return candidates
+
+
+def _normalize_lattice_basis(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """Return a 2x2 basis with columns (col_step, row_step).
+
+    The column step is the vector most aligned with the first varying axis,
+    and both vectors point along the positive direction of their dominant
+    component so lattice origins land on the minimum corner.
+    """
+    vectors = [np.asarray(first, dtype=np.float64), np.asarray(second, dtype=np.float64)]
+    alignment = [abs(float(v[0])) / max(float(np.linalg.norm(v)), 1e-12) for v in vectors]
+    if alignment[1] > alignment[0]:
+        vectors.reverse()
+    for index, vector in enumerate(vectors):
+        if vector[int(np.argmax(np.abs(vector)))] < 0.0:
+            vectors[index] = -vector
+    return np.column_stack(vectors)
+
+
+def _complete_hole_lattices(
+    points: np.ndarray,
+    basis: np.ndarray,
+    config: DetectorConfig,
+) -> list[dict[str, Any]]:
+    try:
+        inverse = np.linalg.inv(basis)
+    except np.linalg.LinAlgError:
+        return []
+    tolerance = config.pattern_regularity_error_max
+    unassigned = np.ones(len(points), dtype=bool)
+    lattices: list[dict[str, Any]] = []
+    for _ in range(max(int(config.lattice_max_cosets), 1)):
+        if not np.any(unassigned):
+            break
+        seed = int(np.flatnonzero(unassigned)[0])
+        fractional = (points - points[seed]) @ inverse.T
+        indices = np.round(fractional)
+        members = unassigned & np.all(np.abs(fractional - indices) <= tolerance, axis=1)
+        unassigned &= ~members
+        member_ids = np.flatnonzero(members)
+        if len(member_ids) < 2:
+            continue
+        lattice = _fit_complete_lattice(
+            points[member_ids], indices[member_ids].astype(np.int64), config=config
+        )
+        if lattice is not None:
+            lattice["members"] = member_ids
+            lattices.append(lattice)
+    return lattices
+
+
+def _fit_complete_lattice(
+    points: np.ndarray,
+    indices: np.ndarray,
+    config: DetectorConfig,
+) -> Optional[dict[str, Any]]:
+    indices = indices - np.min(indices, axis=0)
+    cols = int(np.max(indices[:, 0])) + 1
+    rows = int(np.max(indices[:, 1])) + 1
+    flat = indices[:, 1] * cols + indices[:, 0]
+    if len(np.unique(flat)) != len(points) or rows * cols != len(points):
+        return None
+
+    # Least-squares refine origin and both steps over every member so the
+    # emitted loop does not inherit the drift of the histogram estimate.
+    design = np.column_stack((np.ones(len(points)), indices.astype(np.float64)))
+    solution, *_ = np.linalg.lstsq(design, points, rcond=None)
+    origin, col_step, row_step = solution[0], solution[1], solution[2]
+    if cols < 2:
+        col_step = np.zeros(2, dtype=np.float64)
+    if rows < 2:
+        row_step = np.zeros(2, dtype=np.float64)
+    spacings = [
+        float(np.linalg.norm(step)) for step in (col_step, row_step) if np.any(step)
+    ]
+    min_spacing = max(min(spacings), 1e-9) if spacings else 1e-9
+    residuals = points - design @ np.vstack((origin, col_step, row_step))
+    regularity_error = float(np.max(np.linalg.norm(residuals, axis=1)) / min_spacing)
+    if regularity_error > config.pattern_regularity_error_max:
+        return None
+    return {
+        "origin": origin,
+        "col_step": col_step,
+        "row_step": row_step,
+        "cols": cols,
+        "rows": rows,
+        "regularity_error": regularity_error,
+    }
+
+
 def _linear_hole_pattern_metadata(
     centers: np.ndarray,
     varying_axes: list[int],
@@ -3990,16 +4449,28 @@ def _try_counterbore_fit(
     if h_span < height_span * config.cbore_height_span_floor_ratio:
         return None
 
+    plane_points = component_vertices[:, plane_axes]
+    if not _radial_profile_has_step(plane_points, height_values, h_min, h_span, config):
+        return None
+
     # Fit circles on endpoint slices first. Try thinner slices before thicker
     # ones so near-through counterbores do not blur one side with two radii.
+    # All slices are prefixes/suffixes of one height ordering, so sort once
+    # and locate each slice boundary with a binary search.
+    height_order = np.argsort(height_values, kind="stable")
+    sorted_heights = height_values[height_order]
     endpoint_fit = None
     for slice_ratio in config.cbore_slice_ratios:
         slice_thickness = max(h_span * slice_ratio, 1e-9)
-        lower_mask = height_values <= (h_min + slice_thickness)
-        upper_mask = height_values >= (h_max - slice_thickness)
+        lower_count = int(
+            np.searchsorted(sorted_heights, h_min + slice_thickness, side="right")
+        )
+        upper_start = int(
+            np.searchsorted(sorted_heights, h_max - slice_thickness, side="left")
+        )
 
-        lower_pts = component_vertices[lower_mask][:, plane_axes]
-        upper_pts = component_vertices[upper_mask][:, plane_axes]
+        lower_pts = plane_points[height_order[:lower_count]]
+        upper_pts = plane_points[height_order[upper_start:]]
         if len(lower_pts) < 8 or len(upper_pts) < 8:
             continue
 
@@ -4055,7 +4526,7 @@ def _try_counterbore_fit(
 
     # Use a shared center estimate and classify vertices by nearest radius.
     center_2d = (lower_center + upper_center) * 0.5
-    radii = np.linalg.norm(component_vertices[:, plane_axes] - center_2d, axis=1)
+    radii = np.linalg.norm(plane_points - center_2d, axis=1)
     to_bore = np.abs(radii - bore_radius)
     to_through = np.abs(radii - through_radius)
     bore_membership = to_bore <= to_through
@@ -4104,6 +4575,41 @@ def _try_counterbore_fit(
     }
 
 
+def _radial_profile_has_step(
+    plane_points: np.ndarray,
+    height_values: np.ndarray,
+    h_min: float,
+    h_span: float,
+    config: DetectorConfig,
+) -> bool:
+    """Cheap counterbore precheck on the radial-distance histogram along the axis.
+
+    Constant-section cutouts (plain holes, slots) have the same mean radial
+    distance from the component centroid at every height, so only components
+    whose per-height-bin mean radius varies enough to plausibly satisfy
+    ``cbore_radius_ratio_min`` are worth the per-slice circle fits.
+    """
+    bins = max(int(config.cbore_precheck_bins), 2)
+    radii = np.linalg.norm(plane_points - np.mean(plane_points, axis=0), axis=1)
+    bin_index = np.minimum(
+        ((height_values - h_min) * (bins / max(h_span, 1e-12))).astype(np.int64),
+        bins - 1,
+    )
+    counts = np.bincount(bin_index, minlength=bins)
+    sums = np.bincount(bin_index, weights=radii, minlength=bins)
+    occupied = counts > 0
+    if np.count_nonzero(occupied) < 2:
+        return False
+    mean_radii = sums[occupied] / counts[occupied]
+    smallest = float(np.min(mean_radii))
+    if smallest <= 1e-12:
+        return True
+    required_ratio = 1.0 + (config.cbore_radius_ratio_min - 1.0) * (
+        config.cbore_precheck_step_fraction
+    )
+    return float(np.max(mean_radii)) / smallest >= required_ratio
+
+
 def _connected_face_components(
     vectors: np.ndarray,
     face_indices: np.ndarray,
@@ -4540,25 +5046,51 @@ def build_triage_report(
     Returns:
         A triage-report dict with the keys documented in the Track A spec.
     """
+    return summarize_triage_entries(
+        [build_triage_entry(graph, preview_validator) for graph in graphs],
+        top_n=top_n,
+        input_dir=input_dir,
+    )
+
+
+def build_triage_entry(
+    graph: dict[str, Any],
+    preview_validator: Optional[Callable[[dict[str, Any]], bool]] = None,
+) -> dict[str, Any]:
+    """Return the ``per_file`` triage entry for one feature graph.
+
+    Entries are JSON-serializable and independent of each other, so callers
+    that score files incrementally can keep them and rebuild the report with
+    :func:`summarize_triage_entries`.
+    """
+    bucket = _classify_graph_bucket(graph, preview_validator=preview_validator)
+    entry: dict[str, Any] = {
+        "source_file": str(graph.get("source_file", "")),
+        "bucket": bucket,
+    }
+    if bucket in {"axis_pairs_only", "feature_graph_no_preview"}:
+        entry["failure_shape_metadata"] = _failure_shape_metadata(graph)
+    return entry
+
+
+def summarize_triage_entries(
+    entries: list[dict[str, Any]],
+    top_n: int = 5,
+    input_dir: Optional[str] = None,
+) -> dict[str, Any]:
+    """Build a triage report from :func:`build_triage_entry` results."""
     bucket_counts: dict[str, int] = {bucket: 0 for bucket in _TRIAGE_BUCKETS}
-    per_file: list[dict[str, Any]] = []
     pattern_counts: dict[str, int] = {}
     pattern_examples: dict[str, str] = {}
 
-    for graph in graphs:
-        bucket = _classify_graph_bucket(graph, preview_validator=preview_validator)
-        bucket_counts[bucket] += 1
-        source_file = str(graph.get("source_file", ""))
-
-        entry: dict[str, Any] = {"source_file": source_file, "bucket": bucket}
-        if bucket in {"axis_pairs_only", "feature_graph_no_preview"}:
-            metadata = _failure_shape_metadata(graph)
-            entry["failure_shape_metadata"] = metadata
+    for entry in entries:
+        bucket_counts[entry["bucket"]] += 1
+        metadata = entry.get("failure_shape_metadata")
+        if metadata is not None:
             pattern = _failure_pattern_key(metadata)
             pattern_counts[pattern] = pattern_counts.get(pattern, 0) + 1
             if pattern not in pattern_examples:
-                pattern_examples[pattern] = source_file
-        per_file.append(entry)
+                pattern_examples[pattern] = entry["source_file"]
 
     ranked = sorted(pattern_counts.items(), key=lambda kv: kv[1], reverse=True)
     ranked_failure_patterns = [
@@ -4570,14 +5102,13 @@ def build_triage_report(
         for pattern, count in ranked[:top_n]
     ]
 
-    files_processed = len(graphs)
     return {
         "schema_version": 1,
         "generated_at_utc": datetime.now(timezone.utc).isoformat(),
         "input_dir": input_dir,
         "top_n": top_n,
-        "files_processed": files_processed,
+        "files_processed": len(entries),
         "bucket_counts": bucket_counts,
         "ranked_failure_patterns": ranked_failure_patterns,
-        "per_file": per_file,
+        "per_file": list(entries),
     }
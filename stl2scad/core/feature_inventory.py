@@ -37,6 +37,9 @@ class InventoryConfig:
     symmetry_tolerance: float = 1e-4
     normal_axis_threshold: float = 0.96
     spacing_tolerance: float = 1e-4
+    # When set, mirror-test at most this many sampled points per axis and
+    # report a confidence bound instead of testing every unique point.
+    symmetry_sample_size: Optional[int] = None
 
 
 @dataclass(frozen=True)
@@ -61,14 +64,7 @@ def analyze_stl_folder(
     with ``(completed_count, total_count, file_path_str)``.
     """
     input_path = Path(input_dir)
-    if not input_path.exists():
-        raise FileNotFoundError(f"Input directory not found: {input_path}")
-    if not input_path.is_dir():
-        raise NotADirectoryError(f"Input path is not a directory: {input_path}")
-
-    files = list(_iter_stl_files(input_path, recursive=config.recursive))
-    if config.max_files is not None:
-        files = files[: config.max_files]
+    files = _inventory_folder_files(input_path, config)
 
     total = len(files)
     worker_count = max(1, int(config.workers))
@@ -96,7 +92,31 @@ def analyze_stl_folder(
                 if progress_callback is not None:
                     progress_callback(done_count, total, str(path))
             results = [result_map[path] for path in files]
-    report = {
+    report = _inventory_report(input_path, config, worker_count, results)
+
+    _write_json_report(report, output_json)
+    return report
+
+
+def _inventory_folder_files(input_path: Path, config: InventoryConfig) -> list[Path]:
+    if not input_path.exists():
+        raise FileNotFoundError(f"Input directory not found: {input_path}")
+    if not input_path.is_dir():
+        raise NotADirectoryError(f"Input path is not a directory: {input_path}")
+
+    files = list(_iter_stl_files(input_path, recursive=config.recursive))
+    if config.max_files is not None:
+        files = files[: config.max_files]
+    return files
+
+
+def _inventory_report(
+    input_path: Path,
+    config: InventoryConfig,
+    worker_count: int,
+    results: list[dict[str, Any]],
+) -> dict[str, Any]:
+    return {
         "schema_version": 2,
         "generated_at_utc": datetime.now(timezone.utc).isoformat(),
         "input_dir": str(input_path),
@@ -107,14 +127,12 @@ def analyze_stl_folder(
             "symmetry_tolerance": config.symmetry_tolerance,
             "normal_axis_threshold": config.normal_axis_threshold,
             "spacing_tolerance": config.spacing_tolerance,
+            "symmetry_sample_size": config.symmetry_sample_size,
         },
         "summary": _summarize_results(results),
         "files": results,
     }
 
-    _write_json_report(report, output_json)
-    return report
-
 
 def build_feature_graphs_from_inventory(
     inventory: Union[dict[str, Any], Path, str],
@@ -172,12 +190,36 @@ def build_feature_graphs_from_inventory(
                     progress_callback(done_count, len(selected_work), str(path))
             graphs = [graph_map[path] for _entry, path in selected_work]
 
+    source_inventory = str(inventory) if isinstance(inventory, (str, Path)) else None
+    report = _inventory_graph_report(
+        inventory_files,
+        selected_entries,
+        selection_counts,
+        selection_config,
+        graphs,
+        input_dir=input_dir,
+        worker_count=worker_count,
+        source_inventory=source_inventory,
+    )
+
+    _write_json_report(report, output_json)
+    return report
+
+
+def _inventory_graph_report(
+    inventory_files: Sequence[dict[str, Any]],
+    selected_entries: Sequence[dict[str, Any]],
+    selection_counts: dict[str, int],
+    selection_config: InventorySelectionConfig,
+    graphs: list[dict[str, Any]],
+    input_dir: Optional[Path],
+    worker_count: int,
+    source_inventory: Optional[str],
+) -> dict[str, Any]:
     skipped_error_count = sum(
         1 for result in inventory_files if result.get("status") != "ok"
     )
-    source_inventory = str(inventory) if isinstance(inventory, (str, Path)) else None
-
-    report = {
+    return {
         "schema_version": 2,
         "generated_at_utc": datetime.now(timezone.utc).isoformat(),
         "inventory_source": source_inventory,
@@ -217,9 +259,6 @@ def build_feature_graphs_from_inventory(
         "graphs": graphs,
     }
 
-    _write_json_report(report, output_json)
-    return report
-
 
 def analyze_stl_folder_for_feature_graphs(
     input_dir: Union[Path, str],
@@ -230,6 +269,7 @@ def analyze_stl_folder_for_feature_graphs(
     inventory_output_json: Optional[Union[Path, str]] = None,
     inventory_progress_callback: Optional[Callable[[int, int, str], None]] = None,
     graph_progress_callback: Optional[Callable[[int, int, str], None]] = None,
+    fused: bool = False,
 ) -> dict[str, Any]:
     """
     Run inventory first, then build graphs only for mechanical candidates.
@@ -237,20 +277,39 @@ def analyze_stl_folder_for_feature_graphs(
     This completes the intended folder workflow: broad inventory heuristics
     pre-filter likely mechanical files, and only those selected files are
     handed to the more expensive feature-graph stage.
+
+    With ``fused=True`` each file is parsed once: a single worker computes the
+    inventory entry and, when the entry passes selection, builds the feature
+    graph from the already-loaded mesh arrays. Both reports keep the same
+    layout as the two-pass workflow. The pool size is the larger of
+    ``inventory_config.workers`` and ``graph_workers``, and
+    ``graph_progress_callback`` receives ``(graphs_built, file_count, path)``
+    because the number of selected files is not known up front.
     """
-    inventory_report = analyze_stl_folder(
-        input_dir=input_dir,
-        output_json=inventory_output_json,
-        config=inventory_config,
-        progress_callback=inventory_progress_callback,
-    )
-    graph_report = build_feature_graphs_from_inventory(
-        inventory=inventory_report,
-        output_json=None,
-        workers=graph_workers,
-        selection_config=selection_config,
-        progress_callback=graph_progress_callback,
-    )
+    if fused:
+        inventory_report, graph_report = _analyze_stl_folder_fused(
+            input_dir=input_dir,
+            inventory_config=inventory_config,
+            graph_workers=graph_workers,
+            selection_config=selection_config,
+            inventory_progress_callback=inventory_progress_callback,
+            graph_progress_callback=graph_progress_callback,
+        )
+        _write_json_report(inventory_report, inventory_output_json)
+    else:
+        inventory_report = analyze_stl_folder(
+            input_dir=input_dir,
+            output_json=inventory_output_json,
+            config=inventory_config,
+            progress_callback=inventory_progress_callback,
+        )
+        graph_report = build_feature_graphs_from_inventory(
+            inventory=inventory_report,
+            output_json=None,
+            workers=graph_workers,
+            selection_config=selection_config,
+            progress_callback=graph_progress_callback,
+        )
     graph_report["inventory_summary"] = inventory_report["summary"]
     graph_report["inventory_config"] = inventory_report["config"]
     graph_report["inventory_source"] = (
@@ -260,6 +319,126 @@ def analyze_stl_folder_for_feature_graphs(
     return graph_report
 
 
+def _analyze_stl_folder_fused(
+    input_dir: Union[Path, str],
+    inventory_config: InventoryConfig,
+    graph_workers: int,
+    selection_config: InventorySelectionConfig,
+    inventory_progress_callback: Optional[Callable[[int, int, str], None]],
+    graph_progress_callback: Optional[Callable[[int, int, str], None]],
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    input_path = Path(input_dir)
+    files = _inventory_folder_files(input_path, inventory_config)
+    total = len(files)
+    worker_count = max(1, int(inventory_config.workers), int(graph_workers))
+
+    outcome_map: dict[Path, tuple[dict[str, Any], Optional[dict[str, Any]]]] = {}
+    done_count = 0
+    graph_count = 0
+
+    def record(path: Path, outcome: tuple[dict[str, Any], Optional[dict[str, Any]]]) -> None:
+        nonlocal done_count, graph_count
+        outcome_map[path] = outcome
+        done_count += 1
+        if inventory_progress_callback is not None:
+            inventory_progress_callback(done_count, total, str(path))
+        if outcome[1] is not None:
+            graph_count += 1
+            if graph_progress_callback is not None:
+                graph_progress_callback(graph_count, total, str(path))
+
+    if worker_count == 1 or total <= 1:
+        for path in files:
+            record(
+                path,
+                _analyze_and_graph_stl_file(
+                    path, input_path, inventory_config, selection_config
+                ),
+            )
+    else:
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            future_to_path = {
+                executor.submit(
+                    _analyze_and_graph_stl_file_worker,
+                    (path, input_path, inventory_config, selection_config),
+                ): path
+                for path in files
+            }
+            for future in as_completed(future_to_path):
+                record(future_to_path[future], future.result())
+
+    results = [outcome_map[path][0] for path in files]
+    inventory_report = _inventory_report(
+        input_path, inventory_config, worker_count, results
+    )
+    selected_entries, selection_counts = _select_inventory_entries(
+        results,
+        selection_config=selection_config,
+    )
+    graphs = [
+        graph
+        for _entry, graph in (outcome_map[path] for path in files)
+        if graph is not None
+    ]
+    graph_report = _inventory_graph_report(
+        results,
+        selected_entries,
+        selection_counts,
+        selection_config,
+        graphs,
+        input_dir=input_path,
+        worker_count=worker_count,
+        source_inventory=None,
+    )
+    return inventory_report, graph_report
+
+
+def _analyze_and_graph_stl_file_worker(
+    args: tuple[Path, Path, InventoryConfig, InventorySelectionConfig],
+) -> tuple[dict[str, Any], Optional[dict[str, Any]]]:
+    path, root_dir, inventory_config, selection_config = args
+    return _analyze_and_graph_stl_file(
+        path, root_dir, inventory_config, selection_config
+    )
+
+
+def _analyze_and_graph_stl_file(
+    path: Path,
+    root_dir: Path,
+    inventory_config: InventoryConfig,
+    selection_config: InventorySelectionConfig,
+) -> tuple[dict[str, Any], Optional[dict[str, Any]]]:
+    """Inventory one file and, if it is selected, graph it from the same arrays."""
+    entry, mesh_arrays = _analyze_stl_file_with_arrays(
+        path, root_dir=root_dir, config=inventory_config
+    )
+    selected, _counts = _select_inventory_entries([entry], selection_config)
+    if not selected or mesh_arrays is None:
+        return entry, None
+
+    from .feature_graph import build_feature_graph_for_mesh_arrays
+
+    vectors, normals, face_areas = mesh_arrays
+    try:
+        graph = build_feature_graph_for_mesh_arrays(
+            path,
+            vectors,
+            normals,
+            face_areas,
+            root_dir=root_dir,
+            inventory_context=entry,
+        )
+    except Exception as exc:
+        graph = {
+            "schema_version": 2,
+            "source_file": _relative_or_absolute(path, root_dir),
+            "status": "error",
+            "error": str(exc),
+            "features": [],
+        }
+    return entry, graph
+
+
 def _safe_float(value: Any) -> Optional[float]:
     try:
         return float(value)
@@ -410,6 +589,23 @@ def analyze_stl_file(
     """
     Analyze one STL file and return geometry/feature signals.
     """
+    payload, _mesh_arrays = _analyze_stl_file_with_arrays(
+        stl_file, root_dir=root_dir, config=config
+    )
+    return payload
+
+
+def _analyze_stl_file_with_arrays(
+    stl_file: Union[Path, str],
+    root_dir: Optional[Union[Path, str]],
+    config: InventoryConfig,
+) -> tuple[dict[str, Any], Optional[tuple[np.ndarray, np.ndarray, np.ndarray]]]:
+    """Analyze one STL file and also return its parsed (vectors, normals, areas).
+
+    The arrays are ``None`` when the file could not be loaded. Returning them
+    lets the fused inventory+graph path hand the parsed mesh straight to the
+    feature-graph builder instead of reading the file a second time.
+    """
     path = Path(stl_file)
     payload: dict[str, Any] = {
         "file": _relative_or_absolute(path, root_dir),
@@ -428,7 +624,7 @@ def analyze_stl_file(
     except Exception as exc:
         payload["status"] = "error"
         payload["error"] = str(exc)
-        return payload
+        return payload, None
 
     payload.update(
         {
@@ -443,7 +639,10 @@ def analyze_stl_file(
                 threshold=config.normal_axis_threshold,
             ),
             "symmetry": _symmetry_scores(
-                unique_points, bbox, config.symmetry_tolerance
+                unique_points,
+                bbox,
+                config.symmetry_tolerance,
+                sample_size=config.symmetry_sample_size,
             ),
             "coordinate_spacing": _coordinate_spacing_signals(
                 unique_points,
@@ -451,10 +650,14 @@ def analyze_stl_file(
             ),
         }
     )
+    if config.symmetry_sample_size is not None:
+        payload["symmetry_sampling"] = _symmetry_sampling_summary(
+            len(unique_points), config.symmetry_sample_size
+        )
     payload["classification"] = _classify_inventory(payload)
     payload["candidate_features"] = _candidate_features(payload)
     payload["detector_guidance"] = _detector_guidance(payload)
-    return payload
+    return payload, (vectors, normals, face_areas)
 
 
 def _iter_stl_files(input_dir: Path, recursive: bool) -> Iterable[Path]:
@@ -592,16 +795,30 @@ def _normal_axis_profile(
     }
 
 
+_SYMMETRY_KEY_BITS = 21
+_SYMMETRY_CONFIDENCE_LEVEL = 0.95
+
+
 def _symmetry_scores(
     points: np.ndarray,
     bbox: dict[str, float],
     tolerance: float,
+    sample_size: Optional[int] = None,
 ) -> dict[str, float]:
+    """Fraction of points whose mirror across each bbox mid-plane is also a point.
+
+    Quantized points are packed into one 64-bit key each and membership is a
+    ``searchsorted`` lookup into the sorted key set. With ``sample_size``, only
+    a deterministic subsample of points is mirrored; the full point set is
+    still the lookup target, so each sampled answer is exact.
+    """
+    if sample_size is not None and sample_size < 1:
+        raise ValueError("sample_size must be at least 1")
     if len(points) == 0:
         return {"x": 0.0, "y": 0.0, "z": 0.0}
 
     scale = 1.0 / max(float(tolerance), bbox.get("diagonal", 0.0) * 1e-5, 1e-9)
-    quantized = {tuple(row) for row in np.round(points * scale).astype(np.int64)}
+    quantized = np.round(points * scale).astype(np.int64)
     centers = np.array(
         [
             (bbox["min_x"] + bbox["max_x"]) * 0.5,
@@ -611,16 +828,81 @@ def _symmetry_scores(
         dtype=np.float64,
     )
 
+    queries = points
+    if sample_size is not None and len(points) > sample_size:
+        rng = np.random.default_rng(0)
+        queries = points[rng.choice(len(points), size=int(sample_size), replace=False)]
+
+    # Mirrored points that round outside the packed range cannot match.
+    origin = np.min(quantized, axis=0) - 1
+    limit = 1 << _SYMMETRY_KEY_BITS
+    if np.any(np.max(quantized, axis=0) - origin >= limit - 1):
+        return _symmetry_scores_by_rows(quantized, queries, centers, scale)
+    sorted_keys = np.unique(_pack_symmetry_keys(quantized - origin))
+
     scores: dict[str, float] = {}
     for axis_index, axis_name in enumerate(("x", "y", "z")):
-        mirrored = points.copy()
+        mirrored = queries.copy()
+        mirrored[:, axis_index] = 2.0 * centers[axis_index] - mirrored[:, axis_index]
+        shifted = np.round(mirrored * scale).astype(np.int64) - origin
+        in_range = np.all((shifted >= 0) & (shifted < limit), axis=1)
+        keys = _pack_symmetry_keys(shifted[in_range])
+        positions = np.minimum(np.searchsorted(sorted_keys, keys), len(sorted_keys) - 1)
+        matches = int(np.count_nonzero(sorted_keys[positions] == keys))
+        scores[axis_name] = float(matches / max(len(queries), 1))
+    return scores
+
+
+def _pack_symmetry_keys(shifted: np.ndarray) -> np.ndarray:
+    return (
+        (shifted[:, 0] << (2 * _SYMMETRY_KEY_BITS))
+        | (shifted[:, 1] << _SYMMETRY_KEY_BITS)
+        | shifted[:, 2]
+    )
+
+
+def _symmetry_scores_by_rows(
+    quantized: np.ndarray,
+    queries: np.ndarray,
+    centers: np.ndarray,
+    scale: float,
+) -> dict[str, float]:
+    # Only reachable for caller-supplied bboxes narrower than the points;
+    # the diagonal-relative scale otherwise keeps every axis within 21 bits.
+    reference = {tuple(row) for row in quantized}
+    scores: dict[str, float] = {}
+    for axis_index, axis_name in enumerate(("x", "y", "z")):
+        mirrored = queries.copy()
         mirrored[:, axis_index] = 2.0 * centers[axis_index] - mirrored[:, axis_index]
         mirrored_quantized = np.round(mirrored * scale).astype(np.int64)
-        matches = sum(tuple(row) in quantized for row in mirrored_quantized)
-        scores[axis_name] = float(matches / max(len(points), 1))
+        matches = sum(tuple(row) in reference for row in mirrored_quantized)
+        scores[axis_name] = float(matches / max(len(queries), 1))
     return scores
 
 
+def _symmetry_sampling_summary(point_count: int, sample_size: int) -> dict[str, Any]:
+    """Describe the subsample behind sampled symmetry scores.
+
+    ``confidence_bound`` is a two-sided Hoeffding half-width with the
+    finite-population correction for sampling without replacement: each
+    reported score is within that distance of the full-population score with
+    probability ``confidence_level``.
+    """
+    sampled = min(max(int(sample_size), 1), point_count)
+    if sampled <= 0 or sampled >= point_count:
+        bound = 0.0
+    else:
+        hoeffding = np.sqrt(np.log(2.0 / (1.0 - _SYMMETRY_CONFIDENCE_LEVEL)) / (2.0 * sampled))
+        correction = np.sqrt((point_count - sampled) / max(point_count - 1, 1))
+        bound = float(min(1.0, hoeffding * correction))
+    return {
+        "sampled_points": int(max(sampled, 0)),
+        "total_points": int(point_count),
+        "confidence_level": _SYMMETRY_CONFIDENCE_LEVEL,
+        "confidence_bound": bound,
+    }
+
+
 def _coordinate_spacing_signals(
     points: np.ndarray,
     tolerance: float,
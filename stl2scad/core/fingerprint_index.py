@@ -0,0 +1,213 @@
+"""
+Persistent SHA-256 index for corpus files, keyed by file stat.
+
+Corpus scoring verifies every STL against the SHA-256 recorded in its
+manifest, which meant reading the whole corpus on every run. The index keeps
+each file's digest together with its size, ``st_mtime_ns`` and inode, and a
+file whose stat is unchanged is not read again. A same-size rewrite within one
+mtime tick defeats the check; the ``full`` policy always rehashes.
+
+Verification policies:
+    full: Hash every file; the index is refreshed but never trusted
+    stat: Reuse indexed digests for files whose stat is unchanged
+    off: Skip content verification
+
+Environment:
+    STL2SCAD_FINGERPRINT_INDEX: Index database path; an empty value disables
+        the default index (default:
+        ``$XDG_CACHE_HOME/stl2scad/fingerprints.sqlite3``)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Iterator, Optional, Union
+
+VERIFY_POLICIES = ("full", "stat", "off")
+DEFAULT_VERIFY_POLICY = "stat"
+
+_CHUNK_BYTES = 1 << 20
+
+
+class FingerprintIndex:
+    """
+    SQLite map from absolute file path to ``(size, mtime_ns, inode, sha256)``.
+
+    Each operation opens its own connection, so one index can be shared by
+    threads and by processes.
+
+    Args:
+        path: Database file, created on first use
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._initialized = False
+        self._counters = {"hits": 0, "misses": 0}
+
+    def lookup(self, file_path: Path, stat: os.stat_result) -> Optional[str]:
+        """Return the indexed digest if *file_path* still has *stat*, else None."""
+        try:
+            with self._connect() as connection:
+                row = connection.execute(
+                    "SELECT sha256 FROM fingerprints"
+                    " WHERE path = ? AND size = ? AND mtime_ns = ? AND inode = ?",
+                    (_index_path(file_path), *_stat_key(stat)),
+                ).fetchone()
+        except sqlite3.Error as exc:
+            logging.debug(f"Fingerprint index read failed: {exc}")
+            row = None
+        self._count("hits" if row is not None else "misses")
+        return str(row[0]) if row is not None else None
+
+    def record(self, file_path: Path, stat: os.stat_result, sha256: str) -> None:
+        """Index *sha256* as the digest of *file_path* while it has *stat*."""
+        try:
+            with self._connect() as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO fingerprints"
+                    " (path, size, mtime_ns, inode, sha256) VALUES (?, ?, ?, ?, ?)",
+                    (_index_path(file_path), *_stat_key(stat), sha256),
+                )
+        except sqlite3.Error as exc:
+            logging.debug(f"Fingerprint index write failed: {exc}")
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss counters for this process."""
+        with self._lock:
+            counters: dict[str, Any] = dict(self._counters)
+        counters["path"] = str(self.path)
+        return counters
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=30)
+        try:
+            with connection:
+                if not self._initialized:
+                    connection.execute("PRAGMA journal_mode=WAL")
+                    connection.execute(
+                        "CREATE TABLE IF NOT EXISTS fingerprints ("
+                        " path TEXT PRIMARY KEY, size INTEGER NOT NULL,"
+                        " mtime_ns INTEGER NOT NULL, inode INTEGER NOT NULL,"
+                        " sha256 TEXT NOT NULL)"
+                    )
+                    self._initialized = True
+                yield connection
+        finally:
+            connection.close()
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+
+def _index_path(file_path: Path) -> str:
+    return str(Path(file_path).resolve())
+
+
+def _stat_key(stat: os.stat_result) -> tuple[int, int, int]:
+    return int(stat.st_size), int(stat.st_mtime_ns), int(stat.st_ino)
+
+
+def check_verify_policy(policy: str) -> str:
+    """Return *policy* if it is one of ``VERIFY_POLICIES``, else raise ValueError."""
+    if policy not in VERIFY_POLICIES:
+        raise ValueError(
+            f"Unknown fingerprint verification policy {policy!r};"
+            f" expected one of {', '.join(VERIFY_POLICIES)}"
+        )
+    return policy
+
+
+def sha256_file(path: Union[str, Path]) -> str:
+    """Return the SHA-256 hex digest of a file, read in fixed-size chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_sha256(
+    path: Union[str, Path],
+    *,
+    rehash: bool = False,
+    index: Optional[FingerprintIndex] = None,
+) -> str:
+    """
+    Return a file's SHA-256, reading it only when its stat is not indexed.
+
+    Args:
+        path: File to fingerprint
+        rehash: Always read the file (the ``full`` policy); the result is
+            still written to the index
+        index: Index to use; defaults to ``get_fingerprint_index()``
+    """
+    path = Path(path)
+    index = index if index is not None else get_fingerprint_index()
+    before = path.stat()
+    if index is not None and not rehash:
+        cached = index.lookup(path, before)
+        if cached is not None:
+            return cached
+    sha256 = sha256_file(path)
+    # Only index the digest if the file did not change while it was read.
+    if index is not None and _stat_key(path.stat()) == _stat_key(before):
+        index.record(path, before, sha256)
+    return sha256
+
+
+def record_sha256(
+    path: Union[str, Path],
+    sha256: str,
+    *,
+    index: Optional[FingerprintIndex] = None,
+) -> None:
+    """Index *sha256*, computed while *path* was written, for its current stat."""
+    index = index if index is not None else get_fingerprint_index()
+    if index is not None:
+        index.record(Path(path), Path(path).stat(), sha256)
+
+
+def verify_sha256(
+    path: Union[str, Path],
+    expected: str,
+    policy: str = DEFAULT_VERIFY_POLICY,
+    *,
+    index: Optional[FingerprintIndex] = None,
+) -> bool:
+    """Return True if *path* hashes to *expected* under *policy*.
+
+    An empty *expected* digest and the ``off`` policy always verify.
+    """
+    if check_verify_policy(policy) == "off" or not expected:
+        return True
+    return file_sha256(path, rehash=policy == "full", index=index) == expected
+
+
+_default_index: Optional[FingerprintIndex] = None
+_default_index_lock = threading.Lock()
+
+
+def get_fingerprint_index() -> Optional[FingerprintIndex]:
+    """Return the process-wide fingerprint index, or None when it is disabled."""
+    global _default_index
+    path_text = os.environ.get("STL2SCAD_FINGERPRINT_INDEX")
+    if path_text is None:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+        path_text = str(Path(cache_home) / "stl2scad" / "fingerprints.sqlite3")
+    if not path_text:
+        return None
+    with _default_index_lock:
+        if _default_index is None or _default_index.path != Path(path_text):
+            _default_index = FingerprintIndex(path_text)
+        return _default_index
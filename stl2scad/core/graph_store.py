@@ -0,0 +1,292 @@
+"""
+Persistent feature-graph store shared by the corpus scorers and CorpusEngine.
+
+Scoring the same corpus under the same DetectorConfig is common: a baseline
+comparison, an HTML report and a tuning session all re-run the detector over
+identical files. Graphs are stored in one SQLite file, zlib-compressed, keyed
+by SHA-256 over the STL bytes, the config and a detector fingerprint (package
+version plus a digest of the detector sources, so editing the detector in a
+checkout invalidates old entries). The store is bounded in bytes and evicts
+least recently used entries first.
+
+Graphs are stored with their ``threshold_decisions`` so CorpusEngine can
+replay threshold-only perturbations from a stored graph, and with their
+``dispatch_trace`` so incremental corpus scoring can tell which detector
+stages a stored result depends on.
+
+Environment:
+    STL2SCAD_GRAPH_CACHE_DIR: Store directory; an empty value disables the
+        default store (default: ``$XDG_CACHE_HOME/stl2scad/graphs``)
+    STL2SCAD_GRAPH_CACHE_MAX_MB: Size bound in MiB (default: 512)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import functools
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Iterator, Optional, Union
+
+from stl2scad import __version__
+from stl2scad.core.fingerprint_index import file_sha256
+from stl2scad.tuning.config import DetectorConfig
+
+DEFAULT_GRAPH_STORE_MAX_BYTES = 512 * 1024 * 1024
+
+_DB_FILE = "graphs.sqlite3"
+
+# Modules whose source decides what a feature graph contains.
+_DETECTOR_MODULES = (
+    "feature_graph.py",
+    "feature_inventory.py",
+    "revolve_recovery.py",
+    "linear_extrude_recovery.py",
+)
+
+
+class GraphStore:
+    """
+    Size-bounded LRU store of feature graphs in a SQLite database.
+
+    Each operation opens its own connection, so one store can be used from
+    several threads, and processes sharing the directory see each other's
+    entries.
+
+    Args:
+        root: Store directory, created on first use
+        max_bytes: Total compressed size above which least recently used
+            entries are evicted
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        max_bytes: int = DEFAULT_GRAPH_STORE_MAX_BYTES,
+    ) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.root = Path(root)
+        self.max_bytes = int(max_bytes)
+        self._lock = threading.Lock()
+        self._initialized = False
+        self._counters = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    @staticmethod
+    def key(stl_digest: str, config: DetectorConfig) -> str:
+        """Return the entry key for an STL digest under *config*."""
+        digest = hashlib.sha256()
+        for part in (stl_digest, config_digest(config), detector_fingerprint()):
+            data = part.encode("utf-8")
+            digest.update(len(data).to_bytes(8, "little"))
+            digest.update(data)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        """Return the stored graph for *key*, or None, counting the hit or miss."""
+        try:
+            with self._connect() as connection:
+                row = connection.execute(
+                    "SELECT data FROM graphs WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    connection.execute(
+                        "UPDATE graphs SET last_used = ? WHERE key = ?",
+                        (time.time(), key),
+                    )
+            graph = json.loads(zlib.decompress(row[0])) if row is not None else None
+        except (sqlite3.Error, zlib.error, ValueError) as exc:
+            logging.debug(f"Graph store read failed: {exc}")
+            graph = None
+        self._count("hits" if graph is not None else "misses")
+        return graph
+
+    def put(self, key: str, graph: dict[str, Any]) -> None:
+        """Store *graph* under *key* and evict down to ``max_bytes``."""
+        try:
+            data = zlib.compress(json.dumps(graph).encode("utf-8"), 6)
+        except (TypeError, ValueError) as exc:
+            logging.debug(f"Graph not stored, not JSON-serializable: {exc}")
+            return
+        try:
+            with self._connect() as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO graphs (key, data, size, last_used)"
+                    " VALUES (?, ?, ?, ?)",
+                    (key, data, len(data), time.time()),
+                )
+        except sqlite3.Error as exc:
+            logging.debug(f"Graph store write failed: {exc}")
+            return
+        self._count("stores")
+        self.evict()
+
+    def evict(self) -> int:
+        """Drop least recently used entries until the store fits ``max_bytes``."""
+        try:
+            with self._connect() as connection:
+                total = connection.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM graphs"
+                ).fetchone()[0]
+                if total <= self.max_bytes:
+                    return 0
+                doomed = []
+                for key, size in connection.execute(
+                    "SELECT key, size FROM graphs ORDER BY last_used"
+                ):
+                    if total <= self.max_bytes:
+                        break
+                    doomed.append((key,))
+                    total -= size
+                connection.executemany("DELETE FROM graphs WHERE key = ?", doomed)
+        except sqlite3.Error as exc:
+            logging.debug(f"Graph store eviction failed: {exc}")
+            return 0
+        self._count("evictions", len(doomed))
+        return len(doomed)
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss/store/eviction counters for this process."""
+        with self._lock:
+            counters: dict[str, Any] = dict(self._counters)
+        lookups = counters["hits"] + counters["misses"]
+        counters["hit_rate"] = counters["hits"] / lookups if lookups else 0.0
+        counters["root"] = str(self.root)
+        return counters
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self.root.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.root / _DB_FILE, timeout=30)
+        try:
+            with connection:
+                if not self._initialized:
+                    connection.execute("PRAGMA journal_mode=WAL")
+                    connection.execute(
+                        "CREATE TABLE IF NOT EXISTS graphs ("
+                        " key TEXT PRIMARY KEY, data BLOB NOT NULL,"
+                        " size INTEGER NOT NULL, last_used REAL NOT NULL)"
+                    )
+                    connection.execute(
+                        "CREATE INDEX IF NOT EXISTS graphs_last_used"
+                        " ON graphs (last_used)"
+                    )
+                    self._initialized = True
+                yield connection
+        finally:
+            connection.close()
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] += amount
+
+
+def config_digest(config: DetectorConfig) -> str:
+    """Return a stable SHA-256 of every DetectorConfig field."""
+    payload = json.dumps(dataclasses.asdict(config), sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def detector_fingerprint() -> str:
+    """Return the package version plus a digest of the detector sources."""
+    digest = hashlib.sha256()
+    core_dir = Path(__file__).resolve().parent
+    for name in _DETECTOR_MODULES:
+        try:
+            digest.update((core_dir / name).read_bytes())
+        except OSError:
+            digest.update(name.encode("utf-8"))
+    return f"{__version__}:{digest.hexdigest()[:16]}"
+
+
+def stl_digest(path: Union[str, Path]) -> str:
+    """Return the SHA-256 hex digest of an STL file, via the fingerprint index."""
+    return file_sha256(path)
+
+
+def build_feature_graph_cached(
+    stl_file: Union[str, Path],
+    *,
+    config: Optional[DetectorConfig] = None,
+    root_dir: Optional[Union[str, Path]] = None,
+    store: Optional[GraphStore] = None,
+    record_decisions: bool = False,
+    record_dispatch: bool = False,
+) -> dict[str, Any]:
+    """
+    ``build_feature_graph_for_stl`` backed by *store*.
+
+    With ``store=None`` this simply builds the graph. Stored graphs are
+    content-addressed, so ``source_file`` is rewritten for the requested path
+    on a hit. ``threshold_decisions`` and ``dispatch_trace`` are only kept
+    when requested.
+    """
+    from stl2scad.core.feature_graph import (
+        _relative_or_absolute,
+        build_feature_graph_for_stl,
+    )
+
+    resolved = config or DetectorConfig()
+    path = Path(stl_file)
+    if store is None:
+        return build_feature_graph_for_stl(
+            path,
+            root_dir=root_dir,
+            config=resolved,
+            record_decisions=record_decisions,
+            record_dispatch=record_dispatch,
+        )
+
+    key = store.key(stl_digest(path), resolved)
+    graph = store.get(key)
+    if graph is None or "dispatch_trace" not in graph:
+        graph = build_feature_graph_for_stl(
+            path,
+            root_dir=root_dir,
+            config=resolved,
+            record_decisions=True,
+            record_dispatch=True,
+        )
+        store.put(key, graph)
+    graph["source_file"] = _relative_or_absolute(path, root_dir)
+    if not record_decisions:
+        graph.pop("threshold_decisions", None)
+    if not record_dispatch:
+        graph.pop("dispatch_trace", None)
+    return graph
+
+
+_default_store: Optional[GraphStore] = None
+_default_store_lock = threading.Lock()
+
+
+def get_graph_store() -> Optional[GraphStore]:
+    """Return the process-wide graph store, or None when it is disabled."""
+    global _default_store
+    root_text = os.environ.get("STL2SCAD_GRAPH_CACHE_DIR")
+    if root_text is None:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+        root_text = str(Path(cache_home) / "stl2scad" / "graphs")
+    if not root_text:
+        return None
+    max_mb = os.environ.get("STL2SCAD_GRAPH_CACHE_MAX_MB")
+    max_bytes = (
+        int(float(max_mb) * 1024 * 1024) if max_mb else DEFAULT_GRAPH_STORE_MAX_BYTES
+    )
+    with _default_store_lock:
+        if (
+            _default_store is None
+            or _default_store.root != Path(root_text)
+            or _default_store.max_bytes != max_bytes
+        ):
+            _default_store = GraphStore(root_text, max_bytes)
+        return _default_store
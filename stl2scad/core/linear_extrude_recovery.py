@@ -11,7 +11,9 @@ from typing import Any, Optional
 
 import numpy as np
 
+from stl2scad.core.dispatch_trace import traced_detector
 from stl2scad.tuning.config import DetectorConfig
+from stl2scad.tuning.decisions import gate
 
 
 # ---------------------------------------------------------------------------
@@ -308,6 +310,7 @@ def _build_profile_from_slices(
 # ---------------------------------------------------------------------------
 
 
+@traced_detector("linear_extrude_solid")
 def detect_linear_extrude_solid(
     vertices: np.ndarray,  # (N, 3) unique vertices
     triangles: np.ndarray,  # (M, 3) int64 triangle indices
@@ -398,7 +401,7 @@ def detect_linear_extrude_solid(
         confidence = float(
             0.4 * axis_quality + 0.4 * consistency + 0.2 * profile_validity
         )
-        if confidence < config.linear_extrude_confidence_min:
+        if gate(config, "linear_extrude_confidence_min", "<", confidence):
             continue
 
         # Axis origin = projection of centroid onto the axis's min plane
@@ -0,0 +1,152 @@
+"""
+In-memory caches of parsed STL meshes for repeated detector runs.
+
+Tuning loops run the feature-graph detector over the same files under many
+DetectorConfigs. Parsing and welding a mesh does not depend on the config, so
+``ParsedMeshCache`` keeps those arrays keyed by resolved path, size and
+``st_mtime_ns`` (a rewritten file is parsed again) and each trial pays only
+detector time. CorpusEngine and the fixture scorer both use it.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+import numpy as np
+
+from stl2scad.core.feature_graph import (
+    build_feature_graph_for_mesh_arrays,
+    load_mesh_arrays,
+    weld_mesh_vertices,
+)
+from stl2scad.tuning.config import DetectorConfig
+
+
+class LRUCache:
+    """Recency-ordered cache bounded by the summed cost of its entries.
+
+    ``cost_fn`` prices each value (default: 1, i.e. an entry-count bound).
+    A lookup hit moves the entry to the most-recent end; inserts evict from
+    the least-recent end until the total fits ``capacity``. A value costing
+    more than ``capacity`` on its own is not stored.
+    """
+
+    def __init__(
+        self, capacity: int, cost_fn: Callable[[Any], int] = lambda _value: 1
+    ) -> None:
+        self.capacity = max(0, int(capacity))
+        self._cost_fn = cost_fn
+        self._items: OrderedDict[Any, tuple[Any, int]] = OrderedDict()
+        self._total = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Any) -> Any:
+        item = self._items.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+        self._items.move_to_end(key)
+        self.hits += 1
+        return item[0]
+
+    def put(self, key: Any, value: Any) -> None:
+        cost = int(self._cost_fn(value))
+        if cost > self.capacity:
+            return
+        previous = self._items.pop(key, None)
+        if previous is not None:
+            self._total -= previous[1]
+        while self._items and self._total + cost > self.capacity:
+            _, (_, evicted_cost) = self._items.popitem(last=False)
+            self._total -= evicted_cost
+            self.evictions += 1
+        self._items[key] = (value, cost)
+        self._total += cost
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._items),
+            "size": self._total,
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+@dataclass(frozen=True)
+class ParsedMesh:
+    """Config-independent mesh data shared by every detector run on one file."""
+
+    vectors: np.ndarray
+    normals: np.ndarray
+    face_areas: np.ndarray
+    welded: tuple[np.ndarray, np.ndarray]
+
+    @classmethod
+    def load(cls, stl_file: Union[Path, str]) -> ParsedMesh:
+        vectors, normals, face_areas = load_mesh_arrays(stl_file)
+        return cls(vectors, normals, face_areas, weld_mesh_vertices(vectors))
+
+    @property
+    def nbytes(self) -> int:
+        return int(
+            self.vectors.nbytes
+            + self.normals.nbytes
+            + self.face_areas.nbytes
+            + self.welded[0].nbytes
+            + self.welded[1].nbytes
+        )
+
+
+class ParsedMeshCache(LRUCache):
+    """
+    Parsed and welded meshes keyed by file identity, bounded in bytes.
+
+    Args:
+        max_bytes: Memory budget for the cached arrays; ``None`` keeps every
+            mesh and 0 disables caching
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None) -> None:
+        super().__init__(
+            sys.maxsize if max_bytes is None else max_bytes,
+            lambda mesh: mesh.nbytes,
+        )
+
+    def mesh(self, stl_file: Union[Path, str]) -> ParsedMesh:
+        """Return the parsed mesh for *stl_file*, re-reading it only if it changed."""
+        path = Path(stl_file)
+        stat = path.stat()
+        key = (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+        mesh = self.get(key)
+        if mesh is None:
+            mesh = ParsedMesh.load(path)
+            self.put(key, mesh)
+        return mesh
+
+    def build_graph(
+        self,
+        stl_file: Union[Path, str],
+        config: DetectorConfig,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Run the feature-graph detector on the cached mesh of *stl_file*."""
+        mesh = self.mesh(stl_file)
+        return build_feature_graph_for_mesh_arrays(
+            stl_file,
+            mesh.vectors,
+            mesh.normals,
+            mesh.face_areas,
+            config=config,
+            welded=mesh.welded,
+            **kwargs,
+        )
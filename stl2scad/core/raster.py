@@ -0,0 +1,364 @@
+"""Headless NumPy software rasterizer for mesh thumbnails and comparison views.
+
+Triangles are rasterized with a z-buffer and flat shading entirely in NumPy:
+each triangle is expanded into the pixel centres inside its screen bounding
+box, barycentric and depth planes are evaluated for all candidates at once,
+and the nearest candidate per pixel wins. Work is processed in chunks of a
+bounded number of candidates, so memory stays flat for million-triangle
+meshes. No GUI, OpenGL context or imaging library is needed; PNGs are written
+by a minimal zlib encoder.
+"""
+
+from __future__ import annotations
+
+import math
+from pathlib import Path
+import struct
+from typing import Optional, Sequence, Tuple, Union
+import zlib
+
+import numpy as np
+
+
+PROJECTIONS = ("orthographic", "perspective")
+
+# Candidate (triangle, pixel) pairs evaluated per chunk.
+_CHUNK_CANDIDATES = 1 << 22
+
+Color = Tuple[int, int, int]
+Bounds = Tuple[Sequence[float], Sequence[float]]
+
+
+def rasterize(
+    vectors: np.ndarray,
+    width: int,
+    height: int,
+    *,
+    elevation: float = 24.0,
+    azimuth: float = -42.0,
+    projection: str = "orthographic",
+    fov: float = 30.0,
+    bounds: Optional[Bounds] = None,
+    z_range: Optional[Tuple[float, float]] = None,
+    margin: float = 0.05,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rasterize triangles into a face-index buffer and a flat-shade buffer.
+
+    The camera orbits the centre of *bounds* (default: the mesh bounds) and
+    frames their bounding sphere in the viewport, so meshes rendered with the
+    same bounds line up pixel for pixel.
+
+    Args:
+        vectors: ``(N, 3, 3)`` triangle vertices
+        width: Viewport width in pixels
+        height: Viewport height in pixels
+        elevation: Camera elevation above the XY plane, in degrees
+        azimuth: Camera azimuth from +X towards +Y, in degrees
+        projection: ``"orthographic"`` or ``"perspective"``
+        fov: Vertical field of view for perspective projection, in degrees
+        bounds: ``(min_xyz, max_xyz)`` framing box
+        z_range: Only draw surface points whose world Z lies in ``[lo, hi]``
+        margin: Fraction of the viewport left empty around the framing sphere
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: ``(height, width)`` face indices (-1 for
+        background) and shade values in ``[0, 1]``
+    """
+    if projection not in PROJECTIONS:
+        raise ValueError(f"Unknown projection: {projection}")
+    face = np.full(height * width, -1, dtype=np.int64)
+    shade = np.zeros(height * width, dtype=np.float32)
+    # Whole-mesh passes run in float32 (numpy-stl's native dtype); the
+    # per-pixel planes of the surviving triangles are built in float64.
+    vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, 3, 3)
+    if len(vectors) == 0 or width <= 0 or height <= 0:
+        return face.reshape(height, width), shade.reshape(height, width)
+
+    if bounds is None:
+        points = vectors.reshape(-1, 3)
+        columns = [points[:, axis] for axis in range(3)]
+        bounds = ([c.min() for c in columns], [c.max() for c in columns])
+    lo = np.asarray(bounds[0], dtype=np.float64)
+    hi = np.asarray(bounds[1], dtype=np.float64)
+    center = (lo + hi) / 2.0
+    radius = max(float(np.linalg.norm(hi - lo)) / 2.0, 1e-9)
+
+    forward, right, up = _camera_basis(elevation, azimuth)
+    scale = min(width, height) / 2.0 * (1.0 - margin)
+    # One matmul over the flat vertex list; columns are (right, up, forward).
+    basis = np.stack([right, up, forward], axis=1).astype(np.float32)
+    view = (vectors.reshape(-1, 3) - center.astype(np.float32)) @ basis
+    sx = view[:, 0].reshape(-1, 3)
+    sy = view[:, 1].reshape(-1, 3)
+    toward = view[:, 2].reshape(-1, 3)
+    if projection == "perspective":
+        half_fov = math.radians(max(min(fov, 170.0), 1.0)) / 2.0
+        distance = radius / math.sin(half_fov)
+        cam_z = distance - toward
+        in_front = cam_z > radius * 1e-3
+        valid = in_front[:, 0] & in_front[:, 1] & in_front[:, 2]
+        cam_z = np.where(in_front, cam_z, 1.0)
+        focal = scale / math.tan(half_fov)
+        sx = sx / cam_z * focal
+        sy = sy / cam_z * focal
+        # Screen-space linear quantity for depth tests: nearer is smaller.
+        depth = -1.0 / cam_z
+    else:
+        sx = sx * (scale / radius)
+        sy = sy * (scale / radius)
+        depth = -toward
+        valid = np.ones(len(vectors), dtype=bool)
+
+    px = sx + width / 2.0
+    py = height / 2.0 - sy
+
+    # Pixel centres sit at integer + 0.5; keep triangles covering at least one.
+    x0 = np.clip(np.ceil(_column_min(px) - 0.5), 0, width).astype(np.int64)
+    x1 = np.clip(np.floor(_column_max(px) - 0.5), -1, width - 1).astype(np.int64)
+    y0 = np.clip(np.ceil(_column_min(py) - 0.5), 0, height).astype(np.int64)
+    y1 = np.clip(np.floor(_column_max(py) - 0.5), -1, height - 1).astype(np.int64)
+    span_x = np.maximum(x1 - x0 + 1, 0)
+    span_y = np.maximum(y1 - y0 + 1, 0)
+    area = _signed_area(px, py)
+    keep = np.flatnonzero(valid & (span_x > 0) & (span_y > 0) & (np.abs(area) > 1e-12))
+    if len(keep) == 0:
+        return face.reshape(height, width), shade.reshape(height, width)
+
+    px = px[keep].astype(np.float64)
+    py = py[keep].astype(np.float64)
+    planes = _barycentric_planes(px, py, _signed_area(px, py))
+    depth_plane = _attribute_plane(planes, depth[keep].astype(np.float64))
+    z_plane: Optional[Tuple[np.ndarray, Optional[np.ndarray]]] = None
+    if z_range is not None:
+        z_values = vectors[keep, :, 2].astype(np.float64)
+        if projection == "perspective":
+            # Perspective-correct: interpolate z/w and 1/w, then divide.
+            inverse_w = 1.0 / cam_z[keep].astype(np.float64)
+            z_plane = (
+                _attribute_plane(planes, z_values * inverse_w),
+                _attribute_plane(planes, inverse_w),
+            )
+        else:
+            z_plane = (_attribute_plane(planes, z_values), None)
+
+    zbuffer = np.full(height * width, np.inf)
+    x0, y0, span_x = x0[keep], y0[keep], span_x[keep]
+    counts = span_x * span_y[keep]
+    budget = max(_CHUNK_CANDIDATES, width * height)
+    cumulative = np.cumsum(counts)
+    start = 0
+    while start < len(keep):
+        consumed = cumulative[start - 1] if start else 0
+        stop = int(np.searchsorted(cumulative, consumed + budget, side="right"))
+        stop = max(stop, start + 1)
+        _rasterize_chunk(
+            np.arange(start, stop),
+            counts,
+            x0,
+            y0,
+            span_x,
+            planes,
+            depth_plane,
+            z_plane,
+            z_range,
+            width,
+            zbuffer,
+            face,
+            keep,
+        )
+        start = stop
+
+    # Flat shading, computed only for the faces that won a pixel.
+    covered = np.flatnonzero(face >= 0)
+    visible, inverse = np.unique(face[covered], return_inverse=True)
+    corners = vectors[visible].astype(np.float64)
+    normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    light = _normalize(forward * 0.8 + up * 0.45 - right * 0.35)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        lambert = np.abs(normals @ light) / np.linalg.norm(normals, axis=1)
+    shade[covered] = (0.25 + 0.75 * np.nan_to_num(lambert))[inverse]
+    return face.reshape(height, width), shade.reshape(height, width)
+
+
+def shade_image(
+    face: np.ndarray,
+    shade: np.ndarray,
+    color: Color = (91, 143, 185),
+    background: Color = (15, 23, 42),
+) -> np.ndarray:
+    """Colour a rasterized buffer into an ``(H, W, 3)`` uint8 RGB image."""
+    image = np.empty(face.shape + (3,), dtype=np.uint8)
+    image[...] = np.asarray(background, dtype=np.uint8)
+    covered = face >= 0
+    image[covered] = np.clip(
+        shade[covered, None] * np.asarray(color, dtype=np.float32), 0, 255
+    ).astype(np.uint8)
+    return image
+
+
+def render_mesh(
+    vectors: np.ndarray,
+    width: int = 336,
+    height: int = 240,
+    *,
+    color: Color = (91, 143, 185),
+    background: Color = (15, 23, 42),
+    **camera,
+) -> np.ndarray:
+    """
+    Render triangles to an RGB image with flat shading.
+
+    Keyword arguments beyond the colours are passed to :func:`rasterize`.
+
+    Returns:
+        np.ndarray: ``(height, width, 3)`` uint8 image
+    """
+    face, shade = rasterize(vectors, width, height, **camera)
+    return shade_image(face, shade, color=color, background=background)
+
+
+def encode_png(image: np.ndarray) -> bytes:
+    """Encode an ``(H, W, 3)`` or ``(H, W, 4)`` uint8 image as PNG bytes."""
+    image = np.ascontiguousarray(image, dtype=np.uint8)
+    if image.ndim != 3 or image.shape[2] not in (3, 4):
+        raise ValueError("Expected an (H, W, 3) or (H, W, 4) image")
+    height, width, channels = image.shape
+    raw = np.zeros((height, width * channels + 1), dtype=np.uint8)
+    raw[:, 1:] = image.reshape(height, -1)
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return (
+            struct.pack(">I", len(data))
+            + tag
+            + data
+            + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+        )
+
+    color_type = 2 if channels == 3 else 6
+    header = struct.pack(">IIBBBBB", width, height, 8, color_type, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(raw.tobytes(), 6))
+        + chunk(b"IEND", b"")
+    )
+
+
+def write_png(path: Union[str, Path], image: np.ndarray) -> Path:
+    """Write *image* to *path* as a PNG and return the path."""
+    output = Path(path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_bytes(encode_png(image))
+    return output
+
+
+def _camera_basis(
+    elevation: float, azimuth: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return unit (towards-eye, screen-right, screen-up) vectors."""
+    el = math.radians(elevation)
+    az = math.radians(azimuth)
+    forward = np.array(
+        [math.cos(el) * math.cos(az), math.cos(el) * math.sin(az), math.sin(el)]
+    )
+    right = np.array([-math.sin(az), math.cos(az), 0.0])
+    up = np.cross(forward, right)
+    return forward, right, up
+
+
+def _signed_area(px: np.ndarray, py: np.ndarray) -> np.ndarray:
+    return (px[:, 1] - px[:, 0]) * (py[:, 2] - py[:, 0]) - (px[:, 2] - px[:, 0]) * (
+        py[:, 1] - py[:, 0]
+    )
+
+
+def _column_min(values: np.ndarray) -> np.ndarray:
+    return np.minimum(np.minimum(values[:, 0], values[:, 1]), values[:, 2])
+
+
+def _column_max(values: np.ndarray) -> np.ndarray:
+    return np.maximum(np.maximum(values[:, 0], values[:, 1]), values[:, 2])
+
+
+def _normalize(vector: np.ndarray) -> np.ndarray:
+    return vector / np.linalg.norm(vector)
+
+
+def _barycentric_planes(px: np.ndarray, py: np.ndarray, area: np.ndarray) -> np.ndarray:
+    """Return ``(N, 2, 3)`` coefficients so ``l_i = a*x + b*y + c`` for i in 0, 1."""
+    planes = np.empty((len(px), 2, 3))
+    for index, (j, k) in enumerate(((1, 2), (2, 0))):
+        planes[:, index, 0] = (py[:, j] - py[:, k]) / area
+        planes[:, index, 1] = (px[:, k] - px[:, j]) / area
+        planes[:, index, 2] = (px[:, j] * py[:, k] - px[:, k] * py[:, j]) / area
+    return planes
+
+
+def _attribute_plane(planes: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Return ``(N, 3)`` screen-space plane coefficients for per-vertex *values*."""
+    l0, l1 = planes[:, 0], planes[:, 1]
+    l2 = -l0 - l1
+    l2[:, 2] += 1.0
+    return l0 * values[:, 0:1] + l1 * values[:, 1:2] + l2 * values[:, 2:3]
+
+
+def _rasterize_chunk(
+    chunk: np.ndarray,
+    counts: np.ndarray,
+    x0: np.ndarray,
+    y0: np.ndarray,
+    span_x: np.ndarray,
+    planes: np.ndarray,
+    depth_plane: np.ndarray,
+    z_plane: Optional[Tuple[np.ndarray, Optional[np.ndarray]]],
+    z_range: Optional[Tuple[float, float]],
+    width: int,
+    zbuffer: np.ndarray,
+    face: np.ndarray,
+    keep: np.ndarray,
+) -> None:
+    """Z-test every (triangle, pixel) candidate of *chunk* into the buffers."""
+    chunk_counts = counts[chunk]
+    tri = np.repeat(chunk, chunk_counts)
+    offsets = np.cumsum(chunk_counts) - chunk_counts
+    local = np.arange(len(tri)) - np.repeat(offsets, chunk_counts)
+    span = span_x[tri]
+    x = (x0[tri] + local % span).astype(np.float64) + 0.5
+    y = (y0[tri] + local // span).astype(np.float64) + 0.5
+
+    plane = planes[tri]
+    l0 = plane[:, 0, 0] * x + plane[:, 0, 1] * y + plane[:, 0, 2]
+    l1 = plane[:, 1, 0] * x + plane[:, 1, 1] * y + plane[:, 1, 2]
+    eps = -1e-9
+    inside = (l0 >= eps) & (l1 >= eps) & (1.0 - l0 - l1 >= eps)
+    if z_plane is not None and z_range is not None:
+        numerator = _evaluate(z_plane[0], tri, x, y)
+        world_z = (
+            numerator
+            if z_plane[1] is None
+            else numerator / _evaluate(z_plane[1], tri, x, y)
+        )
+        inside &= (world_z >= z_range[0]) & (world_z <= z_range[1])
+    tri, x, y = tri[inside], x[inside], y[inside]
+    if len(tri) == 0:
+        return
+    depth = _evaluate(depth_plane, tri, x, y)
+    pixel = (y.astype(np.int64)) * width + x.astype(np.int64)
+
+    # Nearest candidate per pixel, then merge with earlier chunks.
+    order = np.lexsort((depth, pixel))
+    pixel, depth, tri = pixel[order], depth[order], tri[order]
+    first = np.ones(len(pixel), dtype=bool)
+    first[1:] = pixel[1:] != pixel[:-1]
+    pixel, depth, tri = pixel[first], depth[first], tri[first]
+    closer = depth < zbuffer[pixel]
+    zbuffer[pixel[closer]] = depth[closer]
+    face[pixel[closer]] = keep[tri[closer]]
+
+
+def _evaluate(
+    plane: np.ndarray, tri: np.ndarray, x: np.ndarray, y: np.ndarray
+) -> np.ndarray:
+    coeffs = plane[tri]
+    return coeffs[:, 0] * x + coeffs[:, 1] * y + coeffs[:, 2]
@@ -0,0 +1,225 @@
+"""
+Shared asyncio scheduler for OpenSCAD subprocesses.
+
+Renders are launched with ``asyncio.create_subprocess_exec`` on one event
+loop that runs in a background thread, so every caller in the process,
+synchronous or not, shares one concurrency cap. Each job has its own
+timeout, and cancelling a job's future kills its process. Submitters block
+once ``max_pending`` jobs are queued or running, which keeps large batches
+from piling up unbounded work.
+
+Environment:
+    STL2SCAD_RENDER_CONCURRENCY: Concurrent OpenSCAD processes for the
+        shared pool (default: CPU count)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+from dataclasses import dataclass, field
+import logging
+import os
+import threading
+from typing import Iterable, List, Optional
+
+
+@dataclass(frozen=True)
+class RenderJob:
+    """One OpenSCAD invocation; mirrors the arguments of ``run_openscad``."""
+
+    description: str
+    args: List[str] = field(default_factory=list)
+    log_file: str = ""
+    openscad_path: Optional[str] = None
+    timeout: float = 30
+
+
+class RenderPool:
+    """
+    Concurrency-capped OpenSCAD runner with a synchronous façade.
+
+    Args:
+        max_concurrency: Processes allowed to run at once (default: CPU count)
+        max_pending: Jobs allowed to be queued or running before ``submit``
+            blocks (default: four per concurrent slot)
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        max_pending: Optional[int] = None,
+    ) -> None:
+        self.max_concurrency = int(max_concurrency or os.cpu_count() or 1)
+        self.max_pending = int(max_pending or self.max_concurrency * 4)
+        if self.max_concurrency <= 0 or self.max_pending <= 0:
+            raise ValueError("max_concurrency and max_pending must be positive")
+        self._pending = threading.BoundedSemaphore(self.max_pending)
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    def submit(self, job: RenderJob) -> "concurrent.futures.Future[bool]":
+        """
+        Schedule *job* and return a future for its success flag.
+
+        Blocks while ``max_pending`` jobs are outstanding. Cancelling the
+        returned future kills the OpenSCAD process if it has started.
+        """
+        loop = self._ensure_loop()
+        self._pending.acquire()
+        try:
+            future = asyncio.run_coroutine_threadsafe(self._run_job(job), loop)
+        except BaseException:
+            self._pending.release()
+            raise
+        future.add_done_callback(lambda _: self._pending.release())
+        return future
+
+    def run(self, job: RenderJob) -> bool:
+        """Run *job* and block until it finishes."""
+        return self.submit(job).result()
+
+    def map(self, jobs: Iterable[RenderJob]) -> List[bool]:
+        """Run independent *jobs* concurrently and return their flags in order."""
+        futures = [self.submit(job) for job in jobs]
+        return [future.result() for future in futures]
+
+    async def run_async(self, job: RenderJob) -> bool:
+        """Await *job* from any event loop, sharing this pool's cap."""
+        caller = asyncio.get_running_loop()
+        future = await caller.run_in_executor(None, self.submit, job)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+
+    def close(self) -> None:
+        """Stop the background loop; later submissions start a new one."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = self._slots = None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join()
+        if loop is not None:
+            loop.close()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="stl2scad-render-pool", daemon=True
+                )
+                thread.start()
+                self._slots = asyncio.run_coroutine_threadsafe(
+                    self._make_slots(), loop
+                ).result()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    async def _make_slots(self) -> asyncio.Semaphore:
+        return asyncio.Semaphore(self.max_concurrency)
+
+    async def _run_job(self, job: RenderJob) -> bool:
+        assert self._slots is not None
+        async with self._slots:
+            return await _execute(job)
+
+
+async def _execute(job: RenderJob) -> bool:
+    """Run one OpenSCAD job, writing its combined output to ``job.log_file``."""
+    logging.info(f"Executing OpenSCAD: {job.description}")
+    logging.debug(f"Command arguments: {job.args}")
+    logging.debug(f"Log file path: {job.log_file}")
+    logging.debug(f"Command timeout: {job.timeout} seconds")
+    logging.debug(f"OpenSCAD path: {job.openscad_path or 'default'}")
+
+    process = None
+    try:
+        command = [job.openscad_path or "openscad"] + [str(a) for a in job.args]
+        logging.info(f"Executing command: {' '.join(command)}")
+
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout_bytes, stderr_bytes = await asyncio.wait_for(
+            process.communicate(), timeout=job.timeout
+        )
+        stdout = stdout_bytes.decode("utf-8", errors="replace")
+        stderr = stderr_bytes.decode("utf-8", errors="replace")
+
+        # Always write output to log file so callers (e.g. version check) can read it
+        with open(job.log_file, "w", encoding="utf-8") as f:
+            if stdout:
+                f.write(stdout)
+            if stderr:
+                f.write(stderr)
+
+        if stdout:
+            logging.debug(f"Command output: {stdout}")
+        if stderr:
+            logging.warning(f"Command stderr: {stderr}")
+
+        if process.returncode != 0:
+            logging.error(f"Command failed with exit code {process.returncode}.")
+            return False
+
+        logging.info("Command completed successfully")
+        return True
+
+    except asyncio.TimeoutError:
+        await _kill(process)
+        logging.error(
+            f"Command timed out after {job.timeout} seconds. This may indicate that OpenSCAD is having trouble processing the file or the system is under heavy load."
+        )
+        return False
+    except asyncio.CancelledError:
+        await _kill(process)
+        logging.info(f"Cancelled OpenSCAD job: {job.description}")
+        raise
+    except Exception as e:
+        logging.error(f"Unexpected error executing OpenSCAD: {str(e)}")
+        logging.debug("Stack trace:", exc_info=True)
+        return False
+
+
+async def _kill(process: Optional[asyncio.subprocess.Process]) -> None:
+    if process is None or process.returncode is not None:
+        return
+    try:
+        process.kill()
+    except ProcessLookupError:
+        return
+    await process.wait()
+
+
+_shared_pool: Optional[RenderPool] = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_render_pool() -> RenderPool:
+    """Return the process-wide pool shared by all OpenSCAD callers."""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            concurrency = os.environ.get("STL2SCAD_RENDER_CONCURRENCY")
+            _shared_pool = RenderPool(int(concurrency) if concurrency else None)
+        return _shared_pool
+
+
+def _reset_after_fork() -> None:
+    # A forked child has no copy of the parent's event-loop thread.
+    global _shared_pool, _shared_pool_lock
+    _shared_pool = None
+    _shared_pool_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
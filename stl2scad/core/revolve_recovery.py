@@ -14,7 +14,9 @@ from typing import Any, Optional
 
 import numpy as np
 
+from stl2scad.core.dispatch_trace import traced_detector
 from stl2scad.tuning.config import DetectorConfig
+from stl2scad.tuning.decisions import gate
 
 
 def candidate_revolution_axis(
@@ -530,6 +532,7 @@ def classify_revolve_profile(
     return None
 
 
+@traced_detector("revolve_solid")
 def detect_revolve_solid(
     vertices: np.ndarray,
     triangles: np.ndarray,
@@ -629,7 +632,7 @@ def detect_revolve_solid(
     nf_q = float(nf_score)
     pv_q = float(profile_validity)
     confidence = min(axis_q, cs_q, nf_q, pv_q)
-    if confidence < config.revolve_confidence_min:
+    if gate(config, "revolve_confidence_min", "<", confidence):
         return []
 
     detected_via = "annular_revolve" if is_annular else "axisymmetric_revolve"
@@ -7,6 +7,7 @@ as well as visualization tools for identifying differences between the original
 """
 
 from .metrics import (
+    AdaptiveSamplingConfig,
     calculate_stl_volume,
     calculate_stl_surface_area,
     calculate_scad_metrics,
@@ -22,12 +23,14 @@ from .verification import (
 )
 
 from .visualization import (
+    VISUALIZATION_RENDERERS,
     generate_comparison_visualization,
     generate_verification_report_html,
 )
 
 __all__ = [
     # Metrics
+    "AdaptiveSamplingConfig",
     "calculate_stl_volume",
     "calculate_stl_surface_area",
     "calculate_scad_metrics",
@@ -39,6 +42,7 @@ __all__ = [
     "verify_existing_conversion",
     "batch_verify",
     # Visualization
+    "VISUALIZATION_RENDERERS",
     "generate_comparison_visualization",
     "generate_verification_report_html",
 ]
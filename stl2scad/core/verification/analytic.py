@@ -0,0 +1,800 @@
+"""
+Closed-form verification metrics for feature-graph IR trees.
+
+The SCAD previews emitted from a feature graph are built from a small set of
+primitives (cubes, cylinders, polygon extrusions and revolves) combined with
+through-cuts. For those trees the volume, surface area and bounding box of the
+rendered solid can be computed exactly from the IR node parameters, so the
+OpenSCAD round trip is only needed for nodes that cannot be integrated here.
+
+The metrics reproduce OpenSCAD's tessellation rather than the ideal curved
+surfaces: circles become regular polygons with the same fragment count and
+vertex phase OpenSCAD uses, so the results match a CGAL render of the same
+SCAD text up to floating-point noise.
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Engines accepted by verify_existing_conversion and the verify command.
+METRICS_ENGINES = ("openscad", "analytic", "auto")
+
+# Fragment counts hard-coded by the IR emitter.
+HOLE_FRAGMENTS = 64
+REVOLVE_FRAGMENTS = 128
+
+# OpenSCAD defaults for $fn, $fs, $fa and its smallest resolvable radius.
+_OPENSCAD_FN = 0.0
+_OPENSCAD_FS = 2.0
+_OPENSCAD_FA = 12.0
+_OPENSCAD_GRID_FINE = 0.00000095367431640625
+
+# Cuts closer than this to a base face or to each other may merge faces in
+# the rendered solid, which the closed forms below do not model.
+_CLEARANCE = 1e-6
+
+_AXES = ("x", "y", "z")
+
+
+class _NotIntegrable(Exception):
+    """Raised when an IR node has no exact closed form here."""
+
+
+@dataclass
+class _Solid:
+    """Integrated properties of one emitted solid."""
+
+    volume: float
+    surface_area: float
+    # Vertices of the tessellated solid; their extent is the bounding box.
+    vertices: np.ndarray
+
+
+@dataclass
+class _Prism:
+    """A cut swept along one world axis: 2D section plus axial interval."""
+
+    section: np.ndarray
+    lo: float
+    hi: float
+
+
+@dataclass
+class _CutPlan:
+    """A cuboid base plus the validated axial cut groups carved from it."""
+
+    prim: Dict[str, Any]
+    placement: np.ndarray
+    axis: int = 2
+    groups: List[List[_Prism]] = field(default_factory=list)
+
+
+def openscad_fragments(
+    radius: float,
+    fn: float = _OPENSCAD_FN,
+    fs: float = _OPENSCAD_FS,
+    fa: float = _OPENSCAD_FA,
+) -> int:
+    """Return the fragment count OpenSCAD uses for a circle of ``radius``."""
+    if radius < _OPENSCAD_GRID_FINE:
+        return 3
+    if fn > 0.0:
+        return int(fn) if fn >= 3 else 3
+    return int(math.ceil(max(min(360.0 / fa, radius * 2.0 * math.pi / fs), 5)))
+
+
+def calculate_ir_metrics(root: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Calculate volume, surface area and bounding box for an IR node tree.
+
+    Args:
+        root: Root IR node, typically ``graph["ir_tree"][0]["root"]``
+
+    Returns:
+        Optional[Dict[str, Any]]: Metrics in the ``calculate_scad_metrics``
+        layout with ``mesh`` set to None, or None when any node in the tree
+        has no exact closed form and must be rendered by OpenSCAD instead
+    """
+    try:
+        solid = _integrate(root)
+    except _NotIntegrable:
+        return None
+    if solid is None or solid.volume <= 0.0:
+        return None
+
+    min_coords = [float(v) for v in solid.vertices.min(axis=0)]
+    max_coords = [float(v) for v in solid.vertices.max(axis=0)]
+    bounding_box = {f"min_{axis}": min_coords[i] for i, axis in enumerate(_AXES)}
+    bounding_box.update({f"max_{axis}": max_coords[i] for i, axis in enumerate(_AXES)})
+    bounding_box["width"] = max_coords[0] - min_coords[0]
+    bounding_box["height"] = max_coords[1] - min_coords[1]
+    bounding_box["depth"] = max_coords[2] - min_coords[2]
+    return {
+        "volume": float(solid.volume),
+        "surface_area": float(solid.surface_area),
+        "bounding_box": bounding_box,
+        "mesh": None,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Node dispatch (mirrors feature_graph._IREmitter)
+# ---------------------------------------------------------------------------
+
+
+def _integrate(node: Dict[str, Any]) -> Optional[_Solid]:
+    """Return the solid emitted for *node*, or None when nothing is emitted."""
+    ntype = node.get("type")
+    if ntype == "BooleanUnion":
+        return _integrate_union(node)
+    if ntype == "BooleanDifference":
+        return _integrate_difference(node)
+    if ntype == "TransformTranslate":
+        child = _integrate(node.get("child", {}))
+        if child is None:
+            return None
+        offset = _vector(node.get("offset"))
+        return _Solid(child.volume, child.surface_area, child.vertices + offset)
+    if ntype == "TransformRotate":
+        child_node = node.get("child", {})
+        child_type = child_node.get("type")
+        if (
+            child_type == "PrimitivePlate"
+            and child_node.get("detected_via") == "rotated_plate"
+        ) or (
+            child_type == "PrimitiveBox"
+            and child_node.get("detected_via") == "rotated_box"
+        ):
+            return _integrate(child_node)
+        child = _integrate(child_node)
+        if child is None:
+            return None
+        rotation = _euler_rotation(node.get("angles_deg", [0.0, 0.0, 0.0]))
+        return _Solid(child.volume, child.surface_area, child.vertices @ rotation.T)
+    if ntype == "PrimitivePlate":
+        return _cuboid(node, _plate_placement(node))
+    if ntype == "PrimitiveBox":
+        return _cuboid(node, _box_placement(node))
+    if ntype == "PrimitiveCylinder":
+        return _primitive_cylinder(node)
+    if ntype == "ExtrudeLinear":
+        return _extrude_linear(node)
+    if ntype == "ExtrudeRevolve":
+        return _extrude_revolve(node)
+    if ntype == "FallbackMesh":
+        raise _NotIntegrable("fallback mesh")
+    return None
+
+
+def _integrate_union(node: Dict[str, Any]) -> Optional[_Solid]:
+    from ..feature_graph import emit_node
+
+    children = node.get("children", [])
+    if len(children) == 1:
+        return _integrate(children[0])
+    solids: List[_Solid] = []
+    for child in children:
+        if emit_node(child) is None:
+            continue
+        solid = _integrate(child)
+        if solid is not None:
+            solids.append(solid)
+    if not solids:
+        return None
+    # Only separated children can be summed; touching or overlapping ones
+    # share material or faces that the union removes.
+    bounds = [(s.vertices.min(axis=0), s.vertices.max(axis=0)) for s in solids]
+    for i in range(len(bounds)):
+        for j in range(i + 1, len(bounds)):
+            separated = np.any(bounds[i][1] + _CLEARANCE < bounds[j][0]) or np.any(
+                bounds[j][1] + _CLEARANCE < bounds[i][0]
+            )
+            if not separated:
+                raise _NotIntegrable("overlapping union children")
+    return _Solid(
+        sum(s.volume for s in solids),
+        sum(s.surface_area for s in solids),
+        np.vstack([s.vertices for s in solids]),
+    )
+
+
+def _integrate_difference(node: Dict[str, Any]) -> Optional[_Solid]:
+    from ..feature_graph import emit_node
+
+    plan = _difference_plan(node)
+    if plan is not None:
+        return _integrate_cut_plan(plan)
+
+    solid = _integrate(node.get("base", {}))
+    if solid is None:
+        return None
+    cuts = node.get("cuts", [])
+    if any(
+        emit_node(cut) is not None
+        for cut in cuts
+        if cut.get("type") != "ChamferOrFilletEdge"
+    ):
+        raise _NotIntegrable("generic difference with emitted cuts")
+    return solid
+
+
+def _difference_plan(node: Dict[str, Any]) -> Optional[_CutPlan]:
+    """Return the cut plan of a difference over a cuboid base, else None."""
+    base = node.get("base", {})
+    cuts = node.get("cuts", [])
+    transform_angles = None
+    base_inner = base
+    if base.get("type") == "TransformRotate":
+        base_inner = base.get("child", {})
+        transform_angles = base.get("angles_deg")
+    base_type = base_inner.get("type")
+
+    edge_treatment = next(
+        (c for c in cuts if c.get("type") == "ChamferOrFilletEdge"), None
+    )
+    actual_cuts = [c for c in cuts if c.get("type") != "ChamferOrFilletEdge"]
+
+    if base_type == "PrimitivePlate":
+        return _plate_cut_plan(
+            base_inner, transform_angles, edge_treatment, actual_cuts
+        )
+    if base_type == "PrimitiveBox":
+        return _box_cut_plan(base_inner, transform_angles, edge_treatment, actual_cuts)
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Cuboid bases
+# ---------------------------------------------------------------------------
+
+
+def _plate_placement(
+    prim: Dict[str, Any], transform_angles: Optional[Sequence[float]] = None
+) -> np.ndarray:
+    """Return the 3x4 affine placement ``_plate_transform_scad`` emits."""
+    origin = _vector(prim.get("origin"))
+    if prim.get("detected_via") == "rotated_plate":
+        axes = [
+            prim.get("local_u_axis"),
+            prim.get("local_v_axis"),
+            prim.get("dominant_axis"),
+        ]
+        if all(isinstance(a, list) and len(a) == 3 for a in axes):
+            return np.column_stack(
+                [np.asarray(a, dtype=np.float64) for a in axes] + [origin]
+            )
+        return np.column_stack(
+            [_euler_rotation(prim.get("rotation_euler_deg", [0.0, 0.0, 0.0])), origin]
+        )
+    if transform_angles is not None and not prim.get("detected_via"):
+        return np.column_stack([_euler_rotation(transform_angles), origin])
+    return np.column_stack([np.eye(3), origin])
+
+
+def _box_placement(prim: Dict[str, Any]) -> np.ndarray:
+    """Return the 3x4 affine placement ``_box_transform_scad`` emits."""
+    origin = _vector(prim.get("origin"))
+    if prim.get("detected_via") == "rotated_box":
+        axes = [
+            prim.get("local_u_axis"),
+            prim.get("local_v_axis"),
+            prim.get("local_n_axis"),
+        ]
+        if all(isinstance(a, list) and len(a) == 3 for a in axes):
+            return np.column_stack(
+                [np.asarray(a, dtype=np.float64) for a in axes] + [origin]
+            )
+        return np.column_stack(
+            [_euler_rotation(prim.get("rotation_euler_deg", [0.0, 0.0, 0.0])), origin]
+        )
+    return np.column_stack([np.eye(3), origin])
+
+
+def _cuboid(prim: Dict[str, Any], placement: np.ndarray) -> _Solid:
+    """Integrate ``cube(size)`` under an affine placement."""
+    size = _vector(prim.get("size"), default=1.0)
+    if np.any(size <= 0.0):
+        raise _NotIntegrable("degenerate cuboid")
+    edges = placement[:, :3] * size
+    volume = abs(float(np.linalg.det(edges)))
+    surface_area = 2.0 * sum(
+        float(np.linalg.norm(np.cross(edges[:, i], edges[:, (i + 1) % 3])))
+        for i in range(3)
+    )
+    corners = np.array(
+        [[i, j, k] for i in (0.0, 1.0) for j in (0.0, 1.0) for k in (0.0, 1.0)]
+    )
+    vertices = corners @ edges.T + placement[:, 3]
+    return _Solid(volume, surface_area, vertices)
+
+
+def _plate_cut_plan(
+    prim: Dict[str, Any],
+    transform_angles: Optional[Sequence[float]],
+    edge_treatment: Optional[Dict[str, Any]],
+    cuts: List[Dict[str, Any]],
+) -> _CutPlan:
+    if edge_treatment is not None:
+        raise _NotIntegrable("plate edge treatment")
+    if transform_angles is not None:
+        if cuts:
+            raise _NotIntegrable("cuts on a rotated plate")
+        return _CutPlan(prim, _plate_placement(prim, transform_angles))
+
+    size = _vector(prim.get("size"), default=1.0)
+    axis = int(np.argmin(size))
+    depth = float(size[axis]) + 0.2
+    local_n_axis = prim.get("local_n_axis") or prim.get("dominant_axis")
+
+    groups: List[List[_Prism]] = []
+    for cut in cuts:
+        ctype = cut.get("type")
+        if ctype in {"PatternLinear", "PatternGrid"}:
+            if cut.get("axis") == "local_n" and local_n_axis is not None:
+                raise _NotIntegrable("plate-normal hole pattern")
+            diameter = float(cut.get("diameter", 0.0))
+            for center in _pattern_centers(cut):
+                groups.append([_hole_prism(center, diameter, depth, axis)])
+            continue
+
+        if ctype == "TransformTranslate":
+            offset = _vector(cut.get("offset"))
+            child = cut.get("child", {})
+        elif ctype == "Slot":
+            offset = None
+            child = cut
+        else:
+            continue
+        child_type = child.get("type")
+
+        if child_type == "HoleThrough" and offset is not None:
+            if child.get("axis") == "local_n" and local_n_axis is not None:
+                raise _NotIntegrable("plate-normal hole")
+            groups.append(
+                [_hole_prism(offset, float(child.get("diameter", 0.0)), depth, axis)]
+            )
+        elif child_type == "HoleCounterbore" and offset is not None:
+            through_d = float(child.get("through_diameter", 0.0))
+            bore_d = float(child.get("bore_diameter", 0.0))
+            bore_depth = float(child.get("bore_depth", 0.0))
+            if bore_d <= through_d or bore_depth <= 0.0:
+                raise _NotIntegrable("counterbore not wider than its hole")
+            bore_start = float(offset[axis]) + depth * 0.5 - bore_depth
+            bore = _hole_prism(offset, bore_d, depth, axis)
+            groups.append(
+                [
+                    _hole_prism(offset, through_d, depth, axis),
+                    _Prism(bore.section, bore_start, bore_start + bore_depth + 0.1),
+                ]
+            )
+        elif child_type == "Slot":
+            slot_axis = str(child.get("axis", _AXES[axis]))
+            if slot_axis not in {_AXES[axis], "local_n"}:
+                continue
+            if slot_axis == "local_n" and local_n_axis is not None:
+                raise _NotIntegrable("plate-normal slot")
+            groups.append([_slot_prism(child, depth, axis)])
+        elif (
+            child_type in {"RectangularCutout", "RectangularPocket"}
+            and offset is not None
+        ):
+            groups.append([_rect_prism(offset, _vector(child.get("size")), axis)])
+
+    return _plan_cuts(prim, axis, groups)
+
+
+def _box_cut_plan(
+    prim: Dict[str, Any],
+    transform_angles: Optional[Sequence[float]],
+    edge_treatment: Optional[Dict[str, Any]],
+    cuts: List[Dict[str, Any]],
+) -> _CutPlan:
+    size = _vector(prim.get("size"), default=1.0)
+    hole_cuts: List[Tuple[int, np.ndarray, float]] = []
+    rect_cuts: List[Tuple[np.ndarray, np.ndarray]] = []
+    for cut in cuts:
+        if cut.get("type") != "TransformTranslate":
+            continue
+        child = cut.get("child", {})
+        offset = _vector(cut.get("offset"))
+        if child.get("type") == "HoleThrough":
+            axis_label = str(child.get("axis", "z"))
+            if axis_label not in _AXES:
+                raise _NotIntegrable("unsupported hole axis")
+            hole_cuts.append(
+                (_AXES.index(axis_label), offset, float(child.get("diameter", 0.0)))
+            )
+        elif child.get("type") in {"RectangularCutout", "RectangularPocket"}:
+            rect_cuts.append((offset, _vector(child.get("size"))))
+
+    if (
+        edge_treatment is not None
+        and edge_treatment.get("edge_kind") in ("chamfer", "fillet")
+        and transform_angles is None
+        and not rect_cuts
+    ):
+        raise _NotIntegrable("box edge treatment")
+    if transform_angles is not None:
+        if hole_cuts or rect_cuts:
+            raise _NotIntegrable("cuts on a rotated box")
+        placement = np.column_stack(
+            [_euler_rotation(transform_angles), _vector(prim.get("origin"))]
+        )
+        return _CutPlan(prim, placement)
+
+    # Every cut must be a prism along one shared axis.
+    hole_axes = {axis for axis, _, _ in hole_cuts}
+    if len(hole_axes) > 1:
+        raise _NotIntegrable("holes along several axes")
+    candidate_axes = sorted(hole_axes) if hole_axes else [0, 1, 2]
+    last_error: Optional[_NotIntegrable] = None
+    for axis in candidate_axes:
+        groups = [
+            [_hole_prism(center, diameter, float(size[axis]) + 0.2, axis)]
+            for _, center, diameter in hole_cuts
+        ]
+        groups += [
+            [_rect_prism(center, rect_size, axis)] for center, rect_size in rect_cuts
+        ]
+        try:
+            return _plan_cuts(prim, axis, groups)
+        except _NotIntegrable as exc:
+            last_error = exc
+    raise last_error or _NotIntegrable("no common cut axis")
+
+
+def _plan_cuts(prim: Dict[str, Any], axis: int, groups: List[List[_Prism]]) -> _CutPlan:
+    """Clip and validate groups of axial prisms cut from an axis-aligned cuboid.
+
+    Each group is a stack of coaxial prisms whose sections are nested, such
+    as a counterbore. Groups must sit strictly inside the cuboid's section
+    and must not overlap one another, so every group carves its own cavity.
+    """
+    origin = _vector(prim.get("origin"))
+    size = _vector(prim.get("size"), default=1.0)
+    plane = [i for i in range(3) if i != axis]
+    section_lo = origin[plane]
+    section_hi = origin[plane] + size[plane]
+    p0 = float(origin[axis])
+    p1 = p0 + float(size[axis])
+
+    group_bounds: List[Tuple[np.ndarray, np.ndarray]] = []
+    planned: List[List[_Prism]] = []
+    for group in groups:
+        clipped = [
+            _Prism(prism.section, max(prism.lo, p0), min(prism.hi, p1))
+            for prism in group
+        ]
+        clipped = [prism for prism in clipped if prism.hi > prism.lo]
+        if not clipped:
+            continue
+        points = np.vstack([prism.section for prism in clipped])
+        lo_xy = points.min(axis=0)
+        hi_xy = points.max(axis=0)
+        if np.any(lo_xy <= section_lo + _CLEARANCE) or np.any(
+            hi_xy >= section_hi - _CLEARANCE
+        ):
+            raise _NotIntegrable("cut reaches the base outline")
+        for other_lo, other_hi in group_bounds:
+            if np.all(lo_xy <= other_hi + _CLEARANCE) and np.all(
+                other_lo <= hi_xy + _CLEARANCE
+            ):
+                raise _NotIntegrable("overlapping cuts")
+        group_bounds.append((lo_xy, hi_xy))
+        planned.append(clipped)
+
+    return _CutPlan(prim, np.column_stack([np.eye(3), origin]), axis, planned)
+
+
+def _integrate_cut_plan(plan: _CutPlan) -> _Solid:
+    solid = _cuboid(plan.prim, plan.placement)
+    if not plan.groups:
+        return solid
+    size = _vector(plan.prim.get("size"), default=1.0)
+    p0 = float(plan.placement[plan.axis, 3])
+    p1 = p0 + float(size[plan.axis])
+    volume = solid.volume
+    surface_area = solid.surface_area
+    for group in plan.groups:
+        removed_volume, area_delta = _axial_cavity(group, p0, p1)
+        volume -= removed_volume
+        surface_area += area_delta
+    return _Solid(volume, surface_area, solid.vertices)
+
+
+def _cavity_levels(
+    prisms: List[_Prism], p0: float, p1: float
+) -> List[Tuple[float, float, Optional[np.ndarray]]]:
+    """Split a nested prism stack into (lo, hi, section) levels over [p0, p1].
+
+    Between consecutive breakpoints the cavity section is the largest prism
+    covering that level, or None where the stack leaves material.
+    """
+    sections = [
+        (abs(_polygon_signed_area(p.section)), i, p) for i, p in enumerate(prisms)
+    ]
+    breakpoints = sorted({p0, p1} | {p.lo for p in prisms} | {p.hi for p in prisms})
+    levels: List[Tuple[float, float, Optional[np.ndarray]]] = []
+    for lo, hi in zip(breakpoints[:-1], breakpoints[1:]):
+        mid = 0.5 * (lo + hi)
+        covering = [(a, i, p) for a, i, p in sections if p.lo <= mid <= p.hi]
+        levels.append((lo, hi, max(covering)[2].section if covering else None))
+    return levels
+
+
+def _axial_cavity(prisms: List[_Prism], p0: float, p1: float) -> Tuple[float, float]:
+    """Return (removed volume, surface area change) for a nested prism stack.
+
+    Walls add perimeter x length, each change of section between levels
+    exposes the difference in area, and the sections reaching the base
+    faces remove that much of the face.
+    """
+    levels: List[Tuple[float, float, float]] = []
+    for lo, hi, section in _cavity_levels(prisms, p0, p1):
+        if section is None:
+            levels.append((hi - lo, 0.0, 0.0))
+        else:
+            area = abs(_polygon_signed_area(section))
+            levels.append((hi - lo, area, _polygon_perimeter(section)))
+
+    removed_volume = sum(length * area for length, area, _ in levels)
+    area_delta = sum(length * perimeter for length, _, perimeter in levels)
+    area_delta += sum(abs(a[1] - b[1]) for a, b in zip(levels[:-1], levels[1:]))
+    area_delta -= levels[0][1] + levels[-1][1]
+    return removed_volume, area_delta
+
+
+def _hole_prism(center: np.ndarray, diameter: float, depth: float, axis: int) -> _Prism:
+    """Section and interval of ``hole_cutout`` along *axis*.
+
+    The emitted y-axis module rotates the cylinder away from its translated
+    start, so its cut does not span the hole center and is left to OpenSCAD.
+    """
+    if axis == 1:
+        raise _NotIntegrable("y-axis hole module")
+    if diameter <= 0.0:
+        raise _NotIntegrable("degenerate hole")
+    radius = diameter * 0.5
+    ring = _circle(radius, HOLE_FRAGMENTS)
+    if axis == 2:
+        section = ring + center[[0, 1]]
+    else:
+        # rotate(a=90, v=[0, 1, 0]) maps local (x, y) to world (y, z) = (y, -x).
+        section = np.column_stack([ring[:, 1], -ring[:, 0]]) + center[[1, 2]]
+    c = float(center[axis])
+    return _Prism(section, c - depth * 0.5, c + depth * 0.5)
+
+
+def _slot_prism(slot: Dict[str, Any], depth: float, axis: int) -> _Prism:
+    from ..feature_graph import _convex_hull_2d
+
+    start = _vector(slot.get("start"))
+    end = _vector(slot.get("end"))
+    if abs(float(start[axis] - end[axis])) > _CLEARANCE:
+        raise _NotIntegrable("slot ends at different depths")
+    width = float(slot.get("width", 0.0))
+    first = _hole_prism(start, width, depth, axis)
+    second = _hole_prism(end, width, depth, axis)
+    hull = _convex_hull_2d(np.vstack([first.section, second.section]))
+    return _Prism(hull, first.lo, first.hi)
+
+
+def _rect_prism(center: np.ndarray, size: np.ndarray, axis: int) -> _Prism:
+    if np.any(size <= 0.0):
+        raise _NotIntegrable("degenerate rectangular cut")
+    plane = [i for i in range(3) if i != axis]
+    lo = center[plane] - size[plane] * 0.5
+    hi = center[plane] + size[plane] * 0.5
+    section = np.array([[lo[0], lo[1]], [hi[0], lo[1]], [hi[0], hi[1]], [lo[0], hi[1]]])
+    c = float(center[axis])
+    s = float(size[axis])
+    return _Prism(section, c - s * 0.5, c + s * 0.5)
+
+
+def _pattern_centers(pattern: Dict[str, Any]) -> List[np.ndarray]:
+    origin = _vector(pattern.get("origin"))
+    if pattern.get("type") == "PatternLinear":
+        step = _vector(pattern.get("step"))
+        return [origin + i * step for i in range(int(pattern.get("count", 0)))]
+    row_step = _vector(pattern.get("row_step"))
+    col_step = _vector(pattern.get("col_step"))
+    return [
+        origin + row * row_step + col * col_step
+        for row in range(int(pattern.get("rows", 0)))
+        for col in range(int(pattern.get("cols", 0)))
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Curved primitives
+# ---------------------------------------------------------------------------
+
+
+def _primitive_cylinder(node: Dict[str, Any]) -> _Solid:
+    height = float(node.get("height", 0.0))
+    if "diameter" in node:
+        radius = float(node["diameter"]) * 0.5
+    else:
+        radius = float(node.get("radius", 0.0))
+    if radius <= 0.0 or height <= 0.0:
+        raise _NotIntegrable("degenerate cylinder")
+    profile = np.array([[0.0, 0.0], [radius, 0.0], [radius, height], [0.0, height]])
+    solid = _revolve(profile, openscad_fragments(radius))
+    rotation = {
+        "x": _euler_rotation([0.0, 90.0, 0.0]),
+        "y": _euler_rotation([-90.0, 0.0, 0.0]),
+    }.get(str(node.get("axis", "z")), np.eye(3))
+    vertices = solid.vertices @ rotation.T + _vector(node.get("origin"))
+    return _Solid(solid.volume, solid.surface_area, vertices)
+
+
+def _extrude_linear(node: Dict[str, Any]) -> _Solid:
+    height = float(node.get("height", 0.0))
+    profile = node.get("profile", {})
+    points = profile.get("points", []) if isinstance(profile, dict) else []
+    section = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    area = abs(_polygon_signed_area(section)) if len(section) >= 3 else 0.0
+    if height <= 0.0 or area <= 0.0:
+        raise _NotIntegrable("degenerate extrusion")
+    vertices = np.vstack(
+        [np.column_stack([section, np.full(len(section), z)]) for z in (0.0, height)]
+    )
+    return _Solid(
+        area * height,
+        2.0 * area + _polygon_perimeter(section) * height,
+        vertices,
+    )
+
+
+def _extrude_revolve(node: Dict[str, Any]) -> _Solid:
+    axis_origin = _vector(node.get("axis_origin"))
+    if not np.any(np.abs(axis_origin) > 1e-6):
+        axis_origin = np.zeros(3)
+
+    upgrade = node.get("primitive_upgrade")
+    if upgrade is not None and upgrade.get("type") in {"cylinder", "cone", "sphere"}:
+        params = upgrade.get("params", {})
+        ptype = upgrade.get("type")
+        if ptype == "sphere":
+            profile = _sphere_profile(float(params.get("r", 1.0)), REVOLVE_FRAGMENTS)
+            z_shift = float(params.get("z_center", 0.0))
+        else:
+            if ptype == "cylinder":
+                r1 = r2 = float(params.get("r", 1.0))
+            else:
+                r1 = float(params.get("r1", 0.0))
+                r2 = float(params.get("r2", 0.0))
+            h = float(params.get("h", 1.0))
+            if h <= 0.0 or max(r1, r2) <= 0.0:
+                raise _NotIntegrable("degenerate revolve primitive")
+            profile = _dedupe_ring([[0.0, 0.0], [r1, 0.0], [r2, h], [0.0, h]])
+            z_shift = float(params.get("z_lo", 0.0))
+        solid = _revolve(profile, REVOLVE_FRAGMENTS)
+        offset = axis_origin + np.array([0.0, 0.0, z_shift])
+        return _Solid(solid.volume, solid.surface_area, solid.vertices + offset)
+
+    profile_node = node.get("profile", {})
+    points = profile_node.get("points", []) if isinstance(profile_node, dict) else []
+    if node.get("detected_via") == "annular_revolve":
+        inner_r = float(node.get("inner_r", 0.0))
+        outer_r = float(node.get("outer_r", 1.0))
+        z_values = [float(p[1]) for p in points]
+        h = (max(z_values) - min(z_values)) if z_values else 0.0
+        z_lo = min(z_values) if z_values else 0.0
+        if h <= 0.0 or outer_r <= inner_r:
+            raise _NotIntegrable("degenerate annular revolve")
+        profile = np.array([[inner_r, 0.0], [outer_r, 0.0], [outer_r, h], [inner_r, h]])
+        solid = _revolve(profile, REVOLVE_FRAGMENTS)
+        offset = axis_origin + np.array([0.0, 0.0, z_lo])
+        return _Solid(solid.volume, solid.surface_area, solid.vertices + offset)
+
+    profile = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if len(profile) < 3 or np.any(profile[:, 0] < 0.0):
+        raise _NotIntegrable("revolve profile crosses the axis")
+    return _revolve(profile, REVOLVE_FRAGMENTS)
+
+
+def _revolve(profile: np.ndarray, fragments: int) -> _Solid:
+    """Integrate ``rotate_extrude`` of an (r, z) polygon with *fragments*.
+
+    At every height the tessellated solid's section is a regular polygon
+    annulus, so the volume is Pappus' theorem scaled by the polygon-to-circle
+    area ratio. Each profile edge sweeps *fragments* planar trapezoids whose
+    parallel sides are the chords at its end radii.
+    """
+    r = profile[:, 0]
+    z = profile[:, 1]
+    r_next = np.roll(r, -1)
+    z_next = np.roll(z, -1)
+    cross = r * z_next - r_next * z
+    signed_area = 0.5 * float(np.sum(cross))
+    if abs(signed_area) <= 0.0:
+        raise _NotIntegrable("degenerate revolve profile")
+    # First moment of the profile area about the revolve axis.
+    moment = float(np.sum((r + r_next) * cross)) / 6.0
+    if signed_area < 0.0:
+        moment = -moment
+    half = math.pi / fragments
+    volume = fragments * math.sin(2.0 * half) * moment
+
+    slant = np.sqrt(((r_next - r) * math.cos(half)) ** 2 + (z_next - z) ** 2)
+    surface_area = fragments * math.sin(half) * float(np.sum((r + r_next) * slant))
+
+    phi = 2.0 * math.pi * np.arange(fragments) / fragments
+    vertices = np.column_stack(
+        [
+            np.outer(r, np.cos(phi)).ravel(),
+            np.outer(r, np.sin(phi)).ravel(),
+            np.repeat(z, fragments),
+        ]
+    )
+    return _Solid(volume, surface_area, vertices)
+
+
+def _sphere_profile(radius: float, fragments: int) -> np.ndarray:
+    """Return the (r, z) outline of OpenSCAD's ring-stacked ``sphere()``."""
+    if radius <= 0.0:
+        raise _NotIntegrable("degenerate sphere")
+    rings = (fragments + 1) // 2
+    phi = math.pi * (np.arange(rings) + 0.5) / rings
+    ring_r = radius * np.sin(phi)
+    ring_z = radius * np.cos(phi)
+    return np.vstack(
+        [
+            [[0.0, ring_z[0]]],
+            np.column_stack([ring_r, ring_z]),
+            [[0.0, ring_z[-1]]],
+        ]
+    )
+
+
+# ---------------------------------------------------------------------------
+# Small geometry helpers
+# ---------------------------------------------------------------------------
+
+
+def _vector(values: Any, default: float = 0.0) -> np.ndarray:
+    if not values:
+        return np.full(3, default, dtype=np.float64)
+    return np.asarray([float(v) for v in values], dtype=np.float64)
+
+
+def _euler_rotation(angles_deg: Sequence[float]) -> np.ndarray:
+    """Return the matrix of OpenSCAD ``rotate([x, y, z])`` (Rz @ Ry @ Rx)."""
+    ax, ay, az = (math.radians(float(a)) for a in angles_deg)
+    cx, sx = math.cos(ax), math.sin(ax)
+    cy, sy = math.cos(ay), math.sin(ay)
+    cz, sz = math.cos(az), math.sin(az)
+    rx = np.array([[1.0, 0.0, 0.0], [0.0, cx, -sx], [0.0, sx, cx]])
+    ry = np.array([[cy, 0.0, sy], [0.0, 1.0, 0.0], [-sy, 0.0, cy]])
+    rz = np.array([[cz, -sz, 0.0], [sz, cz, 0.0], [0.0, 0.0, 1.0]])
+    return rz @ ry @ rx
+
+
+def _circle(radius: float, fragments: int) -> np.ndarray:
+    phi = 2.0 * math.pi * np.arange(fragments) / fragments
+    return np.column_stack([radius * np.cos(phi), radius * np.sin(phi)])
+
+
+def _dedupe_ring(points: List[List[float]]) -> np.ndarray:
+    """Drop consecutive duplicates, e.g. the collapsed apex of a cone."""
+    kept: List[List[float]] = []
+    for point in points:
+        if not kept or point != kept[-1]:
+            kept.append(point)
+    if len(kept) > 1 and kept[0] == kept[-1]:
+        kept.pop()
+    return np.asarray(kept, dtype=np.float64)
+
+
+def _polygon_signed_area(points: np.ndarray) -> float:
+    x = points[:, 0]
+    y = points[:, 1]
+    return 0.5 * float(np.sum(x * np.roll(y, -1) - np.roll(x, -1) * y))
+
+
+def _polygon_perimeter(points: np.ndarray) -> float:
+    return float(np.sum(np.linalg.norm(np.roll(points, -1, axis=0) - points, axis=1)))
@@ -9,13 +9,53 @@ import numpy as np
 import subprocess
 import re
 import os
+from dataclasses import dataclass
 from pathlib import Path
+from statistics import NormalDist
 from typing import Dict, Optional, Tuple, Any, Union, List
 import stl
 from stl.mesh import Mesh
 
 from ..converter import run_openscad, get_openscad_path
 from ..temp_paths import temporary_directory
+from .render_cache import get_render_cache, openscad_version
+from .spatial_index import TriangleBVH, nearest_neighbors
+
+# Surface samples drawn per mesh for the Hausdorff and normal-deviation metrics.
+DEFAULT_NUM_SAMPLES = 1000
+# "surface" measures samples against the other mesh's triangles; "points"
+# compares the two sample clouds directly.
+DISTANCE_METHODS = ("surface", "points")
+# Render-cache key components for the STL export behind calculate_scad_metrics.
+_SCAD_METRICS_CACHE_TAG = "scad-metrics-v1"
+_SCAD_METRICS_EXPORT_ARGS = ("-o", "rendered.stl")
+
+
+@dataclass(frozen=True)
+class AdaptiveSamplingConfig:
+    """
+    Settings for adaptive, early-stopping point-based verification.
+
+    Samples are drawn in rounds from a randomly shifted low-discrepancy
+    sequence. After each round, distribution-free confidence intervals on the
+    Hausdorff and normal-deviation percentiles are compared against the
+    tolerances; sampling stops once both decisions are settled or
+    ``max_samples`` per side is reached. The maximum distance has no
+    finite-sample confidence bound, so adaptive mode reports the
+    ``hausdorff_quantile`` percentile as the Hausdorff value.
+    """
+
+    initial_samples: int = 256
+    max_samples: int = 65536
+    growth_factor: float = 2.0
+    confidence: float = 0.95
+    hausdorff_quantile: float = 0.99
+    normal_quantile: float = 0.95
+
+
+# Generalised golden ratio for the 3D additive recurrence (R3) sequence.
+_R3_PHI = 1.2207440846057596
+_R3_ALPHA = np.array([1.0 / _R3_PHI, 1.0 / _R3_PHI**2, 1.0 / _R3_PHI**3])
 
 
 def calculate_stl_volume(mesh: Mesh) -> float:
@@ -144,13 +184,207 @@ def sample_mesh_points(
     return points, sampled_normals
 
 
-def calculate_hausdorff_distance(points1: np.ndarray, points2: np.ndarray) -> float:
+def _unit_face_normals(mesh: Mesh) -> np.ndarray:
+    normals = np.asarray(mesh.normals, dtype=np.float64)
+    norms = np.linalg.norm(normals, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0  # avoid division by zero
+    return normals / norms
+
+
+def sample_mesh_points_low_discrepancy(
+    mesh: Mesh,
+    num_samples: int,
+    shift: np.ndarray,
+    start_index: int = 0,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Area-weighted surface samples from a shifted R3 low-discrepancy sequence.
+
+    The first coordinate picks a triangle by inverting the cumulative area
+    distribution, so triangles are stratified in proportion to their area;
+    the other two map to barycentric coordinates. Calling again with
+    ``start_index`` advanced by the previous count continues the same
+    sequence, which keeps successive rounds jointly well spread.
+
+    Args:
+        mesh: The STL mesh
+        num_samples: Number of points to sample
+        shift: Random Cranley-Patterson rotation, three values in [0, 1)
+        start_index: Sequence index of the first sample
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Sampled points and their unit normals
+    """
+    vectors = np.asarray(mesh.vectors, dtype=np.float64)
+    if num_samples <= 0 or len(vectors) == 0:
+        return np.zeros((0, 3)), np.zeros((0, 3))
+
+    v0 = vectors[:, 0]
+    edge1 = vectors[:, 1] - v0
+    edge2 = vectors[:, 2] - v0
+    areas = 0.5 * np.linalg.norm(np.cross(edge1, edge2), axis=1)
+    cumulative = np.cumsum(areas)
+    if cumulative[-1] <= 0:
+        return np.zeros((0, 3)), np.zeros((0, 3))
+
+    index = np.arange(start_index, start_index + num_samples, dtype=np.float64)
+    sequence = np.mod(np.asarray(shift)[None, :] + index[:, None] * _R3_ALPHA, 1.0)
+    triangle_idx = np.searchsorted(
+        cumulative, sequence[:, 0] * cumulative[-1], side="right"
+    )
+    triangle_idx = np.minimum(triangle_idx, len(vectors) - 1)
+
+    # Square-root warp maps the unit square uniformly onto the triangle.
+    root = np.sqrt(sequence[:, 1:2])
+    u = root * (1.0 - sequence[:, 2:3])
+    v = root * sequence[:, 2:3]
+    points = v0[triangle_idx] + u * edge1[triangle_idx] + v * edge2[triangle_idx]
+    return points, _unit_face_normals(mesh)[triangle_idx]
+
+
+def _quantile_confidence_interval(
+    values: np.ndarray, quantile: float, confidence: float
+) -> Tuple[float, float, float]:
+    """
+    Point estimate and distribution-free interval for a quantile.
+
+    Uses the order statistics whose ranks bracket ``n * quantile`` by the
+    normal approximation to the binomial. The upper bound is infinite until
+    enough samples exist to place it.
+    """
+    ordered = np.sort(values)
+    count = len(ordered)
+    estimate = float(np.quantile(ordered, quantile))
+    z = NormalDist().inv_cdf(0.5 + confidence / 2.0)
+    spread = z * np.sqrt(count * quantile * (1.0 - quantile))
+    lower_rank = int(np.floor(count * quantile - spread))
+    upper_rank = int(np.ceil(count * quantile + spread))
+    lower = float(ordered[lower_rank]) if lower_rank >= 0 else float("-inf")
+    upper = float(ordered[upper_rank]) if upper_rank < count else float("inf")
+    return estimate, lower, upper
+
+
+def _decision_settled(lower: float, upper: float, tolerance: Optional[float]) -> bool:
+    if tolerance is None:
+        return True
+    return upper <= tolerance or lower > tolerance
+
+
+def _adaptive_point_metrics(
+    stl_mesh: Mesh,
+    scad_mesh: Mesh,
+    diagonal: float,
+    tolerance: Optional[Dict[str, float]],
+    config: AdaptiveSamplingConfig,
+    rng_stl: np.random.Generator,
+    rng_scad: np.random.Generator,
+) -> Dict[str, Any]:
+    tolerance = tolerance or {}
+    hausdorff_tol = tolerance.get("hausdorff_distance")
+    normal_tol = tolerance.get("normal_deviation")
+    shift_stl = rng_stl.random(3)
+    shift_scad = rng_scad.random(3)
+    scad_bvh = TriangleBVH(scad_mesh.vectors)
+    stl_bvh = TriangleBVH(stl_mesh.vectors)
+    scad_centroids = np.asarray(scad_mesh.vectors, dtype=np.float64).mean(axis=1)
+    scad_face_normals = _unit_face_normals(scad_mesh)
+
+    distances: List[np.ndarray] = []
+    angles: List[np.ndarray] = []
+    drawn = 0
+    rounds = 0
+    round_size = min(config.initial_samples, config.max_samples)
+    while True:
+        stl_points, stl_normals = sample_mesh_points_low_discrepancy(
+            stl_mesh, round_size, shift_stl, start_index=drawn
+        )
+        scad_points, _ = sample_mesh_points_low_discrepancy(
+            scad_mesh, round_size, shift_scad, start_index=drawn
+        )
+        drawn += round_size
+        rounds += 1
+        if not len(stl_points) or not len(scad_points):
+            break
+
+        forward, forward_idx = calculate_surface_distances(stl_points, scad_bvh)
+        backward, _ = calculate_surface_distances(scad_points, stl_bvh)
+        distances.extend([forward, backward])
+        nearest_normals = scad_face_normals[forward_idx]
+        dots = np.clip(np.sum(stl_normals * nearest_normals, axis=1), -1.0, 1.0)
+        angles.append(np.degrees(np.arccos(dots)))
+
+        all_distances = np.concatenate(distances)
+        h_est, h_lo, h_hi = _quantile_confidence_interval(
+            all_distances, config.hausdorff_quantile, config.confidence
+        )
+        all_angles = np.concatenate(angles)
+        n_est, n_lo, n_hi = _quantile_confidence_interval(
+            all_angles, config.normal_quantile, config.confidence
+        )
+        scale = float(100.0 / diagonal) if diagonal > 0 else 0.0
+        settled = _decision_settled(
+            h_lo * scale, h_hi * scale, hausdorff_tol
+        ) and _decision_settled(n_lo, n_hi, normal_tol)
+        if settled or drawn >= config.max_samples:
+            break
+        target = min(config.max_samples, int(np.ceil(drawn * config.growth_factor)))
+        round_size = max(1, target - drawn)
+
+    if not distances:
+        empty = {"value": 0.0, "difference_percent": 0.0, "num_samples": drawn}
+        return {
+            "hausdorff_distance": dict(empty, method="surface"),
+            "normal_deviation": dict(empty),
+            "adaptive_sampling": {
+                "rounds": rounds,
+                "samples_used": drawn,
+                "max_samples": config.max_samples,
+                "confidence": config.confidence,
+                "settled": False,
+            },
+        }
+
+    return {
+        "hausdorff_distance": {
+            "value": h_est,
+            "difference_percent": h_est * scale,
+            "num_samples": drawn,
+            "method": "surface",
+            "quantile": config.hausdorff_quantile,
+            "max_observed": float(np.max(all_distances)),
+            "confidence_interval": [h_lo, h_hi],
+            "confidence_interval_percent": [h_lo * scale, h_hi * scale],
+        },
+        "normal_deviation": {
+            "value": n_est,
+            "difference_percent": n_est,
+            "num_samples": drawn,
+            "quantile": config.normal_quantile,
+            "confidence_interval": [n_lo, n_hi],
+        },
+        "adaptive_sampling": {
+            "rounds": rounds,
+            "samples_used": drawn,
+            "max_samples": config.max_samples,
+            "confidence": config.confidence,
+            "settled": bool(settled),
+        },
+    }
+
+
+def calculate_hausdorff_distance(
+    points1: np.ndarray,
+    points2: np.ndarray,
+    forward_distances: Optional[np.ndarray] = None,
+) -> float:
     """
-    Calculate Hausdorff distance between two sets of points using broadcasting.
+    Calculate Hausdorff distance between two sets of points using a spatial index.
 
     Args:
         points1: First array of points (N, 3)
         points2: Second array of points (M, 3)
+        forward_distances: Optional precomputed nearest distances from points1
+            to points2, as returned by ``nearest_neighbors(points1, points2)``
 
     Returns:
         float: Hausdorff distance
@@ -158,30 +392,50 @@ def calculate_hausdorff_distance(points1: np.ndarray, points2: np.ndarray) -> fl
     if len(points1) == 0 or len(points2) == 0:
         return 0.0
 
-    # Calculate pairwise distances (N, M)
-    # Using squared distance first to save computation
-    diff = points1[:, np.newaxis, :] - points2[np.newaxis, :, :]
-    dist_sq = np.sum(diff**2, axis=-1)
-
     # For each point in points1, find the minimum distance to points2
-    min_dist_sq_1 = np.min(dist_sq, axis=1)
+    if forward_distances is None:
+        forward_distances, _ = nearest_neighbors(points1, points2)
 
     # For each point in points2, find the minimum distance to points1
-    min_dist_sq_2 = np.min(dist_sq, axis=0)
+    backward_distances, _ = nearest_neighbors(points2, points1)
 
     # The Hausdorff distance is the maximum of these minimums
-    hausdorff_sq = max(np.max(min_dist_sq_1), np.max(min_dist_sq_2))
+    return float(max(np.max(forward_distances), np.max(backward_distances)))
 
-    return float(np.sqrt(hausdorff_sq))
+
+def calculate_surface_distances(
+    points: np.ndarray, surface: Union[Mesh, TriangleBVH]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Distance from each point to the closest point on a triangle surface.
+
+    Args:
+        points: Query points (N, 3)
+        surface: STL mesh, or a prebuilt ``TriangleBVH`` to reuse across calls
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Distances and closest triangle indices
+    """
+    bvh = surface if isinstance(surface, TriangleBVH) else TriangleBVH(surface.vectors)
+    distances, _closest, triangle_idx = bvh.closest_points(points)
+    return distances, triangle_idx
 
 
 def compare_normal_vectors(
-    points1: np.ndarray, normals1: np.ndarray, points2: np.ndarray, normals2: np.ndarray
+    points1: np.ndarray,
+    normals1: np.ndarray,
+    points2: np.ndarray,
+    normals2: np.ndarray,
+    nearest_idx: Optional[np.ndarray] = None,
 ) -> float:
     """
     Compare normal deviations between two surfaces.
     For each point in points1, finds nearest point in points2 and measures angle between normals.
 
+    ``nearest_idx`` may carry the indices from an existing
+    ``nearest_neighbors(points1, points2)`` query so the search is shared with
+    the Hausdorff computation.
+
     Returns:
         float: Maximum normal deviation in degrees (95th percentile to ignore outliers).
     """
@@ -189,9 +443,8 @@ def compare_normal_vectors(
         return 0.0
 
     # Find nearest neighbors from points1 to points2
-    diff = points1[:, np.newaxis, :] - points2[np.newaxis, :, :]
-    dist_sq = np.sum(diff**2, axis=-1)
-    nearest_idx = np.argmin(dist_sq, axis=1)
+    if nearest_idx is None:
+        _, nearest_idx = nearest_neighbors(points1, points2)
 
     nearest_normals = normals2[nearest_idx]
 
@@ -207,17 +460,22 @@ def compare_normal_vectors(
 
 
 def calculate_scad_metrics(
-    scad_file: Union[str, Path], timeout: int = 120
+    scad_file: Union[str, Path], timeout: int = 120, use_cache: bool = True
 ) -> Dict[str, Any]:
     """
     Calculate volume and surface area of a SCAD model using OpenSCAD via STL export.
 
+    Renders are looked up in the persistent render cache first, keyed by the
+    SCAD source, the OpenSCAD version and the export arguments.
+
     Args:
         scad_file: Path to the SCAD file
         timeout: Timeout in seconds for OpenSCAD execution
+        use_cache: Whether to read and populate the render cache
 
     Returns:
-        Dict[str, Any]: Dictionary with volume, surface_area, bounding_box, and mesh
+        Dict[str, Any]: Dictionary with volume, surface_area, bounding_box, mesh
+        and render_cache ("hit", "miss" or "disabled")
 
     Raises:
         RuntimeError: If OpenSCAD execution fails
@@ -229,6 +487,25 @@ def calculate_scad_metrics(
     # Get OpenSCAD path
     openscad_path = get_openscad_path()
 
+    cache = get_render_cache() if use_cache else None
+    cache_key = None
+    if cache is not None:
+        cache_key = cache.key(
+            _SCAD_METRICS_CACHE_TAG,
+            scad_path.read_bytes(),
+            openscad_version(openscad_path),
+            *_SCAD_METRICS_EXPORT_ARGS,
+        )
+        entry = cache.get(cache_key)
+        if entry is not None:
+            try:
+                cached_mesh = stl.mesh.Mesh.from_file(
+                    str(entry["path"] / "rendered.stl")
+                )
+                return dict(entry["meta"], mesh=cached_mesh, render_cache="hit")
+            except Exception:
+                pass
+
     with temporary_directory(prefix="scad-metrics") as temp_dir:
         temp_stl = temp_dir / "rendered.stl"
         log_file = temp_dir / "render.log"
@@ -257,23 +534,33 @@ def calculate_scad_metrics(
             volume = calculate_stl_volume(rendered_mesh)
             surface_area = calculate_stl_surface_area(rendered_mesh)
             bounding_box = get_stl_bounding_box(rendered_mesh)
-
-            return {
-                "volume": volume,
-                "surface_area": surface_area,
-                "bounding_box": bounding_box,
-                "mesh": rendered_mesh,
-            }
         except Exception as e:
             raise RuntimeError(
                 f"Failed to calculate SCAD metrics after rendering: {str(e)}"
             )
 
+        metrics = {
+            "volume": volume,
+            "surface_area": surface_area,
+            "bounding_box": bounding_box,
+        }
+        if cache is not None and cache_key is not None:
+            cache.put(cache_key, {"rendered.stl": temp_stl}, metrics)
+        return dict(
+            metrics,
+            mesh=rendered_mesh,
+            render_cache="miss" if cache is not None else "disabled",
+        )
+
 
 def compare_metrics(
     stl_metrics: Dict[str, Any],
     scad_metrics: Dict[str, Any],
     sample_seed: Optional[int] = None,
+    num_samples: int = DEFAULT_NUM_SAMPLES,
+    distance_method: str = "surface",
+    adaptive: Optional[AdaptiveSamplingConfig] = None,
+    tolerance: Optional[Dict[str, float]] = None,
 ) -> Dict[str, Any]:
     """
     Compare metrics between STL and SCAD models.
@@ -282,6 +569,13 @@ def compare_metrics(
         stl_metrics: Metrics from STL model
         scad_metrics: Metrics from SCAD model
         sample_seed: Optional seed for deterministic point sampling comparisons
+        num_samples: Surface points sampled per mesh for the point-based metrics
+        distance_method: "surface" measures each side's samples against the
+            other mesh's triangles; "points" compares the two sample clouds
+        adaptive: Optional adaptive-sampling settings; when given, samples are
+            drawn in rounds until the tolerance decisions are settled and
+            ``num_samples`` is ignored
+        tolerance: Verification tolerances used as the adaptive stopping target
 
     Returns:
         Dict[str, Any]: Comparison results with differences and percentages
@@ -371,34 +665,83 @@ def compare_metrics(
 
         if sample_seed is not None and sample_seed < 0:
             raise ValueError("sample_seed must be non-negative when provided")
+        if num_samples <= 0:
+            raise ValueError("num_samples must be positive")
+        if distance_method not in DISTANCE_METHODS:
+            raise ValueError(
+                f"distance_method must be one of {', '.join(DISTANCE_METHODS)}"
+            )
 
         rng_stl = np.random.default_rng(sample_seed)
         rng_scad = np.random.default_rng(
             None if sample_seed is None else sample_seed + 1
         )
+        stl_bbox = stl_metrics["bounding_box"]
+        diagonal = np.sqrt(
+            stl_bbox["width"] ** 2 + stl_bbox["height"] ** 2 + stl_bbox["depth"] ** 2
+        )
+
+        if adaptive is not None:
+            if distance_method != "surface":
+                raise ValueError("adaptive sampling requires distance_method='surface'")
+            results.update(
+                _adaptive_point_metrics(
+                    stl_mesh,
+                    scad_mesh,
+                    diagonal,
+                    tolerance,
+                    adaptive,
+                    rng_stl,
+                    rng_scad,
+                )
+            )
+            return results
 
-        num_samples = 1000
         stl_points, stl_normals = sample_mesh_points(stl_mesh, num_samples, rng=rng_stl)
         scad_points, scad_normals = sample_mesh_points(
             scad_mesh, num_samples, rng=rng_scad
         )
 
-        hausdorff = calculate_hausdorff_distance(stl_points, scad_points)
-        normal_dev = compare_normal_vectors(
-            stl_points, stl_normals, scad_points, scad_normals
-        )
+        # One STL->SCAD query feeds both the Hausdorff and normal metrics.
+        if not len(stl_points) or not len(scad_points):
+            hausdorff = 0.0
+            normal_dev = 0.0
+        elif distance_method == "surface":
+            forward_distances, forward_idx = calculate_surface_distances(
+                stl_points, scad_mesh
+            )
+            backward_distances, _ = calculate_surface_distances(scad_points, stl_mesh)
+            hausdorff = float(
+                max(np.max(forward_distances), np.max(backward_distances))
+            )
+            normal_dev = compare_normal_vectors(
+                stl_points,
+                stl_normals,
+                np.asarray(scad_mesh.vectors).mean(axis=1),
+                _unit_face_normals(scad_mesh),
+                nearest_idx=forward_idx,
+            )
+        else:
+            forward_distances, forward_idx = nearest_neighbors(stl_points, scad_points)
+            hausdorff = calculate_hausdorff_distance(
+                stl_points, scad_points, forward_distances=forward_distances
+            )
+            normal_dev = compare_normal_vectors(
+                stl_points,
+                stl_normals,
+                scad_points,
+                scad_normals,
+                nearest_idx=forward_idx,
+            )
 
-        # Compute relative bounding box diagonal for percentage calculation of Hausdorff
-        # using STL mesh bounding box
-        stl_bbox = stl_metrics["bounding_box"]
-        diagonal = np.sqrt(
-            stl_bbox["width"] ** 2 + stl_bbox["height"] ** 2 + stl_bbox["depth"] ** 2
-        )
+        # Relative to the STL bounding box diagonal computed above
         hausdorff_pct = (hausdorff / diagonal * 100) if diagonal > 0 else 0.0
 
         results["hausdorff_distance"] = {
             "value": hausdorff,
             "difference_percent": hausdorff_pct,
+            "num_samples": num_samples,
+            "method": distance_method,
         }
 
         results["normal_deviation"] = {
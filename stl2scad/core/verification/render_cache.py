@@ -0,0 +1,226 @@
+"""
+Persistent, content-addressed cache for OpenSCAD renders.
+
+Rendering is the most expensive per-file step in verification, and the same
+SCAD text is often rendered again across runs, baseline/candidate comparisons
+and duplicated parts. Entries are keyed by SHA-256 over the SCAD source, the
+OpenSCAD version and the render arguments, and hold the exported files plus a
+small JSON payload. The cache is bounded in bytes and evicts least recently
+used entries first.
+
+Only the bytes passed to :meth:`RenderCache.key` are hashed. Callers whose
+SCAD text ``include``s or ``import``s other files must hash those files too.
+
+Environment:
+    STL2SCAD_RENDER_CACHE_DIR: Cache directory; an empty value disables the
+        default cache (default: ``$XDG_CACHE_HOME/stl2scad/renders``)
+    STL2SCAD_RENDER_CACHE_MAX_MB: Size bound in MiB (default: 2048)
+"""
+
+import functools
+import hashlib
+import json
+import os
+import shutil
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from ..converter import run_openscad
+from ..temp_paths import temporary_directory
+
+DEFAULT_RENDER_CACHE_MAX_BYTES = 2048 * 1024 * 1024
+
+_META_FILE = "meta.json"
+
+
+class RenderCache:
+    """
+    Size-bounded LRU cache of OpenSCAD render outputs on disk.
+
+    Each entry is a directory named by its key. Entries are published with an
+    atomic rename, so concurrent processes sharing a directory never see a
+    partial entry; a hit refreshes the entry's mtime, which orders eviction.
+
+    Args:
+        root: Cache directory, created on first store
+        max_bytes: Total size above which least recently used entries are evicted
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        max_bytes: int = DEFAULT_RENDER_CACHE_MAX_BYTES,
+    ) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.root = Path(root)
+        self.max_bytes = int(max_bytes)
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    @staticmethod
+    def key(*parts: Union[str, bytes]) -> str:
+        """Return the SHA-256 key of length-prefixed *parts*."""
+        digest = hashlib.sha256()
+        for part in parts:
+            data = part.encode("utf-8") if isinstance(part, str) else bytes(part)
+            digest.update(len(data).to_bytes(8, "little"))
+            digest.update(data)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up an entry and count the hit or miss.
+
+        Returns:
+            Optional[Dict[str, Any]]: ``{"path": entry_dir, "meta": payload}``,
+            or None on a miss
+        """
+        entry = self._entry_dir(key)
+        try:
+            with open(entry / _META_FILE, "r", encoding="utf-8") as handle:
+                meta = json.load(handle)
+            os.utime(entry)
+        except (OSError, ValueError):
+            self._count("misses")
+            return None
+        self._count("hits")
+        return {"path": entry, "meta": meta}
+
+    def put(
+        self,
+        key: str,
+        files: Optional[Dict[str, Path]] = None,
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> Path:
+        """
+        Store *files* (entry name -> source path) and a JSON *meta* payload.
+
+        Returns:
+            Path: The entry directory
+        """
+        entry = self._entry_dir(key)
+        staging = entry.parent / f".{entry.name}.{uuid.uuid4().hex[:12]}.tmp"
+        staging.mkdir(parents=True, exist_ok=True)
+        try:
+            for name, source in (files or {}).items():
+                shutil.copyfile(source, staging / name)
+            with open(staging / _META_FILE, "w", encoding="utf-8") as handle:
+                json.dump(meta or {}, handle)
+            try:
+                os.replace(staging, entry)
+            except OSError:
+                # Another writer published the same key first; keep theirs.
+                if not (entry / _META_FILE).exists():
+                    raise
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+        self._count("stores")
+        self.evict()
+        return entry
+
+    def evict(self) -> int:
+        """Drop least recently used entries until the cache fits ``max_bytes``."""
+        entries = []
+        total = 0
+        if not self.root.exists():
+            return 0
+        for shard in self.root.iterdir():
+            if not shard.is_dir():
+                continue
+            for entry in shard.iterdir():
+                if entry.name.startswith(".") or not entry.is_dir():
+                    continue
+                try:
+                    size = sum(f.stat().st_size for f in entry.iterdir())
+                    entries.append((entry.stat().st_mtime, size, entry))
+                except OSError:
+                    continue
+                total += size
+        evicted = 0
+        for _, size, entry in sorted(entries, key=lambda item: item[0]):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            evicted += 1
+        if evicted:
+            self._count("evictions", evicted)
+        return evicted
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss/store/eviction counters for this process."""
+        with self._lock:
+            counters: Dict[str, Any] = dict(self._counters)
+        lookups = counters["hits"] + counters["misses"]
+        counters["hit_rate"] = counters["hits"] / lookups if lookups else 0.0
+        counters["root"] = str(self.root)
+        return counters
+
+    def _entry_dir(self, key: str) -> Path:
+        return self.root / key[:2] / key
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] += amount
+
+
+def file_digest(path: Union[str, Path]) -> str:
+    """Return the SHA-256 hex digest of a file's bytes."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def openscad_version(openscad_path: Optional[str]) -> str:
+    """
+    Return the ``--version`` output of an OpenSCAD executable, for cache keys.
+
+    Falls back to the executable's path, size and mtime when the version
+    cannot be read, so a changed binary still produces new keys.
+    """
+    with temporary_directory(prefix="openscad-version") as temp_dir:
+        log_file = temp_dir / "version.log"
+        if run_openscad(
+            "Version for render cache", ["--version"], str(log_file), openscad_path
+        ):
+            text = " ".join(log_file.read_text(encoding="utf-8").split())
+            if text:
+                return text
+    try:
+        stat = os.stat(openscad_path or "openscad")
+        return f"{openscad_path}:{stat.st_size}:{stat.st_mtime_ns}"
+    except OSError:
+        return str(openscad_path)
+
+
+_default_cache: Optional[RenderCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_render_cache() -> Optional[RenderCache]:
+    """Return the process-wide render cache, or None when it is disabled."""
+    global _default_cache
+    root_text = os.environ.get("STL2SCAD_RENDER_CACHE_DIR")
+    if root_text is None:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+        root_text = str(Path(cache_home) / "stl2scad" / "renders")
+    if not root_text:
+        return None
+    max_mb = os.environ.get("STL2SCAD_RENDER_CACHE_MAX_MB")
+    max_bytes = (
+        int(float(max_mb) * 1024 * 1024) if max_mb else DEFAULT_RENDER_CACHE_MAX_BYTES
+    )
+    with _default_cache_lock:
+        if (
+            _default_cache is None
+            or _default_cache.root != Path(root_text)
+            or _default_cache.max_bytes != max_bytes
+        ):
+            _default_cache = RenderCache(root_text, max_bytes)
+        return _default_cache
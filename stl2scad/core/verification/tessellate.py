@@ -0,0 +1,512 @@
+"""
+Direct tessellation of feature-graph IR trees into triangle meshes.
+
+This is the mesh counterpart of :mod:`analytic`: it walks the same IR node
+shapes and produces the triangles OpenSCAD would export for them, so the
+sampling-based metrics (Hausdorff distance, normal deviation) can run
+without an OpenSCAD render. Circles use the same fragment counts and vertex
+phase as the emitted SCAD.
+
+Faces with cut-outs are triangulated by slab decomposition, which leaves
+T-junctions where a face meets a hole wall. The surface is still closed as a
+point set, so volume, area and surface distances are exact.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from stl.mesh import Mesh
+
+from .analytic import (
+    REVOLVE_FRAGMENTS,
+    _CLEARANCE,
+    _CutPlan,
+    _NotIntegrable,
+    _cavity_levels,
+    _difference_plan,
+    _dedupe_ring,
+    _euler_rotation,
+    _polygon_signed_area,
+    _sphere_profile,
+    _vector,
+    openscad_fragments,
+)
+
+# Slabs triangulated per vectorised block; bounds the (slabs x edges) arrays.
+_SLAB_BLOCK = 256
+
+_CUBE_CORNERS = np.array(
+    [[i, j, k] for i in (0.0, 1.0) for j in (0.0, 1.0) for k in (0.0, 1.0)]
+)
+# Outward-wound quads of the unit cube, as indices into _CUBE_CORNERS.
+_CUBE_QUADS = np.array(
+    [
+        [0, 1, 3, 2],  # x = 0
+        [4, 6, 7, 5],  # x = 1
+        [0, 4, 5, 1],  # y = 0
+        [2, 3, 7, 6],  # y = 1
+        [0, 2, 6, 4],  # z = 0
+        [1, 5, 7, 3],  # z = 1
+    ]
+)
+
+__all__ = [
+    "tessellate_ir",
+    "ir_mesh",
+]
+
+
+def tessellate_ir(root: Dict[str, Any]) -> Optional[np.ndarray]:
+    """
+    Tessellate an IR node tree into outward-wound triangles.
+
+    Args:
+        root: Root IR node, typically ``graph["ir_tree"][0]["root"]``
+
+    Returns:
+        Optional[np.ndarray]: ``(N, 3, 3)`` triangle vertices, or None when
+        any node in the tree must be rendered by OpenSCAD instead
+    """
+    try:
+        triangles = _tessellate(root)
+    except _NotIntegrable:
+        return None
+    if triangles is None or len(triangles) == 0:
+        return None
+    return triangles
+
+
+def ir_mesh(root: Dict[str, Any]) -> Optional[Mesh]:
+    """
+    Tessellate an IR node tree into a numpy-stl mesh.
+
+    Args:
+        root: Root IR node, typically ``graph["ir_tree"][0]["root"]``
+
+    Returns:
+        Optional[Mesh]: Mesh usable wherever a rendered SCAD mesh is, or None
+        when the tree cannot be tessellated here
+    """
+    triangles = tessellate_ir(root)
+    if triangles is None:
+        return None
+    data = np.zeros(len(triangles), dtype=Mesh.dtype)
+    data["vectors"] = triangles
+    return Mesh(data)
+
+
+# ---------------------------------------------------------------------------
+# Node dispatch (mirrors analytic._integrate)
+# ---------------------------------------------------------------------------
+
+
+def _tessellate(node: Dict[str, Any]) -> Optional[np.ndarray]:
+    """Return triangles emitted for *node*, or None when nothing is emitted."""
+    ntype = node.get("type")
+    if ntype == "BooleanUnion":
+        return _tessellate_union(node)
+    if ntype == "BooleanDifference":
+        return _tessellate_difference(node)
+    if ntype == "TransformTranslate":
+        child = _tessellate(node.get("child", {}))
+        if child is None:
+            return None
+        return child + _vector(node.get("offset"))
+    if ntype == "TransformRotate":
+        child_node = node.get("child", {})
+        child_type = child_node.get("type")
+        if (
+            child_type == "PrimitivePlate"
+            and child_node.get("detected_via") == "rotated_plate"
+        ) or (
+            child_type == "PrimitiveBox"
+            and child_node.get("detected_via") == "rotated_box"
+        ):
+            return _tessellate(child_node)
+        child = _tessellate(child_node)
+        if child is None:
+            return None
+        return _transform(
+            child, _euler_rotation(node.get("angles_deg", [0.0, 0.0, 0.0]))
+        )
+    if ntype in {"PrimitivePlate", "PrimitiveBox"}:
+        plan = _difference_plan({"base": node, "cuts": []})
+        return _tessellate_cut_plan(plan) if plan is not None else None
+    if ntype == "PrimitiveCylinder":
+        return _primitive_cylinder(node)
+    if ntype == "ExtrudeLinear":
+        return _extrude_linear(node)
+    if ntype == "ExtrudeRevolve":
+        return _extrude_revolve(node)
+    if ntype == "FallbackMesh":
+        raise _NotIntegrable("fallback mesh")
+    return None
+
+
+def _tessellate_union(node: Dict[str, Any]) -> Optional[np.ndarray]:
+    from ..feature_graph import emit_node
+
+    children = node.get("children", [])
+    if len(children) == 1:
+        return _tessellate(children[0])
+    parts: List[np.ndarray] = []
+    for child in children:
+        if emit_node(child) is None:
+            continue
+        part = _tessellate(child)
+        if part is not None:
+            parts.append(part)
+    if not parts:
+        return None
+    bounds = [
+        (p.reshape(-1, 3).min(axis=0), p.reshape(-1, 3).max(axis=0)) for p in parts
+    ]
+    for i in range(len(bounds)):
+        for j in range(i + 1, len(bounds)):
+            separated = np.any(bounds[i][1] + _CLEARANCE < bounds[j][0]) or np.any(
+                bounds[j][1] + _CLEARANCE < bounds[i][0]
+            )
+            if not separated:
+                raise _NotIntegrable("overlapping union children")
+    return np.concatenate(parts)
+
+
+def _tessellate_difference(node: Dict[str, Any]) -> Optional[np.ndarray]:
+    from ..feature_graph import emit_node
+
+    plan = _difference_plan(node)
+    if plan is not None:
+        return _tessellate_cut_plan(plan)
+
+    triangles = _tessellate(node.get("base", {}))
+    if triangles is None:
+        return None
+    cuts = node.get("cuts", [])
+    if any(
+        emit_node(cut) is not None
+        for cut in cuts
+        if cut.get("type") != "ChamferOrFilletEdge"
+    ):
+        raise _NotIntegrable("generic difference with emitted cuts")
+    return triangles
+
+
+# ---------------------------------------------------------------------------
+# Cuboids and axial cavities
+# ---------------------------------------------------------------------------
+
+
+def _tessellate_cut_plan(plan: _CutPlan) -> np.ndarray:
+    size = _vector(plan.prim.get("size"), default=1.0)
+    if np.any(size <= 0.0):
+        raise _NotIntegrable("degenerate cuboid")
+    if not plan.groups:
+        edges = plan.placement[:, :3] * size
+        triangles = _quads(_CUBE_CORNERS[_CUBE_QUADS] @ edges.T) + plan.placement[:, 3]
+        # A left-handed placement frame mirrors the cube.
+        return triangles if np.linalg.det(edges) > 0.0 else _flip(triangles)
+
+    # Work in (u, v, w) with w along the cut axis, then permute back.
+    axis = plan.axis
+    order = [i for i in range(3) if i != axis] + [axis]
+    origin = plan.placement[:, 3]
+    u0, v0, p0 = (float(origin[i]) for i in order)
+    u1, v1, p1 = (
+        u0 + float(size[order[0]]),
+        v0 + float(size[order[1]]),
+        p0 + float(size[axis]),
+    )
+    outline = np.array([[u0, v0], [u1, v0], [u1, v1], [u0, v1]])
+
+    parts: List[np.ndarray] = []
+    bottom_holes: List[np.ndarray] = []
+    top_holes: List[np.ndarray] = []
+    for group in plan.groups:
+        levels = _cavity_levels(group, p0, p1)
+        if levels[0][2] is not None:
+            bottom_holes.append(levels[0][2])
+        if levels[-1][2] is not None:
+            top_holes.append(levels[-1][2])
+        for lo, hi, section in levels:
+            if section is not None:
+                parts.append(_prism_walls(_ccw(section), lo, hi, inward=True))
+        for (_, boundary, below), (_, _, above) in zip(levels[:-1], levels[1:]):
+            if below is above:
+                continue
+            parts.append(_step_face(below, above, boundary))
+
+    parts.append(_flip(_lift(_triangulate_region(outline, bottom_holes), p0)))
+    parts.append(_lift(_triangulate_region(outline, top_holes), p1))
+    parts.append(_prism_walls(outline, p0, p1, inward=False))
+
+    local = np.concatenate(parts)
+    world = np.empty_like(local)
+    world[..., order] = local
+    # Swapping two axes mirrors the solid; restore outward winding.
+    if order == [0, 2, 1]:
+        world = _flip(world)
+    return world
+
+
+def _step_face(
+    below: Optional[np.ndarray], above: Optional[np.ndarray], w: float
+) -> np.ndarray:
+    """Triangulate the shoulder between two nested cavity sections at *w*.
+
+    Material left by the wider section below faces down into it; material
+    left by the wider section above faces up.
+    """
+    below_area = abs(_polygon_signed_area(below)) if below is not None else 0.0
+    above_area = abs(_polygon_signed_area(above)) if above is not None else 0.0
+    if below is not None and below_area > above_area:
+        holes = [above] if above is not None else []
+        return _flip(_lift(_triangulate_region(_ccw(below), holes), w))
+    if above is None:
+        raise _NotIntegrable("cavity step without a section")
+    holes = [below] if below is not None else []
+    return _lift(_triangulate_region(_ccw(above), holes), w)
+
+
+def _prism_walls(section: np.ndarray, lo: float, hi: float, inward: bool) -> np.ndarray:
+    """Side quads of a CCW *section* swept over [lo, hi].
+
+    Walls face away from the polygon by default and into it for cavities.
+    """
+    a = section
+    b = np.roll(section, -1, axis=0)
+    quads = np.stack(
+        [
+            np.column_stack([a, np.full(len(a), lo)]),
+            np.column_stack([b, np.full(len(a), lo)]),
+            np.column_stack([b, np.full(len(a), hi)]),
+            np.column_stack([a, np.full(len(a), hi)]),
+        ],
+        axis=1,
+    )
+    triangles = _quads(quads)
+    return _flip(triangles) if inward else triangles
+
+
+# ---------------------------------------------------------------------------
+# Curved primitives and extrusions
+# ---------------------------------------------------------------------------
+
+
+def _primitive_cylinder(node: Dict[str, Any]) -> np.ndarray:
+    height = float(node.get("height", 0.0))
+    if "diameter" in node:
+        radius = float(node["diameter"]) * 0.5
+    else:
+        radius = float(node.get("radius", 0.0))
+    if radius <= 0.0 or height <= 0.0:
+        raise _NotIntegrable("degenerate cylinder")
+    profile = np.array([[0.0, 0.0], [radius, 0.0], [radius, height], [0.0, height]])
+    triangles = _revolve(profile, openscad_fragments(radius))
+    rotation = {
+        "x": _euler_rotation([0.0, 90.0, 0.0]),
+        "y": _euler_rotation([-90.0, 0.0, 0.0]),
+    }.get(str(node.get("axis", "z")), np.eye(3))
+    return _transform(triangles, rotation) + _vector(node.get("origin"))
+
+
+def _extrude_linear(node: Dict[str, Any]) -> np.ndarray:
+    height = float(node.get("height", 0.0))
+    profile = node.get("profile", {})
+    points = profile.get("points", []) if isinstance(profile, dict) else []
+    section = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if height <= 0.0 or len(section) < 3 or _polygon_signed_area(section) == 0.0:
+        raise _NotIntegrable("degenerate extrusion")
+    section = _ccw(section)
+    caps = _triangulate_region(section, [])
+    return np.concatenate(
+        [
+            _flip(_lift(caps, 0.0)),
+            _lift(caps, height),
+            _prism_walls(section, 0.0, height, inward=False),
+        ]
+    )
+
+
+def _extrude_revolve(node: Dict[str, Any]) -> np.ndarray:
+    axis_origin = _vector(node.get("axis_origin"))
+    if not np.any(np.abs(axis_origin) > 1e-6):
+        axis_origin = np.zeros(3)
+
+    upgrade = node.get("primitive_upgrade")
+    if upgrade is not None and upgrade.get("type") in {"cylinder", "cone", "sphere"}:
+        params = upgrade.get("params", {})
+        ptype = upgrade.get("type")
+        if ptype == "sphere":
+            profile = _sphere_profile(float(params.get("r", 1.0)), REVOLVE_FRAGMENTS)
+            z_shift = float(params.get("z_center", 0.0))
+        else:
+            if ptype == "cylinder":
+                r1 = r2 = float(params.get("r", 1.0))
+            else:
+                r1 = float(params.get("r1", 0.0))
+                r2 = float(params.get("r2", 0.0))
+            h = float(params.get("h", 1.0))
+            if h <= 0.0 or max(r1, r2) <= 0.0:
+                raise _NotIntegrable("degenerate revolve primitive")
+            profile = _dedupe_ring([[0.0, 0.0], [r1, 0.0], [r2, h], [0.0, h]])
+            z_shift = float(params.get("z_lo", 0.0))
+        triangles = _revolve(profile, REVOLVE_FRAGMENTS)
+        return triangles + axis_origin + np.array([0.0, 0.0, z_shift])
+
+    profile_node = node.get("profile", {})
+    points = profile_node.get("points", []) if isinstance(profile_node, dict) else []
+    if node.get("detected_via") == "annular_revolve":
+        inner_r = float(node.get("inner_r", 0.0))
+        outer_r = float(node.get("outer_r", 1.0))
+        z_values = [float(p[1]) for p in points]
+        h = (max(z_values) - min(z_values)) if z_values else 0.0
+        z_lo = min(z_values) if z_values else 0.0
+        if h <= 0.0 or outer_r <= inner_r:
+            raise _NotIntegrable("degenerate annular revolve")
+        profile = np.array([[inner_r, 0.0], [outer_r, 0.0], [outer_r, h], [inner_r, h]])
+        triangles = _revolve(profile, REVOLVE_FRAGMENTS)
+        return triangles + axis_origin + np.array([0.0, 0.0, z_lo])
+
+    profile = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if len(profile) < 3 or np.any(profile[:, 0] < 0.0):
+        raise _NotIntegrable("revolve profile crosses the axis")
+    return _revolve(profile, REVOLVE_FRAGMENTS)
+
+
+def _revolve(profile: np.ndarray, fragments: int) -> np.ndarray:
+    """Tessellate ``rotate_extrude`` of an (r, z) polygon with *fragments*.
+
+    Each profile edge sweeps one quad per fragment; quads on the axis
+    collapse to triangles and are dropped as degenerate halves.
+    """
+    if _polygon_signed_area(profile) == 0.0:
+        raise _NotIntegrable("degenerate revolve profile")
+    a = profile
+    b = np.roll(profile, -1, axis=0)
+    phi = 2.0 * np.pi * np.arange(fragments + 1) / fragments
+    cos = np.cos(phi)
+    sin = np.sin(phi)
+
+    def ring(points: np.ndarray, k: slice) -> np.ndarray:
+        r = points[:, 0][:, None]
+        z = np.broadcast_to(points[:, 1][:, None], (len(points), fragments))
+        return np.stack([r * cos[k], r * sin[k], z], axis=-1)
+
+    now, nxt = slice(0, fragments), slice(1, fragments + 1)
+    quads = np.stack([ring(a, now), ring(a, nxt), ring(b, nxt), ring(b, now)], axis=2)
+    triangles = _drop_degenerate(_quads(quads.reshape(-1, 4, 3)))
+    return triangles if _signed_volume(triangles) > 0.0 else _flip(triangles)
+
+
+# ---------------------------------------------------------------------------
+# Planar regions
+# ---------------------------------------------------------------------------
+
+
+def _triangulate_region(outline: np.ndarray, holes: List[np.ndarray]) -> np.ndarray:
+    """Triangulate a polygon with holes by vertical slab decomposition.
+
+    Every pair of edges that bounds the region within a slab forms a
+    trapezoid, so arbitrary simple outlines and any number of disjoint holes
+    are handled without ear clipping. Triangles are CCW in the plane.
+    """
+    rings = [np.asarray(outline, dtype=np.float64)] + [
+        np.asarray(h, dtype=np.float64) for h in holes
+    ]
+    starts = np.concatenate(rings)
+    ends = np.concatenate([np.roll(r, -1, axis=0) for r in rings])
+    left = np.where((starts[:, 0] <= ends[:, 0])[:, None], starts, ends)
+    right = np.where((starts[:, 0] <= ends[:, 0])[:, None], ends, starts)
+    keep = right[:, 0] > left[:, 0]
+    left, right = left[keep], right[keep]
+    slope = (right[:, 1] - left[:, 1]) / (right[:, 0] - left[:, 0])
+
+    xs = np.unique(starts[:, 0])
+    parts: List[np.ndarray] = []
+    for block in range(0, len(xs) - 1, _SLAB_BLOCK):
+        xl = xs[block : block + _SLAB_BLOCK][:, None]
+        xr = xs[block + 1 : block + _SLAB_BLOCK + 1][:, None]
+        xl = xl[: len(xr)]
+        spans = (left[:, 0] <= xl) & (right[:, 0] >= xr)
+        yl = left[:, 1] + slope * (xl - left[:, 0])
+        yr = left[:, 1] + slope * (xr - left[:, 0])
+        key = np.where(spans, yl + yr, np.inf)
+        rank = np.argsort(key, axis=1, kind="stable")
+        counts = spans.sum(axis=1)
+        yl = np.take_along_axis(yl, rank, axis=1)
+        yr = np.take_along_axis(yr, rank, axis=1)
+        # Even-odd pairing: sorted edges (0, 1), (2, 3), ... bound the region.
+        pair = np.arange(0, yl.shape[1] - 1, 2)
+        valid = pair[None, :] + 1 < counts[:, None]
+        rows, cols = np.nonzero(valid)
+        if len(rows) == 0:
+            continue
+        lo, hi = pair[cols], pair[cols] + 1
+        x0 = xl[rows, 0]
+        x1 = xr[rows, 0]
+        quads = np.stack(
+            [
+                np.column_stack([x0, yl[rows, lo]]),
+                np.column_stack([x1, yr[rows, lo]]),
+                np.column_stack([x1, yr[rows, hi]]),
+                np.column_stack([x0, yl[rows, hi]]),
+            ],
+            axis=1,
+        )
+        parts.append(quads)
+    if not parts:
+        raise _NotIntegrable("empty planar region")
+    quads = np.concatenate(parts)
+    triangles = np.concatenate([quads[:, [0, 1, 2]], quads[:, [0, 2, 3]]])
+    cross = (triangles[:, 1, 0] - triangles[:, 0, 0]) * (
+        triangles[:, 2, 1] - triangles[:, 0, 1]
+    ) - (triangles[:, 1, 1] - triangles[:, 0, 1]) * (
+        triangles[:, 2, 0] - triangles[:, 0, 0]
+    )
+    return triangles[cross > 0.0]
+
+
+# ---------------------------------------------------------------------------
+# Small helpers
+# ---------------------------------------------------------------------------
+
+
+def _ccw(points: np.ndarray) -> np.ndarray:
+    return points if _polygon_signed_area(points) > 0.0 else points[::-1]
+
+
+def _lift(triangles_2d: np.ndarray, w: float) -> np.ndarray:
+    return np.concatenate(
+        [triangles_2d, np.full(triangles_2d.shape[:2] + (1,), w)], axis=-1
+    )
+
+
+def _quads(quads: np.ndarray) -> np.ndarray:
+    """Split (N, 4, 3) quads wound a-b-c-d into (2N, 3, 3) triangles."""
+    return np.concatenate([quads[:, [0, 1, 2]], quads[:, [0, 2, 3]]])
+
+
+def _flip(triangles: np.ndarray) -> np.ndarray:
+    return triangles[:, [0, 2, 1]]
+
+
+def _transform(triangles: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    return triangles @ matrix.T
+
+
+def _signed_volume(triangles: np.ndarray) -> float:
+    return (
+        float(
+            np.einsum(
+                "ij,ij->i", triangles[:, 0], np.cross(triangles[:, 1], triangles[:, 2])
+            ).sum()
+        )
+        / 6.0
+    )
+
+
+def _drop_degenerate(triangles: np.ndarray) -> np.ndarray:
+    cross = np.cross(
+        triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0]
+    )
+    return triangles[np.einsum("ij,ij->i", cross, cross) > 0.0]
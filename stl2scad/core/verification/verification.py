@@ -8,15 +8,32 @@ verification reports.
 
 import os
 import json
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Any, Optional, Union, List, Tuple
+from typing import Callable, Dict, Any, Optional, Sequence, Union, List, Tuple
 from dataclasses import dataclass, field
 import stl
 import numpy as np
 
 from ..converter import stl2scad
 from ..temp_paths import temporary_directory
-from .metrics import get_stl_metrics, calculate_scad_metrics, compare_metrics
+from .metrics import (
+    DEFAULT_NUM_SAMPLES,
+    AdaptiveSamplingConfig,
+    get_stl_metrics,
+    calculate_scad_metrics,
+    compare_metrics,
+)
+from .analytic import METRICS_ENGINES, calculate_ir_metrics
+from .render_cache import get_render_cache
+from .tessellate import ir_mesh
+from .visualization import (
+    generate_comparison_visualization,
+    generate_verification_report_html,
+)
+
+# Tolerances that can only be evaluated against a SCAD mesh.
+_MESH_TOLERANCE_METRICS = ("hausdorff_distance", "normal_deviation")
 
 
 def _extract_conversion_metadata_from_scad(scad_file: Path) -> Dict[str, Any]:
@@ -74,6 +91,73 @@ def _extract_conversion_metadata_from_scad(scad_file: Path) -> Dict[str, Any]:
     return metadata
 
 
+def _feature_graph_ir_root(stl_file: Path, scad_file: Path) -> Optional[Dict[str, Any]]:
+    """
+    Recover the IR root a feature-graph SCAD file was emitted from.
+
+    The graph is rebuilt from the STL and only trusted when re-emitting it
+    reproduces the SCAD body, so hand-edited files are never integrated.
+    """
+    from ..feature_graph import (
+        build_feature_graph_for_stl,
+        emit_feature_graph_scad_preview,
+    )
+
+    metadata = _extract_conversion_metadata_from_scad(scad_file)
+    if metadata.get("recognition_backend_used") != "feature_graph":
+        return None
+    try:
+        graph = build_feature_graph_for_stl(stl_file)
+        preview = emit_feature_graph_scad_preview(graph)
+        scad_text = scad_file.read_text(encoding="utf-8", errors="replace")
+    except Exception:
+        return None
+    if not preview or preview.strip() not in scad_text:
+        return None
+    return graph["ir_tree"][0]["root"]
+
+
+def _calculate_scad_metrics_with_engine(
+    stl_file: Path,
+    scad_file: Path,
+    tolerance: Dict[str, float],
+    metrics_engine: str,
+    ir_root: Optional[Dict[str, Any]] = None,
+) -> Tuple[Dict[str, Any], str]:
+    """
+    Calculate SCAD metrics with the requested engine.
+
+    Returns:
+        Tuple[Dict[str, Any], str]: SCAD metrics and the engine that produced them
+    """
+    if metrics_engine not in METRICS_ENGINES:
+        raise ValueError(f"metrics_engine must be one of {', '.join(METRICS_ENGINES)}")
+
+    if metrics_engine != "openscad":
+        root = (
+            ir_root
+            if ir_root is not None
+            else _feature_graph_ir_root(stl_file, scad_file)
+        )
+        analytic_metrics = calculate_ir_metrics(root) if root is not None else None
+        if root is not None and analytic_metrics is not None:
+            # Hausdorff and normal deviation need a mesh; tessellate the IR
+            # directly instead of rendering it when they decide the result.
+            needs_mesh = any(metric in tolerance for metric in _MESH_TOLERANCE_METRICS)
+            if needs_mesh:
+                analytic_metrics["mesh"] = ir_mesh(root)
+            # "analytic" never renders for a mesh; verify_existing_conversion
+            # fails the checks it cannot evaluate without one.
+            if (
+                analytic_metrics["mesh"] is not None
+                or not needs_mesh
+                or metrics_engine == "analytic"
+            ):
+                return analytic_metrics, "analytic"
+
+    return calculate_scad_metrics(scad_file), "openscad"
+
+
 @dataclass
 class VerificationResult:
     """
@@ -190,6 +274,9 @@ def verify_conversion(
     tolerance: Optional[Dict[str, float]] = None,
     debug: bool = False,
     sample_seed: Optional[int] = None,
+    num_samples: int = DEFAULT_NUM_SAMPLES,
+    adaptive_sampling: Optional[AdaptiveSamplingConfig] = None,
+    metrics_engine: str = "openscad",
 ) -> VerificationResult:
     """
     Verify the accuracy of an STL to SCAD conversion.
@@ -200,6 +287,13 @@ def verify_conversion(
         tolerance: Dictionary of tolerance values for different metrics
         debug: Whether to enable debug mode
         sample_seed: Optional seed for deterministic sampling-based metrics
+        num_samples: Surface points sampled per mesh for sampling-based metrics
+        adaptive_sampling: Optional settings to sample in rounds until the
+            Hausdorff and normal-deviation decisions are statistically settled
+        metrics_engine: "openscad" renders the SCAD file; "analytic" integrates
+            and tessellates feature-graph output directly, falling back to
+            OpenSCAD for trees it cannot integrate; "auto" also renders when
+            a mesh-based tolerance needs a mesh that cannot be tessellated
 
     Returns:
         VerificationResult: Result of the verification
@@ -228,12 +322,26 @@ def verify_conversion(
             temp_scad = temp_dir / f"{stl_path.stem}.scad"
             stl2scad(str(stl_path), str(temp_scad), debug=debug)
             return verify_existing_conversion(
-                stl_path, temp_scad, tolerance, debug, sample_seed=sample_seed
+                stl_path,
+                temp_scad,
+                tolerance,
+                debug,
+                sample_seed=sample_seed,
+                num_samples=num_samples,
+                adaptive_sampling=adaptive_sampling,
+                metrics_engine=metrics_engine,
             )
     else:
         scad_path = Path(scad_file)
         return verify_existing_conversion(
-            stl_path, scad_path, tolerance, debug, sample_seed=sample_seed
+            stl_path,
+            scad_path,
+            tolerance,
+            debug,
+            sample_seed=sample_seed,
+            num_samples=num_samples,
+            adaptive_sampling=adaptive_sampling,
+            metrics_engine=metrics_engine,
         )
 
 
@@ -243,6 +351,10 @@ def verify_existing_conversion(
     tolerance: Dict[str, float],
     debug: bool = False,
     sample_seed: Optional[int] = None,
+    num_samples: int = DEFAULT_NUM_SAMPLES,
+    adaptive_sampling: Optional[AdaptiveSamplingConfig] = None,
+    metrics_engine: str = "openscad",
+    ir_root: Optional[Dict[str, Any]] = None,
 ) -> VerificationResult:
     """
     Verify the accuracy of an existing STL to SCAD conversion.
@@ -253,6 +365,17 @@ def verify_existing_conversion(
         tolerance: Dictionary of tolerance values for different metrics
         debug: Whether to enable debug mode
         sample_seed: Optional seed for deterministic sampling-based metrics
+        num_samples: Surface points sampled per mesh for sampling-based metrics
+        adaptive_sampling: Optional settings to sample in rounds until the
+            Hausdorff and normal-deviation decisions are statistically settled
+        metrics_engine: "openscad" renders the SCAD file; "analytic" integrates
+            and tessellates feature-graph output directly, falling back to
+            OpenSCAD for trees it cannot integrate; "auto" also renders when
+            a mesh-based tolerance needs a mesh that cannot be tessellated.
+            Under "analytic" such tolerances fail and are listed in the
+            report's ``unevaluated_checks``
+        ir_root: Optional IR root the SCAD file was emitted from; when omitted
+            the analytic engine rebuilds it from the STL's feature graph
 
     Returns:
         VerificationResult: Result of the verification
@@ -261,10 +384,20 @@ def verify_existing_conversion(
     stl_metrics = get_stl_metrics(stl_file)
 
     # Calculate SCAD metrics
-    scad_metrics = calculate_scad_metrics(scad_file)
+    scad_metrics, engine_used = _calculate_scad_metrics_with_engine(
+        stl_file, scad_file, tolerance, metrics_engine, ir_root=ir_root
+    )
+    render_cache_status = scad_metrics.pop("render_cache", None)
 
     # Compare metrics
-    comparison = compare_metrics(stl_metrics, scad_metrics, sample_seed=sample_seed)
+    comparison = compare_metrics(
+        stl_metrics,
+        scad_metrics,
+        sample_seed=sample_seed,
+        num_samples=num_samples,
+        adaptive=adaptive_sampling,
+        tolerance=tolerance,
+    )
 
     # Remove 'mesh' object to avoid JSON serialization errors
     stl_metrics.pop("mesh", None)
@@ -305,6 +438,16 @@ def verify_existing_conversion(
         if normal_dev > tolerance["normal_deviation"]:
             passed = False
 
+    # A requested tolerance that could not be evaluated fails instead of
+    # passing unchecked (the analytic engine may have no mesh to compare).
+    unevaluated = [
+        metric
+        for metric in _MESH_TOLERANCE_METRICS
+        if metric in tolerance and metric not in comparison
+    ]
+    if unevaluated:
+        passed = False
+
     # Create verification result
     result = VerificationResult(
         stl_file=str(stl_file),
@@ -381,6 +524,15 @@ def verify_existing_conversion(
                 }
             )
 
+    for metric in unevaluated:
+        failures.append(
+            {
+                "metric": metric,
+                "tolerance": tolerance[metric],
+                "message": f"{metric} was not evaluated: the {engine_used} metrics engine produced no SCAD mesh",
+            }
+        )
+
     conversion_metadata = _extract_conversion_metadata_from_scad(scad_file)
 
     # Generate detailed report
@@ -389,7 +541,12 @@ def verify_existing_conversion(
         "metrics_comparison": comparison,
         "tolerance_used": tolerance,
         "failures": failures,
+        "metrics_engine": engine_used,
     }
+    if unevaluated:
+        report["unevaluated_checks"] = unevaluated
+    if render_cache_status is not None:
+        report["render_cache"] = render_cache_status
     if conversion_metadata:
         report["conversion_metadata"] = conversion_metadata
 
@@ -399,14 +556,28 @@ def verify_existing_conversion(
 
 
 def batch_verify(
-    stl_files: List[Union[str, Path]],
+    stl_files: Sequence[Union[str, Path]],
     output_dir: Union[str, Path],
     tolerance: Optional[Dict[str, float]] = None,
     debug: bool = False,
     sample_seed: Optional[int] = None,
+    num_samples: int = DEFAULT_NUM_SAMPLES,
+    adaptive_sampling: Optional[AdaptiveSamplingConfig] = None,
+    workers: int = 1,
+    metrics_engine: str = "openscad",
+    input_root: Optional[Union[str, Path]] = None,
+    conversion_options: Optional[Dict[str, Any]] = None,
+    html_report: bool = False,
+    visual_renderer: str = "openscad",
+    progress_callback: Optional[Callable[[int, int, str], None]] = None,
 ) -> Dict[str, VerificationResult]:
     """
-    Verify multiple STL to SCAD conversions.
+    Convert and verify multiple STL files.
+
+    Each file's report and ``verification_summary.json`` are written as soon
+    as the file finishes, so an interrupted run leaves a usable partial
+    summary. A file that raises is recorded in the summary with its error
+    and does not stop the run.
 
     Args:
         stl_files: List of STL file paths
@@ -414,42 +585,207 @@ def batch_verify(
         tolerance: Dictionary of tolerance values for different metrics
         debug: Whether to enable debug mode
         sample_seed: Optional seed for deterministic sampling-based metrics
+        num_samples: Surface points sampled per mesh for sampling-based metrics
+        adaptive_sampling: Optional settings to sample in rounds until the
+            Hausdorff and normal-deviation decisions are statistically settled
+        workers: Processes converting and verifying files in parallel. The
+            OpenSCAD render budget (``STL2SCAD_RENDER_CONCURRENCY``, default:
+            CPU count) is split between them.
+        metrics_engine: Metrics engine passed to :func:`verify_conversion`
+        input_root: Directory the STL files were collected from. Outputs then
+            mirror each file's relative path under ``output_dir`` and results
+            are keyed by that relative path instead of the file name.
+        conversion_options: Extra keyword arguments for :func:`stl2scad`
+        html_report: Also render comparison images and an HTML report per file
+        visual_renderer: Renderer for the HTML report images
+        progress_callback: Called as ``(completed, total, key)`` after each file
 
     Returns:
-        Dict[str, VerificationResult]: Dictionary of verification results keyed by STL file name
+        Dict[str, VerificationResult]: Verification results keyed by STL file
+        name (or relative path with ``input_root``); files that raised are
+        only listed in the summary
     """
     output_path = Path(output_dir)
     output_path.mkdir(exist_ok=True, parents=True)
+    stl_paths = [Path(stl_file) for stl_file in stl_files]
+    worker_count = max(1, min(int(workers), len(stl_paths) or 1))
+    keys: Dict[Path, str] = {}
+    output_dirs: Dict[Path, Path] = {}
+    for stl_path in stl_paths:
+        if input_root is None:
+            keys[stl_path] = stl_path.name
+            output_dirs[stl_path] = output_path
+        else:
+            relative = stl_path.relative_to(input_root)
+            keys[stl_path] = str(relative)
+            output_dirs[stl_path] = output_path / relative.parent
+    job_args = (
+        tolerance,
+        debug,
+        sample_seed,
+        num_samples,
+        adaptive_sampling,
+        metrics_engine,
+        conversion_options or {},
+        html_report,
+        visual_renderer,
+    )
 
-    results = {}
-
-    for stl_file in stl_files:
-        stl_path = Path(stl_file)
-        scad_path = output_path / f"{stl_path.stem}.scad"
-        report_path = output_path / f"{stl_path.stem}_verification.json"
-
-        # Convert and verify
-        result = verify_conversion(
-            stl_path, scad_path, tolerance, debug, sample_seed=sample_seed
+    results: Dict[str, VerificationResult] = {}
+    entries: Dict[str, Dict[str, Any]] = {}
+    cache_counters = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    def record(stl_path: Path, outcome: Any, error: Optional[BaseException]) -> None:
+        key = keys[stl_path]
+        if error is None:
+            result, counters = outcome
+            results[key] = result
+            file_dir = output_dirs[stl_path]
+            entries[key] = {
+                "passed": result.passed,
+                "report": str(file_dir / f"{stl_path.stem}_verification.json"),
+            }
+            if html_report:
+                entries[key]["html"] = str(
+                    file_dir / f"{stl_path.stem}_verification.html"
+                )
+            for name, value in counters.items():
+                cache_counters[name] += value
+        else:
+            entries[key] = {
+                "passed": False,
+                "error": f"{type(error).__name__}: {error}",
+            }
+        _write_batch_summary(output_path, len(stl_paths), entries, cache_counters)
+        if progress_callback is not None:
+            progress_callback(len(entries), len(stl_paths), key)
+
+    if worker_count == 1:
+        for stl_path in stl_paths:
+            try:
+                outcome = _verify_batch_file(stl_path, output_dirs[stl_path], *job_args)
+            except Exception as exc:
+                record(stl_path, None, exc)
+            else:
+                record(stl_path, outcome, None)
+    else:
+        total_renders = int(
+            os.environ.get("STL2SCAD_RENDER_CONCURRENCY") or os.cpu_count() or 1
         )
+        with ProcessPoolExecutor(
+            max_workers=worker_count,
+            initializer=_init_batch_worker,
+            initargs=(max(1, total_renders // worker_count),),
+        ) as executor:
+            future_to_path = {
+                executor.submit(
+                    _verify_batch_file, stl_path, output_dirs[stl_path], *job_args
+                ): stl_path
+                for stl_path in stl_paths
+            }
+            for future in as_completed(future_to_path):
+                stl_path = future_to_path[future]
+                try:
+                    outcome = future.result()
+                except Exception as exc:
+                    record(stl_path, None, exc)
+                else:
+                    record(stl_path, outcome, None)
+
+    # Final summary in input order.
+    ordered = {
+        keys[path]: entries[keys[path]] for path in stl_paths if keys[path] in entries
+    }
+    _write_batch_summary(output_path, len(stl_paths), ordered, cache_counters)
+    return {
+        keys[path]: results[keys[path]] for path in stl_paths if keys[path] in results
+    }
 
-        # Save report
-        result.save_report(report_path)
 
-        # Store result
-        results[stl_path.name] = result
+def _init_batch_worker(render_concurrency: int) -> None:
+    """Give each batch worker process its share of the OpenSCAD render budget."""
+    os.environ["STL2SCAD_RENDER_CONCURRENCY"] = str(render_concurrency)
+
+
+def _verify_batch_file(
+    stl_path: Path,
+    output_path: Path,
+    tolerance: Optional[Dict[str, float]],
+    debug: bool,
+    sample_seed: Optional[int],
+    num_samples: int,
+    adaptive_sampling: Optional[AdaptiveSamplingConfig],
+    metrics_engine: str,
+    conversion_options: Dict[str, Any],
+    html_report: bool,
+    visual_renderer: str,
+) -> Tuple[VerificationResult, Dict[str, int]]:
+    """Convert, verify and report one file; returns render-cache counter deltas."""
+    output_path.mkdir(exist_ok=True, parents=True)
+    scad_path = output_path / f"{stl_path.stem}.scad"
+    report_path = output_path / f"{stl_path.stem}_verification.json"
+    render_cache = get_render_cache()
+    before = render_cache.stats() if render_cache is not None else {}
+
+    stl2scad(str(stl_path), str(scad_path), debug=debug, **conversion_options)
+    result = verify_conversion(
+        stl_path,
+        scad_path,
+        tolerance,
+        debug,
+        sample_seed=sample_seed,
+        num_samples=num_samples,
+        adaptive_sampling=adaptive_sampling,
+        metrics_engine=metrics_engine,
+    )
+    result.save_report(report_path)
+    if html_report:
+        vis_dir = output_path / f"{stl_path.stem}_visualizations"
+        vis_dir.mkdir(exist_ok=True, parents=True)
+        visualizations = generate_comparison_visualization(
+            stl_path, scad_path, vis_dir, renderer=visual_renderer
+        )
+        generate_verification_report_html(
+            vars(result),
+            visualizations,
+            output_path / f"{stl_path.stem}_verification.html",
+        )
 
-    # Create summary report
-    summary = {
-        "total": len(results),
-        "passed": sum(1 for r in results.values() if r.passed),
-        "failed": sum(1 for r in results.values() if not r.passed),
-        "results": {
-            name: {"passed": result.passed} for name, result in results.items()
-        },
+    after = render_cache.stats() if render_cache is not None else {}
+    counters: Dict[str, int] = {
+        name: after[name] - before[name]
+        for name in ("hits", "misses", "stores", "evictions")
+        if name in after
+    }
+    return result, counters
+
+
+def _write_batch_summary(
+    output_path: Path,
+    total: int,
+    entries: Dict[str, Dict[str, Any]],
+    cache_counters: Dict[str, int],
+) -> None:
+    """Atomically (re)write ``verification_summary.json`` for a batch run."""
+    summary: Dict[str, Any] = {
+        "total": total,
+        "completed": len(entries),
+        "passed": sum(1 for entry in entries.values() if entry["passed"]),
+        "failed": sum(1 for entry in entries.values() if not entry["passed"]),
+        "errors": sum(1 for entry in entries.values() if "error" in entry),
+        "results": entries,
     }
+    render_cache = get_render_cache()
+    if render_cache is not None:
+        lookups = cache_counters["hits"] + cache_counters["misses"]
+        summary["render_cache"] = dict(
+            cache_counters,
+            hit_rate=cache_counters["hits"] / lookups if lookups else 0.0,
+            root=str(render_cache.root),
+        )
 
-    with open(output_path / "verification_summary.json", "w") as f:
+    summary_path = output_path / "verification_summary.json"
+    staging = output_path / f".verification_summary.{os.getpid()}.tmp"
+    with open(staging, "w") as f:
         json.dump(summary, f, indent=2)
-
-    return results
+    os.replace(staging, summary_path)
@@ -6,12 +6,36 @@ STL and SCAD models, including side-by-side views, cross-sections,
 and difference highlighting.
 """
 
+import logging
+import math
 import os
+import shutil
 from pathlib import Path
-from typing import Dict, Any, Optional, Union, List, Tuple
+from typing import Dict, Any, Optional, Union, List, Sequence, Tuple
 import stl
 
-from ..converter import run_openscad, get_openscad_path
+import numpy as np
+
+from ..converter import get_openscad_path
+from ..raster import rasterize, shade_image, write_png
+from ..render_pool import RenderJob, get_render_pool
+from .metrics import calculate_scad_metrics
+from .render_cache import RenderCache, file_digest, get_render_cache, openscad_version
+
+# Render-cache key tag for comparison images.
+_IMAGE_CACHE_TAG = "comparison-image-v1"
+
+# OpenSCAD's default viewport rotation, used for views without a camera.
+_DEFAULT_VIEW_ROTATION = (55.0, 0.0, 25.0)
+
+# Comparison image renderers: OpenSCAD, or the NumPy rasterizer in core.raster.
+VISUALIZATION_RENDERERS = ("openscad", "software")
+
+# Software renderer colours, matching the OpenSCAD script's STL/SCAD colours.
+_SOFTWARE_IMAGE_SIZE = (800, 600)
+_SOFTWARE_BACKGROUND = (255, 255, 229)
+_SOFTWARE_STL_COLOR = (77, 128, 230)
+_SOFTWARE_SCAD_COLOR = (230, 77, 77)
 
 
 def _get_stl_z_bounds(stl_path: Path) -> Tuple[float, float]:
@@ -35,20 +59,275 @@ def _compute_cross_section_heights(
     return [min_z + model_height * (0.1 + 0.8 * i / (count - 1)) for i in range(count)]
 
 
+def _render_images_cached(
+    requests: List[Tuple[str, List[str], Path, Path]],
+    vis_file: Path,
+    openscad_path: Optional[str],
+    cache: Optional[RenderCache],
+    key_parts: Tuple[str, ...],
+) -> List[bool]:
+    """
+    Render images of *vis_file* concurrently, reusing cached PNGs for the same inputs.
+
+    Args:
+        requests: ``(description, args, output_file, log_file)`` per image
+        vis_file: Visualization script passed to every render
+        openscad_path: Optional path to OpenSCAD executable
+        cache: Render cache, or None to always render
+        key_parts: Cache key prefix shared by every image of this script
+
+    Returns:
+        List[bool]: Success flag per request, in order
+    """
+    results = [False] * len(requests)
+    keys: List[Optional[str]] = [None] * len(requests)
+    misses = []
+    for index, (_, args, output_file, _) in enumerate(requests):
+        if cache is not None:
+            image_key = cache.key(*key_parts, *args)
+            keys[index] = image_key
+            entry = cache.get(image_key)
+            if entry is not None:
+                try:
+                    shutil.copyfile(entry["path"] / "image.png", output_file)
+                    results[index] = True
+                    continue
+                except OSError:
+                    pass
+        misses.append(index)
+
+    # Cache misses are independent renders; the shared pool runs them side by side.
+    rendered = get_render_pool().map(
+        [
+            RenderJob(
+                requests[index][0],
+                requests[index][1] + ["-o", str(requests[index][2]), str(vis_file)],
+                str(requests[index][3]),
+                openscad_path,
+            )
+            for index in misses
+        ]
+    )
+    for index, success in zip(misses, rendered):
+        output_file = requests[index][2]
+        key = keys[index]
+        if success and output_file.exists() and cache is not None and key is not None:
+            cache.put(key, {"image.png": output_file})
+        results[index] = success
+    return results
+
+
+def _eye_rotation(
+    eye: Sequence[float], center: Sequence[float]
+) -> Tuple[float, float, float]:
+    """Return the ``$vpr`` rotation OpenSCAD derives from an eye/center camera."""
+    dx, dy, dz = (e - c for e, c in zip(eye, center))
+    tilt = math.degrees(math.atan2(dz, math.hypot(dx, dy)))
+    return (90.0 - tilt, 0.0, 90.0 + math.degrees(math.atan2(dy, dx)))
+
+
+def _render_views_single_pass(
+    script: str,
+    output_files: List[Path],
+    work_dir: Path,
+    openscad_path: Optional[str],
+    cache: Optional[RenderCache],
+    key_parts: Tuple[str, ...],
+    frames: List[Tuple[str, float, Tuple[float, float, float]]],
+) -> bool:
+    """
+    Render every view of an animated view script in one OpenSCAD process.
+
+    Each animation frame selects one view and its ``$vpr`` camera. OpenSCAD
+    keeps its geometry cache across frames, so the STL import and the SCAD
+    model are evaluated once rather than once per view. Builds that ignore a
+    script-assigned ``$vpr`` in command-line exports render every overlay
+    frame with the default camera; byte-identical overlay frames for
+    different cameras are treated as that case.
+
+    Args:
+        script: Visualization script driven by ``$t``, one frame per view
+        output_files: Image path per frame, in frame order
+        work_dir: Directory for the script, frames and log
+        openscad_path: Optional path to OpenSCAD executable
+        cache: Render cache, or None to always render
+        key_parts: Cache key identifying the script and its inputs
+        frames: ``(view_type, cross_section_z, $vpr)`` per frame
+
+    Returns:
+        bool: True when every frame was produced with its own camera, False
+        if the caller should fall back to one render per view
+    """
+    key = cache.key(*key_parts) if cache is not None else None
+    if cache is not None and key is not None:
+        entry = cache.get(key)
+        if entry is not None:
+            try:
+                for index, output_file in enumerate(output_files):
+                    shutil.copyfile(
+                        entry["path"] / f"frame_{index:05d}.png", output_file
+                    )
+                return True
+            except OSError:
+                pass
+
+    script_file = work_dir / "comparison_views.scad"
+    script_file.write_text(script, encoding="utf-8")
+    frames_dir = work_dir / "comparison_frames"
+    shutil.rmtree(frames_dir, ignore_errors=True)
+    frames_dir.mkdir(parents=True)
+    try:
+        success = get_render_pool().run(
+            RenderJob(
+                "All comparison views",
+                [
+                    "--animate",
+                    str(len(output_files)),
+                    "--render",
+                    "--autocenter",
+                    "--viewall",
+                    "-o",
+                    str(frames_dir / "frame.png"),
+                    str(script_file),
+                ],
+                str(work_dir / "comparison_views.log"),
+                openscad_path,
+                timeout=30 * len(output_files),
+            )
+        )
+        # Frame names are zero-padded, so sorting restores frame order.
+        frame_files = sorted(frames_dir.glob("*.png"))
+        if not success or len(frame_files) != len(output_files):
+            return False
+        if _cameras_ignored(frame_files, frames):
+            logging.info("OpenSCAD ignored the per-frame $vpr cameras")
+            return False
+        for frame_file, output_file in zip(frame_files, output_files):
+            shutil.copyfile(frame_file, output_file)
+    finally:
+        shutil.rmtree(frames_dir, ignore_errors=True)
+
+    if cache is not None and key is not None:
+        cache.put(
+            key,
+            {f"frame_{index:05d}.png": path for index, path in enumerate(output_files)},
+        )
+    return True
+
+
+def _cameras_ignored(
+    frame_files: List[Path],
+    frames: List[Tuple[str, float, Tuple[float, float, float]]],
+) -> bool:
+    """Return True if overlay frames with different cameras are byte-identical."""
+    overlay = [
+        (frame_file, rotation)
+        for frame_file, (view_type, _, rotation) in zip(frame_files, frames)
+        if view_type == "overlay"
+    ]
+    if len({rotation for _, rotation in overlay}) < 2:
+        return False
+    return len({frame_file.read_bytes() for frame_file, _ in overlay}) == 1
+
+
+def _render_views_software(
+    stl_vectors: np.ndarray,
+    scad_vectors: np.ndarray,
+    frames: List[Tuple[str, float, Tuple[float, float, float]]],
+    output_files: List[Path],
+    cross_section_thickness: float,
+) -> List[bool]:
+    """
+    Rasterize overlay and cross-section views without OpenSCAD.
+
+    Both meshes are framed by their combined bounds. Pixels covered by both
+    are blended, so agreeing surfaces read as a mix of the two colours and
+    deviations show in the pure STL or SCAD colour.
+
+    Args:
+        stl_vectors: ``(N, 3, 3)`` source STL triangles
+        scad_vectors: ``(M, 3, 3)`` rendered SCAD triangles
+        frames: ``(view_type, cross_section_z, $vpr)`` per image
+        output_files: Image path per frame
+        cross_section_thickness: Height of the slab shown by cross sections
+
+    Returns:
+        List[bool]: Success flag per frame
+    """
+    points = np.concatenate(
+        [np.reshape(stl_vectors, (-1, 3)), np.reshape(scad_vectors, (-1, 3))]
+    )
+    bounds = (points.min(axis=0), points.max(axis=0))
+    width, height = _SOFTWARE_IMAGE_SIZE
+    results = []
+    for (view_type, z, (rx, _, rz)), output_file in zip(frames, output_files):
+        z_range: Optional[Tuple[float, float]] = None
+        if view_type == "cross_section":
+            half = cross_section_thickness / 2.0
+            z_range = (z - half, z + half)
+        elevation, azimuth = 90.0 - rx, rz - 90.0
+        stl_face, stl_shade = rasterize(
+            stl_vectors,
+            width,
+            height,
+            elevation=elevation,
+            azimuth=azimuth,
+            bounds=bounds,
+            z_range=z_range,
+        )
+        scad_face, scad_shade = rasterize(
+            scad_vectors,
+            width,
+            height,
+            elevation=elevation,
+            azimuth=azimuth,
+            bounds=bounds,
+            z_range=z_range,
+        )
+        stl_image = shade_image(
+            stl_face, stl_shade, _SOFTWARE_STL_COLOR, _SOFTWARE_BACKGROUND
+        )
+        scad_image = shade_image(
+            scad_face, scad_shade, _SOFTWARE_SCAD_COLOR, _SOFTWARE_BACKGROUND
+        )
+        image = np.where((scad_face >= 0)[..., None], scad_image, stl_image)
+        both = (stl_face >= 0) & (scad_face >= 0)
+        image[both] = (stl_image[both].astype(np.uint16) + scad_image[both]) // 2
+        try:
+            write_png(output_file, image)
+            results.append(True)
+        except OSError:
+            results.append(False)
+    return results
+
+
 def generate_comparison_visualization(
     stl_file: Union[str, Path],
     scad_file: Union[str, Path],
     output_dir: Union[str, Path],
     views: Optional[List[str]] = None,
+    use_cache: bool = True,
+    renderer: str = "openscad",
 ) -> Dict[str, Path]:
     """
     Generate comparison visualizations between STL and SCAD models.
 
+    With the OpenSCAD renderer, all views are rendered as frames of one OpenSCAD animation run, so the
+    models are evaluated once; if that run fails (e.g. an OpenSCAD build
+    without ``--animate``) or ignores the per-frame cameras, each view is
+    rendered by its own process. Images
+    are looked up in the persistent render cache first, keyed by the
+    visualization script, the STL and SCAD contents, the OpenSCAD version and
+    the render arguments.
+
     Args:
         stl_file: Path to the STL file
         scad_file: Path to the SCAD file
         output_dir: Directory to save visualization files
         views: List of views to generate ('perspective', 'top', 'front', 'side', 'comparison')
+        use_cache: Whether to read and populate the render cache
+        renderer: ``"openscad"``, or ``"software"`` to rasterize the views
+            from the STL and the rendered SCAD mesh with NumPy
 
     Returns:
         Dict[str, Path]: Dictionary of generated visualization files
@@ -57,6 +336,8 @@ def generate_comparison_visualization(
         FileNotFoundError: If input files not found
         RuntimeError: If visualization generation fails
     """
+    if renderer not in VISUALIZATION_RENDERERS:
+        raise ValueError(f"Unknown visualization renderer: {renderer}")
     stl_path = Path(stl_file)
     scad_path = Path(scad_file)
     output_path = Path(output_dir)
@@ -75,7 +356,7 @@ def generate_comparison_visualization(
         views = ["perspective", "top", "front", "side", "comparison"]
 
     # Get OpenSCAD path
-    openscad_path = get_openscad_path()
+    openscad_path = get_openscad_path() if renderer == "openscad" else None
 
     # Derive cross-section levels from the source model's actual Z bounds.
     try:
@@ -93,7 +374,7 @@ def generate_comparison_visualization(
     scad_path_posix = scad_path.absolute().as_posix()
 
     # Create visualization script
-    vis_script = f"""
+    vis_header = """
     // STL to SCAD Comparison Visualization
     // Generated by stl2scad verification system
     
@@ -101,10 +382,12 @@ def generate_comparison_visualization(
     show_stl = true;
     show_scad = true;
     cross_section = false;
-    cross_section_z = 0;
+    """
+    vis_parameters = """cross_section_z = 0;
     cross_section_thickness = 0.1;
     view_type = "side_by_side"; // override at command line using -D view_type="..."
-    
+    """
+    vis_body = f"""
     // Colors
     stl_color = [0.3, 0.5, 0.9, 0.7];  // Blue, semi-transparent
     scad_color = [0.9, 0.3, 0.3, 0.7];  // Red, semi-transparent
@@ -161,12 +444,27 @@ def generate_comparison_visualization(
         side_by_side();
     }}
     """
+    vis_script = vis_header + vis_parameters + vis_body
 
     # Write script to file
     vis_file = output_path / "comparison.scad"
     with open(vis_file, "w") as f:
         f.write(vis_script)
 
+    # The script embeds absolute paths; key on the referenced contents instead.
+    cache = get_render_cache() if use_cache and renderer == "openscad" else None
+    key_parts: Tuple[str, ...] = ()
+    if cache is not None:
+        key_parts = (
+            _IMAGE_CACHE_TAG,
+            vis_script.replace(stl_path_posix, "<stl>").replace(
+                scad_path_posix, "<scad>"
+            ),
+            file_digest(stl_path),
+            file_digest(scad_path),
+            openscad_version(openscad_path),
+        )
+
     # Generate visualizations
     visualizations = {}
 
@@ -178,6 +476,13 @@ def generate_comparison_visualization(
         "side": {"eye": [200, 0, 0], "center": [0, 0, 0], "up": [0, 0, 1]},
     }
 
+    # Queue every image first so the renders can run concurrently, then
+    # collect the outcomes in view order.
+    requests: List[Tuple[str, List[str], Path, Path]] = []
+    outcomes: List[Tuple[str, Path, Optional[int]]] = []
+    # Per request: view_type, cross_section_z and $vpr for the single-pass run.
+    frames: List[Tuple[str, float, Tuple[float, float, float]]] = []
+
     for view_name in views:
         output_file = output_path / f"{view_name}_view.png"
 
@@ -188,31 +493,24 @@ def generate_comparison_visualization(
                 angle_file = output_path / f"comparison_{angle}.png"
                 camera = f"0,0,0,0,0,{angle},200"
 
-                success = run_openscad(
-                    f"Comparison view {angle}°",
-                    [
-                        "-D",
-                        'view_type="overlay"',
-                        "--camera",
-                        camera,
-                        "--render",
-                        "--autocenter",
-                        "--viewall",
-                        "-o",
-                        str(angle_file),
-                        str(vis_file),
-                    ],
-                    str(output_path / f"comparison_{angle}.log"),
-                    openscad_path,
-                )
-
-                if success and angle_file.exists():
-                    if angle == 0:  # Use the first angle as the main comparison view
-                        visualizations[view_name] = angle_file
-                else:
-                    print(
-                        f"Warning: Failed to generate {view_name} view at angle {angle}"
+                requests.append(
+                    (
+                        f"Comparison view {angle}°",
+                        [
+                            "-D",
+                            'view_type="overlay"',
+                            "--camera",
+                            camera,
+                            "--render",
+                            "--autocenter",
+                            "--viewall",
+                        ],
+                        angle_file,
+                        output_path / f"comparison_{angle}.log",
                     )
+                )
+                outcomes.append((view_name, angle_file, angle))
+                frames.append(("overlay", 0.0, (0.0, 0.0, float(angle))))
         else:
             # Generate standard view
             if view_name in camera_settings:
@@ -222,55 +520,121 @@ def generate_comparison_visualization(
                 up_str = f"{camera_config['up'][0]},{camera_config['up'][1]},{camera_config['up'][2]}"
                 camera_str = f"{eye_str},{center_str}"
 
-                success = run_openscad(
-                    f"{view_name.capitalize()} view",
-                    [
-                        "-D",
-                        'view_type="overlay"',
-                        "--camera",
-                        camera_str,
-                        "--render",
-                        "--autocenter",
-                        "--viewall",
-                        "-o",
-                        str(output_file),
-                        str(vis_file),
-                    ],
-                    str(output_path / f"{view_name}_view.log"),
-                    openscad_path,
+                requests.append(
+                    (
+                        f"{view_name.capitalize()} view",
+                        [
+                            "-D",
+                            'view_type="overlay"',
+                            "--camera",
+                            camera_str,
+                            "--render",
+                            "--autocenter",
+                            "--viewall",
+                        ],
+                        output_file,
+                        output_path / f"{view_name}_view.log",
+                    )
+                )
+                outcomes.append((view_name, output_file, None))
+                frames.append(
+                    (
+                        "overlay",
+                        0.0,
+                        _eye_rotation(camera_config["eye"], camera_config["center"]),
+                    )
                 )
-
-                if success and output_file.exists():
-                    visualizations[view_name] = output_file
-                else:
-                    print(f"Warning: Failed to generate {view_name} view")
 
     # Generate cross-section views at actual model heights.
     for i, height in enumerate(section_heights):
         # Generate cross-section image
         output_file = output_path / f"cross_section_{i+1}.png"
-        success = run_openscad(
-            f"Cross-section {i+1}",
-            [
-                "-D",
-                'view_type="cross_section"',
-                "-D",
-                f"cross_section_z={height}",
-                "-D",
-                f"cross_section_thickness={cross_section_thickness}",
-                "--render",
-                "--autocenter",
-                "--viewall",
-                "-o",
-                str(output_file),
-                str(vis_file),
-            ],
-            str(output_path / f"cross_section_{i+1}.log"),
-            openscad_path,
+        requests.append(
+            (
+                f"Cross-section {i+1}",
+                [
+                    "-D",
+                    'view_type="cross_section"',
+                    "-D",
+                    f"cross_section_z={height}",
+                    "-D",
+                    f"cross_section_thickness={cross_section_thickness}",
+                    "--render",
+                    "--autocenter",
+                    "--viewall",
+                ],
+                output_file,
+                output_path / f"cross_section_{i+1}.log",
+            )
         )
+        outcomes.append((f"cross_section_{i+1}", output_file, None))
+        frames.append(("cross_section", height, _DEFAULT_VIEW_ROTATION))
 
-        if success and output_file.exists():
-            visualizations[f"cross_section_{i+1}"] = output_file
+    # Frame i of the animation shows view i; $t steps by 1/len(frames).
+    frame_rows = ",\n        ".join(
+        f'["{view_type}", {z!r}, [{rx!r}, {ry!r}, {rz!r}]]'
+        for view_type, z, (rx, ry, rz) in frames
+    )
+    frames_parameters = f"""// One frame per view: [view_type, cross_section_z, $vpr]
+    frames = [
+        {frame_rows}
+    ];
+    frame = frames[min(len(frames) - 1, round($t * len(frames)))];
+    view_type = frame[0];
+    cross_section_z = frame[1];
+    cross_section_thickness = {cross_section_thickness!r};
+    $vpr = frame[2];
+    """
+    frames_script = vis_header + frames_parameters + vis_body
+    frames_key_parts = key_parts + (
+        "single-pass",
+        frames_script.replace(stl_path_posix, "<stl>").replace(
+            scad_path_posix, "<scad>"
+        ),
+    )
+
+    results: List[bool] = []
+    if requests and renderer == "software":
+        # The SCAD mesh comes from the (render-cached) metrics render.
+        stl_vectors = stl.mesh.Mesh.from_file(str(stl_path)).vectors
+        scad_metrics = calculate_scad_metrics(scad_path, use_cache=use_cache)
+        results = _render_views_software(
+            stl_vectors,
+            scad_metrics["mesh"].vectors,
+            frames,
+            [request[2] for request in requests],
+            cross_section_thickness,
+        )
+    elif requests and _render_views_single_pass(
+        frames_script,
+        [request[2] for request in requests],
+        output_path,
+        openscad_path,
+        cache,
+        frames_key_parts,
+        frames,
+    ):
+        results = [True] * len(requests)
+    elif requests:
+        logging.info("Single-pass view rendering unavailable; rendering each view")
+        results = _render_images_cached(
+            requests, vis_file, openscad_path, cache, key_parts
+        )
+    for (name, output_file, view_angle), success in zip(outcomes, results):
+        ok = success and output_file.exists()
+        if name == "comparison":
+            if ok:
+                if view_angle == 0:  # Use the first angle as the main comparison view
+                    visualizations[name] = output_file
+            else:
+                print(f"Warning: Failed to generate {name} view at angle {view_angle}")
+        elif name.startswith("cross_section_"):
+            if ok:
+                visualizations[name] = output_file
+        elif ok:
+            visualizations[name] = output_file
+        else:
+            print(f"Warning: Failed to generate {name} view")
 
     return visualizations
 
@@ -295,6 +659,12 @@ def generate_verification_report_html(
     comparison = verification_result.get("comparison", {})
     report = verification_result.get("report", {})
 
+    render_html = ""
+    if report.get("metrics_engine"):
+        render_html += f"<br>\n                <strong>Metrics Engine:</strong> {report['metrics_engine']}"
+    if report.get("render_cache"):
+        render_html += f"<br>\n                <strong>Render Cache:</strong> {report['render_cache']}"
+
     # Format metrics for display
     metrics_html = ""
 
@@ -538,7 +908,7 @@ def generate_verification_report_html(
             </p>
             <p>
                 <strong>STL File:</strong> {os.path.basename(stl_file)}<br>
-                <strong>SCAD File:</strong> {os.path.basename(scad_file)}
+                <strong>SCAD File:</strong> {os.path.basename(scad_file)}{render_html}
             </p>
         </header>
         
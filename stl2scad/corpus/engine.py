@@ -22,6 +22,7 @@ if session.best_candidate:
 from __future__ import annotations
 
 import dataclasses
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
 import functools
 import itertools
 import json
@@ -31,8 +32,14 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable, Generator, Iterable, Optional
 
-from stl2scad.core.feature_graph import build_feature_graph_for_stl
+import numpy as np
+
+from stl2scad.core.feature_graph import emit_feature_graph_scad_preview
+from stl2scad.core.graph_store import GraphStore, get_graph_store, stl_digest
+from stl2scad.core.mesh_cache import LRUCache, ParsedMeshCache
 from stl2scad.tuning.config import DetectorConfig
+from stl2scad.tuning.decisions import Decision, decisions_flip
+from stl2scad.tuning.splits import stratified_split
 from stl2scad.tuning.thingi10k import (
     _classify_graph_bucket,
     _top_confidence,
@@ -65,6 +72,14 @@ _PERTURBATION_STEPS: tuple[float, ...] = (-0.10, -0.05, +0.05, +0.10)
 # Minimum improvement in preview_ready_ratio to consider a trial a winner.
 _MIN_IMPROVEMENT = 0.005
 
+# Racing: fraction of the corpus scored at each rung, and the z-score of the
+# confidence bound used to eliminate trials between rungs.
+_RACE_FRACTIONS: tuple[float, ...] = (0.125, 0.25, 0.5, 1.0)
+_RACE_Z = 2.0
+
+# Default memory budget for parsed mesh arrays shared across trials.
+_DEFAULT_MESH_CACHE_BYTES = 512 * 1024 * 1024
+
 
 # ── Score dataclasses ─────────────────────────────────────────────────────────
 
@@ -157,6 +172,8 @@ class ImprovementSession:
     all_trial_deltas: list[float] = field(default_factory=list)
     started_at_utc: str = ""
     finished_at_utc: str = ""
+    # (trial, file) scorings performed; racing scores fewer than trials × files.
+    files_scored: int = 0
 
     @property
     def improved(self) -> bool:
@@ -177,6 +194,18 @@ class ImprovementSession:
         return "\n".join(lines)
 
 
+# ── Caches ────────────────────────────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class _DecisionReference:
+    """Last full detector run for one file, kept for threshold replay."""
+
+    file_key: tuple[str, int, int]
+    config: DetectorConfig
+    graph: dict[str, Any]
+    decisions: tuple[Decision, ...]
+
+
 # ── Engine ────────────────────────────────────────────────────────────────────
 
 class CorpusEngine:
@@ -189,6 +218,19 @@ class CorpusEngine:
     cache_size:
         Max number of feature graphs to keep in the in-memory LRU cache.
         Set to 0 to disable caching (re-runs detector on every score call).
+    mesh_cache_bytes:
+        Memory budget for parsed mesh arrays (vectors, normals, areas and
+        welded vertices), keyed by path, size and mtime. Trials reuse them
+        instead of re-reading the STL, so they pay only detector time.
+        Set to 0 to disable.
+    replay_thresholds:
+        Keep each file's last graph with the threshold decisions it recorded.
+        A config that only moves replayable thresholds reuses that graph when
+        no recorded decision flips, so only flipped files re-run the detector.
+    use_graph_cache:
+        Read and write graphs through the persistent feature-graph store
+        (``stl2scad.core.graph_store``), so a repeated session or a scorer
+        that already saw a (file, config) pair skips the detector.
     progress_fn:
         Optional tqdm-compatible progress wrapper.
     """
@@ -198,11 +240,22 @@ class CorpusEngine:
         file_entries: Iterable[tuple[str, Path]],
         *,
         cache_size: int = 200,
+        mesh_cache_bytes: int = _DEFAULT_MESH_CACHE_BYTES,
+        replay_thresholds: bool = True,
+        use_graph_cache: bool = True,
         progress_fn: Optional[Callable] = None,
     ) -> None:
         self._entries: list[tuple[str, Path]] = list(file_entries)
-        self._cache_size = cache_size
-        self._graph_cache: dict[tuple[str, str], dict[str, Any]] = {}
+        self._graph_cache = LRUCache(cache_size)
+        self._mesh_cache = ParsedMeshCache(mesh_cache_bytes)
+        self._replay_thresholds = replay_thresholds
+        self._references: dict[str, _DecisionReference] = {}
+        self._replayed = 0
+        self._rebuilt = 0
+        self._graph_store: Optional[GraphStore] = (
+            get_graph_store() if use_graph_cache else None
+        )
+        self._digests: dict[tuple[str, int, int], str] = {}
         self._progress_fn = progress_fn
 
     # ── Factory methods ───────────────────────────────────────────────────
@@ -214,6 +267,8 @@ class CorpusEngine:
         *,
         corpus_root: Optional[Path | str] = None,
         cache_size: int = 200,
+        mesh_cache_bytes: int = _DEFAULT_MESH_CACHE_BYTES,
+        use_graph_cache: bool = True,
         progress_fn: Optional[Callable] = None,
     ) -> "CorpusEngine":
         """Build an engine from a local corpus manifest."""
@@ -228,7 +283,13 @@ class CorpusEngine:
             (str(case["relative_path"]), root / str(case["relative_path"]))
             for case in manifest["cases"]
         ]
-        return cls(entries, cache_size=cache_size, progress_fn=progress_fn)
+        return cls(
+            entries,
+            cache_size=cache_size,
+            mesh_cache_bytes=mesh_cache_bytes,
+            use_graph_cache=use_graph_cache,
+            progress_fn=progress_fn,
+        )
 
     @classmethod
     def from_thingi10k_manifest(
@@ -237,6 +298,8 @@ class CorpusEngine:
         cache_root: Path | str = ".local/thingi10k",
         *,
         cache_size: int = 200,
+        mesh_cache_bytes: int = _DEFAULT_MESH_CACHE_BYTES,
+        use_graph_cache: bool = True,
         progress_fn: Optional[Callable] = None,
     ) -> "CorpusEngine":
         """Build an engine from a Thingi10K batch manifest."""
@@ -248,7 +311,13 @@ class CorpusEngine:
             (str(e["file_id"]), batch_cache / f"{e['file_id']}.stl")
             for e in manifest["entries"]
         ]
-        return cls(entries, cache_size=cache_size, progress_fn=progress_fn)
+        return cls(
+            entries,
+            cache_size=cache_size,
+            mesh_cache_bytes=mesh_cache_bytes,
+            use_graph_cache=use_graph_cache,
+            progress_fn=progress_fn,
+        )
 
     # ── Scoring ───────────────────────────────────────────────────────────
 
@@ -263,33 +332,87 @@ class CorpusEngine:
         return self._run_score(config)
 
     def _run_score(self, config: DetectorConfig) -> CorpusScore:
+        return _aggregate_score(self._score_entries(config, progress=True))
+
+    def _score_entries(
+        self,
+        config: DetectorConfig,
+        *,
+        progress: bool = False,
+        indices: Optional[list[int]] = None,
+    ) -> list[FileResult]:
         config_key = json.dumps(asdict(config), sort_keys=True)
-        entries_iter: Any = self._entries
-        if self._progress_fn is not None:
+        entries = (
+            self._entries
+            if indices is None
+            else [self._entries[index] for index in indices]
+        )
+        entries_iter: Any = entries
+        if progress and self._progress_fn is not None:
             entries_iter = self._progress_fn(
-                self._entries, desc="Scoring corpus", total=len(self._entries)
+                entries, desc="Scoring corpus", total=len(entries)
             )
+        return [
+            self._score_file(file_id, stl_path, config, config_key)
+            for file_id, stl_path in entries_iter
+        ]
 
-        results: list[FileResult] = []
-        for file_id, stl_path in entries_iter:
-            results.append(self._score_file(file_id, stl_path, config, config_key))
-
-        ok = [r for r in results if r.status == "ok"]
-        preview_ready = [r for r in ok if r.preview_ready]
-        bucket_counts: dict[str, int] = {}
-        for r in ok:
-            bucket_counts[r.bucket] = bucket_counts.get(r.bucket, 0) + 1
-        mean_conf = sum(r.top_confidence for r in ok) / len(ok) if ok else 0.0
-
-        return CorpusScore(
-            n_files=len(results),
-            n_ok=len(ok),
-            preview_ready_count=len(preview_ready),
-            preview_ready_ratio=len(preview_ready) / len(ok) if ok else 0.0,
-            bucket_counts=bucket_counts,
-            mean_top_confidence=mean_conf,
-            scored_at_utc=datetime.now(timezone.utc).isoformat(),
-        )
+    def _iter_parallel_scores(
+        self, configs: list[DetectorConfig], workers: int
+    ) -> Generator[list[FileResult], None, None]:
+        """Score every config on a process pool, yielding results in config order.
+
+        Entry ``i`` always goes to worker ``i % workers``, and each worker runs
+        its own engine over that shard, so a worker's mesh and graph caches stay
+        warm for the same files across every config. Per-file results for a
+        config are merged back into entry order as shards finish, and a config
+        is yielded as soon as it and every earlier config are complete.
+        """
+        n_shards = min(workers, len(self._entries))
+        if n_shards == 0:
+            for _ in configs:
+                yield []
+            return
+        pools = [
+            ProcessPoolExecutor(
+                max_workers=1,
+                initializer=_init_trial_worker,
+                initargs=(
+                    self._entries[shard::n_shards],
+                    self._graph_cache.capacity,
+                    self._mesh_cache.capacity,
+                    self._replay_thresholds,
+                    self._graph_store is not None,
+                ),
+            )
+            for shard in range(n_shards)
+        ]
+        futures: dict[Future[list[FileResult]], tuple[int, int]] = {}
+        try:
+            futures = {
+                pool.submit(_score_trial_shard, config): (index, shard)
+                for index, config in enumerate(configs)
+                for shard, pool in enumerate(pools)
+            }
+            merged: list[list[Optional[FileResult]]] = [
+                [None] * len(self._entries) for _ in configs
+            ]
+            remaining = [n_shards] * len(configs)
+            next_index = 0
+            for future in as_completed(futures):
+                index, shard = futures[future]
+                merged[index][shard::n_shards] = future.result()
+                remaining[index] -= 1
+                while next_index < len(configs) and remaining[next_index] == 0:
+                    yield [r for r in merged[next_index] if r is not None]
+                    merged[next_index] = []
+                    next_index += 1
+        finally:
+            # shutdown(cancel_futures=True) needs Python 3.9.
+            for future in futures:
+                future.cancel()
+            for pool in pools:
+                pool.shutdown(wait=True)
 
     def _score_file(
         self,
@@ -302,21 +425,17 @@ class CorpusEngine:
             return FileResult(file_id=file_id, status="missing")
 
         cache_key = (file_id, config_key)
-        if cache_key in self._graph_cache:
-            graph = self._graph_cache[cache_key]
-        else:
+        graph = self._graph_cache.get(cache_key)
+        if graph is None:
             try:
-                graph = build_feature_graph_for_stl(stl_path, config=config)
+                graph = self._replayed_graph(file_id, stl_path, config)
+                if graph is None:
+                    graph = self._build_graph(file_id, stl_path, config)
             except Exception as exc:
                 return FileResult(file_id=file_id, status="error", error=str(exc))
-            if self._cache_size > 0:
-                if len(self._graph_cache) >= self._cache_size:
-                    # Evict oldest entry (insertion-ordered dict in Python 3.7+)
-                    oldest = next(iter(self._graph_cache))
-                    del self._graph_cache[oldest]
-                self._graph_cache[cache_key] = graph
-
-        preview = graph.get("scad_preview") or ""
+            self._graph_cache.put(cache_key, graph)
+
+        preview = emit_feature_graph_scad_preview(graph) or ""
         has_preview = bool(preview and len(preview.strip()) > 20)
         bucket = _classify_graph_bucket(graph)
         return FileResult(
@@ -328,6 +447,69 @@ class CorpusEngine:
             top_confidence=_top_confidence(graph),
         )
 
+    def _replayed_graph(
+        self, file_id: str, stl_path: Path, config: DetectorConfig
+    ) -> Optional[dict[str, Any]]:
+        """Reuse the file's last graph if no recorded decision flips under config."""
+        if not self._replay_thresholds:
+            return None
+        reference = self._references.get(file_id)
+        if reference is None or reference.file_key != _file_key(file_id, stl_path):
+            return None
+        if decisions_flip(reference.decisions, reference.config, config):
+            return None
+        self._replayed += 1
+        return reference.graph
+
+    def _build_graph(
+        self, file_id: str, stl_path: Path, config: DetectorConfig
+    ) -> dict[str, Any]:
+        store_key = None
+        graph = None
+        if self._graph_store is not None:
+            store_key = self._graph_store.key(
+                self._stl_digest(file_id, stl_path), config
+            )
+            graph = self._graph_store.get(store_key)
+        if graph is None:
+            graph = self._mesh_cache.build_graph(
+                stl_path,
+                config,
+                record_decisions=True,
+                record_dispatch=True,
+            )
+            self._rebuilt += 1
+            if self._graph_store is not None and store_key is not None:
+                self._graph_store.put(store_key, graph)
+        graph.pop("dispatch_trace", None)
+        decisions = graph.pop("threshold_decisions", None)
+        if self._replay_thresholds and decisions is not None:
+            self._references[file_id] = _DecisionReference(
+                file_key=_file_key(file_id, stl_path),
+                config=config,
+                graph=graph,
+                decisions=tuple(Decision.from_dict(d) for d in decisions),
+            )
+        return graph
+
+    def _stl_digest(self, file_id: str, stl_path: Path) -> str:
+        key = _file_key(file_id, stl_path)
+        digest = self._digests.get(key)
+        if digest is None:
+            digest = self._digests[key] = stl_digest(stl_path)
+        return digest
+
+    def cache_stats(self) -> dict[str, dict[str, Any]]:
+        """Counters for the in-memory caches, threshold replay and the graph store."""
+        return {
+            "graph": self._graph_cache.stats(),
+            "mesh": self._mesh_cache.stats(),
+            "replay": {"replayed": self._replayed, "rebuilt": self._rebuilt},
+            "store": (
+                self._graph_store.stats() if self._graph_store is not None else {}
+            ),
+        }
+
     # ── Improvement session ───────────────────────────────────────────────
 
     def run_improvement_session(
@@ -340,6 +522,10 @@ class CorpusEngine:
         steps: Optional[tuple[float, ...]] = None,
         min_improvement: float = _MIN_IMPROVEMENT,
         max_representative_failures: int = 10,
+        workers: int = 1,
+        racing: bool = False,
+        race_fractions: tuple[float, ...] = _RACE_FRACTIONS,
+        race_z: float = _RACE_Z,
     ) -> ImprovementSession:
         """Run a bounded improvement loop.
 
@@ -363,13 +549,27 @@ class CorpusEngine:
             Minimum Δpreview_ready_ratio to accept a candidate.
         max_representative_failures:
             Number of still-failing file_ids to include in the review bundle.
+        workers:
+            Worker processes for trial scoring. With more than one, files are
+            pinned to workers so each keeps its own files' meshes cached
+            across trials; the session result is identical to a serial run.
+        racing:
+            Score trials on growing stratified subsets of the corpus (see
+            ``race_fractions``) and drop a trial once the upper confidence
+            bound of its delta falls below both ``min_improvement`` and the
+            best surviving trial's lower bound. Only finalists are scored on
+            the full corpus; dropped trials report their subset estimate in
+            ``all_trial_deltas``. Not combinable with ``workers > 1``.
+        race_fractions:
+            Increasing corpus fractions scored at each racing rung.
+        race_z:
+            z-score of the racing confidence bounds.
         """
+        if racing and workers > 1:
+            raise ValueError("racing does not support workers > 1")
         started = datetime.now(timezone.utc).isoformat()
         if config is None:
             config = DetectorConfig()
-        if baseline_score is None:
-            log.info("Computing baseline score...")
-            baseline_score = self.score(config)
 
         tunable = params or _TUNABLE_PARAMS
         step_sizes = steps or _PERTURBATION_STEPS
@@ -380,41 +580,86 @@ class CorpusEngine:
             for step in step_sizes:
                 candidates_to_try.append((param, step))
 
-        trial_candidates = candidates_to_try[:n_trials]
-        log.info("Running %d trial(s)...", len(trial_candidates))
+        trials: list[tuple[str, float, DetectorConfig]] = []
+        for param, step in candidates_to_try[:n_trials]:
+            perturbed = _perturb_config(config, param, step)
+            if perturbed is not None:
+                trials.append((param, step, perturbed))
+
+        trial_configs = [perturbed for _, _, perturbed in trials]
+        raced_deltas: dict[int, float] = {}
+        files_scored = len(trials) * len(self._entries)
+        scored: Generator[Optional[list[FileResult]], None, None]
+        if racing:
+            base_results = self._score_entries(config, progress=True)
+            if baseline_score is None:
+                baseline_score = _aggregate_score(base_results)
+            finalists, raced_deltas, files_scored = self._race_trials(
+                trial_configs,
+                base_results,
+                min_improvement,
+                race_fractions,
+                race_z,
+            )
+            scored = (finalists.get(index) for index in range(len(trials)))
+        elif workers > 1:
+            if baseline_score is None:
+                trial_configs.insert(0, config)
+            parallel = self._iter_parallel_scores(trial_configs, workers)
+            if baseline_score is None:
+                log.info("Computing baseline score...")
+                baseline_score = _aggregate_score(next(parallel))
+            scored = parallel
+        else:
+            if baseline_score is None:
+                log.info("Computing baseline score...")
+                baseline_score = self.score(config)
+            scored = (
+                self._score_entries(c, progress=True) for c in trial_configs
+            )
+        log.info("Running %d trial(s)...", len(trials))
 
         best_candidate: Optional[CandidateResult] = None
         all_deltas: list[float] = []
         trials_run = 0
 
-        for param, step in trial_candidates:
-            perturbed = _perturb_config(config, param, step)
-            if perturbed is None:
-                continue
-            trials_run += 1
-            trial_score = self._run_score(perturbed)
-            delta = trial_score.preview_ready_ratio - baseline_score.preview_ready_ratio
-            all_deltas.append(delta)
-            log.debug(
-                "Trial %d: %s %+.3f → ratio=%.4f (Δ%+.4f)",
-                trials_run, param, step, trial_score.preview_ready_ratio, delta,
-            )
-            if delta >= min_improvement:
-                if best_candidate is None or delta > best_candidate.delta_preview_ready_ratio:
-                    # Collect representative failures (still not preview-ready)
-                    failures = self._representative_failures(
-                        perturbed, max_representative_failures
-                    )
-                    old_val = getattr(config, param)
-                    new_val = getattr(perturbed, param)
-                    best_candidate = CandidateResult(
-                        config=perturbed,
-                        score=trial_score,
-                        baseline_score=baseline_score,
-                        delta_preview_ready_ratio=delta,
-                        changed_params={param: (float(old_val), float(new_val))},
-                        representative_failures=failures,
+        try:
+            for index, ((param, step, perturbed), results) in enumerate(
+                zip(trials, scored)
+            ):
+                trials_run += 1
+                if results is None:
+                    all_deltas.append(raced_deltas[index])
+                    log.debug(
+                        "Trial %d: %s %+.3f dropped by racing (Δ≈%+.4f)",
+                        trials_run, param, step, raced_deltas[index],
                     )
+                    continue
+                trial_score = _aggregate_score(results)
+                delta = trial_score.preview_ready_ratio - baseline_score.preview_ready_ratio
+                all_deltas.append(delta)
+                log.debug(
+                    "Trial %d: %s %+.3f → ratio=%.4f (Δ%+.4f)",
+                    trials_run, param, step, trial_score.preview_ready_ratio, delta,
+                )
+                if delta >= min_improvement:
+                    if best_candidate is None or delta > best_candidate.delta_preview_ready_ratio:
+                        old_val = getattr(config, param)
+                        new_val = getattr(perturbed, param)
+                        best_candidate = CandidateResult(
+                            config=perturbed,
+                            score=trial_score,
+                            baseline_score=baseline_score,
+                            delta_preview_ready_ratio=delta,
+                            changed_params={param: (float(old_val), float(new_val))},
+                            # Files still not preview-ready under the candidate
+                            representative_failures=_still_failing(
+                                results, max_representative_failures
+                            ),
+                        )
+        finally:
+            # Stops parallel workers even when fewer results were consumed.
+            scored.close()
 
         finished = datetime.now(timezone.utc).isoformat()
         return ImprovementSession(
@@ -424,25 +669,173 @@ class CorpusEngine:
             all_trial_deltas=all_deltas,
             started_at_utc=started,
             finished_at_utc=finished,
+            files_scored=files_scored,
         )
 
-    def _representative_failures(
-        self, config: DetectorConfig, limit: int
-    ) -> list[str]:
-        """Return file_ids that are still not preview-ready under config."""
-        config_key = json.dumps(asdict(config), sort_keys=True)
-        failures: list[str] = []
-        for file_id, stl_path in self._entries:
-            if len(failures) >= limit:
+    def _race_trials(
+        self,
+        configs: list[DetectorConfig],
+        base_results: list[FileResult],
+        min_improvement: float,
+        fractions: tuple[float, ...],
+        z: float,
+    ) -> tuple[dict[int, list[FileResult]], dict[int, float], int]:
+        """Successively score surviving configs on larger stratified subsets.
+
+        Returns full-corpus results for the finalists, the last subset delta
+        estimate for each dropped config, and the number of files scored.
+        """
+        rungs = _racing_subsets(base_results, fractions)
+        total = len(self._entries)
+        results: dict[int, dict[int, FileResult]] = {i: {} for i in range(len(configs))}
+        alive = list(range(len(configs)))
+        estimates: dict[int, float] = {}
+        files_scored = 0
+        for rung, subset in enumerate(rungs):
+            bounds: dict[int, tuple[float, float, float]] = {}
+            for trial in alive:
+                missing = [i for i in subset if i not in results[trial]]
+                scored = self._score_entries(configs[trial], indices=missing)
+                results[trial].update(zip(missing, scored))
+                files_scored += len(missing)
+                bounds[trial] = _paired_delta_bounds(
+                    [results[trial][i] for i in subset],
+                    [base_results[i] for i in subset],
+                    total,
+                    z,
+                )
+            if rung == len(rungs) - 1:
                 break
-            result = self._score_file(file_id, stl_path, config, config_key)
-            if result.status == "ok" and not result.preview_ready:
-                failures.append(file_id)
-        return failures
+            bar = max(min_improvement, max(low for _, _, low in bounds.values()))
+            survivors = [trial for trial in alive if bounds[trial][1] >= bar]
+            for trial in alive:
+                if trial not in survivors:
+                    estimates[trial] = bounds[trial][0]
+            log.debug(
+                "Racing rung %d (%d files): %d of %d trial(s) survive",
+                rung, len(subset), len(survivors), len(alive),
+            )
+            alive = survivors
+        finalists = {
+            trial: [results[trial][i] for i in range(total)] for trial in alive
+        }
+        return finalists, estimates, files_scored
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
+def _aggregate_score(results: list[FileResult]) -> CorpusScore:
+    ok = [r for r in results if r.status == "ok"]
+    preview_ready = [r for r in ok if r.preview_ready]
+    bucket_counts: dict[str, int] = {}
+    for r in ok:
+        bucket_counts[r.bucket] = bucket_counts.get(r.bucket, 0) + 1
+    mean_conf = sum(r.top_confidence for r in ok) / len(ok) if ok else 0.0
+
+    return CorpusScore(
+        n_files=len(results),
+        n_ok=len(ok),
+        preview_ready_count=len(preview_ready),
+        preview_ready_ratio=len(preview_ready) / len(ok) if ok else 0.0,
+        bucket_counts=bucket_counts,
+        mean_top_confidence=mean_conf,
+        scored_at_utc=datetime.now(timezone.utc).isoformat(),
+    )
+
+
+def _racing_subsets(
+    base_results: list[FileResult], fractions: tuple[float, ...]
+) -> list[list[int]]:
+    """Nested, bucket-stratified entry index subsets, ending with the full corpus.
+
+    Strata are the baseline buckets. ``stratified_split`` shuffles each stratum
+    with the same seed regardless of ratio, so a larger fraction extends the
+    smaller one's sample rather than redrawing it.
+    """
+    items = [
+        {
+            "name": f"{index:09d}",
+            "fixture_type": result.bucket if result.status == "ok" else result.status,
+            "index": index,
+        }
+        for index, result in enumerate(base_results)
+    ]
+    subsets: list[list[int]] = []
+    for fraction in sorted(f for f in fractions if 0.0 < f < 1.0):
+        _, sample = stratified_split(items, holdout_ratio=fraction)
+        indices = [item["index"] for item in sample]
+        if indices and (not subsets or len(indices) > len(subsets[-1])):
+            subsets.append(indices)
+    subsets.append(list(range(len(base_results))))
+    return subsets
+
+
+def _paired_delta_bounds(
+    trial_results: list[FileResult],
+    base_results: list[FileResult],
+    population: int,
+    z: float,
+) -> tuple[float, float, float]:
+    """Estimate, upper and lower bound of a trial's preview-ready ratio delta.
+
+    Uses the per-file readiness difference against the baseline, a normal
+    bound with finite-population correction, and one +1/-1 pseudo-pair so a
+    subset with no observed differences still carries some uncertainty.
+    """
+    diffs = [
+        float(t.status == "ok" and t.preview_ready)
+        - float(b.status == "ok" and b.preview_ready)
+        for t, b in zip(trial_results, base_results)
+    ]
+    n_ok = sum(1 for b in base_results if b.status == "ok")
+    scale = len(diffs) / n_ok if n_ok else 1.0
+    mean = float(np.mean(diffs)) * scale if diffs else 0.0
+    if len(diffs) >= population:
+        return mean, mean, mean
+    padded = np.asarray(diffs + [1.0, -1.0]) * scale
+    stderr = float(np.std(padded, ddof=1)) / np.sqrt(len(padded))
+    fpc = np.sqrt((population - len(diffs)) / max(population - 1, 1))
+    half_width = z * stderr * float(fpc)
+    return mean, mean + half_width, mean - half_width
+
+
+def _still_failing(results: list[FileResult], limit: int) -> list[str]:
+    """Return up to ``limit`` file_ids that scored ok but are not preview-ready."""
+    failures = [r.file_id for r in results if r.status == "ok" and not r.preview_ready]
+    return failures[:limit]
+
+
+# Per-process engine for parallel trial evaluation, built once per worker.
+_trial_worker_engine: Optional["CorpusEngine"] = None
+
+
+def _init_trial_worker(
+    entries: list[tuple[str, Path]],
+    cache_size: int,
+    mesh_cache_bytes: int,
+    replay_thresholds: bool,
+    use_graph_cache: bool,
+) -> None:
+    global _trial_worker_engine
+    _trial_worker_engine = CorpusEngine(
+        entries,
+        cache_size=cache_size,
+        mesh_cache_bytes=mesh_cache_bytes,
+        replay_thresholds=replay_thresholds,
+        use_graph_cache=use_graph_cache,
+    )
+
+
+def _score_trial_shard(config: DetectorConfig) -> list[FileResult]:
+    assert _trial_worker_engine is not None
+    return _trial_worker_engine._score_entries(config)
+
+
+def _file_key(file_id: str, stl_path: Path) -> tuple[str, int, int]:
+    stat = stl_path.stat()
+    return (file_id, stat.st_size, stat.st_mtime_ns)
+
+
 def _perturb_config(
     config: DetectorConfig, param: str, step: float
 ) -> Optional[DetectorConfig]:
@@ -64,6 +64,11 @@ class DetectorConfig:
     cbore_depth_floor_ratio: float = 0.10
     cbore_depth_ceiling_ratio: float = 0.95
     cbore_edge_tolerance_ratio: float = 0.08
+    # Radial-histogram precheck: components whose per-height mean radial
+    # distance varies by less than this fraction of the required radius step
+    # are treated as constant-section cutouts and skip the slice fits.
+    cbore_precheck_bins: int = 8
+    cbore_precheck_step_fraction: float = 0.50
 
     # --- Slot thresholds ---
     slot_aspect_ratio_min: float = 1.40
@@ -97,6 +102,11 @@ class DetectorConfig:
     pattern_diameter_rounding_mm: float = 0.01
     pattern_regularity_error_max: float = 0.08
     grid_pattern_min_holes: int = 4
+    # Lattice finder for groups the row/column grid fit cannot describe
+    # (large perforated panels, interleaved grids, mesh noise).
+    lattice_offset_bin_ratio: float = 0.25
+    lattice_basis_candidates: int = 6
+    lattice_max_cosets: int = 8
 
     # --- Revolve (rotate_extrude) thresholds (Phase 1) ---
     revolve_axis_quality_min: float = 0.85
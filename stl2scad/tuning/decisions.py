@@ -0,0 +1,141 @@
+"""Threshold decision recording for replay-based re-scoring.
+
+The detector compares many already-computed scores against thresholds such as
+``box_confidence_min``. While ``recording_decisions()`` is active, each of those
+comparisons is logged with the score, the operator and the outcome. Because the
+detector is deterministic, a file whose recorded outcomes all hold under a new
+config takes exactly the same path, so its earlier graph can be reused without
+re-running any geometry.
+
+Only parameters listed in ``REPLAYABLE_THRESHOLDS`` are recorded. A config that
+changes any other field cannot be replayed.
+"""
+
+from __future__ import annotations
+
+import operator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, fields
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from stl2scad.tuning.config import DetectorConfig
+
+REPLAYABLE_THRESHOLDS: frozenset[str] = frozenset(
+    {
+        "plate_confidence_min",
+        "plate_tolerant_confidence_min",
+        "box_confidence_min",
+        "box_tolerant_confidence_min",
+        "cylinder_confidence_min",
+        "revolve_confidence_min",
+        "linear_extrude_confidence_min",
+        "tolerant_plate_paired_support_min",
+        "tolerant_plate_footprint_fill_ratio",
+        "tolerant_box_footprint_fill_ratio",
+        "hole_angular_coverage_min",
+        "hole_radial_error_max",
+    }
+)
+
+_COMPARISONS: dict[str, Callable[[float, float], bool]] = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+# ``value`` decisions record a threshold that feeds into a computed quantity
+# rather than a comparison; any change to it invalidates the file.
+_VALUE_OP = "value"
+
+_active_log: ContextVar[Optional[list["Decision"]]] = ContextVar(
+    "stl2scad_decision_log", default=None
+)
+
+
+@dataclass(frozen=True)
+class Decision:
+    """One recorded use of a replayable threshold."""
+
+    param: str
+    op: str
+    value: float
+    outcome: bool
+
+    def holds_under(self, config: DetectorConfig) -> bool:
+        """Return True if this decision is unchanged under *config*."""
+        threshold = float(getattr(config, self.param))
+        if self.op == _VALUE_OP:
+            return threshold == self.value
+        return _COMPARISONS[self.op](self.value, threshold) == self.outcome
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Decision":
+        return cls(
+            param=str(data["param"]),
+            op=str(data["op"]),
+            value=float(data["value"]),
+            outcome=bool(data["outcome"]),
+        )
+
+
+def gate(config: DetectorConfig, param: str, op: str, value: Any) -> bool:
+    """Compare *value* against ``config.<param>`` and record the outcome.
+
+    Example: ``gate(config, "box_confidence_min", "<", confidence)`` is
+    ``confidence < config.box_confidence_min``.
+    """
+    score = float(value)
+    outcome = _COMPARISONS[op](score, float(getattr(config, param)))
+    log = _active_log.get()
+    if log is not None:
+        log.append(Decision(param, op, score, outcome))
+    return outcome
+
+
+def threshold_value(config: DetectorConfig, param: str) -> float:
+    """Return ``config.<param>`` for use in arithmetic, recording the use."""
+    threshold = float(getattr(config, param))
+    log = _active_log.get()
+    if log is not None:
+        log.append(Decision(param, _VALUE_OP, threshold, True))
+    return threshold
+
+
+@contextmanager
+def recording_decisions() -> Iterator[list[Decision]]:
+    """Collect every ``gate``/``threshold_value`` call made in this context."""
+    log: list[Decision] = []
+    token = _active_log.set(log)
+    try:
+        yield log
+    finally:
+        _active_log.reset(token)
+
+
+def replayable_change(base: DetectorConfig, candidate: DetectorConfig) -> bool:
+    """Return True if *candidate* differs from *base* only in replayable thresholds."""
+    for field in fields(DetectorConfig):
+        if field.name in REPLAYABLE_THRESHOLDS:
+            continue
+        if getattr(base, field.name) != getattr(candidate, field.name):
+            return False
+    return True
+
+
+def decisions_flip(
+    decisions: Iterable[Decision],
+    base: DetectorConfig,
+    candidate: DetectorConfig,
+) -> bool:
+    """Return True if re-running under *candidate* could change the result.
+
+    *decisions* must have been recorded while building the graph under *base*.
+    """
+    if not replayable_change(base, candidate):
+        return True
+    return not all(decision.holds_under(candidate) for decision in decisions)
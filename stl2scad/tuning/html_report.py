@@ -3,12 +3,12 @@
 from __future__ import annotations
 
 import base64
-import hashlib
 from html import escape
 import json
 from pathlib import Path
 from typing import Any
 
+from stl2scad.core.fingerprint_index import file_sha256
 from stl2scad.tuning.progress import corpus_progress
 
 
@@ -88,57 +88,21 @@ def generate_html_report(
 
 
 def _render_thumbnail_png(stl_path: Path, output_path: Path) -> None:
-    import matplotlib
-
-    matplotlib.use("Agg")
-    import matplotlib.pyplot as plt
-    from mpl_toolkits.mplot3d.art3d import Poly3DCollection
     from stl import mesh as stl_mesh
 
+    from stl2scad.core.raster import render_mesh, write_png
+
     stl = stl_mesh.Mesh.from_file(str(stl_path))
-    vectors = stl.vectors
-    points = vectors.reshape(-1, 3)
-    mins = points.min(axis=0)
-    maxs = points.max(axis=0)
-    center = (mins + maxs) / 2.0
-    radius = max(float((maxs - mins).max()) / 2.0, 1e-6)
-
-    fig = plt.figure(figsize=(2.8, 2.0), dpi=120)
-    ax = fig.add_subplot(111, projection="3d")
-    fig.patch.set_facecolor("#0f172a")
-    ax.set_facecolor("#0f172a")
-
-    collection = Poly3DCollection(
-        vectors,
-        facecolor="#5b8fb9",
-        edgecolor="#dbeafe",
-        linewidths=0.15,
-        alpha=0.95,
+    image = render_mesh(
+        stl.vectors,
+        336,
+        240,
+        color=(91, 143, 185),
+        background=(15, 23, 42),
+        elevation=24,
+        azimuth=-42,
     )
-    ax.add_collection3d(collection)
-    ax.set_xlim(center[0] - radius, center[0] + radius)
-    ax.set_ylim(center[1] - radius, center[1] + radius)
-    ax.set_zlim(center[2] - radius, center[2] + radius)
-    ax.set_box_aspect((1, 1, 1))
-    ax.view_init(elev=24, azim=-42)
-    ax.set_axis_off()
-    ax.set_proj_type("ortho")
-
-    try:
-        ax.dist = 7
-    except Exception:
-        pass
-    fig.subplots_adjust(left=0, right=1, bottom=0, top=1)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    try:
-        fig.savefig(
-            output_path,
-            facecolor=fig.get_facecolor(),
-            bbox_inches="tight",
-            pad_inches=0,
-        )
-    finally:
-        plt.close(fig)
+    write_png(output_path, image)
 
 
 def _png_data_uri(data: bytes) -> str:
@@ -163,7 +127,7 @@ def _report_row(
     sha256 = str(case.get("sha256", ""))
     if bucket != "missing" and not sha256:
         try:
-            sha256 = hashlib.sha256(stl_path.read_bytes()).hexdigest()
+            sha256 = file_sha256(stl_path)
         except Exception:
             sha256 = ""
     thumb = ""
@@ -7,15 +7,29 @@ produce reproducible aggregate reports without committing those files.
 
 from __future__ import annotations
 
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+import contextlib
 from dataclasses import asdict
 from datetime import datetime, timezone
-import hashlib
 import json
+import logging
 from pathlib import Path
 import tempfile
-from typing import Any, Iterable, Optional
-
-from stl2scad.core.feature_graph import build_feature_graph_for_stl, build_triage_report
+from typing import Any, Iterable, Iterator, Optional
+
+from stl2scad.core.feature_graph import _classify_graph_bucket, build_triage_report
+from stl2scad.core.fingerprint_index import (
+    DEFAULT_VERIFY_POLICY,
+    check_verify_policy,
+    file_sha256,
+    verify_sha256,
+)
+from stl2scad.core.graph_store import build_feature_graph_cached, get_graph_store
 from stl2scad.core.feature_graph import emit_feature_graph_scad_preview
 from stl2scad.core.feature_inventory import (
     STL_SUFFIXES,
@@ -23,6 +37,7 @@ from stl2scad.core.feature_inventory import (
     analyze_stl_file,
 )
 from stl2scad.core.verification import verify_existing_conversion
+from stl2scad.core.render_pool import get_render_pool
 from stl2scad.tuning.config import DetectorConfig
 from stl2scad.tuning.scoring import FixtureScore, score_fixture_against_graph
 
@@ -165,77 +180,34 @@ def score_local_corpus(
     detector_config: DetectorConfig = DetectorConfig(),
     triage_top_n: int = 5,
     progress_fn: Any = None,
+    use_graph_cache: bool = True,
+    verify_fingerprints: str = DEFAULT_VERIFY_POLICY,
+    workers: int = 1,
+    per_file_output: Path | str | None = None,
 ) -> dict[str, Any]:
-    """Score a local corpus with triage buckets and optional labels."""
+    """Score a local corpus with triage buckets and optional labels.
+
+    Graphs come from the persistent feature-graph store unless
+    ``use_graph_cache`` is False. ``verify_fingerprints`` is a
+    ``fingerprint_index`` policy: ``full``, ``stat`` or ``off``. Under ``off``
+    files report ``fingerprint_verified: None`` and never count as
+    mismatches.
+
+    With ``workers > 1`` feature graphs are built in that many processes and
+    preview validations run concurrently, bounded by the shared OpenSCAD
+    render pool; the report is the same as the serial one. When
+    ``per_file_output`` is given, each ``per_file`` entry is appended to that
+    NDJSON file as soon as the file is fully scored, in completion order.
+    """
+    check_verify_policy(verify_fingerprints)
     manifest = load_local_corpus_manifest(manifest_path)
+    graph_store = get_graph_store() if use_graph_cache else None
     root = resolve_local_corpus_root(manifest_path, manifest, corpus_root)
-
-    graphs: list[dict[str, Any]] = []
-    per_file: list[dict[str, Any]] = []
-    labeled_scores: list[FixtureScore] = []
-    fingerprint_mismatch_count = 0
-    files_missing = 0
-
     cases = manifest["cases"]
-    case_iterable = cases
-    if progress_fn is not None:
-        case_iterable = progress_fn(
-            cases,
-            desc="Scoring STL files",
-            total=len(cases),
-        )
-
-    for case in case_iterable:
-        rel_path = str(case["relative_path"])
-        stl_path = root / rel_path
-        if not stl_path.exists():
-            files_missing += 1
-            per_file.append(
-                {
-                    "relative_path": rel_path,
-                    "sha256": str(case.get("sha256", "")),
-                    "status": "missing",
-                    "fingerprint_verified": False,
-                }
-            )
-            continue
-
-        fingerprint_verified = _fingerprint_matches_case(case, stl_path)
-        if not fingerprint_verified:
-            fingerprint_mismatch_count += 1
-
-        try:
-            graph = build_feature_graph_for_stl(
-                stl_path,
-                root_dir=root,
-                config=detector_config,
-            )
-        except Exception as exc:
-            graph = {
-                "schema_version": 1,
-                "source_file": rel_path,
-                "status": "error",
-                "error": str(exc),
-                "features": [],
-            }
-        graphs.append(graph)
-
-        entry: dict[str, Any] = {
-            "relative_path": rel_path,
-            "sha256": str(case.get("sha256", "")),
-            "status": graph.get("status", "ok"),
-            "fingerprint_verified": fingerprint_verified,
-        }
-        if graph.get("status") == "error":
-            entry["error"] = str(graph.get("error", ""))
-        labeled_fixture = _fixture_from_case_labels(case)
-        if labeled_fixture is not None and graph.get("status") != "error":
-            fixture_score = score_fixture_against_graph(labeled_fixture, graph)
-            labeled_scores.append(fixture_score)
-            entry["label_score"] = _serialize_fixture_score(fixture_score)
-        per_file.append(entry)
 
+    outcomes: list[Optional[dict[str, Any]]] = [None] * len(cases)
     preview_validation_cache: dict[str, dict[str, Any]] = {}
+    counters_before = graph_store.stats() if graph_store is not None else {}
 
     def _preview_validator(graph: dict[str, Any]) -> bool:
         source_file = str(graph.get("source_file", ""))
@@ -246,6 +218,104 @@ def score_local_corpus(
         preview_validation_cache[source_file] = result
         return bool(result.get("passed", False))
 
+    with contextlib.ExitStack() as stack:
+        sidecar = None
+        if per_file_output is not None:
+            sidecar_path = Path(per_file_output)
+            sidecar_path.parent.mkdir(parents=True, exist_ok=True)
+            sidecar = stack.enter_context(
+                sidecar_path.open("w", encoding="utf-8", newline="\n")
+            )
+        preview_pool = None
+        if workers > 1:
+            preview_pool = stack.enter_context(
+                ThreadPoolExecutor(max_workers=get_render_pool().max_concurrency)
+            )
+        pending_previews: dict[Future, int] = {}
+
+        def _finish(index: int) -> None:
+            # The bucket is the one build_triage_report assigns below, so the
+            # streamed entry matches the final per_file entry.
+            outcome = outcomes[index]
+            assert outcome is not None
+            entry, graph = outcome["entry"], outcome["graph"]
+            if graph is not None:
+                entry["triage_bucket"] = _classify_graph_bucket(
+                    graph, preview_validator=_preview_validator
+                )
+                preview_validation = preview_validation_cache.get(
+                    str(graph.get("source_file", ""))
+                )
+                if preview_validation is not None:
+                    entry["preview_validation"] = preview_validation
+            if sidecar is not None:
+                sidecar.write(json.dumps(entry) + "\n")
+                sidecar.flush()
+
+        def _collect_previews(block: bool) -> None:
+            ready: Iterable[Future] = (
+                as_completed(list(pending_previews))
+                if block
+                else [future for future in pending_previews if future.done()]
+            )
+            for future in ready:
+                index = pending_previews.pop(future)
+                outcome = outcomes[index]
+                assert outcome is not None
+                graph = outcome["graph"]
+                preview_validation_cache.setdefault(
+                    str(graph.get("source_file", "")), future.result()
+                )
+                _finish(index)
+
+        completed: Iterable[tuple[int, dict[str, Any]]] = _iter_scored_cases(
+            cases,
+            root,
+            detector_config=detector_config,
+            use_graph_cache=use_graph_cache,
+            verify_fingerprints=verify_fingerprints,
+            workers=workers,
+        )
+        if progress_fn is not None:
+            completed = progress_fn(
+                completed,
+                desc="Scoring STL files",
+                total=len(cases),
+            )
+
+        for index, outcome in completed:
+            outcomes[index] = outcome
+            graph = outcome["graph"]
+            if (
+                preview_pool is not None
+                and graph is not None
+                and graph.get("status") != "error"
+                and emit_feature_graph_scad_preview(graph) is not None
+            ):
+                future = preview_pool.submit(_validate_preview_geometry, graph, root)
+                pending_previews[future] = index
+            else:
+                _finish(index)
+            _collect_previews(block=False)
+        _collect_previews(block=True)
+
+    graphs: list[dict[str, Any]] = []
+    per_file: list[dict[str, Any]] = []
+    labeled_scores: list[FixtureScore] = []
+    for result in outcomes:
+        assert result is not None
+        per_file.append(result["entry"])
+        if result["graph"] is not None:
+            graphs.append(result["graph"])
+        if result["label_score"] is not None:
+            labeled_scores.append(result["label_score"])
+    files_missing = sum(1 for entry in per_file if entry["status"] == "missing")
+    fingerprint_mismatch_count = sum(
+        1
+        for entry in per_file
+        if entry["status"] != "missing" and entry["fingerprint_verified"] is False
+    )
+
     triage = build_triage_report(
         graphs,
         top_n=triage_top_n,
@@ -253,32 +323,33 @@ def score_local_corpus(
         preview_validator=_preview_validator,
     )
 
-    triage_by_source = {
-        str(entry.get("source_file", "")): entry for entry in triage.get("per_file", [])
-    }
-    for entry in per_file:
-        triage_entry = triage_by_source.get(str(entry.get("relative_path", "")))
-        if triage_entry is not None:
-            entry["triage_bucket"] = triage_entry.get("bucket")
-        preview_validation = preview_validation_cache.get(str(entry.get("relative_path", "")))
-        if preview_validation is not None:
-            entry["preview_validation"] = preview_validation
-
     labeled_summary = _summarize_labeled_scores(labeled_scores)
     preview_ready_ratio = (
         triage["bucket_counts"]["parametric_preview"] / triage["files_processed"]
         if triage["files_processed"]
         else 0.0
     )
+    if graph_store is not None and workers <= 1:
+        # Cache state must not change the report, so counters are only logged.
+        # Pool workers keep their own counters, so only serial runs log them.
+        counters = graph_store.stats()
+        logging.info(
+            f"Feature-graph store {graph_store.root}: "
+            f"{counters['hits'] - counters_before['hits']} hit(s), "
+            f"{counters['misses'] - counters_before['misses']} miss(es), "
+            f"{counters['stores'] - counters_before['stores']} store(s), "
+            f"{counters['evictions'] - counters_before['evictions']} eviction(s)"
+        )
 
     return {
         "schema_version": LOCAL_CORPUS_SCORE_SCHEMA_VERSION,
         "generated_at_utc": datetime.now(timezone.utc).isoformat(),
         "manifest_path": str(Path(manifest_path)),
         "corpus_root": str(root),
-        "files_total": len(manifest["cases"]),
+        "files_total": len(cases),
         "files_present": len(graphs),
         "files_missing": files_missing,
+        "fingerprint_policy": verify_fingerprints,
         "fingerprint_mismatch_count": fingerprint_mismatch_count,
         "preview_ready_ratio": float(preview_ready_ratio),
         "triage": triage,
@@ -287,6 +358,97 @@ def score_local_corpus(
     }
 
 
+def _iter_scored_cases(
+    cases: list[dict[str, Any]],
+    root: Path,
+    *,
+    detector_config: DetectorConfig,
+    use_graph_cache: bool,
+    verify_fingerprints: str,
+    workers: int,
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Yield ``(case index, _score_local_case outcome)`` as cases complete."""
+    job_args = (root, detector_config, use_graph_cache, verify_fingerprints)
+    worker_count = max(1, min(int(workers), len(cases) or 1))
+    if worker_count == 1:
+        for index, case in enumerate(cases):
+            yield index, _score_local_case(case, *job_args)
+        return
+
+    with ProcessPoolExecutor(max_workers=worker_count) as executor:
+        future_to_index = {
+            executor.submit(_score_local_case, case, *job_args): index
+            for index, case in enumerate(cases)
+        }
+        for future in as_completed(future_to_index):
+            yield future_to_index[future], future.result()
+
+
+def _score_local_case(
+    case: dict[str, Any],
+    root: Path,
+    detector_config: DetectorConfig,
+    use_graph_cache: bool,
+    verify_fingerprints: str,
+) -> dict[str, Any]:
+    """Fingerprint, graph and label-score one manifest case.
+
+    Returns the ``per_file`` entry (without triage fields), the graph (None
+    for a missing file) and the label score if the case is labeled. Runs in
+    pool workers, so it only reads its arguments and process-wide stores.
+    """
+    rel_path = str(case["relative_path"])
+    stl_path = root / rel_path
+    outcome: dict[str, Any] = {
+        "graph": None,
+        "label_score": None,
+    }
+    if not stl_path.exists():
+        outcome["entry"] = {
+            "relative_path": rel_path,
+            "sha256": str(case.get("sha256", "")),
+            "status": "missing",
+            "fingerprint_verified": False,
+        }
+        return outcome
+
+    fingerprint_verified = _fingerprint_matches_case(case, stl_path, verify_fingerprints)
+
+    graph_store = get_graph_store() if use_graph_cache else None
+    try:
+        graph = build_feature_graph_cached(
+            stl_path,
+            root_dir=root,
+            config=detector_config,
+            store=graph_store,
+        )
+    except Exception as exc:
+        graph = {
+            "schema_version": 1,
+            "source_file": rel_path,
+            "status": "error",
+            "error": str(exc),
+            "features": [],
+        }
+    outcome["graph"] = graph
+
+    entry: dict[str, Any] = {
+        "relative_path": rel_path,
+        "sha256": str(case.get("sha256", "")),
+        "status": graph.get("status", "ok"),
+        "fingerprint_verified": fingerprint_verified,
+    }
+    if graph.get("status") == "error":
+        entry["error"] = str(graph.get("error", ""))
+    labeled_fixture = _fixture_from_case_labels(case)
+    if labeled_fixture is not None and graph.get("status") != "error":
+        fixture_score = score_fixture_against_graph(labeled_fixture, graph)
+        outcome["label_score"] = fixture_score
+        entry["label_score"] = _serialize_fixture_score(fixture_score)
+    outcome["entry"] = entry
+    return outcome
+
+
 def _validate_preview_geometry(graph: dict[str, Any], corpus_root: Path) -> dict[str, Any]:
     """Render emitted SCAD preview and verify it against the source STL."""
     scad_preview = emit_feature_graph_scad_preview(graph)
@@ -301,6 +463,11 @@ def _validate_preview_geometry(graph: dict[str, Any], corpus_root: Path) -> dict
     if not stl_path.exists():
         return {"attempted": False, "passed": False, "reason": "missing_source_stl"}
 
+    # The preview was emitted from this IR, so it can be integrated and
+    # tessellated directly; OpenSCAD only renders trees it cannot handle.
+    ir_tree = graph.get("ir_tree")
+    ir_root = ir_tree[0].get("root") if ir_tree else None
+
     try:
         with tempfile.TemporaryDirectory(prefix="preview-verify-") as temp_dir:
             temp_scad = Path(temp_dir) / f"{Path(source_file).stem}_preview.scad"
@@ -311,6 +478,8 @@ def _validate_preview_geometry(graph: dict[str, Any], corpus_root: Path) -> dict
                 dict(LOCAL_CORPUS_PREVIEW_TOLERANCE),
                 debug=False,
                 sample_seed=0,
+                metrics_engine="auto",
+                ir_root=ir_root,
             )
     except Exception as exc:
         return {
@@ -397,20 +566,23 @@ def _build_manifest_case(
 
 def _compute_file_fingerprint(path: Path) -> dict[str, Any]:
     return {
-        "sha256": hashlib.sha256(path.read_bytes()).hexdigest(),
+        "sha256": file_sha256(path),
         "size_bytes": int(path.stat().st_size),
     }
 
 
-def _fingerprint_matches_case(case: dict[str, Any], path: Path) -> bool:
-    actual = _compute_file_fingerprint(path)
-    expected_sha = str(case.get("sha256", "")).strip()
+def _fingerprint_matches_case(
+    case: dict[str, Any],
+    path: Path,
+    policy: str = DEFAULT_VERIFY_POLICY,
+) -> Optional[bool]:
+    """Return whether *path* matches the case, or None when *policy* is off."""
+    if policy == "off":
+        return None
     expected_size = int(case.get("size_bytes", -1))
-    if expected_sha and actual["sha256"] != expected_sha:
-        return False
-    if expected_size >= 0 and actual["size_bytes"] != expected_size:
+    if expected_size >= 0 and int(path.stat().st_size) != expected_size:
         return False
-    return True
+    return verify_sha256(path, str(case.get("sha256", "")).strip(), policy)
 
 
 def _fixture_from_case_labels(case: dict[str, Any]) -> dict[str, Any] | None:
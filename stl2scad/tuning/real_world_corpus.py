@@ -2,17 +2,25 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import contextlib
 from dataclasses import dataclass, field
-import hashlib
 import json
 from pathlib import Path
-from typing import Any, Iterable, Optional
+from typing import Any, Iterable, Iterator, Optional
 
 from stl.mesh import Mesh
 
 from stl2scad.core.feature_inventory import _bbox
+from stl2scad.core.fingerprint_index import (
+    DEFAULT_VERIFY_POLICY,
+    check_verify_policy,
+    file_sha256,
+    verify_sha256,
+)
+from stl2scad.core.graph_store import build_feature_graph_cached, get_graph_store
 from stl2scad.tuning.config import DetectorConfig
-from stl2scad.tuning.scoring import FixtureScore, score_fixture
+from stl2scad.tuning.scoring import FixtureScore, score_fixture_against_graph
 
 
 @dataclass(frozen=True)
@@ -21,7 +29,7 @@ class RealWorldCaseScore:
     relative_path: str
     fixture_score: FixtureScore
     preview_emitted: bool
-    fingerprint_verified: bool
+    fingerprint_verified: Optional[bool]
     present: bool = True
 
 
@@ -102,26 +110,40 @@ def list_missing_real_world_corpus_files(
 def compute_stl_fingerprint(stl_path: Path | str) -> dict[str, Any]:
     """Compute sha256 and bounding box for an STL file."""
     path = Path(stl_path)
-    sha256 = hashlib.sha256(path.read_bytes()).hexdigest()
+    return {"sha256": file_sha256(path), "bounds": _stl_bounds(path)}
+
+
+def _stl_bounds(path: Path) -> dict[str, float]:
     mesh = Mesh.from_file(str(path))
-    bbox = _bbox(mesh.vectors.reshape(-1, 3))
-    return {"sha256": sha256, "bounds": bbox}
+    return _bbox(mesh.vectors.reshape(-1, 3))
 
 
-def fingerprint_matches_case(case: dict[str, Any], stl_path: Path | str) -> bool:
-    """Check a case fingerprint against a local STL file when metadata is present."""
+def fingerprint_matches_case(
+    case: dict[str, Any],
+    stl_path: Path | str,
+    policy: str = DEFAULT_VERIFY_POLICY,
+) -> Optional[bool]:
+    """Check a case fingerprint against a local STL file when metadata is present.
+
+    ``policy`` is a ``fingerprint_index`` verification policy. Under ``stat``
+    a matching SHA-256 already pins the bounds, so the mesh is only parsed
+    when the case records bounds without a digest. Under ``off`` nothing is
+    checked and None is returned.
+    """
+    if check_verify_policy(policy) == "off":
+        return None
     expected_fingerprint = case.get("fingerprint") or {}
     expected_sha = str(expected_fingerprint.get("sha256", "")).strip()
     expected_bounds = expected_fingerprint.get("bounds")
     if not expected_sha and not expected_bounds:
         return True
 
-    actual = compute_stl_fingerprint(stl_path)
-    if expected_sha and actual["sha256"] != expected_sha:
+    if expected_sha and not verify_sha256(stl_path, expected_sha, policy):
         return False
-    if expected_bounds:
+    if expected_bounds and (policy == "full" or not expected_sha):
+        actual_bounds = _stl_bounds(Path(stl_path))
         for key, expected_value in expected_bounds.items():
-            if abs(float(actual["bounds"].get(key, 0.0)) - float(expected_value)) > 1e-6:
+            if abs(float(actual_bounds.get(key, 0.0)) - float(expected_value)) > 1e-6:
                 return False
     return True
 
@@ -130,36 +152,61 @@ def score_real_world_corpus(
     config: DetectorConfig,
     manifest_path: Path | str,
     corpus_root: Path | str | None = None,
+    use_graph_cache: bool = True,
+    verify_fingerprints: str = DEFAULT_VERIFY_POLICY,
+    workers: int = 1,
+    per_case_output: Path | str | None = None,
 ) -> RealWorldCorpusScore:
-    """Score a real-world STL corpus against authored expectations."""
+    """Score a real-world STL corpus against authored expectations.
+
+    Graphs come from the persistent feature-graph store unless
+    ``use_graph_cache`` is False. ``verify_fingerprints`` is a
+    ``fingerprint_index`` policy: ``full``, ``stat`` or ``off``.
+
+    With ``workers > 1`` cases are scored in that many processes; the result
+    is the same as the serial one. When ``per_case_output`` is given, each
+    serialized ``per_case`` entry is appended to that NDJSON file as soon as
+    the case is scored, in completion order.
+    """
+    check_verify_policy(verify_fingerprints)
     manifest = load_real_world_corpus_manifest(manifest_path)
     root = resolve_real_world_corpus_root(manifest_path, manifest, corpus_root)
+    cases = manifest["cases"]
+    scored: list[Optional[RealWorldCaseScore]] = [None] * len(cases)
+
+    with contextlib.ExitStack() as stack:
+        sidecar = None
+        if per_case_output is not None:
+            sidecar_path = Path(per_case_output)
+            sidecar_path.parent.mkdir(parents=True, exist_ok=True)
+            sidecar = stack.enter_context(
+                sidecar_path.open("w", encoding="utf-8", newline="\n")
+            )
+        for index, case_score in _iter_real_world_case_scores(
+            cases,
+            root,
+            config=config,
+            use_graph_cache=use_graph_cache,
+            verify_fingerprints=verify_fingerprints,
+            workers=workers,
+        ):
+            scored[index] = case_score
+            if sidecar is not None and case_score is not None:
+                sidecar.write(json.dumps(_serialize_case_score(case_score)) + "\n")
+                sidecar.flush()
+
     case_scores: list[RealWorldCaseScore] = []
     family_hits: dict[str, int] = {}
     family_totals: dict[str, int] = {}
     missing_count = 0
-
-    for case in manifest["cases"]:
-        stl_path = root / str(case["relative_path"])
-        if not stl_path.exists():
+    for case_score in scored:
+        if case_score is None:
             missing_count += 1
             continue
+        case_scores.append(case_score)
 
-        fixture_score = score_fixture(config, case, stl_path)
-        detail_expected = fixture_score.detail.get("expected", {})
-        detail_actual = fixture_score.detail.get("actual", {})
-        preview_emitted = bool(_is_preview_ready(case, detail_expected, detail_actual))
-        fingerprint_verified = fingerprint_matches_case(case, stl_path)
-        case_scores.append(
-            RealWorldCaseScore(
-                name=str(case["name"]),
-                relative_path=str(case["relative_path"]),
-                fixture_score=fixture_score,
-                preview_emitted=preview_emitted,
-                fingerprint_verified=fingerprint_verified,
-            )
-        )
-
+        detail_expected = case_score.fixture_score.detail.get("expected", {})
+        detail_actual = case_score.fixture_score.detail.get("actual", {})
         for family, expected_count in detail_expected.items():
             if int(expected_count) <= 0:
                 continue
@@ -194,6 +241,59 @@ def score_real_world_corpus(
     )
 
 
+def _iter_real_world_case_scores(
+    cases: list[dict[str, Any]],
+    root: Path,
+    *,
+    config: DetectorConfig,
+    use_graph_cache: bool,
+    verify_fingerprints: str,
+    workers: int,
+) -> Iterator[tuple[int, Optional[RealWorldCaseScore]]]:
+    """Yield ``(case index, score or None if missing)`` as cases complete."""
+    job_args = (root, config, use_graph_cache, verify_fingerprints)
+    worker_count = max(1, min(int(workers), len(cases) or 1))
+    if worker_count == 1:
+        for index, case in enumerate(cases):
+            yield index, _score_real_world_case(case, *job_args)
+        return
+
+    with ProcessPoolExecutor(max_workers=worker_count) as executor:
+        future_to_index = {
+            executor.submit(_score_real_world_case, case, *job_args): index
+            for index, case in enumerate(cases)
+        }
+        for future in as_completed(future_to_index):
+            yield future_to_index[future], future.result()
+
+
+def _score_real_world_case(
+    case: dict[str, Any],
+    root: Path,
+    config: DetectorConfig,
+    use_graph_cache: bool,
+    verify_fingerprints: str,
+) -> Optional[RealWorldCaseScore]:
+    stl_path = root / str(case["relative_path"])
+    if not stl_path.exists():
+        return None
+
+    graph_store = get_graph_store() if use_graph_cache else None
+    graph = build_feature_graph_cached(stl_path, config=config, store=graph_store)
+    fixture_score = score_fixture_against_graph(case, graph)
+    detail_expected = fixture_score.detail.get("expected", {})
+    detail_actual = fixture_score.detail.get("actual", {})
+    return RealWorldCaseScore(
+        name=str(case["name"]),
+        relative_path=str(case["relative_path"]),
+        fixture_score=fixture_score,
+        preview_emitted=bool(_is_preview_ready(case, detail_expected, detail_actual)),
+        fingerprint_verified=fingerprint_matches_case(
+            case, stl_path, verify_fingerprints
+        ),
+    )
+
+
 def serialize_real_world_corpus_score(score: RealWorldCorpusScore) -> dict[str, Any]:
     """Convert a corpus score to JSON-serializable form."""
     return {
@@ -205,18 +305,19 @@ def serialize_real_world_corpus_score(score: RealWorldCorpusScore) -> dict[str,
         "mean_score": score.mean_score,
         "preview_ready_ratio": score.preview_ready_ratio,
         "feature_family_recall": score.feature_family_recall,
-        "per_case": [
-            {
-                "name": case.name,
-                "relative_path": case.relative_path,
-                "count_score": case.fixture_score.count_score,
-                "dimension_score": case.fixture_score.dimension_score,
-                "total": case.fixture_score.total,
-                "preview_emitted": case.preview_emitted,
-                "fingerprint_verified": case.fingerprint_verified,
-            }
-            for case in score.per_case
-        ],
+        "per_case": [_serialize_case_score(case) for case in score.per_case],
+    }
+
+
+def _serialize_case_score(case: RealWorldCaseScore) -> dict[str, Any]:
+    return {
+        "name": case.name,
+        "relative_path": case.relative_path,
+        "count_score": case.fixture_score.count_score,
+        "dimension_score": case.fixture_score.dimension_score,
+        "total": case.fixture_score.total,
+        "preview_emitted": case.preview_emitted,
+        "fingerprint_verified": case.fingerprint_verified,
     }
 
 
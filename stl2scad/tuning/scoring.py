@@ -5,13 +5,14 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from math import dist
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Optional
 
 from stl2scad.core.feature_fixtures import (
     iter_expected_feature_counts,
     summarize_detected_feature_counts,
 )
 from stl2scad.core.feature_graph import build_feature_graph_for_stl
+from stl2scad.core.mesh_cache import ParsedMeshCache
 from stl2scad.tuning.config import DetectorConfig
 
 # Same tolerances the fixture tests use; keep in sync.
@@ -45,12 +46,24 @@ class ManifestScore:
         return {k: sum(v) / len(v) for k, v in totals.items() if v}
 
 
+class FixtureMeshCache(ParsedMeshCache):
+    """Parsed and welded fixture meshes kept warm across tuning trials.
+
+    Entries are keyed by path, size and mtime, so a re-rendered fixture is
+    parsed again. The fixture library is small and is never evicted.
+    """
+
+
 def score_fixture(
     config: DetectorConfig,
     fixture: dict[str, Any],
     stl_path: Path,
+    mesh_cache: Optional[FixtureMeshCache] = None,
 ) -> FixtureScore:
-    graph = build_feature_graph_for_stl(stl_path, config=config)
+    if mesh_cache is not None:
+        graph = mesh_cache.build_graph(stl_path, config)
+    else:
+        graph = build_feature_graph_for_stl(stl_path, config=config)
     return score_fixture_against_graph(fixture, graph)
 
 
@@ -153,12 +166,13 @@ def score_manifest(
     config: DetectorConfig,
     fixtures: Iterable[dict[str, Any]],
     stl_dir: Path,
+    mesh_cache: Optional[FixtureMeshCache] = None,
 ) -> ManifestScore:
     scores: list[FixtureScore] = []
     for fixture in fixtures:
         stl_path = Path(stl_dir) / f"{Path(fixture['output_filename']).stem}.stl"
         if not stl_path.exists():
             raise FileNotFoundError(f"Missing rendered STL for {fixture['name']}: {stl_path}")
-        scores.append(score_fixture(config, fixture, stl_path))
+        scores.append(score_fixture(config, fixture, stl_path, mesh_cache))
     mean = sum(s.total for s in scores) / len(scores) if scores else 0.0
     return ManifestScore(mean=float(mean), per_fixture=scores)
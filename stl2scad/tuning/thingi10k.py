@@ -10,21 +10,41 @@ STL byte downloads use requests (already a core dependency).
 
 from __future__ import annotations
 
+import contextlib
 import csv
 import hashlib
 import json
+import logging
+import os
 import random
-import shutil
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import asdict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Iterable, Optional
+from typing import Any, BinaryIO, Callable, Iterable, Optional
+
+from stl2scad.core.fingerprint_index import (
+    DEFAULT_VERIFY_POLICY,
+    check_verify_policy,
+    record_sha256,
+    verify_sha256,
+)
 
 # ── Dataset constants ─────────────────────────────────────────────────────────
 THINGI10K_HF_REPO = "Thingi10K/Thingi10K"
 THINGI10K_HF_METADATA = "metadata/input_summary.csv"
 THINGI10K_STL_PREFIX = "raw_meshes/"
 THINGI10K_BATCH_SCHEMA_VERSION = 1
+THINGI10K_JOURNAL_FILE = ".materialize_journal.ndjson"
+THINGI10K_TRACE_SCHEMA_VERSION = 1
+
+# Maps an entry's hf_path to a readable binary stream of the STL bytes.
+Thingi10KFetch = Callable[[str], BinaryIO]
+
+_PARTIAL_SUFFIX = ".partial"
+_COPY_CHUNK_BYTES = 1 << 20
 
 # Licenses safe for public reproducibility (from planning/feature_level_reconstruction.md).
 ALLOWED_LICENSES: frozenset[str] = frozenset(
@@ -216,14 +236,94 @@ def materialize_thingi10k_batch(
     hf_token: Optional[str] = None,
     progress_fn: Optional[Callable] = None,
     force: bool = False,
+    verify_fingerprints: str = DEFAULT_VERIFY_POLICY,
+    workers: int = 8,
+    fetch: Optional[Thingi10KFetch] = None,
 ) -> dict[str, Any]:
     """Download STLs from HuggingFace into a local cache directory.
 
     Updates manifest entries in-place with sha256 and file_size_bytes once
     files are successfully downloaded.  Returns a result summary dict.
+    Cached files are checked against the recorded sha256 under the
+    ``verify_fingerprints`` policy (``full``, ``stat`` or ``off``).
+
+    Up to ``workers`` entries are fetched at once. Each download is hashed
+    while it is copied to a temporary file, checked against the recorded
+    sha256 when there is one, and renamed into place, so the cache never
+    holds a partial STL. Installed files are appended to a resume journal in
+    the cache directory; a rerun after an interruption fills in sha256 and
+    file_size_bytes for files a previous run installed but never wrote back
+    to the manifest. ``per_entry`` and the manifest updates follow manifest
+    order regardless of completion order.
+
+    ``fetch`` maps an entry's ``hf_path`` to a readable binary stream and
+    defaults to ``hf_hub_download`` from the manifest's ``hf_repo``.
 
     The local cache layout is: ``{cache_root}/{batch_id}/{file_id}.stl``
     """
+    check_verify_policy(verify_fingerprints)
+    cache_dir = resolve_thingi10k_cache(manifest, cache_root)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    if fetch is None:
+        fetch = _hf_fetcher(manifest, cache_dir, hf_token)
+    for stale in cache_dir.glob(f"*{_PARTIAL_SUFFIX}"):
+        stale.unlink(missing_ok=True)
+    journal = _MaterializeJournal(cache_dir / THINGI10K_JOURNAL_FILE)
+
+    entries = manifest.get("entries", [])
+    results: list[Optional[dict[str, Any]]] = [None] * len(entries)
+    with ThreadPoolExecutor(max_workers=max(1, int(workers))) as executor:
+        future_to_index = {
+            executor.submit(
+                _materialize_entry,
+                entry,
+                cache_dir,
+                fetch,
+                journal,
+                force,
+                verify_fingerprints,
+            ): index
+            for index, entry in enumerate(entries)
+        }
+        completed: Iterable[Any] = as_completed(future_to_index)
+        if progress_fn is not None:
+            completed = progress_fn(completed, desc="Downloading STLs", total=len(entries))
+        for future in completed:
+            results[future_to_index[future]] = future.result()
+
+    per_entry: list[dict[str, Any]] = []
+    manifest_updated = False
+    for entry, result in zip(entries, results):
+        assert result is not None
+        learned = result.pop("learned", None)
+        if learned is not None:
+            # Update manifest entry in-place so caller can persist updated manifest
+            manifest_updated = manifest_updated or (
+                entry.get("sha256") != learned["sha256"]
+                or entry.get("file_size_bytes") != learned["size"]
+            )
+            entry["sha256"] = learned["sha256"]
+            entry["file_size_bytes"] = learned["size"]
+        per_entry.append(result)
+
+    return {
+        "batch_id": manifest.get("batch_id"),
+        "cache_dir": str(cache_dir),
+        "total": len(entries),
+        "downloaded": sum(1 for r in per_entry if r["status"] == "downloaded"),
+        "skipped": sum(1 for r in per_entry if r["status"] == "cached"),
+        "failed": sum(1 for r in per_entry if r["status"] == "failed"),
+        "manifest_updated": manifest_updated,
+        "per_entry": per_entry,
+    }
+
+
+def _hf_fetcher(
+    manifest: dict[str, Any],
+    cache_dir: Path,
+    hf_token: Optional[str],
+) -> Thingi10KFetch:
+    """Return a fetch function backed by ``hf_hub_download``."""
     try:
         from huggingface_hub import hf_hub_download
     except ImportError:
@@ -232,79 +332,122 @@ def materialize_thingi10k_batch(
         )
 
     hf_repo = str(manifest.get("hf_repo", THINGI10K_HF_REPO))
-    hf_revision = str(manifest.get("hf_repo_revision", "main"))
-    cache_dir = resolve_thingi10k_cache(manifest, cache_root)
-    cache_dir.mkdir(parents=True, exist_ok=True)
+    dl_kwargs: dict[str, Any] = {
+        "repo_type": "dataset",
+        "revision": str(manifest.get("hf_repo_revision", "main")),
+        # hf_hub_download caches in a HF-managed layout under local_dir; we copy
+        # files into a flat per-batch layout so scripts can predict exact paths.
+        "local_dir": str(cache_dir / ".hf_cache"),
+    }
+    if hf_token:
+        dl_kwargs["token"] = hf_token
 
-    # hf_hub_download caches in a HF-managed layout under local_dir; we copy
-    # files into a flat per-batch layout so scripts can predict exact paths.
-    hf_local_dir = cache_dir / ".hf_cache"
-    hf_local_dir.mkdir(parents=True, exist_ok=True)
+    def fetch(hf_path: str) -> BinaryIO:
+        return open(hf_hub_download(hf_repo, hf_path, **dl_kwargs), "rb")
 
-    entries = manifest.get("entries", [])
-    iterable: Any = entries
-    if progress_fn is not None:
-        iterable = progress_fn(entries, desc="Downloading STLs", total=len(entries))
+    return fetch
 
-    downloaded = 0
-    skipped = 0
-    failed = 0
-    per_entry: list[dict[str, Any]] = []
 
-    for entry in iterable:
-        file_id = str(entry["file_id"])
-        hf_path = str(entry["hf_path"])
-        local_path = cache_dir / f"{file_id}.stl"
-
-        if local_path.exists() and not force:
-            recorded_sha = str(entry.get("sha256", "")).strip()
-            if recorded_sha:
-                actual_sha = _sha256_file(local_path)
-                if actual_sha == recorded_sha:
-                    skipped += 1
-                    per_entry.append({"file_id": file_id, "status": "cached"})
-                    continue
-                # sha mismatch — re-download
-            else:
-                skipped += 1
-                per_entry.append({"file_id": file_id, "status": "cached"})
-                continue
+def _materialize_entry(
+    entry: dict[str, Any],
+    cache_dir: Path,
+    fetch: Thingi10KFetch,
+    journal: "_MaterializeJournal",
+    force: bool,
+    verify_fingerprints: str,
+) -> dict[str, Any]:
+    """Verify or fetch one entry; ``learned`` carries sha256/size for the manifest."""
+    file_id = str(entry["file_id"])
+    local_path = cache_dir / f"{file_id}.stl"
+    recorded_sha = str(entry.get("sha256", "")).strip()
+
+    if local_path.exists() and not force:
+        journaled = journal.get(file_id)
+        if journaled is not None and journaled["size"] != local_path.stat().st_size:
+            journaled = None
+        expected_sha = recorded_sha or (journaled["sha256"] if journaled else "")
+        if verify_sha256(local_path, expected_sha, verify_fingerprints):
+            result: dict[str, Any] = {"file_id": file_id, "status": "cached"}
+            if not recorded_sha and journaled is not None:
+                result["learned"] = journaled
+            return result
+        # sha mismatch — re-download
 
-        try:
-            dl_kwargs: dict[str, Any] = {
-                "repo_type": "dataset",
-                "revision": hf_revision,
-                "local_dir": str(hf_local_dir),
-            }
-            if hf_token:
-                dl_kwargs["token"] = hf_token
+    try:
+        sha, size = _fetch_verified(fetch, str(entry["hf_path"]), local_path, recorded_sha)
+    except Exception as exc:
+        return {"file_id": file_id, "status": "failed", "error": str(exc)}
+    journal.append(file_id, sha, size)
+    return {
+        "file_id": file_id,
+        "status": "downloaded",
+        "sha256": sha,
+        "size": size,
+        "learned": {"sha256": sha, "size": size},
+    }
 
-            dl_path = Path(hf_hub_download(hf_repo, hf_path, **dl_kwargs))
-            if dl_path.resolve() != local_path.resolve():
-                shutil.copy2(dl_path, local_path)
 
-            sha = _sha256_file(local_path)
-            size = local_path.stat().st_size
-            # Update manifest entry in-place so caller can persist updated manifest
-            entry["sha256"] = sha
-            entry["file_size_bytes"] = size
-            downloaded += 1
-            per_entry.append(
-                {"file_id": file_id, "status": "downloaded", "sha256": sha, "size": size}
+def _fetch_verified(
+    fetch: Thingi10KFetch,
+    hf_path: str,
+    local_path: Path,
+    expected_sha: str,
+) -> tuple[str, int]:
+    """Stream *hf_path* into *local_path*, hashing on the way; return (sha, size)."""
+    partial = local_path.with_name(
+        f"{local_path.name}.{uuid.uuid4().hex[:8]}{_PARTIAL_SUFFIX}"
+    )
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with contextlib.closing(fetch(hf_path)) as source, partial.open("wb") as sink:
+            for chunk in iter(lambda: source.read(_COPY_CHUNK_BYTES), b""):
+                digest.update(chunk)
+                sink.write(chunk)
+                size += len(chunk)
+            sink.flush()
+            os.fsync(sink.fileno())
+        sha = digest.hexdigest()
+        if expected_sha and sha != expected_sha:
+            raise ValueError(
+                f"sha256 mismatch for {hf_path}: expected {expected_sha}, got {sha}"
             )
-        except Exception as exc:
-            failed += 1
-            per_entry.append({"file_id": file_id, "status": "failed", "error": str(exc)})
-
-    return {
-        "batch_id": manifest.get("batch_id"),
-        "cache_dir": str(cache_dir),
-        "total": len(entries),
-        "downloaded": downloaded,
-        "skipped": skipped,
-        "failed": failed,
-        "per_entry": per_entry,
-    }
+        os.replace(partial, local_path)
+    finally:
+        partial.unlink(missing_ok=True)
+    record_sha256(local_path, sha)
+    return sha, size
+
+
+class _MaterializeJournal:
+    """Append-only NDJSON log of installed files, read back on the next run."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._records: dict[str, dict[str, Any]] = {}
+        if path.exists():
+            for line in path.read_text(encoding="utf-8").splitlines():
+                try:
+                    record = json.loads(line)
+                    self._records[str(record["file_id"])] = {
+                        "sha256": str(record["sha256"]),
+                        "size": int(record["size"]),
+                    }
+                except (ValueError, KeyError, TypeError):
+                    continue  # torn final line from an interrupted run
+
+    def get(self, file_id: str) -> Optional[dict[str, Any]]:
+        with self._lock:
+            record = self._records.get(file_id)
+        return dict(record) if record is not None else None
+
+    def append(self, file_id: str, sha256: str, size: int) -> None:
+        line = json.dumps({"file_id": file_id, "sha256": sha256, "size": size})
+        with self._lock:
+            self._records[file_id] = {"sha256": sha256, "size": size}
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write(line + "\n")
 
 
 # ── Scoring ───────────────────────────────────────────────────────────────────
@@ -315,25 +458,59 @@ def score_thingi10k_batch(
     *,
     config: Any = None,
     progress_fn: Optional[Callable] = None,
+    use_graph_cache: bool = True,
+    trace_path: Optional[Path | str] = None,
+    incremental: bool = False,
 ) -> dict[str, Any]:
     """Run the feature-graph detector on every cached STL and aggregate results.
 
-    Returns a score dict that can be committed as a baseline artifact.
+    Returns a score dict that can be committed as a baseline artifact. Graphs
+    come from the persistent feature-graph store unless ``use_graph_cache``
+    is False.
+
+    With ``trace_path`` each scored file's SHA-256, dispatch trace (the
+    detector stages that ran and the feature types each produced), per-file
+    result and triage entry are written there. With ``incremental`` a previous
+    trace at that path is used as the baseline: a file is only re-scored when
+    its STL bytes changed or the code fingerprint of a detector stage in its
+    trace changed, and the recorded results of every other file are carried
+    over. A changed config or change to the shared dispatch and scoring code
+    re-scores everything. The score equals a full re-run apart from
+    timestamps.
     """
-    from stl2scad.core.feature_graph import build_feature_graph_for_stl, build_triage_report, emit_feature_graph_scad_preview
+    from stl2scad.core.dispatch_trace import detector_fingerprints
+    from stl2scad.core.feature_graph import summarize_triage_entries
+    from stl2scad.core.fingerprint_index import file_sha256
+    from stl2scad.core.graph_store import config_digest, get_graph_store
     from stl2scad.tuning.config import DetectorConfig
 
     if config is None:
         config = DetectorConfig()
+    if incremental and trace_path is None:
+        raise ValueError("Incremental scoring requires a trace_path")
 
     cache_dir = resolve_thingi10k_cache(manifest, cache_root)
+    graph_store = get_graph_store() if use_graph_cache else None
+    header = {
+        "schema_version": THINGI10K_TRACE_SCHEMA_VERSION,
+        "config_digest": config_digest(config),
+        "code_fingerprint": _scoring_code_fingerprint(),
+        "detector_fingerprints": detector_fingerprints(),
+    }
+    baseline = (
+        _load_score_trace(Path(trace_path), header)
+        if incremental and trace_path is not None
+        else {}
+    )
     entries = manifest.get("entries", [])
     iterable: Any = entries
     if progress_fn is not None:
         iterable = progress_fn(entries, desc="Scoring STLs", total=len(entries))
 
     per_file_results: list[dict[str, Any]] = []
-    graphs: list[dict[str, Any]] = []
+    triage_entries: list[dict[str, Any]] = []
+    records: dict[str, dict[str, Any]] = {}
+    reused = 0
 
     for entry in iterable:
         file_id = str(entry["file_id"])
@@ -342,26 +519,30 @@ def score_thingi10k_batch(
             per_file_results.append({"file_id": file_id, "status": "missing"})
             continue
         try:
-            graph = build_feature_graph_for_stl(local_path, config=config)
-            preview = emit_feature_graph_scad_preview(graph) or ""
-            has_preview = bool(preview and len(preview.strip()) > 20)
-            bucket = _classify_graph_bucket(graph)
-            per_file_results.append(
-                {
-                    "file_id": file_id,
-                    "status": "ok",
-                    "bucket": bucket,
-                    "preview_ready": has_preview,
-                    "feature_count": len(graph.get("features", [])),
-                    "top_confidence": _top_confidence(graph),
-                }
-            )
-            graphs.append(graph)
+            sha256 = file_sha256(local_path) if trace_path is not None else ""
+            record = baseline.get(file_id)
+            if record is not None and _trace_record_current(record, sha256, header):
+                record["triage"]["source_file"] = str(local_path)
+                reused += 1
+            else:
+                record = _score_thingi10k_file(local_path, config, graph_store)
+                record["sha256"] = sha256
+            result = {"file_id": file_id, **record["result"]}
+            per_file_results.append(result)
+            triage_entries.append(record["triage"])
+            records[file_id] = record
         except Exception as exc:
             per_file_results.append(
                 {"file_id": file_id, "status": "error", "error": str(exc)}
             )
 
+    if trace_path is not None:
+        _write_score_trace(Path(trace_path), header, records)
+        logging.info(
+            f"Thingi10K scoring reused {reused} and re-scored "
+            f"{len(records) - reused} file(s)"
+        )
+
     ok_results = [r for r in per_file_results if r["status"] == "ok"]
     preview_ready = [r for r in ok_results if r.get("preview_ready")]
     bucket_counts: dict[str, int] = {}
@@ -369,7 +550,7 @@ def score_thingi10k_batch(
         b = str(r.get("bucket", "unknown"))
         bucket_counts[b] = bucket_counts.get(b, 0) + 1
 
-    triage = build_triage_report(graphs) if graphs else {}
+    triage = summarize_triage_entries(triage_entries) if triage_entries else {}
 
     return {
         "schema_version": 1,
@@ -386,6 +567,110 @@ def score_thingi10k_batch(
     }
 
 
+def _score_thingi10k_file(
+    local_path: Path,
+    config: Any,
+    graph_store: Any,
+) -> dict[str, Any]:
+    """Score one STL into a trace record (everything but its sha256)."""
+    from stl2scad.core.dispatch_trace import traced_detector_names
+    from stl2scad.core.feature_graph import build_triage_entry, emit_feature_graph_scad_preview
+    from stl2scad.core.graph_store import build_feature_graph_cached
+
+    graph = build_feature_graph_cached(
+        local_path, config=config, store=graph_store, record_dispatch=True
+    )
+    dispatch_trace = graph.pop("dispatch_trace", [])
+    preview = emit_feature_graph_scad_preview(graph) or ""
+    has_preview = bool(preview and len(preview.strip()) > 20)
+    return {
+        "detectors": traced_detector_names(dispatch_trace),
+        "dispatch_trace": dispatch_trace,
+        "result": {
+            "status": "ok",
+            "bucket": _classify_graph_bucket(graph),
+            "preview_ready": has_preview,
+            "feature_count": len(graph.get("features", [])),
+            "top_confidence": _top_confidence(graph),
+        },
+        "triage": build_triage_entry(graph),
+    }
+
+
+def _scoring_code_fingerprint() -> str:
+    """Fingerprint the dispatch and scoring code shared by every file."""
+    from stl2scad.core.dispatch_trace import code_fingerprint
+    from stl2scad.core.feature_graph import (
+        build_feature_graph_for_mesh_arrays,
+        build_feature_graph_for_stl,
+        summarize_triage_entries,
+    )
+
+    return code_fingerprint(
+        [
+            build_feature_graph_for_stl,
+            build_feature_graph_for_mesh_arrays,
+            summarize_triage_entries,
+            _score_thingi10k_file,
+        ]
+    )
+
+
+def _trace_record_current(
+    record: dict[str, Any],
+    sha256: str,
+    header: dict[str, Any],
+) -> bool:
+    """Return True if *record* still describes the file with digest *sha256*."""
+    if not sha256 or record.get("sha256") != sha256:
+        return False
+    current = header["detector_fingerprints"]
+    recorded = record.get("detector_fingerprints", {})
+    return all(
+        name in current and recorded.get(name) == current[name]
+        for name in record.get("detectors", [])
+    )
+
+
+def _load_score_trace(path: Path, header: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """Return reusable per-file records from a previous trace, keyed by file_id."""
+    try:
+        trace = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if any(
+        trace.get(key) != header[key]
+        for key in ("schema_version", "config_digest", "code_fingerprint")
+    ):
+        return {}
+    fingerprints = trace.get("detector_fingerprints", {})
+    records = trace.get("files", {})
+    for record in records.values():
+        record["detector_fingerprints"] = {
+            name: fingerprints.get(name) for name in record.get("detectors", [])
+        }
+    return records
+
+
+def _write_score_trace(
+    path: Path,
+    header: dict[str, Any],
+    records: dict[str, dict[str, Any]],
+) -> None:
+    """Atomically write the header and per-file records to *path*."""
+    files = {
+        file_id: {
+            key: record[key]
+            for key in ("sha256", "detectors", "dispatch_trace", "result", "triage")
+        }
+        for file_id, record in records.items()
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}{_PARTIAL_SUFFIX}")
+    temp_path.write_text(json.dumps({**header, "files": files}), encoding="utf-8")
+    os.replace(temp_path, path)
+
+
 def compare_thingi10k_score_to_baseline(
     score: dict[str, Any],
     baseline: dict[str, Any],
@@ -417,14 +702,6 @@ def compare_thingi10k_score_to_baseline(
 
 # ── Internal helpers ──────────────────────────────────────────────────────────
 
-def _sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(65536), b""):
-            h.update(chunk)
-    return h.hexdigest()
-
-
 def _classify_graph_bucket(graph: dict[str, Any]) -> str:
     """Map a feature graph to a triage bucket name."""
     from stl2scad.core.feature_graph import emit_feature_graph_scad_preview
@@ -16,6 +16,12 @@ os.environ.setdefault("TEMP", str(_REPO_LOCAL_TEMP))
 os.environ.setdefault("TMP", str(_REPO_LOCAL_TEMP))
 os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", str(_REPO_LOCAL_TEMP))
 os.environ.setdefault("STL2SCAD_TEMP_DIR", str(_REPO_LOCAL_TEMP))
+# Keep OpenSCAD renders out of the user's persistent render cache.
+os.environ.setdefault("STL2SCAD_RENDER_CACHE_DIR", "")
+# Likewise keep test graphs out of the persistent feature-graph store.
+os.environ.setdefault("STL2SCAD_GRAPH_CACHE_DIR", "")
+# ...and test files out of the persistent fingerprint index.
+os.environ.setdefault("STL2SCAD_FINGERPRINT_INDEX", "")
 tempfile.tempdir = str(_REPO_LOCAL_TEMP)
 
 
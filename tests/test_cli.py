@@ -44,6 +44,71 @@ def test_verify_parser_rejects_negative_sample_seed():
         assert exc.code == 2
 
 
+def test_verify_and_batch_parsers_accept_sample_count():
+    """Sampling-based metric sample count should be configurable and positive."""
+    parser = cli.build_parser()
+    args = parser.parse_args(["verify", "in.stl", "--samples", "200000"])
+    assert args.samples == 200000
+    args = parser.parse_args(["batch", "in", "out", "--samples", "50000"])
+    assert args.samples == 50000
+    try:
+        parser.parse_args(["verify", "in.stl", "--samples", "0"])
+        assert False, "Expected argparse to reject a zero sample count"
+    except SystemExit as exc:
+        assert exc.code == 2
+
+
+def test_verify_parser_accepts_metrics_engine():
+    """verify should default to OpenSCAD metrics and accept analytic/auto."""
+    parser = cli.build_parser()
+    assert parser.parse_args(["verify", "in.stl"]).metrics_engine == "openscad"
+    args = parser.parse_args(["verify", "in.stl", "--metrics-engine", "analytic"])
+    assert args.metrics_engine == "analytic"
+    try:
+        parser.parse_args(["verify", "in.stl", "--metrics-engine", "cgal"])
+        assert False, "Expected argparse to reject an unknown metrics engine"
+    except SystemExit as exc:
+        assert exc.code == 2
+
+
+def test_verify_and_batch_parsers_accept_visual_renderer():
+    """verify and batch should default to OpenSCAD images and accept software."""
+    parser = cli.build_parser()
+    assert parser.parse_args(["verify", "in.stl"]).visual_renderer == "openscad"
+    args = parser.parse_args(["batch", "in", "out", "--visual-renderer", "software"])
+    assert args.visual_renderer == "software"
+
+
+def test_verify_parser_builds_adaptive_sampling_and_metric_tolerances():
+    """Adaptive sampling flags should map to AdaptiveSamplingConfig and tolerances."""
+    parser = cli.build_parser()
+    args = parser.parse_args(
+        [
+            "verify",
+            "in.stl",
+            "--samples",
+            "500",
+            "--adaptive-sampling",
+            "--max-samples",
+            "20000",
+            "--hausdorff-tol",
+            "0.5",
+            "--normal-tol",
+            "3",
+        ]
+    )
+    config = cli._adaptive_sampling_from_args(args)
+    assert config.initial_samples == 500
+    assert config.max_samples == 20000
+    tolerance = cli._tolerance_from_args(args)
+    assert tolerance["hausdorff_distance"] == 0.5
+    assert tolerance["normal_deviation"] == 3.0
+
+    args = parser.parse_args(["batch", "in", "out"])
+    assert cli._adaptive_sampling_from_args(args) is None
+    assert "hausdorff_distance" not in cli._tolerance_from_args(args)
+
+
 def test_verify_parser_html_flag():
     """Verify command should parse html-report and visualize flags independently."""
     parser = cli.build_parser()
@@ -187,10 +252,11 @@ def test_verify_command_execution(mock_stl2scad, mock_verify, test_output_dir):
     assert args[0] == "dummy.stl"
     assert args[2]["volume"] == 1.5
     assert kwargs["sample_seed"] is None
+    assert kwargs["num_samples"] == 1000
 
 
-@patch("stl2scad.cli.verify_conversion")
-@patch("stl2scad.cli.stl2scad")
+@patch("stl2scad.core.verification.verification.verify_conversion")
+@patch("stl2scad.core.verification.verification.stl2scad")
 def test_batch_command_execution(
     mock_stl2scad, mock_verify, test_data_dir, test_output_dir
 ):
@@ -206,6 +272,22 @@ def test_batch_command_execution(
     # Should have executed for at least the sample stl in data dir
     assert mock_stl2scad.call_count > 0
     assert mock_verify.call_count > 0
+    assert mock_stl2scad.call_args.kwargs["recognition_backend"] == "native"
+    summary = json.loads(
+        (test_output_dir / "verification_summary.json").read_text(encoding="utf-8")
+    )
+    assert summary["completed"] == summary["total"] == mock_stl2scad.call_count
+    nested = [key for key in summary["results"] if Path(key).parent != Path(".")]
+    for key in nested:
+        report = Path(summary["results"][key]["report"])
+        assert report.parent == test_output_dir / Path(key).parent
+
+
+def test_batch_parser_accepts_workers():
+    """batch should stay serial by default and accept 0 for auto."""
+    parser = cli.build_parser()
+    assert parser.parse_args(["batch", "in", "out"]).workers == 1
+    assert parser.parse_args(["batch", "in", "out", "--workers", "0"]).workers == 0
 
 
 @patch("stl2scad.cli.analyze_stl_folder")
@@ -244,6 +326,7 @@ def test_feature_inventory_command_execution(mock_analyze, test_output_dir):
     assert kwargs["config"].max_files == 4
     assert kwargs["config"].workers == 2
     assert kwargs["config"].recursive is True
+    assert kwargs["config"].symmetry_sample_size is None
 
 
 @patch("stl2scad.cli.build_feature_graph_for_folder")
@@ -331,6 +414,7 @@ def test_feature_graph_directory_command_inventory_prefilter_execution(
     assert kwargs["selection_config"].allowed_families == ()
     assert callable(kwargs["inventory_progress_callback"])
     assert callable(kwargs["graph_progress_callback"])
+    assert kwargs["fused"] is False
 
 
 @patch("stl2scad.cli.build_feature_graphs_from_inventory")
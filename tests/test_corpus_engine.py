@@ -0,0 +1,141 @@
+"""Tests for the in-memory corpus improvement engine."""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+
+from stl2scad.core import mesh_cache as mesh_cache_module
+from stl2scad.core.benchmark_fixtures import ensure_benchmark_fixtures
+from stl2scad.core.feature_graph import build_feature_graph_for_stl
+from stl2scad.corpus.engine import CorpusEngine
+from stl2scad.tuning.config import DetectorConfig
+
+
+def _fixture_entries(test_data_dir):
+    fixtures_dir = test_data_dir / "benchmark_fixtures"
+    ensure_benchmark_fixtures(fixtures_dir)
+    names = ["primitive_box_axis_aligned", "primitive_cylinder_axis_aligned"]
+    return [(name, fixtures_dir / f"{name}.stl") for name in names]
+
+
+def test_trials_reuse_parsed_meshes_and_match_direct_graphs(test_data_dir, monkeypatch):
+    entries = _fixture_entries(test_data_dir)
+    loads = []
+    real_load = mesh_cache_module.load_mesh_arrays
+
+    def counting_load(path):
+        loads.append(path)
+        return real_load(path)
+
+    monkeypatch.setattr(mesh_cache_module, "load_mesh_arrays", counting_load)
+    engine = CorpusEngine(entries, replay_thresholds=False)
+    perturbed = dataclasses.replace(
+        DetectorConfig(), box_confidence_min=DetectorConfig().box_confidence_min + 0.05
+    )
+
+    engine.score()
+    engine.score(perturbed)
+
+    assert len(loads) == len(entries)
+    stats = engine.cache_stats()
+    assert stats["mesh"]["hits"] == len(entries)
+    assert stats["mesh"]["size"] > 0
+    config_key = json.dumps(dataclasses.asdict(perturbed), sort_keys=True)
+    for file_id, path in entries:
+        direct = build_feature_graph_for_stl(path, config=perturbed)
+        cached = engine._graph_cache.get((file_id, config_key))
+        assert cached["features"] == direct["features"]
+        assert cached.get("scad_preview") == direct.get("scad_preview")
+
+
+def test_threshold_only_trials_replay_unflipped_files(test_data_dir):
+    entries = _fixture_entries(test_data_dir)
+    engine = CorpusEngine(entries)
+    base = DetectorConfig()
+    engine.score(base)
+
+    for step in (-0.05, 0.05):
+        trial = dataclasses.replace(
+            base, hole_angular_coverage_min=base.hole_angular_coverage_min + step
+        )
+        replayed = engine.score(trial)
+        rebuilt = CorpusEngine(entries, replay_thresholds=False).score(trial)
+        assert dataclasses.replace(replayed, scored_at_utc="") == dataclasses.replace(
+            rebuilt, scored_at_utc=""
+        )
+
+    assert engine.cache_stats()["replay"] == {
+        "replayed": 2 * len(entries),
+        "rebuilt": len(entries),
+    }
+
+
+def test_flipped_threshold_rebuilds_the_graph(test_data_dir):
+    entries = _fixture_entries(test_data_dir)[:1]
+    engine = CorpusEngine(entries)
+    engine.score()
+
+    # The axis-aligned box scores 1.0 against box_confidence_min.
+    engine.score(dataclasses.replace(DetectorConfig(), box_confidence_min=1.01))
+
+    assert engine.cache_stats()["replay"] == {"replayed": 0, "rebuilt": 2}
+
+
+def test_parallel_improvement_session_matches_serial(test_data_dir):
+    fixtures_dir = test_data_dir / "benchmark_fixtures"
+    ensure_benchmark_fixtures(fixtures_dir)
+    entries = [
+        (path.stem, path)
+        for path in sorted(fixtures_dir.glob("*.stl"))
+        if path.stem not in {"composite_subtraction_shell", "primitive_sphere"}
+    ]
+    kwargs = dict(
+        n_trials=8,
+        params=("box_confidence_min", "plate_confidence_min"),
+        steps=(-0.5, -0.1, 0.1, 0.5),
+        min_improvement=-1.0,
+    )
+
+    serial = CorpusEngine(entries).run_improvement_session(**kwargs)
+    parallel = CorpusEngine(entries).run_improvement_session(workers=3, **kwargs)
+
+    def scrub(score):
+        return dataclasses.replace(score, scored_at_utc="")
+
+    assert parallel.trials_run == serial.trials_run == 8
+    assert parallel.all_trial_deltas == serial.all_trial_deltas
+    assert scrub(parallel.baseline_score) == scrub(serial.baseline_score)
+    assert parallel.best_candidate is not None and serial.best_candidate is not None
+    assert parallel.best_candidate.config == serial.best_candidate.config
+    assert scrub(parallel.best_candidate.score) == scrub(serial.best_candidate.score)
+    assert (
+        parallel.best_candidate.representative_failures
+        == serial.best_candidate.representative_failures
+    )
+
+
+def test_racing_drops_losing_trials_and_keeps_the_serial_winner(test_data_dir):
+    fixtures_dir = test_data_dir / "benchmark_fixtures"
+    ensure_benchmark_fixtures(fixtures_dir)
+    names = [
+        "primitive_box_axis_aligned",
+        "primitive_cylinder_rotated",
+        "primitive_cone",
+        "composite_overlapping_dual_box",
+    ]
+    entries = [
+        (f"{name}_{copy}", fixtures_dir / f"{name}.stl")
+        for copy in range(8)
+        for name in names
+    ]
+    kwargs = dict(params=("revolve_confidence_min",), steps=(-0.3, 0.3))
+
+    serial = CorpusEngine(entries).run_improvement_session(**kwargs)
+    raced = CorpusEngine(entries).run_improvement_session(racing=True, **kwargs)
+
+    assert serial.all_trial_deltas[1] < 0  # raising the bar loses a revolve fixture
+    assert raced.all_trial_deltas[0] == serial.all_trial_deltas[0]
+    assert raced.all_trial_deltas[1] < 0
+    assert raced.best_candidate is None and serial.best_candidate is None
+    assert raced.files_scored < serial.files_scored == 2 * len(entries)
@@ -53,3 +53,21 @@ def test_config_override_preserves_others():
     # All other defaults should still be the production defaults.
     assert config.boundary_tolerance_ratio == 0.01
     assert config.plate_confidence_min == 0.55
+
+
+def test_recorded_decisions_flip_only_when_a_threshold_crosses_its_score():
+    from stl2scad.tuning.decisions import decisions_flip, gate, recording_decisions
+
+    base = DetectorConfig()
+    with recording_decisions() as decisions:
+        assert gate(base, "box_confidence_min", ">=", 0.75)
+    assert gate(base, "box_confidence_min", ">=", 0.75)  # not recorded
+    assert len(decisions) == 1
+
+    nudged = dataclasses.replace(base, box_confidence_min=0.72)
+    crossed = dataclasses.replace(base, box_confidence_min=0.80)
+    structural = dataclasses.replace(base, revolve_slice_count=16)
+
+    assert not decisions_flip(decisions, base, nudged)
+    assert decisions_flip(decisions, base, crossed)
+    assert decisions_flip(decisions, base, structural)
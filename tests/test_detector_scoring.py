@@ -134,3 +134,25 @@ def test_score_fixture_penalizes_generic_future_feature_counts():
     assert score.count_score < 1.0
     assert score.detail["expected"]["boss"] == 1
     assert score.detail["actual"].get("boss", 0) == 0
+
+
+def test_fixture_mesh_cache_reuses_parsed_mesh_across_configs(test_data_dir):
+    import dataclasses
+
+    from stl2scad.core.benchmark_fixtures import ensure_benchmark_fixtures
+    from stl2scad.core.feature_graph import build_feature_graph_for_stl
+    from stl2scad.tuning.scoring import FixtureMeshCache
+
+    fixtures_dir = test_data_dir / "benchmark_fixtures"
+    ensure_benchmark_fixtures(fixtures_dir)
+    stl_path = fixtures_dir / "primitive_box_axis_aligned.stl"
+    cache = FixtureMeshCache()
+    strict = dataclasses.replace(DetectorConfig(), box_confidence_min=0.99)
+
+    for config in (DetectorConfig(), strict, DetectorConfig()):
+        cached = cache.build_graph(stl_path, config)
+        assert cached["features"] == build_feature_graph_for_stl(
+            stl_path, config=config
+        )["features"]
+
+    assert (cache.misses, cache.hits) == (1, 2)
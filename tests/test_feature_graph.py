@@ -15,8 +15,14 @@ from stl2scad.core.feature_graph import (
     build_feature_graph_for_stl,
     build_triage_report,
     emit_feature_graph_scad_preview,
+    _convex_hull_2d,
     _estimate_edge_treatment,
+    _extract_repeated_hole_patterns,
+    _min_area_rect_2d,
+    _radial_profile_has_step,
+    _try_counterbore_fit,
 )
+from stl2scad.tuning.config import DetectorConfig
 
 
 def test_feature_graph_extracts_box_like_solid(test_data_dir):
@@ -153,6 +159,58 @@ def test_feature_graph_extracts_grid_through_holes(test_output_dir):
     assert abs(patterns[0]["grid_col_spacing"] - 6.0) < 1e-5
 
 
+def _synthetic_holes(centers_xy, diameter=1.0):
+    return [
+        {
+            "type": "hole_like_cutout",
+            "confidence": 0.9,
+            "axis": "z",
+            "center": [float(x), float(y), 1.0],
+            "diameter": diameter,
+        }
+        for x, y in centers_xy
+    ]
+
+
+def test_repeated_hole_patterns_split_interleaved_grids_into_lattices():
+    primary = [(i * 4.0, j * 4.0) for i in range(10) for j in range(6)]
+    staggered = [(i * 4.0 + 2.0, j * 4.0 + 2.0) for i in range(9) for j in range(5)]
+
+    patterns = _extract_repeated_hole_patterns(
+        _synthetic_holes(primary + staggered), config=DetectorConfig()
+    )
+
+    assert len(patterns) == 2
+    assert all(pattern["type"] == "grid_hole_pattern" for pattern in patterns)
+    assert all(pattern["detected_via"] == "lattice" for pattern in patterns)
+    shapes = sorted((p["grid_rows"], p["grid_cols"], p["hole_count"]) for p in patterns)
+    assert shapes == [(5, 9, 45), (6, 10, 60)]
+    for pattern in patterns:
+        assert pattern["grid_col_step"] == pytest.approx([4.0, 0.0, 0.0], abs=1e-6)
+        assert pattern["grid_row_step"] == pytest.approx([0.0, 4.0, 0.0], abs=1e-6)
+
+
+def test_repeated_hole_patterns_recover_large_noisy_lattice():
+    rng = np.random.default_rng(7)
+    centers = np.asarray(
+        [(i * 3.0, j * 3.0) for i in range(60) for j in range(40)], dtype=np.float64
+    )
+    centers += rng.normal(0.0, 0.02, size=centers.shape)
+
+    patterns = _extract_repeated_hole_patterns(
+        _synthetic_holes(centers), config=DetectorConfig()
+    )
+
+    assert len(patterns) == 1
+    grid = patterns[0]
+    assert grid["type"] == "grid_hole_pattern"
+    assert grid["hole_count"] == 2400
+    assert (grid["grid_rows"], grid["grid_cols"]) == (40, 60)
+    assert grid["grid_col_spacing"] == pytest.approx(3.0, abs=0.01)
+    assert grid["grid_row_spacing"] == pytest.approx(3.0, abs=0.01)
+    assert grid["regularity_error"] <= DetectorConfig().pattern_regularity_error_max
+
+
 def test_feature_graph_extracts_slot_cutout(test_output_dir):
     stl_file = test_output_dir / "plate_with_slot.stl"
     _create_plate_with_slot(stl_file)
@@ -629,6 +687,45 @@ def test_feature_graph_extracts_counterbore_hole(test_output_dir):
     assert cbore["source_parent_type"] == "plate_like_solid"
 
 
+def _ring_points(radius, heights, segments=32):
+    theta = np.linspace(0.0, 2.0 * np.pi, segments, endpoint=False)
+    rings = [
+        np.column_stack(
+            (radius * np.cos(theta), radius * np.sin(theta), np.full(segments, z))
+        )
+        for z in heights
+    ]
+    return np.vstack(rings)
+
+
+def test_counterbore_precheck_rejects_constant_section_hole():
+    config = DetectorConfig()
+    plain = _ring_points(2.0, (0.0, 6.0))
+    assert not _radial_profile_has_step(
+        plain[:, :2], plain[:, 2], 0.0, 6.0, config
+    )
+    assert (
+        _try_counterbore_fit(plain, 2, [0, 1], 6.0, 0.0, 6.0, config=config) is None
+    )
+
+
+def test_counterbore_precheck_accepts_stepped_hole():
+    config = DetectorConfig()
+    stepped = np.vstack(
+        (
+            _ring_points(2.0, (0.0, 3.0)),
+            _ring_points(4.0, (3.0, 6.0)),
+        )
+    )
+    assert _radial_profile_has_step(
+        stepped[:, :2], stepped[:, 2], 0.0, 6.0, config
+    )
+    cbore = _try_counterbore_fit(stepped, 2, [0, 1], 6.0, 0.0, 6.0, config=config)
+    assert cbore is not None
+    assert cbore["bore_radius"] == pytest.approx(4.0, rel=1e-3)
+    assert cbore["through_radius"] == pytest.approx(2.0, rel=1e-3)
+
+
 def test_feature_graph_scad_preview_emits_counterbore_cutout(test_output_dir):
     stl_file = test_output_dir / "plate_with_counterbore_preview.stl"
     _create_plate_with_counterbore(stl_file)
@@ -2001,6 +2098,39 @@ def test_rotated_plate_detected_as_plate_like_solid(test_output_dir):
     assert plate.get("detected_via") == "rotated_plate"
 
 
+def test_convex_hull_prefilter_keeps_every_hull_vertex():
+    rng = np.random.default_rng(3)
+    angles = np.linspace(0.0, 2.0 * np.pi, 40, endpoint=False)
+    ring = np.column_stack((10.0 * np.cos(angles), 4.0 * np.sin(angles)))
+    points = np.vstack((rng.uniform(-5.0, 5.0, size=(5000, 2)) * [1.0, 0.3], ring))
+
+    hull = _convex_hull_2d(points)
+
+    assert len(hull) == 40
+    assert {tuple(p) for p in hull} == {tuple(p) for p in ring}
+
+
+def test_min_area_rect_matches_brute_force_edge_search():
+    rng = np.random.default_rng(11)
+    theta = np.radians(23.0)
+    rotation = np.array(
+        [[np.cos(theta), -np.sin(theta)], [np.sin(theta), np.cos(theta)]]
+    )
+    points = (rng.uniform(-1.0, 1.0, size=(3000, 2)) * [12.0, 5.0]) @ rotation.T
+
+    best_u, best_v = _min_area_rect_2d(points)
+
+    hull = _convex_hull_2d(points)
+    areas = []
+    for index in range(len(hull)):
+        edge = hull[(index + 1) % len(hull)] - hull[index]
+        u = edge / np.linalg.norm(edge)
+        v = np.array([-u[1], u[0]])
+        areas.append(np.ptp(hull @ u) * np.ptp(hull @ v))
+    assert np.ptp(hull @ best_u) * np.ptp(hull @ best_v) == pytest.approx(min(areas))
+    assert float(best_u @ best_v) == pytest.approx(0.0, abs=1e-12)
+
+
 def test_rotated_plate_not_detected_as_box(test_output_dir):
     """A rotated plate must not be falsely classified as box_like_solid."""
     stl_file = test_output_dir / "rotated_plate_x30_no_box.stl"
@@ -4,6 +4,8 @@ Tests for feature-level STL inventory.
 
 import json
 
+import pytest
+
 from stl2scad import cli
 from stl2scad.core.benchmark_fixtures import ensure_benchmark_fixtures
 from stl2scad.core.feature_inventory import (
@@ -41,6 +43,38 @@ def test_analyze_stl_file_detects_box_feature_signals(test_data_dir):
     assert "mirror_symmetry" in feature_types
 
 
+def test_analyze_stl_file_sampled_symmetry_reports_confidence_bound(test_data_dir):
+    fixtures_dir = test_data_dir / "benchmark_fixtures"
+    ensure_benchmark_fixtures(fixtures_dir)
+    stl_file = fixtures_dir / "perf" / "perf_sphere_high.stl"
+
+    full = analyze_stl_file(stl_file)
+    sampled = analyze_stl_file(
+        stl_file, config=InventoryConfig(symmetry_sample_size=500)
+    )
+
+    assert "symmetry_sampling" not in full
+    sampling = sampled["symmetry_sampling"]
+    assert sampling["sampled_points"] == 500
+    assert sampling["total_points"] == full["unique_vertices"]
+    assert sampling["confidence_level"] == 0.95
+    assert 0.0 < sampling["confidence_bound"] < 0.1
+    for axis, score in full["symmetry"].items():
+        assert abs(sampled["symmetry"][axis] - score) <= sampling["confidence_bound"]
+
+
+def test_analyze_stl_file_rejects_non_positive_symmetry_sample_size(test_data_dir):
+    fixtures_dir = test_data_dir / "benchmark_fixtures"
+    ensure_benchmark_fixtures(fixtures_dir)
+    stl_file = fixtures_dir / "primitive_box_axis_aligned.stl"
+
+    for sample_size in (0, -5):
+        with pytest.raises(ValueError, match="sample_size"):
+            analyze_stl_file(
+                stl_file, config=InventoryConfig(symmetry_sample_size=sample_size)
+            )
+
+
 def test_analyze_stl_folder_writes_inventory_report(test_data_dir, test_output_dir):
     fixtures_dir = test_data_dir / "benchmark_fixtures"
     ensure_benchmark_fixtures(fixtures_dir)
@@ -156,6 +190,48 @@ def test_analyze_stl_folder_for_feature_graphs_prefilters_mechanical_candidates(
     assert graph_events[-1][0] == 1
 
 
+def test_fused_feature_graph_pipeline_matches_two_pass_reports(
+    test_data_dir, test_output_dir
+):
+    fixtures_dir = test_data_dir / "benchmark_fixtures"
+    ensure_benchmark_fixtures(fixtures_dir)
+
+    input_dir = test_output_dir / "fused_input"
+    input_dir.mkdir()
+    for fixture_name in (
+        "primitive_box_axis_aligned.stl",
+        "primitive_sphere.stl",
+        "composite_union_l_shape.stl",
+    ):
+        source = fixtures_dir / fixture_name
+        (input_dir / fixture_name).write_bytes(source.read_bytes())
+
+    reports = {}
+    for fused in (False, True):
+        inventory_json = test_output_dir / f"fused_{fused}_inventory.json"
+        report = analyze_stl_folder_for_feature_graphs(
+            input_dir=input_dir,
+            output_json=test_output_dir / f"fused_{fused}_graphs.json",
+            inventory_config=InventoryConfig(recursive=False, workers=2),
+            graph_workers=2,
+            inventory_output_json=inventory_json,
+            fused=fused,
+        )
+        inventory = json.loads(inventory_json.read_text(encoding="utf-8"))
+        reports[fused] = (report, inventory)
+
+    two_pass, two_pass_inventory = reports[False]
+    fused_report, fused_inventory = reports[True]
+    assert fused_inventory["files"] == two_pass_inventory["files"]
+    assert fused_inventory["summary"] == two_pass_inventory["summary"]
+    assert fused_report["selection"] == two_pass["selection"]
+    assert fused_report["summary"] == two_pass["summary"]
+    assert fused_report["inventory_summary"] == two_pass["inventory_summary"]
+    for graph in fused_report["graphs"] + two_pass["graphs"]:
+        graph.pop("generated_at_utc", None)
+    assert fused_report["graphs"] == two_pass["graphs"]
+
+
 def test_build_feature_graphs_from_inventory_supports_score_based_selection(
     test_data_dir, test_output_dir
 ):
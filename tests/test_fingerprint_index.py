@@ -0,0 +1,125 @@
+"""Tests for the stat-keyed SHA-256 fingerprint index."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+
+import pytest
+
+from stl2scad.core.benchmark_fixtures import ensure_benchmark_fixtures
+from stl2scad.core import fingerprint_index
+from stl2scad.core.fingerprint_index import (
+    FingerprintIndex,
+    file_sha256,
+    verify_sha256,
+)
+from stl2scad.tuning.local_corpus import (
+    create_local_corpus_manifest,
+    score_local_corpus,
+)
+
+
+def _count_reads(monkeypatch):
+    reads = []
+    original = fingerprint_index.sha256_file
+
+    def _counting(path):
+        reads.append(path)
+        return original(path)
+
+    monkeypatch.setattr(fingerprint_index, "sha256_file", _counting)
+    return reads
+
+
+def test_unchanged_file_is_not_reread(tmp_path, monkeypatch):
+    path = tmp_path / "part.stl"
+    path.write_bytes(b"solid a\nendsolid a\n")
+    index = FingerprintIndex(tmp_path / "fingerprints.sqlite3")
+    reads = _count_reads(monkeypatch)
+    expected = hashlib.sha256(path.read_bytes()).hexdigest()
+
+    assert file_sha256(path, index=index) == expected
+    assert file_sha256(path, index=index) == expected
+    assert len(reads) == 1
+    assert index.stats()["hits"] == 1
+
+    # A rewrite changes size and mtime, so the stale digest is not trusted.
+    path.write_bytes(b"solid b\nendsolid b\n  ")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert (
+        file_sha256(path, index=index) == hashlib.sha256(path.read_bytes()).hexdigest()
+    )
+    assert len(reads) == 2
+
+
+def test_verify_policies(tmp_path, monkeypatch):
+    path = tmp_path / "part.stl"
+    path.write_bytes(b"solid a\nendsolid a\n")
+    index = FingerprintIndex(tmp_path / "fingerprints.sqlite3")
+    digest = file_sha256(path, index=index)
+    reads = _count_reads(monkeypatch)
+
+    assert verify_sha256(path, digest, "stat", index=index)
+    assert verify_sha256(path, digest, "full", index=index)
+    assert not verify_sha256(path, "0" * 64, "stat", index=index)
+    assert verify_sha256(path, "0" * 64, "off", index=index)
+    assert len(reads) == 1
+    with pytest.raises(ValueError):
+        verify_sha256(path, digest, "sometimes")
+
+
+def test_local_corpus_scoring_skips_rehash_under_stat_policy(
+    test_data_dir, tmp_path, monkeypatch
+):
+    monkeypatch.setenv(
+        "STL2SCAD_FINGERPRINT_INDEX", str(tmp_path / "fingerprints.sqlite3")
+    )
+    fixtures_dir = test_data_dir / "benchmark_fixtures"
+    ensure_benchmark_fixtures(fixtures_dir)
+    corpus_dir = tmp_path / "corpus"
+    corpus_dir.mkdir()
+    for name in ("primitive_box_axis_aligned.stl", "primitive_sphere.stl"):
+        shutil.copy2(fixtures_dir / name, corpus_dir)
+    manifest_path = tmp_path / ".local" / "local_corpus.json"
+    create_local_corpus_manifest(corpus_dir, output_path=manifest_path, recursive=False)
+    reads = _count_reads(monkeypatch)
+
+    stat_score = score_local_corpus(manifest_path, use_graph_cache=False)
+    assert stat_score["fingerprint_mismatch_count"] == 0
+    assert reads == []
+
+    full_score = score_local_corpus(
+        manifest_path, use_graph_cache=False, verify_fingerprints="full"
+    )
+    assert full_score["fingerprint_mismatch_count"] == 0
+    assert len(reads) == 2
+
+
+def test_off_policy_reports_files_as_unverified(test_data_dir, tmp_path):
+    fixtures_dir = test_data_dir / "benchmark_fixtures"
+    ensure_benchmark_fixtures(fixtures_dir)
+    corpus_dir = tmp_path / "corpus"
+    corpus_dir.mkdir()
+    shutil.copy2(fixtures_dir / "primitive_box_axis_aligned.stl", corpus_dir)
+    manifest_path = tmp_path / ".local" / "local_corpus.json"
+    create_local_corpus_manifest(corpus_dir, output_path=manifest_path, recursive=False)
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    manifest["cases"][0]["sha256"] = "0" * 64
+    manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+
+    off = score_local_corpus(
+        manifest_path, use_graph_cache=False, verify_fingerprints="off"
+    )
+    full = score_local_corpus(
+        manifest_path, use_graph_cache=False, verify_fingerprints="full"
+    )
+
+    assert off["fingerprint_policy"] == "off"
+    assert off["per_file"][0]["fingerprint_verified"] is None
+    assert off["fingerprint_mismatch_count"] == 0
+    assert full["per_file"][0]["fingerprint_verified"] is False
+    assert full["fingerprint_mismatch_count"] == 1
@@ -0,0 +1,86 @@
+"""Tests for the persistent feature-graph store."""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import shutil
+import zlib
+
+from stl2scad.core import mesh_cache as mesh_cache_module
+from stl2scad.core.benchmark_fixtures import ensure_benchmark_fixtures
+from stl2scad.core.graph_store import GraphStore, build_feature_graph_cached
+from stl2scad.corpus.engine import CorpusEngine
+from stl2scad.tuning.config import DetectorConfig
+
+
+def _box_stl(test_data_dir, tmp_path):
+    fixtures_dir = test_data_dir / "benchmark_fixtures"
+    ensure_benchmark_fixtures(fixtures_dir)
+    path = tmp_path / "parts" / "box.stl"
+    path.parent.mkdir()
+    shutil.copy2(fixtures_dir / "primitive_box_axis_aligned.stl", path)
+    return path
+
+
+def test_cached_graph_is_reused_per_content_and_config(test_data_dir, tmp_path):
+    stl_path = _box_stl(test_data_dir, tmp_path)
+    copy_path = tmp_path / "elsewhere.stl"
+    shutil.copy2(stl_path, copy_path)
+    store = GraphStore(tmp_path / "graphs")
+
+    built = build_feature_graph_cached(stl_path, root_dir=tmp_path, store=store)
+    reused = build_feature_graph_cached(copy_path, store=store)
+    build_feature_graph_cached(
+        stl_path,
+        config=dataclasses.replace(DetectorConfig(), box_confidence_min=0.75),
+        store=store,
+    )
+    with_decisions = build_feature_graph_cached(
+        stl_path, store=store, record_decisions=True
+    )
+
+    assert store.stats()["hits"] == 2 and store.stats()["misses"] == 2
+    assert reused["features"] == built["features"]
+    assert built["source_file"] == "parts/box.stl"
+    assert reused["source_file"] == str(copy_path)
+    assert "threshold_decisions" not in reused
+    assert with_decisions["threshold_decisions"]
+
+
+def test_store_evicts_least_recently_used_entries(tmp_path):
+    graph = {"features": [{"type": "noise", "values": list(range(200))}]}
+    entry_bytes = len(zlib.compress(json.dumps(graph).encode("utf-8"), 6))
+    store = GraphStore(tmp_path / "graphs", max_bytes=2 * entry_bytes)
+    store.put("a", graph)
+    store.put("b", graph)
+    store.get("a")
+
+    store.put("c", graph)
+
+    assert store.get("b") is None
+    assert store.get("a") == graph and store.get("c") == graph
+    assert store.stats()["evictions"] == 1
+
+
+def test_engine_reads_graphs_written_by_an_earlier_session(
+    test_data_dir, tmp_path, monkeypatch
+):
+    stl_path = _box_stl(test_data_dir, tmp_path)
+    monkeypatch.setenv("STL2SCAD_GRAPH_CACHE_DIR", str(tmp_path / "graphs"))
+    entries = [("box", stl_path)]
+
+    first = CorpusEngine(entries).score()
+    monkeypatch.setattr(
+        mesh_cache_module,
+        "build_feature_graph_for_mesh_arrays",
+        lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError("rebuilt")),
+    )
+    second_engine = CorpusEngine(entries)
+    second = second_engine.score()
+
+    assert dataclasses.replace(second, scored_at_utc="") == dataclasses.replace(
+        first, scored_at_utc=""
+    )
+    assert second_engine.cache_stats()["store"]["hits"] == 1
+    assert CorpusEngine(entries, use_graph_cache=False).cache_stats()["store"] == {}
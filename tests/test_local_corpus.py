@@ -193,7 +193,7 @@ def test_score_local_corpus_uses_geometric_preview_validation(
         ],
     }
 
-    def _fake_build_graph(stl_path, root_dir=None, config=None):
+    def _fake_build_graph(stl_path, root_dir=None, config=None, store=None):
         name = Path(stl_path).name
         if name == "primitive_box_axis_aligned.stl":
             return box_graph
@@ -207,7 +207,7 @@ def test_score_local_corpus_uses_geometric_preview_validation(
         }
 
     monkeypatch.setattr(
-        "stl2scad.tuning.local_corpus.build_feature_graph_for_stl",
+        "stl2scad.tuning.local_corpus.build_feature_graph_cached",
         _fake_build_graph,
     )
     monkeypatch.setattr(
@@ -223,3 +223,60 @@ def test_score_local_corpus_uses_geometric_preview_validation(
     assert by_file["primitive_box_axis_aligned.stl"]["triage_bucket"] == "parametric_preview"
     assert by_file["primitive_sphere.stl"]["triage_bucket"] == "feature_graph_no_preview"
     assert by_file["primitive_box_axis_aligned.stl"]["preview_validation"]["attempted"] is True
+
+
+def test_validate_preview_geometry_verifies_ir_without_openscad(
+    test_data_dir,
+    tmp_path,
+    monkeypatch,
+):
+    from stl2scad.core.feature_graph import build_feature_graph_for_stl
+    from stl2scad.tuning.local_corpus import _validate_preview_geometry
+
+    def _fail_render(scad_file):
+        raise AssertionError("OpenSCAD should not be invoked")
+
+    monkeypatch.setattr(
+        "stl2scad.core.verification.verification.calculate_scad_metrics",
+        _fail_render,
+    )
+    corpus_dir = _copy_fixture_corpus(test_data_dir, tmp_path)
+    graph = build_feature_graph_for_stl(
+        corpus_dir / "primitive_box_axis_aligned.stl", root_dir=corpus_dir
+    )
+
+    result = _validate_preview_geometry(graph, corpus_dir)
+
+    assert result["attempted"] is True
+    assert result["passed"] is True
+    assert "hausdorff_distance" in result["comparison"]
+
+
+def test_parallel_local_corpus_score_matches_serial_and_streams_ndjson(
+    test_data_dir,
+    tmp_path,
+    monkeypatch,
+):
+    # With live caches the second run sees warm entries; the report must not
+    # depend on that.
+    monkeypatch.setenv("STL2SCAD_RENDER_CACHE_DIR", str(tmp_path / "renders"))
+    monkeypatch.setenv("STL2SCAD_GRAPH_CACHE_DIR", str(tmp_path / "graphs"))
+    corpus_dir = _copy_fixture_corpus(test_data_dir, tmp_path)
+    fixtures_dir = test_data_dir / "benchmark_fixtures"
+    shutil.copy2(fixtures_dir / "primitive_cylinder_axis_aligned.stl", corpus_dir)
+    manifest_path = tmp_path / ".local" / "local_corpus.json"
+    create_local_corpus_manifest(corpus_dir, output_path=manifest_path, recursive=False)
+    sidecar = tmp_path / "per_file.ndjson"
+
+    serial = score_local_corpus(manifest_path)
+    parallel = score_local_corpus(manifest_path, workers=2, per_file_output=sidecar)
+
+    def _stable(score):
+        triage = {k: v for k, v in score["triage"].items() if k != "generated_at_utc"}
+        return {**score, "generated_at_utc": None, "triage": triage}
+
+    assert _stable(parallel) == _stable(serial)
+    assert any("preview_validation" in entry for entry in serial["per_file"])
+    streamed = [json.loads(line) for line in sidecar.read_text().splitlines()]
+    key = lambda entry: entry["relative_path"]
+    assert sorted(streamed, key=key) == sorted(serial["per_file"], key=key)
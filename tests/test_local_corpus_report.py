@@ -124,3 +124,15 @@ def test_generate_html_report_contains_badges_and_thumbnail(tmp_path):
     assert "polyhedron_fallback" in html
     assert "parametric preview" in html
     assert "<img" in html
+
+
+def test_render_thumbnail_png_rasterizes_without_matplotlib(test_data_dir, tmp_path):
+    fixtures_dir = test_data_dir / "benchmark_fixtures"
+    ensure_benchmark_fixtures(fixtures_dir)
+    output_path = tmp_path / "thumb.png"
+
+    html_report._render_thumbnail_png(
+        fixtures_dir / "primitive_box_axis_aligned.stl", output_path
+    )
+
+    assert output_path.read_bytes().startswith(b"\x89PNG\r\n\x1a\n")
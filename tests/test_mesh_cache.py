@@ -0,0 +1,62 @@
+"""Tests for the in-memory parsed-mesh caches."""
+
+from __future__ import annotations
+
+import os
+
+from stl2scad.core import mesh_cache as mesh_cache_module
+from stl2scad.core.benchmark_fixtures import ensure_benchmark_fixtures
+from stl2scad.core.mesh_cache import LRUCache, ParsedMeshCache
+
+
+def test_lru_cache_evicts_least_recently_used_within_budget():
+    cache = LRUCache(10, cost_fn=len)
+    cache.put("a", "aaaa")
+    cache.put("b", "bbbb")
+    assert cache.get("a") == "aaaa"
+
+    cache.put("c", "cccc")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "aaaa" and cache.get("c") == "cccc"
+    cache.put("huge", "x" * 11)
+    assert cache.get("huge") is None
+    stats = cache.stats()
+    assert stats["size"] == 8 and stats["evictions"] == 1
+    assert stats["hits"] == 3 and stats["misses"] == 2
+
+
+def test_parsed_mesh_is_reloaded_when_the_file_changes(
+    test_data_dir, tmp_path, monkeypatch
+):
+    fixtures_dir = test_data_dir / "benchmark_fixtures"
+    ensure_benchmark_fixtures(fixtures_dir)
+    stl_path = tmp_path / "part.stl"
+    stl_path.write_bytes((fixtures_dir / "primitive_box_axis_aligned.stl").read_bytes())
+    loads = []
+    real_load = mesh_cache_module.load_mesh_arrays
+    monkeypatch.setattr(
+        mesh_cache_module,
+        "load_mesh_arrays",
+        lambda path: loads.append(path) or real_load(path),
+    )
+    cache = ParsedMeshCache()
+
+    first = cache.mesh(stl_path)
+    assert cache.mesh(stl_path) is first
+    stat = stl_path.stat()
+    os.utime(stl_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    cache.mesh(stl_path)
+
+    assert len(loads) == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_zero_budget_parses_every_time(test_data_dir):
+    fixtures_dir = test_data_dir / "benchmark_fixtures"
+    ensure_benchmark_fixtures(fixtures_dir)
+    stl_path = fixtures_dir / "primitive_box_axis_aligned.stl"
+    cache = ParsedMeshCache(0)
+
+    assert cache.mesh(stl_path) is not cache.mesh(stl_path)
+    assert cache.stats()["entries"] == 0
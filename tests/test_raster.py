@@ -0,0 +1,105 @@
+"""Tests for the NumPy software rasterizer."""
+
+import struct
+import zlib
+
+import numpy as np
+import pytest
+
+from stl2scad.core import raster
+from stl2scad.core.raster import encode_png, rasterize, render_mesh
+
+
+def _box_vectors(size=(10.0, 10.0, 10.0)):
+    sx, sy, sz = size
+    corners = np.array(
+        [[x, y, z] for x in (0.0, sx) for y in (0.0, sy) for z in (0.0, sz)]
+    )
+    faces = [
+        (0, 1, 3),
+        (0, 3, 2),
+        (4, 6, 7),
+        (4, 7, 5),
+        (0, 4, 5),
+        (0, 5, 1),
+        (2, 3, 7),
+        (2, 7, 6),
+        (0, 2, 6),
+        (0, 6, 4),
+        (1, 5, 7),
+        (1, 7, 3),
+    ]
+    return corners[np.array(faces)]
+
+
+def _decode_png(data):
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    offset, idat, header = 8, b"", None
+    while offset < len(data):
+        (length,) = struct.unpack(">I", data[offset : offset + 4])
+        tag = data[offset + 4 : offset + 8]
+        body = data[offset + 8 : offset + 8 + length]
+        (crc,) = struct.unpack(">I", data[offset + 8 + length : offset + 12 + length])
+        assert crc == zlib.crc32(tag + body) & 0xFFFFFFFF
+        if tag == b"IHDR":
+            header = struct.unpack(">IIBBBBB", body)
+        elif tag == b"IDAT":
+            idat += body
+        offset += 12 + length
+    width, height = header[:2]
+    rows = np.frombuffer(zlib.decompress(idat), dtype=np.uint8).reshape(height, -1)
+    return rows[:, 1:].reshape(height, width, -1)
+
+
+def test_rasterize_box_covers_centre_and_shades_faces_differently():
+    face, shade = rasterize(_box_vectors(), 64, 48)
+
+    assert face[24, 32] >= 0
+    assert face[0, 0] == -1 and face[-1, -1] == -1
+    # An oblique view shows three box sides with distinct flat shades.
+    visible = np.unique(np.round(shade[face >= 0], 4))
+    assert len(visible) == 3
+
+
+@pytest.mark.parametrize("projection", ["orthographic", "perspective"])
+def test_rasterize_z_range_keeps_only_the_slab(projection):
+    full, _ = rasterize(_box_vectors(), 80, 60, projection=projection)
+    band, _ = rasterize(
+        _box_vectors(), 80, 60, projection=projection, z_range=(4.0, 6.0)
+    )
+
+    assert 0 < (band >= 0).sum() < (full >= 0).sum()
+    # Faces 8-11 are the bottom and top caps, outside the slab.
+    assert set(np.unique(band[band >= 0])) <= set(range(8))
+
+
+def test_rasterize_chunking_does_not_change_the_result(monkeypatch):
+    vectors = _box_vectors((10.0, 4.0, 7.0))
+    expected = rasterize(vectors, 120, 90, azimuth=30.0)
+
+    monkeypatch.setattr(raster, "_CHUNK_CANDIDATES", 64)
+    chunked = rasterize(vectors, 120, 90, azimuth=30.0)
+
+    np.testing.assert_array_equal(expected[0], chunked[0])
+    np.testing.assert_allclose(expected[1], chunked[1])
+
+
+def test_top_view_puts_positive_y_at_the_top_of_the_image():
+    slab = _box_vectors((10.0, 10.0, 1.0))
+    lower = slab.copy()
+    lower[..., 1] -= 20.0
+    face, _ = rasterize(
+        np.concatenate([slab, lower]), 60, 60, elevation=90.0, azimuth=-90.0
+    )
+
+    rows = np.flatnonzero((face >= 12).any(axis=1))
+    upper_rows = np.flatnonzero(((face >= 0) & (face < 12)).any(axis=1))
+    assert upper_rows.max() < rows.min()
+
+
+def test_encode_png_round_trips_pixels():
+    image = render_mesh(_box_vectors(), 40, 30)
+    decoded = _decode_png(encode_png(image))
+
+    assert decoded.shape == (30, 40, 3)
+    np.testing.assert_array_equal(decoded, image)
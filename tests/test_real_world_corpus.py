@@ -6,6 +6,7 @@ import pytest
 
 from stl2scad.tuning.real_world_corpus import (
     compare_real_world_score_to_baseline,
+    fingerprint_matches_case,
     list_missing_real_world_corpus_files,
     load_real_world_corpus_manifest,
     resolve_real_world_corpus_root,
@@ -148,3 +149,13 @@ def test_serialize_real_world_corpus_score_preserves_case_summary():
     assert payload["feature_family_recall"]["plate_like_solid"] == 1.0
     assert payload["per_case"][0]["name"] == "plate_case"
     assert payload["per_case"][0]["fingerprint_verified"] is False
+
+
+def test_fingerprint_matches_case_reports_off_policy_as_unverified(tmp_path):
+    stl_path = tmp_path / "part.stl"
+    stl_path.write_bytes(b"solid part\nendsolid part\n")
+    case = {"fingerprint": {"sha256": "0" * 64}}
+
+    assert fingerprint_matches_case(case, stl_path, "full") is False
+    assert fingerprint_matches_case(case, stl_path, "off") is None
+    assert fingerprint_matches_case({}, stl_path, "full") is True
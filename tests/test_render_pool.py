@@ -0,0 +1,117 @@
+"""
+Tests for the shared asyncio OpenSCAD render pool.
+
+A Python interpreter stands in for OpenSCAD so scheduling can be checked
+without a real install.
+"""
+
+import asyncio
+import sys
+import time
+
+import pytest
+
+from stl2scad.core.render_pool import RenderJob, RenderPool
+
+
+def _sleep_job(tmp_path, name, seconds, timeout=30):
+    return RenderJob(
+        name,
+        ["-c", f"import time; time.sleep({seconds}); print('{name}')"],
+        str(tmp_path / f"{name}.log"),
+        sys.executable,
+        timeout,
+    )
+
+
+# Marks itself running in a shared directory, waits until it sees a second
+# running job (or gives up), then prints the most jobs it saw at once.
+_OVERLAP_SCRIPT = """
+import os, sys, time
+running, name = sys.argv[1], sys.argv[2]
+marker = os.path.join(running, name)
+open(marker, "w").close()
+peak = 0
+deadline = time.monotonic() + 10
+while time.monotonic() < deadline and peak < 2:
+    peak = max(peak, len(os.listdir(running)))
+    time.sleep(0.01)
+time.sleep(0.2)
+peak = max(peak, len(os.listdir(running)))
+os.remove(marker)
+print(peak)
+"""
+
+
+def _overlap_job(tmp_path, name):
+    running = tmp_path / "running"
+    running.mkdir(exist_ok=True)
+    return RenderJob(
+        name,
+        ["-c", _OVERLAP_SCRIPT, str(running), name],
+        str(tmp_path / f"{name}.log"),
+        sys.executable,
+    )
+
+
+def _peak_concurrency(tmp_path, names):
+    return max(
+        int((tmp_path / f"{name}.log").read_text(encoding="utf-8").strip())
+        for name in names
+    )
+
+
+@pytest.fixture
+def pool():
+    pool = RenderPool(max_concurrency=2, max_pending=4)
+    yield pool
+    pool.close()
+
+
+def test_render_pool_runs_jobs_concurrently_up_to_cap(tmp_path, pool):
+    names = [f"job{i}" for i in range(4)]
+
+    assert pool.map([_overlap_job(tmp_path, name) for name in names]) == [True] * 4
+
+    # Two slots: jobs overlap, but never more than two at once.
+    assert _peak_concurrency(tmp_path, names) == 2
+
+
+def test_render_pool_reports_failures_and_timeouts(tmp_path, pool):
+    failing = RenderJob(
+        "fail",
+        ["-c", "import sys; sys.stderr.write('boom'); sys.exit(3)"],
+        str(tmp_path / "fail.log"),
+        sys.executable,
+    )
+    started = time.monotonic()
+    results = pool.map([failing, _sleep_job(tmp_path, "slow", 10, timeout=0.3)])
+
+    assert results == [False, False]
+    assert time.monotonic() - started < 5
+    assert "boom" in (tmp_path / "fail.log").read_text(encoding="utf-8")
+
+    missing = RenderJob("missing", [], str(tmp_path / "m.log"), str(tmp_path / "nope"))
+    assert pool.run(missing) is False
+
+
+def test_render_pool_cancellation_frees_the_slot(tmp_path, pool):
+    blockers = [pool.submit(_sleep_job(tmp_path, f"block{i}", 10)) for i in range(2)]
+    time.sleep(0.3)
+    for future in blockers:
+        future.cancel()
+
+    started = time.monotonic()
+    assert pool.run(_sleep_job(tmp_path, "after", 0)) is True
+    assert time.monotonic() - started < 5
+
+
+def test_render_pool_run_async_shares_cap(tmp_path, pool):
+    names = [f"async{i}" for i in range(4)]
+
+    async def run_all():
+        jobs = [_overlap_job(tmp_path, name) for name in names]
+        return await asyncio.gather(*(pool.run_async(job) for job in jobs))
+
+    assert asyncio.run(run_all()) == [True] * 4
+    assert _peak_concurrency(tmp_path, names) == 2
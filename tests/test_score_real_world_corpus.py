@@ -69,7 +69,9 @@ def test_merge_gate_fails_when_baseline_missing(monkeypatch, capsys, tmp_path):
     monkeypatch.setattr(
         module,
         "score_real_world_corpus",
-        lambda _config, manifest_path, corpus_root: _build_stub_score(tmp_path),
+        lambda _config, manifest_path, corpus_root, **_kwargs: _build_stub_score(
+            tmp_path
+        ),
     )
 
     output_path = tmp_path / "real_world_recall.json"
@@ -111,7 +113,9 @@ def test_merge_gate_writes_delta_when_baseline_present(monkeypatch, tmp_path):
     monkeypatch.setattr(
         module,
         "score_real_world_corpus",
-        lambda _config, manifest_path, corpus_root: _build_stub_score(tmp_path),
+        lambda _config, manifest_path, corpus_root, **_kwargs: _build_stub_score(
+            tmp_path
+        ),
     )
     monkeypatch.setattr(
         module,
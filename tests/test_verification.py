@@ -4,10 +4,11 @@ Tests for STL to SCAD verification functionality.
 
 import pytest
 import os
+import shutil
 from pathlib import Path
 import stl
 import numpy as np
-from stl2scad.core.converter import stl2scad
+from stl2scad.core.converter import get_openscad_path, stl2scad
 from stl2scad.core.verification import (
     calculate_stl_volume,
     calculate_stl_surface_area,
@@ -309,3 +310,667 @@ def test_compare_metrics_deterministic_with_sample_seed(test_output_dir):
         )
         > 1e-9
     )
+
+
+def test_point_grid_index_matches_dense_nearest_neighbors():
+    """The hash-grid index should reproduce dense argmin results, ties included."""
+    from stl2scad.core.verification.spatial_index import PointGridIndex
+
+    rng = np.random.default_rng(7)
+    for scale, rounding in ((1.0, None), (5.0, 1), (0.01, None)):
+        reference = rng.normal(size=(300, 3)) * scale
+        queries = rng.normal(size=(250, 3)) * scale
+        if rounding is not None:
+            reference = np.round(reference, rounding)
+            queries = np.round(queries, rounding)
+        queries[:5] += 40.0 * scale  # far queries exercise the fallback path
+
+        dist_sq = np.sum(
+            (queries[:, np.newaxis, :] - reference[np.newaxis, :, :]) ** 2, axis=-1
+        )
+        expected_idx = np.argmin(dist_sq, axis=1)
+        distances, indices = PointGridIndex(reference).query(queries)
+
+        np.testing.assert_array_equal(indices, expected_idx)
+        np.testing.assert_array_equal(
+            distances, np.sqrt(dist_sq[np.arange(len(queries)), expected_idx])
+        )
+
+
+def test_compare_metrics_supports_large_sample_counts(test_output_dir):
+    """Point-based metrics should handle sample counts far beyond a dense matrix."""
+    cube_file = test_output_dir / "cube_many_samples.stl"
+    create_cube_stl(cube_file)
+    mesh_a = stl.mesh.Mesh.from_file(str(cube_file))
+    mesh_b = stl.mesh.Mesh.from_file(str(cube_file))
+    mesh_b.translate(np.array([0.01, 0.0, 0.0]))
+
+    bbox = {"width": 1.0, "height": 1.0, "depth": 1.0}
+    result = compare_metrics(
+        {"bounding_box": bbox, "mesh": mesh_a},
+        {"bounding_box": bbox, "mesh": mesh_b},
+        sample_seed=3,
+        num_samples=100_000,
+        distance_method="points",
+    )
+
+    assert result["hausdorff_distance"]["num_samples"] == 100_000
+    # Dense sampling keeps the estimate within a sample spacing of the 0.01 shift.
+    assert 0.01 <= result["hausdorff_distance"]["value"] < 0.02
+    assert result["normal_deviation"]["value"] < 1.0
+
+
+def test_triangle_bvh_matches_brute_force_closest_points():
+    """BVH closest-point queries should agree with an exhaustive triangle scan."""
+    from stl2scad.core.verification.spatial_index import (
+        TriangleBVH,
+        closest_point_on_triangles,
+    )
+
+    rng = np.random.default_rng(11)
+    triangles = rng.normal(size=(150, 3, 3))
+    triangles[7] = triangles[7, 0]  # fully degenerate triangle
+    queries = rng.normal(size=(80, 3)) * 3.0
+
+    pairs_q = np.repeat(queries, len(triangles), axis=0)
+    pairs_t = np.tile(triangles, (len(queries), 1, 1))
+    closest = closest_point_on_triangles(pairs_q, pairs_t)
+    dist_sq = np.sum((pairs_q - closest) ** 2, axis=1).reshape(len(queries), -1)
+
+    distances, points, triangle_idx = TriangleBVH(triangles).closest_points(queries)
+
+    np.testing.assert_array_equal(triangle_idx, np.argmin(dist_sq, axis=1))
+    np.testing.assert_allclose(distances, np.sqrt(dist_sq.min(axis=1)), atol=1e-12)
+    np.testing.assert_allclose(
+        np.linalg.norm(points - queries, axis=1), distances, atol=1e-12
+    )
+
+
+def test_compare_metrics_surface_distance_is_exact_with_few_samples(test_output_dir):
+    """Point-to-surface Hausdorff should recover a small offset without dense sampling."""
+    cube_file = test_output_dir / "cube_surface_distance.stl"
+    create_cube_stl(cube_file)
+    mesh_a = stl.mesh.Mesh.from_file(str(cube_file))
+    mesh_b = stl.mesh.Mesh.from_file(str(cube_file))
+    mesh_b.translate(np.array([0.01, 0.0, 0.0]))
+
+    bbox = {"width": 1.0, "height": 1.0, "depth": 1.0}
+    result = compare_metrics(
+        {"bounding_box": bbox, "mesh": mesh_a},
+        {"bounding_box": bbox, "mesh": mesh_b},
+        sample_seed=5,
+        num_samples=2000,
+    )
+
+    assert result["hausdorff_distance"]["method"] == "surface"
+    assert result["hausdorff_distance"]["value"] == pytest.approx(0.01, abs=1e-3)
+    assert result["normal_deviation"]["value"] < 1.0
+
+
+def test_compare_metrics_adaptive_sampling_stops_early_on_clear_pass(test_output_dir):
+    """Adaptive sampling should stop once the pass decision is settled."""
+    from stl2scad.core.verification import AdaptiveSamplingConfig
+
+    cube_file = test_output_dir / "cube_adaptive_pass.stl"
+    create_cube_stl(cube_file)
+    mesh_a = stl.mesh.Mesh.from_file(str(cube_file))
+    mesh_b = stl.mesh.Mesh.from_file(str(cube_file))
+    mesh_b.translate(np.array([0.001, 0.0, 0.0]))
+
+    bbox = {"width": 1.0, "height": 1.0, "depth": 1.0}
+    config = AdaptiveSamplingConfig(initial_samples=128, max_samples=32768)
+    result = compare_metrics(
+        {"bounding_box": bbox, "mesh": mesh_a},
+        {"bounding_box": bbox, "mesh": mesh_b},
+        sample_seed=9,
+        adaptive=config,
+        tolerance={"hausdorff_distance": 1.0, "normal_deviation": 5.0},
+    )
+
+    sampling = result["adaptive_sampling"]
+    assert sampling["settled"] is True
+    assert sampling["samples_used"] < config.max_samples
+    h_lo, h_hi = result["hausdorff_distance"]["confidence_interval_percent"]
+    assert h_hi <= 1.0
+    assert result["hausdorff_distance"]["num_samples"] == sampling["samples_used"]
+    n_lo, n_hi = result["normal_deviation"]["confidence_interval"]
+    assert n_lo <= result["normal_deviation"]["value"] <= n_hi
+
+
+def test_compare_metrics_adaptive_sampling_runs_to_cap_when_borderline(test_output_dir):
+    """A tolerance inside the confidence interval should keep sampling to the cap."""
+    from stl2scad.core.verification import AdaptiveSamplingConfig
+
+    cube_file = test_output_dir / "cube_adaptive_borderline.stl"
+    create_cube_stl(cube_file)
+    mesh_a = stl.mesh.Mesh.from_file(str(cube_file))
+    mesh_b = stl.mesh.Mesh.from_file(str(cube_file))
+    # A small rotation gives a continuous spread of surface distances.
+    mesh_b.rotate([0.0, 0.0, 1.0], np.radians(2.0))
+
+    bbox = {"width": 1.0, "height": 1.0, "depth": 1.0}
+    config = AdaptiveSamplingConfig(initial_samples=64, max_samples=1024)
+    stl_metrics = {"bounding_box": bbox, "mesh": mesh_a}
+    scad_metrics = {"bounding_box": bbox, "mesh": mesh_b}
+    # A dense run pins the percentile near its true value.
+    dense = AdaptiveSamplingConfig(initial_samples=16384, max_samples=16384)
+    probe = compare_metrics(stl_metrics, scad_metrics, sample_seed=2, adaptive=dense)
+    borderline = probe["hausdorff_distance"]["difference_percent"]
+
+    result = compare_metrics(
+        stl_metrics,
+        scad_metrics,
+        sample_seed=1,
+        adaptive=config,
+        tolerance={"hausdorff_distance": borderline},
+    )
+
+    assert result["adaptive_sampling"]["samples_used"] == config.max_samples
+    assert result["adaptive_sampling"]["settled"] is False
+    assert result["adaptive_sampling"]["rounds"] > 1
+
+
+def test_calculate_ir_metrics_matches_tessellated_plate_with_hole():
+    """A plate with a through hole integrates to the 64-gon OpenSCAD renders."""
+    import math
+    from stl2scad.core.verification.analytic import calculate_ir_metrics
+
+    root = {
+        "type": "BooleanDifference",
+        "base": {"type": "PrimitivePlate", "origin": [0, 0, 0], "size": [20, 10, 2]},
+        "cuts": [
+            {
+                "type": "TransformTranslate",
+                "offset": [10, 5, 1],
+                "child": {"type": "HoleThrough", "diameter": 4.0, "axis": "z"},
+            }
+        ],
+    }
+    metrics = calculate_ir_metrics(root)
+
+    n = 64
+    hole_area = 0.5 * n * 4.0 * math.sin(2.0 * math.pi / n)
+    hole_perimeter = 2.0 * n * 2.0 * math.sin(math.pi / n)
+    assert metrics is not None
+    assert metrics["mesh"] is None
+    assert metrics["volume"] == pytest.approx(400.0 - 2.0 * hole_area)
+    assert metrics["surface_area"] == pytest.approx(
+        520.0 - 2.0 * hole_area + 2.0 * hole_perimeter
+    )
+    assert metrics["bounding_box"]["width"] == pytest.approx(20.0)
+    assert metrics["bounding_box"]["depth"] == pytest.approx(2.0)
+    assert calculate_ir_metrics({"type": "FallbackMesh"}) is None
+
+
+def test_verify_existing_conversion_analytic_engine_skips_openscad(
+    test_data_dir, test_output_dir, monkeypatch
+):
+    """Feature-graph output should verify without an OpenSCAD render."""
+    from stl2scad.core.verification import verification
+
+    def fail_render(scad_file):
+        raise AssertionError("OpenSCAD should not be invoked")
+
+    monkeypatch.setattr(verification, "calculate_scad_metrics", fail_render)
+    stl_file = test_data_dir / "benchmark_fixtures" / "primitive_box_axis_aligned.stl"
+    scad_file = test_output_dir / "analytic_box.scad"
+    stl2scad(str(stl_file), str(scad_file), parametric=True)
+
+    tolerance = {"volume": 1.0, "surface_area": 2.0, "bounding_box": 0.5}
+    result = verify_existing_conversion(
+        stl_file, scad_file, tolerance, metrics_engine="auto"
+    )
+
+    assert result.passed
+    assert result.report["metrics_engine"] == "analytic"
+    assert result.comparison["volume"]["difference_percent"] == pytest.approx(
+        0.0, abs=1e-6
+    )
+    assert "hausdorff_distance" not in result.comparison
+
+
+def test_tessellate_ir_matches_analytic_metrics():
+    """Tessellated IR meshes should carry the closed-form volume and area."""
+    from stl2scad.core.verification.analytic import calculate_ir_metrics
+    from stl2scad.core.verification.tessellate import ir_mesh, tessellate_ir
+
+    plate = {
+        "type": "BooleanDifference",
+        "base": {"type": "PrimitivePlate", "origin": [0, 0, 0], "size": [20, 10, 2]},
+        "cuts": [
+            {
+                "type": "TransformTranslate",
+                "offset": [5, 5, 1],
+                "child": {
+                    "type": "HoleCounterbore",
+                    "through_diameter": 2.0,
+                    "bore_diameter": 4.0,
+                    "bore_depth": 1.0,
+                },
+            },
+            {
+                "type": "PatternLinear",
+                "origin": [15, 2, 1],
+                "step": [0, 3, 0],
+                "count": 3,
+                "diameter": 1.5,
+            },
+        ],
+    }
+    revolve = {
+        "type": "ExtrudeRevolve",
+        "profile": {"points": [[0, 0], [3, 0], [3, 1], [1, 1], [1, 4], [0, 4]]},
+    }
+    extrude = {
+        "type": "ExtrudeLinear",
+        "height": 3.0,
+        "profile": {"points": [[0, 0], [4, 0], [4, 1], [1, 1], [1, 4], [0, 4]]},
+    }
+    cylinder = {
+        "type": "PrimitiveCylinder",
+        "radius": 3.0,
+        "height": 5.0,
+        "axis": "x",
+        "origin": [1, 2, 3],
+    }
+
+    for root in (plate, revolve, extrude, cylinder):
+        metrics = calculate_ir_metrics(root)
+        mesh = ir_mesh(root)
+        assert mesh is not None
+        # Signed tetrahedron volumes; positive only if every face points out.
+        vectors = mesh.vectors.astype(np.float64)
+        volume = (
+            np.einsum(
+                "ij,ij->i", vectors[:, 0], np.cross(vectors[:, 1], vectors[:, 2])
+            ).sum()
+            / 6.0
+        )
+        assert volume == pytest.approx(metrics["volume"], rel=1e-6)
+        assert calculate_stl_surface_area(mesh) == pytest.approx(
+            metrics["surface_area"], rel=1e-6
+        )
+        assert mesh.min_ == pytest.approx(
+            [metrics["bounding_box"][f"min_{axis}"] for axis in "xyz"], abs=1e-5
+        )
+    assert tessellate_ir({"type": "FallbackMesh"}) is None
+
+
+def test_verify_existing_conversion_auto_engine_tessellates_for_mesh_tolerances(
+    test_data_dir, test_output_dir, monkeypatch
+):
+    """Auto should tessellate the IR, not render, for Hausdorff/normal checks."""
+    from stl2scad.core.verification import verification
+
+    def fail_render(scad_file):
+        raise AssertionError("OpenSCAD should not be invoked")
+
+    monkeypatch.setattr(verification, "calculate_scad_metrics", fail_render)
+    stl_file = test_data_dir / "benchmark_fixtures" / "primitive_box_axis_aligned.stl"
+    scad_file = test_output_dir / "auto_box.scad"
+    stl2scad(str(stl_file), str(scad_file), parametric=True)
+    tolerance = {
+        "volume": 1.0,
+        "surface_area": 2.0,
+        "bounding_box": 0.5,
+        "hausdorff_distance": 1.0,
+        "normal_deviation": 5.0,
+    }
+    result = verify_existing_conversion(
+        stl_file, scad_file, tolerance, sample_seed=0, metrics_engine="auto"
+    )
+
+    assert result.passed
+    assert result.report["metrics_engine"] == "analytic"
+    assert result.comparison["hausdorff_distance"]["value"] == pytest.approx(
+        0.0, abs=1e-4
+    )
+
+
+def test_verify_existing_conversion_analytic_engine_fails_unevaluated_mesh_checks(
+    test_data_dir, test_output_dir, monkeypatch
+):
+    """Mesh tolerances the analytic engine cannot evaluate must not pass."""
+    from stl2scad.core.verification import verification
+
+    def fail_render(scad_file):
+        raise AssertionError("OpenSCAD should not be invoked")
+
+    monkeypatch.setattr(verification, "calculate_scad_metrics", fail_render)
+    monkeypatch.setattr(verification, "ir_mesh", lambda root: None)
+    stl_file = test_data_dir / "benchmark_fixtures" / "primitive_box_axis_aligned.stl"
+    scad_file = test_output_dir / "analytic_no_mesh_box.scad"
+    stl2scad(str(stl_file), str(scad_file), parametric=True)
+    tolerance = {
+        "volume": 1.0,
+        "surface_area": 2.0,
+        "bounding_box": 0.5,
+        "hausdorff_distance": 1.0,
+        "normal_deviation": 5.0,
+    }
+    result = verify_existing_conversion(
+        stl_file, scad_file, tolerance, sample_seed=0, metrics_engine="analytic"
+    )
+
+    assert not result.passed
+    assert result.report["metrics_engine"] == "analytic"
+    assert result.report["unevaluated_checks"] == [
+        "hausdorff_distance",
+        "normal_deviation",
+    ]
+    assert {f["metric"] for f in result.report["failures"]} == {
+        "hausdorff_distance",
+        "normal_deviation",
+    }
+
+
+def test_verify_existing_conversion_auto_engine_renders_untessellated_trees(
+    test_data_dir, test_output_dir, monkeypatch
+):
+    """IR trees without a closed form should fall back to an OpenSCAD render."""
+    from stl2scad.core.verification import verification
+
+    stl_file = test_data_dir / "benchmark_fixtures" / "primitive_box_axis_aligned.stl"
+    scad_file = test_output_dir / "fallback_box.scad"
+    scad_file.write_text("cube(1);\n", encoding="utf-8")
+    rendered = verification.get_stl_metrics(stl_file)
+    calls = []
+
+    def fake_render(path):
+        calls.append(path)
+        return dict(rendered)
+
+    monkeypatch.setattr(verification, "calculate_scad_metrics", fake_render)
+    tolerance = {"volume": 1.0, "surface_area": 2.0, "bounding_box": 0.5}
+    result = verify_existing_conversion(
+        stl_file,
+        scad_file,
+        tolerance,
+        sample_seed=0,
+        metrics_engine="auto",
+        ir_root={"type": "FallbackMesh"},
+    )
+
+    assert calls == [scad_file]
+    assert result.report["metrics_engine"] == "openscad"
+
+
+def test_render_cache_counts_hits_and_evicts_least_recently_used(test_output_dir):
+    """The render cache should key on content and stay within its byte bound."""
+    import os
+    from stl2scad.core.verification.render_cache import RenderCache
+
+    payload = test_output_dir / "payload.bin"
+    payload.write_bytes(b"x" * 400)
+    cache = RenderCache(test_output_dir / "cache", max_bytes=1000)
+
+    first = cache.key("cube(1);", "2025.02.19", "-o", "rendered.stl")
+    assert first != cache.key("cube(2);", "2025.02.19", "-o", "rendered.stl")
+    assert cache.get(first) is None
+    cache.put(first, {"rendered.stl": payload}, {"volume": 1.0})
+    entry = cache.get(first)
+    assert entry["meta"] == {"volume": 1.0}
+    assert (entry["path"] / "rendered.stl").read_bytes() == payload.read_bytes()
+
+    second = cache.key("second")
+    cache.put(second, {"rendered.stl": payload})
+    os.utime(cache.get(first)["path"], (1e9, 1e9))
+    # A third entry exceeds the bound; the oldest-touched entry goes first.
+    cache.put(cache.key("third"), {"rendered.stl": payload})
+
+    assert cache.get(first) is None
+    assert cache.get(second) is not None
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["hits"] == 3
+    assert stats["misses"] == 2
+
+
+def test_calculate_scad_metrics_reuses_cached_render(test_output_dir, monkeypatch):
+    """Identical SCAD text should only be rendered by OpenSCAD once."""
+    from stl2scad.core.verification import metrics, render_cache
+
+    cube_file = test_output_dir / "cube_render.stl"
+    create_cube_stl(cube_file)
+    renders = []
+
+    def fake_run_openscad(description, args, log_file, openscad_path=None, timeout=30):
+        if "--version" in args:
+            Path(log_file).write_text("OpenSCAD version 2025.02.19\n", encoding="utf-8")
+            return True
+        renders.append(args)
+        shutil.copyfile(cube_file, args[args.index("-o") + 1])
+        return True
+
+    monkeypatch.setenv("STL2SCAD_RENDER_CACHE_DIR", str(test_output_dir / "cache"))
+    monkeypatch.setattr(metrics, "get_openscad_path", lambda: "openscad")
+    monkeypatch.setattr(metrics, "run_openscad", fake_run_openscad)
+    monkeypatch.setattr(render_cache, "run_openscad", fake_run_openscad)
+    render_cache.openscad_version.cache_clear()
+
+    scad_a = test_output_dir / "a.scad"
+    scad_b = test_output_dir / "b.scad"
+    scad_a.write_text("cube(1);\n", encoding="utf-8")
+    scad_b.write_text("cube(1);\n", encoding="utf-8")
+
+    first = metrics.calculate_scad_metrics(scad_a)
+    second = metrics.calculate_scad_metrics(scad_b)
+    render_cache.openscad_version.cache_clear()
+
+    assert len(renders) == 1
+    assert first["render_cache"] == "miss"
+    assert second["render_cache"] == "hit"
+    assert second["volume"] == pytest.approx(first["volume"])
+    assert len(second["mesh"].vectors) == 12
+
+
+def _write_fake_openscad(path, calls_file, animate="cameras"):
+    """Write an executable stand-in for OpenSCAD that records each call.
+
+    ``animate`` is "cameras" to honour per-frame cameras, "static" to render
+    every frame identically (a build that ignores ``$vpr``) or "none" to
+    reject ``--animate``.
+    """
+    import sys
+
+    path.write_text(
+        f"""#!{sys.executable}
+import sys
+from pathlib import Path
+
+args = sys.argv[1:]
+with open({str(calls_file)!r}, "a", encoding="utf-8") as handle:
+    handle.write(" ".join(args) + "\\n")
+output = Path(args[args.index("-o") + 1])
+if "--animate" in args:
+    if {animate!r} == "none":
+        sys.exit(1)
+    for frame in range(int(args[args.index("--animate") + 1])):
+        data = b"png" if {animate!r} == "static" else f"png{{frame}}".encode()
+        output.with_name(f"{{output.stem}}{{frame:05d}}.png").write_bytes(data)
+else:
+    output.write_bytes(b"png")
+""",
+        encoding="utf-8",
+    )
+    path.chmod(0o755)
+
+
+@pytest.mark.parametrize("animate", ["cameras", "static", "none"])
+def test_comparison_visualization_renders_all_views_in_one_pass(
+    test_output_dir, monkeypatch, animate
+):
+    """All views come from one OpenSCAD run, with per-view renders as fallback.
+
+    A run whose frames ignore their cameras falls back like a failed one.
+    """
+    from stl2scad.core.verification import visualization
+
+    stl_file = test_output_dir / "views_cube.stl"
+    create_cube_stl(stl_file)
+    scad_file = test_output_dir / "views_cube.scad"
+    scad_file.write_text("cube(10);\n", encoding="utf-8")
+    calls_file = test_output_dir / f"calls_{animate}.txt"
+    fake = test_output_dir / f"fake_openscad_{animate}.py"
+    _write_fake_openscad(fake, calls_file, animate=animate)
+    monkeypatch.setattr(visualization, "get_openscad_path", lambda: str(fake))
+
+    output_dir = test_output_dir / f"views_{animate}"
+    visualizations = generate_comparison_visualization(
+        stl_file, scad_file, output_dir, views=["perspective", "top", "comparison"]
+    )
+
+    calls = calls_file.read_text(encoding="utf-8").splitlines()
+    images = 2 + 8 + 5
+    assert len(calls) == (1 if animate == "cameras" else 1 + images)
+    assert "--animate 15" in calls[0]
+    assert set(visualizations) == {
+        "perspective",
+        "top",
+        "comparison",
+        *(f"cross_section_{i}" for i in range(1, 6)),
+    }
+    assert all(path.exists() for path in visualizations.values())
+    script = (output_dir / "comparison_views.scad").read_text(encoding="utf-8")
+    assert '["cross_section", ' in script and "$vpr = frame[2];" in script
+
+
+def test_comparison_visualization_views_differ_with_real_openscad(test_output_dir):
+    """Real OpenSCAD output must show each view from its own camera."""
+    try:
+        openscad_path = get_openscad_path()
+    except FileNotFoundError:
+        openscad_path = None
+    if openscad_path is None:
+        pytest.skip("OpenSCAD not available")
+
+    stl_file = test_output_dir / "camera_cube.stl"
+    create_cube_stl(stl_file)
+    scad_file = test_output_dir / "camera_part.scad"
+    # Asymmetric so that no two standard views coincide.
+    scad_file.write_text(
+        "cube([10, 20, 5]);\ntranslate([8, 0, 5]) cube([2, 4, 12]);\n",
+        encoding="utf-8",
+    )
+
+    visualizations = generate_comparison_visualization(
+        stl_file,
+        scad_file,
+        test_output_dir / "camera_views",
+        views=["front", "top", "side"],
+        use_cache=False,
+    )
+
+    images = [visualizations[name].read_bytes() for name in ("front", "top", "side")]
+    assert len(set(images)) == 3
+
+
+def test_eye_rotation_matches_openscad_camera_conventions():
+    from stl2scad.core.verification.visualization import _eye_rotation
+
+    assert _eye_rotation([0, -200, 0], [0, 0, 0]) == pytest.approx((90, 0, 0))
+    assert _eye_rotation([200, 0, 0], [0, 0, 0]) == pytest.approx((90, 0, 90))
+    assert _eye_rotation([0, 0, 200], [0, 0, 0])[0] == pytest.approx(0)
+
+
+def test_comparison_visualization_software_renderer_needs_no_openscad(
+    test_output_dir, monkeypatch
+):
+    """The software renderer rasterizes every view from the two meshes."""
+    from stl2scad.core.verification import visualization
+
+    stl_file = test_output_dir / "software_cube.stl"
+    create_cube_stl(stl_file)
+    scad_file = test_output_dir / "software_cube.scad"
+    scad_file.write_text("cube(10);\n", encoding="utf-8")
+    scad_mesh = stl.mesh.Mesh.from_file(str(stl_file))
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("software rendering should not call OpenSCAD")
+
+    monkeypatch.setattr(visualization, "get_openscad_path", fail)
+    monkeypatch.setattr(visualization, "get_render_pool", fail)
+    monkeypatch.setattr(
+        visualization,
+        "calculate_scad_metrics",
+        lambda *_args, **_kwargs: {"mesh": scad_mesh},
+    )
+
+    visualizations = generate_comparison_visualization(
+        stl_file,
+        scad_file,
+        test_output_dir / "software_views",
+        views=["perspective", "front"],
+        renderer="software",
+    )
+
+    assert set(visualizations) == {
+        "perspective",
+        "front",
+        *(f"cross_section_{i}" for i in range(1, 6)),
+    }
+    for path in visualizations.values():
+        assert path.read_bytes().startswith(b"\x89PNG\r\n\x1a\n")
+
+
+def test_batch_verify_writes_summary_incrementally_and_survives_failures(
+    test_output_dir, monkeypatch
+):
+    """A failing file is recorded and the summary is rewritten after each file."""
+    import json
+
+    from stl2scad.core.verification import verification
+
+    output_dir = test_output_dir / "batch_incremental"
+    summary_path = output_dir / "verification_summary.json"
+    seen_completed = []
+
+    def fake_verify(stl_path, output_path, *_args):
+        if summary_path.exists():
+            seen_completed.append(
+                json.loads(summary_path.read_text(encoding="utf-8"))["completed"]
+            )
+        if stl_path.stem == "bad":
+            raise ValueError("corrupt mesh")
+        scad_path = output_path / f"{stl_path.stem}.scad"
+        result = verification.VerificationResult(
+            str(stl_path), str(scad_path), {}, {}, {}, True, {}
+        )
+        return result, {"hits": 1, "misses": 0, "stores": 0, "evictions": 0}
+
+    monkeypatch.setenv("STL2SCAD_RENDER_CACHE_DIR", str(test_output_dir / "cache"))
+    monkeypatch.setattr(verification, "_verify_batch_file", fake_verify)
+    files = [test_output_dir / name for name in ("a.stl", "bad.stl", "c.stl")]
+
+    results = verification.batch_verify(files, output_dir)
+
+    assert list(results) == ["a.stl", "c.stl"]
+    assert seen_completed == [1, 2]
+    summary = json.loads(summary_path.read_text(encoding="utf-8"))
+    assert summary["total"] == 3 and summary["completed"] == 3
+    assert summary["passed"] == 2 and summary["errors"] == 1
+    assert summary["results"]["bad.stl"]["error"] == "ValueError: corrupt mesh"
+    assert summary["render_cache"]["hits"] == 2
+
+
+def test_batch_verify_workers_isolate_per_file_errors(test_output_dir):
+    """Process workers report unreadable files without stopping the batch."""
+    import json
+
+    from stl2scad.core.verification import batch_verify
+
+    inputs = test_output_dir / "batch_workers_in"
+    inputs.mkdir(exist_ok=True)
+    files = []
+    for index in range(3):
+        path = inputs / f"broken_{index}.stl"
+        path.write_bytes(b"not an stl")
+        files.append(path)
+
+    output_dir = test_output_dir / "batch_workers_out"
+    results = batch_verify(files, output_dir, workers=2)
+
+    assert results == {}
+    summary = json.loads((output_dir / "verification_summary.json").read_text())
+    assert summary["completed"] == 3 and summary["errors"] == 3
+    assert list(summary["results"]) == [path.name for path in files]